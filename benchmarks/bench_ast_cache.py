@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+AST缓存基准测试
+比较重新分析源代码（词法分析+语法分析）与从序列化数据加载AST的耗时（取最小值），
+并报告序列化数据的大小。
+
+用法: python benchmarks/bench_ast_cache.py [--copies 1000] [-n 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_serializer import dump_ast, load_ast
+from synthetic import synth_alu_source
+
+
+def best_of(func, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL AST缓存基准测试')
+    parser.add_argument('--copies', type=int, default=1000, help='ALU模块复制份数')
+    parser.add_argument('-n', '--runs', type=int, default=5, help='重复次数')
+    args = parser.parse_args()
+
+    compiler = GraceHDLCompiler()
+    source = synth_alu_source(args.copies)
+    parse_time, ast = best_of(lambda: compiler._parse(source), args.runs)
+    dump_time, data = best_of(lambda: dump_ast(ast), args.runs)
+    load_time, _ = best_of(lambda: load_ast(data), args.runs)
+
+    print(f"源代码: {len(source) / 1024:.0f} KB, 序列化AST: {len(data) / 1024:.0f} KB")
+    print(f"语法分析: {parse_time * 1000:.1f} ms")
+    print(f"序列化:   {dump_time * 1000:.1f} ms")
+    print(f"加载:     {load_time * 1000:.1f} ms  (比重新分析快 {parse_time / load_time:.1f} 倍)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
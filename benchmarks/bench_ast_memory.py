@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+AST内存基准测试
+解析表达式密集的合成设计（ALU模块复制多份），用tracemalloc统计解析完成后
+AST保留的内存总量（含列表和字符串）以及平均每个节点的内存。
+
+用法: python benchmarks/bench_ast_memory.py [--copies 1000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_nodes import ASTNode
+from synthetic import synth_alu_source
+
+
+def count_unique_nodes(root):
+    """统计AST中不同节点对象的数量（SourceText的modules和items共享模块节点）"""
+    seen = set()
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ASTNode):
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            stack.extend(value for _, value in item.fields())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return len(seen)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL AST内存基准测试')
+    parser.add_argument('--copies', type=int, default=1000, help='ALU模块复制份数')
+    args = parser.parse_args()
+
+    compiler = GraceHDLCompiler()
+    source = synth_alu_source(args.copies)
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    ast = compiler.parser.parser.parse(source, lexer=compiler.lexer)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+
+    nodes = count_unique_nodes(ast)
+    print(f"源代码: {len(source.splitlines())} 行, AST节点: {nodes}")
+    print(f"AST内存: {retained / 1024 / 1024:.1f} MB  ({retained / nodes:.0f} 字节/节点)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
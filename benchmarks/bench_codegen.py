@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+代码生成基准测试
+把examples/alu.ghdl中的ALU（按当前语法改写）复制多份，只对代码生成计时（AST预先构建）。
+同时计时旧的分派方式（LegacyDispatchGenerator）并输出两者的比值。
+
+用法: python benchmarks/bench_codegen.py [--copies 1000] [-n 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src import ast_nodes
+from src.verilog_generator import VerilogGenerator
+from synthetic import synth_alu_source
+
+# 旧visit_expression中isinstance判断的顺序
+_LEGACY_EXPRESSION_ORDER = [
+    (ast_nodes.BinaryExpression, ast_nodes.BinaryOp), ast_nodes.UnaryExpression, ast_nodes.ConditionalExpression,
+    (ast_nodes.IdentifierExpression, ast_nodes.Identifier), (ast_nodes.NumberExpression, ast_nodes.Number),
+    ast_nodes.NewNumberExpression, ast_nodes.IndexExpression, ast_nodes.SliceExpression,
+    ast_nodes.ConcatenationExpression, ast_nodes.EnumReference, ast_nodes.FunctionCall, ast_nodes.ReduceOperation,
+    str, int,
+]
+
+
+class LegacyDispatchGenerator(VerilogGenerator):
+    """分派表之前的分派方式：每次visit拼接方法名并getattr，表达式按isinstance链逐个判断类型
+
+    各类型仍调用当前的visit_方法，输出与VerilogGenerator相同，计时差别只来自分派。
+    """
+
+    _legacy_chain = [(types, VerilogGenerator.lookup(types[0] if isinstance(types, tuple) else types))
+                     for types in _LEGACY_EXPRESSION_ORDER]
+
+    def visit(self, node):
+        visitor = getattr(self, f'visit_{type(node).__name__}', self.generic_visit)
+        return visitor(node)
+
+    def visit_expression(self, node):
+        for types, render in self._legacy_chain:
+            if isinstance(node, types):
+                return render(self, node)
+        return VerilogGenerator.visit_expression(self, node)
+
+
+def time_generate(generator, ast, repeat):
+    """返回 (最短时间, 输出)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        code = generator.generate(ast)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, code
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL代码生成基准测试')
+    parser.add_argument('--copies', type=int, default=1000, help='ALU模块的份数')
+    parser.add_argument('-n', '--repeat', type=int, default=3, help='重复次数（取最短）')
+    args = parser.parse_args()
+
+    compiler = GraceHDLCompiler()
+    source = synth_alu_source(args.copies)
+    compiler.lexer.input(source)
+    ast = compiler.parser.parser.parse(source, lexer=compiler.lexer)
+    if ast is None:
+        print("语法分析失败")
+        return 1
+
+    legacy, legacy_code = time_generate(LegacyDispatchGenerator(), ast, args.repeat)
+    best, code = time_generate(compiler.generator, ast, args.repeat)
+
+    lines = code.count('\n') + 1
+    print(f"{args.copies} 个ALU模块, 输出 {lines} 行")
+    print(f"旧的分派方式: {legacy:.3f} s")
+    print(f"分派表:       {best:.3f} s  ({lines / best:.0f} 行/s)")
+    print(f"加速比: {legacy / best:.2f}x  输出一致: {'是' if legacy_code == code else '否'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+冷启动基准测试
+测量 `python gracehdl_compiler.py x.ghdl` 在开始词法分析之前的耗时
+（导入 + 构建编译器），并检查启动过程中没有写入任何文件。
+与正常安装一致，子进程启用字节码缓存（__pycache__ 不计入写入检查）。
+
+用法: python benchmarks/bench_cold_start.py [-n 次数]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# 在子进程中测量：从解释器开始执行脚本到编译器构建完成（即将开始词法分析）
+PROBE = r'''
+import time
+t0 = time.perf_counter()
+import sys
+sys.path.insert(0, {root!r})
+import gracehdl_compiler
+compiler = gracehdl_compiler.GraceHDLCompiler()
+print((time.perf_counter() - t0) * 1000.0)
+'''
+
+SAMPLE = """module and_gate:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a & b
+"""
+
+
+def snapshot(path):
+    """记录目录下所有文件及修改时间（忽略字节码缓存）"""
+    result = {}
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames if d != '__pycache__']
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            result[full] = os.stat(full).st_mtime_ns
+    return result
+
+
+def run(runs, bytecode=True):
+    env = dict(os.environ)
+    if bytecode:
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+    else:
+        env['PYTHONDONTWRITEBYTECODE'] = '1'
+    probe = [sys.executable, '-c', PROBE.format(root=ROOT)]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        sample = os.path.join(workdir, 'x.ghdl')
+        with open(sample, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE)
+
+        # 预热一次，生成字节码缓存
+        subprocess.run(probe, cwd=workdir, env=env, capture_output=True, check=True)
+
+        src_before = snapshot(os.path.join(ROOT, 'src'))
+        cwd_before = set(os.listdir(workdir))
+
+        pre_lex = []
+        for _ in range(runs):
+            out = subprocess.run(probe, cwd=workdir, env=env,
+                                 capture_output=True, text=True, check=True)
+            pre_lex.append(float(out.stdout.strip().splitlines()[-1]))
+
+        # 整个进程的墙钟时间（含解释器启动与编译）
+        baseline, total = [], []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, '-c', 'pass'], env=env, check=True)
+            baseline.append((time.perf_counter() - t0) * 1000.0)
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, os.path.join(ROOT, 'gracehdl_compiler.py'), sample],
+                           cwd=workdir, env=env, capture_output=True, check=True)
+            total.append((time.perf_counter() - t0) * 1000.0)
+
+        written = (set(os.listdir(workdir)) - cwd_before) - {'x.v'}
+        src_changed = snapshot(os.path.join(ROOT, 'src')) != src_before
+
+    print(f"运行次数: {runs}  字节码缓存: {'启用' if bytecode else '禁用'}")
+    print(f"词法分析前耗时 (导入+构建): 中位数 {statistics.median(pre_lex):.1f} ms, "
+          f"最大 {max(pre_lex):.1f} ms")
+    print(f"解释器空启动: 中位数 {statistics.median(baseline):.1f} ms")
+    print(f"完整编译进程: 中位数 {statistics.median(total):.1f} ms")
+    print(f"工作目录新增文件: {sorted(written) or '无'}")
+    print(f"src目录被修改: {'是' if src_changed else '否'}")
+    return statistics.median(pre_lex) < 100.0 and not written and not src_changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL冷启动基准测试')
+    parser.add_argument('-n', '--runs', type=int, default=10, help='运行次数')
+    parser.add_argument('--no-bytecode', action='store_true', help='禁用字节码缓存')
+    args = parser.parse_args()
+    ok = run(args.runs, bytecode=not args.no_bytecode)
+    print('通过' if ok else '未通过')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
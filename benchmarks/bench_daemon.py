@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+编译守护进程延迟基准测试
+对同一个小模块比较三种方式的单文件编译延迟（中位数）：
+  - 每次启动编译器进程: python gracehdl_compiler.py x.ghdl
+  - 每次启动瘦客户端进程: python gracehdl_daemon.py client x.ghdl
+  - 已连接的调用方直接发送请求: gracehdl_daemon.request_compile()
+
+用法: python benchmarks/bench_daemon.py [-n 次数]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from gracehdl_daemon import request_compile
+
+SAMPLE = """module and_gate:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a & b
+"""
+
+
+def median_ms(func, runs):
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def wait_for(path, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if time.monotonic() > deadline:
+            raise RuntimeError(f'守护进程未在 {timeout:.0f} 秒内启动')
+        time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL编译守护进程延迟基准测试')
+    parser.add_argument('-n', '--runs', type=int, default=20, help='运行次数')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        sample = os.path.join(workdir, 'x.ghdl')
+        output = os.path.join(workdir, 'x.v')
+        with open(sample, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE)
+        socket_path = os.path.join(workdir, 'gracehdl.sock')
+        env = dict(os.environ, GRACEHDL_SOCKET=socket_path)
+
+        def run(*command):
+            subprocess.run([sys.executable, *command], cwd=workdir, env=env,
+                           capture_output=True, check=True)
+
+        cold = median_ms(lambda: run(os.path.join(ROOT, 'gracehdl_compiler.py'), sample), args.runs)
+
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, 'gracehdl_daemon.py'), 'serve', '-j', '1'],
+                                  cwd=workdir, env=env, stdout=subprocess.DEVNULL)
+        try:
+            wait_for(socket_path)
+            client = median_ms(lambda: run(os.path.join(ROOT, 'gracehdl_daemon.py'), 'client', sample), args.runs)
+            request = {'input': sample, 'output': output}
+            direct = median_ms(lambda: request_compile(request, socket_path), args.runs)
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"运行次数: {args.runs}")
+    print(f"编译器进程:     中位数 {cold:.1f} ms")
+    print(f"瘦客户端进程:   中位数 {client:.1f} ms")
+    print(f"直接发送请求:   中位数 {direct:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
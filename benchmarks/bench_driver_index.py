@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+驱动索引基准测试
+对有数千个输出端口、每个端口由always块中一条语句驱动的模块计时代码生成，
+端口类型推断查询驱动索引，每个端口的平均耗时应不随端口数增长。
+
+用法: python benchmarks/bench_driver_index.py [--ports 500,1000,2000,4000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.parser import GraceHDLParser
+from src.verilog_generator import VerilogGenerator
+from synthetic import synth_wide_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL驱动索引基准测试')
+    parser.add_argument('--ports', default='500,1000,2000,4000', help='逗号分隔的输出端口数量')
+    args = parser.parse_args()
+
+    grace_parser = GraceHDLParser()
+    grace_parser.build()
+    generator = VerilogGenerator()
+
+    print(f"{'端口数':>10} {'生成(s)':>10} {'每端口(us)':>12} {'reg端口':>10}")
+    for ports in (int(n) for n in args.ports.split(',')):
+        ast = grace_parser.parse(synth_wide_module(ports))
+        start = time.perf_counter()
+        code = generator.generate(ast)
+        elapsed = time.perf_counter() - start
+        print(f"{ports:>10} {elapsed:>10.3f} {elapsed / ports * 1e6:>12.1f} {code.count('output reg'):>10}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+代码生成内存基准测试
+比较先生成完整字符串再写文件（generate）与流式写入文件（generate_to）的峰值内存。
+只统计代码生成和写入阶段新增的内存（AST已提前构建），
+流式写入的峰值应基本不随输出大小增长。
+
+用法: python benchmarks/bench_emit_memory.py [--modules 50,200,800]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.parser import GraceHDLParser
+from src.verilog_generator import VerilogGenerator
+from synthetic import synth_module
+
+
+def peak_memory(func):
+    """返回func执行期间相对开始时的峰值内存（字节）"""
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        func()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL代码生成内存基准测试')
+    parser.add_argument('--modules', default='50,200,800', help='逗号分隔的合成模块数量')
+    args = parser.parse_args()
+
+    grace_parser = GraceHDLParser()
+    grace_parser.build()
+    generator = VerilogGenerator()
+
+    print(f"{'模块数':>10} {'输出(KB)':>10} {'generate(KB)':>14} {'generate_to(KB)':>16}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'out.v')
+
+        def write_string():
+            code = generator.generate(ast)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(code)
+
+        def write_stream():
+            with open(path, 'w', encoding='utf-8') as f:
+                generator.generate_to(ast, f)
+
+        for count in (int(n) for n in args.modules.split(',')):
+            lines = []
+            for index in range(count):
+                lines += synth_module(index)
+            ast = grace_parser.parse('\n'.join(lines) + '\n')
+            joined = peak_memory(write_string)
+            streamed = peak_memory(write_stream)
+            size = os.path.getsize(path)
+            print(f"{count:>10} {size / 1024:>10.0f} {joined / 1024:>14.0f} {streamed / 1024:>16.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+接口扫描基准测试
+比较完整语法分析与接口扫描（只分析模块头和 parameter/input/output 段）的耗时，
+分别使用接口占比较大的ALU设计和always段很长的合成设计。
+
+用法: python benchmarks/bench_interface_scan.py [--modules 100] [-n 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from gracehdl_compiler import GraceHDLCompiler
+from synthetic import synth_alu_source, synth_body_heavy_source
+
+
+def best_of(func, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL接口扫描基准测试')
+    parser.add_argument('--modules', type=int, default=100, help='模块数')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='重复次数')
+    args = parser.parse_args()
+
+    compiler = GraceHDLCompiler()
+    print(f"{'设计':<12}{'行数':>10}{'完整分析(ms)':>16}{'接口扫描(ms)':>16}{'加速':>10}")
+    for name, source in (('alu', synth_alu_source(args.modules)),
+                         ('body-heavy', synth_body_heavy_source(args.modules))):
+        assert len(compiler.parser.scan_interfaces(source)) == args.modules
+        full = best_of(lambda: compiler._parse(source), args.runs)
+        scan = best_of(lambda: compiler.parser.scan_interfaces(source), args.runs)
+        print(f"{name:<12}{source.count(chr(10)):>10}{full * 1000:>16.1f}{scan * 1000:>16.1f}{full / scan:>9.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+词法分析基准测试
+比较单遍前向缩进处理（forward）与旧的回退重扫实现（rewind）的速度，
+并确认两者产生相同的token流。
+
+用法: python benchmarks/bench_lexer.py [--lines 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.lexer import GraceHDLLexer
+from synthetic import synth_source
+
+
+def token_stream(mode, source):
+    """逐个产生 (类型, 值, 行号)"""
+    lexer = GraceHDLLexer(indent_mode=mode)
+    lexer.build()
+    lexer.input(source)
+    while True:
+        tok = lexer.token()
+        if not tok:
+            return
+        yield tok.type, tok.value, tok.lineno
+
+
+def time_lexing(mode, source, repeat=3):
+    """返回 (token数, 最短耗时秒)；只计数不保存token，与语法分析时的用法一致"""
+    lexer = GraceHDLLexer(indent_mode=mode)
+    lexer.build()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        lexer.input(source)
+        token = lexer.token
+        count = 0
+        while token():
+            count += 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return count, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL词法分析基准测试')
+    parser.add_argument('--lines', type=int, default=100000, help='合成源文件行数')
+    args = parser.parse_args()
+
+    source = synth_source(args.lines)
+    print(f"合成源文件: {source.count(chr(10))} 行, {len(source)} 字节")
+
+    rewind_count, rewind_time = time_lexing('rewind', source)
+    forward_count, forward_time = time_lexing('forward', source)
+    same = all(a == b for a, b in zip(token_stream('rewind', source), token_stream('forward', source)))
+    same = same and rewind_count == forward_count
+
+    speedup = rewind_time / forward_time
+    print(f"rewind:  {rewind_count} tokens, {rewind_time:.3f} s")
+    print(f"forward: {forward_count} tokens, {forward_time:.3f} s")
+    print(f"加速比: {speedup:.2f}x  token流一致: {'是' if same else '否'}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+并行语法分析基准测试
+比较串行分析与按顶层项切分后多进程分析同一个多模块大文件的耗时。
+进程池在计时前预热，结果不含工作进程的启动时间。
+
+用法: python benchmarks/bench_parallel_parse.py [--modules 200] [-j 4] [-n 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_serializer import dump_ast
+from src.parallel_parse import ParallelParser
+from synthetic import synth_alu_source, synth_body_heavy_source
+
+
+def best_of(func, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL并行语法分析基准测试')
+    parser.add_argument('--modules', type=int, default=200, help='模块数')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='并行进程数')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='重复次数')
+    args = parser.parse_args()
+
+    compiler = GraceHDLCompiler()
+    parallel = ParallelParser(compiler.parser, max(args.jobs, 2))
+    print(f"CPU核数: {os.cpu_count()}, 进程数: {parallel.jobs}")
+    print(f"{'设计':<12}{'行数':>10}{'串行(ms)':>12}{'并行(ms)':>12}{'加速':>10}")
+    try:
+        for name, source in (('alu', synth_alu_source(args.modules)),
+                             ('body-heavy', synth_body_heavy_source(args.modules))):
+            # 预热进程池，并确认结果与串行分析一致
+            assert dump_ast(parallel.parse(source)) == dump_ast(compiler._parse(source))
+            serial = best_of(lambda: compiler._parse(source), args.runs)
+            elapsed = best_of(lambda: parallel.parse(source), args.runs)
+            print(f"{name:<12}{source.count(chr(10)):>10}{serial * 1000:>12.1f}"
+                  f"{elapsed * 1000:>12.1f}{serial / elapsed:>9.2f}x")
+    finally:
+        parallel.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
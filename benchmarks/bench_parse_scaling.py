@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+语法分析规模基准测试
+对包含1k到200k条语句的assign段/run块计时，检查每条语句的平均耗时
+不随规模增长（即语法分析时间与语句数呈线性关系）。
+
+用法: python benchmarks/bench_parse_scaling.py [--kind assign|run] [--sizes 1000,10000,...]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.parser import GraceHDLParser
+from synthetic import synth_statement_block
+
+DEFAULT_SIZES = (1000, 5000, 20000, 50000, 100000, 200000)
+
+# 最大规模下每条语句耗时允许相对最小规模增长的倍数
+LINEAR_TOLERANCE = 2.0
+
+
+def time_parse(parser, source, repeat=1):
+    """返回 (AST, 最短耗时秒)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ast = parser.parse(source)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return ast, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL语法分析规模基准测试')
+    parser.add_argument('--kind', choices=('assign', 'run'), default='assign', help='语句块类型')
+    parser.add_argument('--sizes', default=','.join(str(n) for n in DEFAULT_SIZES),
+                        help='逗号分隔的语句数量')
+    parser.add_argument('-n', '--repeat', type=int, default=1, help='每个规模重复次数（取最短）')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    grace_parser = GraceHDLParser()
+    grace_parser.build()
+
+    per_statement = []
+    print(f"{'语句数':>10} {'耗时(s)':>10} {'每条(us)':>10}")
+    for size in sizes:
+        ast, elapsed = time_parse(grace_parser, synth_statement_block(size, args.kind), args.repeat)
+        if ast is None:
+            print(f"语法分析失败: {size} 条语句")
+            return 1
+        per_statement.append(elapsed / size * 1e6)
+        print(f"{size:>10} {elapsed:>10.3f} {per_statement[-1]:>10.2f}")
+
+    growth = per_statement[-1] / per_statement[0]
+    linear = growth <= LINEAR_TOLERANCE
+    print(f"每条语句耗时增长: {growth:.2f}x  线性: {'是' if linear else '否'}")
+    return 0 if linear else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
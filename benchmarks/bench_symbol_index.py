@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+符号数据库基准测试
+在临时目录中生成 --files 个ALU模块文件和一个实例化所有ALU的顶层文件，比较：
+建立数据库、无修改时的增量更新、修改一个文件后的增量更新，
+以及"谁实例化了X"查询与重新分析所有文件回答同一问题的耗时。
+
+用法: python benchmarks/bench_symbol_index.py [--files 200] [-n 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.linker import find_instantiations
+from src.symbol_index import SymbolIndex
+from synthetic import ALU_TEMPLATE
+
+
+def top_source(count):
+    lines = ["module top:", "    input(", "        wire(7, 0) a,", "        wire(7, 0) b,",
+             "        wire(2, 0) op", "    )", "    output(", "        wire zero", "    )"]
+    lines += [f"    alu{index} u{index}(.a(a), .b(b), .op(op), .zero(zero))" for index in range(count)]
+    return '\n'.join(lines) + '\n'
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def reparse_instantiators(compiler, root, name):
+    """不使用数据库：重新分析所有文件查找实例"""
+    found = []
+    for path in sorted(Path(root).glob('*.ghdl')):
+        ast = compiler._parse(path.read_text(encoding='utf-8'))
+        for module in ast.modules:
+            found += [(module.name, instance.instance_name) for instance in find_instantiations(module.sections)
+                      if instance.module_name == name]
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL符号数据库基准测试')
+    parser.add_argument('--files', type=int, default=200, help='ALU文件数')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='查询重复次数')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        for index in range(args.files):
+            Path(root, f'alu{index}.ghdl').write_text(ALU_TEMPLATE.format(index=index), encoding='utf-8')
+        Path(root, 'top.ghdl').write_text(top_source(args.files), encoding='utf-8')
+        index = SymbolIndex(os.path.join(root, 'symbols.sqlite'))
+
+        build, counts = timed(lambda: index.update(root))
+        print(f"建立数据库: {build * 1000:.1f} ms  (索引 {counts[0]} 个文件)")
+        noop, counts = timed(lambda: index.update(root))
+        print(f"无修改的增量更新: {noop * 1000:.1f} ms  ({counts[2]} 个文件未改变)")
+        Path(root, 'alu0.ghdl').write_text(ALU_TEMPLATE.format(index=0).replace('wire zero', 'wire(1, 0) zero'),
+                                           encoding='utf-8')
+        one, counts = timed(lambda: index.update(root))
+        print(f"修改一个文件后的增量更新: {one * 1000:.1f} ms  (重新索引 {counts[0]} 个文件)")
+
+        target = f'alu{args.files // 2}'
+        compiler = GraceHDLCompiler()
+        expected = [(parent, instance) for parent, instance, _ in index.instantiators(target)]
+        assert reparse_instantiators(compiler, root, target) == expected
+        query = min(timed(lambda: index.instantiators(target))[0] for _ in range(args.runs))
+        reparse = min(timed(lambda: reparse_instantiators(compiler, root, target))[0] for _ in range(args.runs))
+        print(f"谁实例化了{target}: 查询 {query * 1e6:.0f} us, 重新分析所有文件 {reparse * 1000:.1f} ms "
+              f"({reparse / query:.0f}x)")
+        index.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
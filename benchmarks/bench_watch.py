@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+监视模式延迟基准测试
+在后台线程中运行 watch_directory，反复修改目录中的一个文件，
+测量从写入源文件到输出文件内容更新的时间（编辑到Verilog的延迟）。
+
+用法: python benchmarks/bench_watch.py [--files 200] [-n 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from gracehdl_compiler import GraceHDLCompiler
+from synthetic import ALU_TEMPLATE
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraceHDL监视模式延迟基准测试')
+    parser.add_argument('--files', type=int, default=200, help='目录中的文件数')
+    parser.add_argument('-n', '--runs', type=int, default=20, help='修改次数')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        src = Path(workdir) / 'src'
+        build = Path(workdir) / 'build'
+        src.mkdir()
+        for index in range(args.files):
+            (src / f'alu{index}.ghdl').write_text(ALU_TEMPLATE.format(index=index), encoding='utf-8')
+        target = src / 'alu0.ghdl'
+        output = build / 'alu0.v'
+        base = target.read_text(encoding='utf-8')
+
+        stop = threading.Event()
+        compiler = GraceHDLCompiler()
+        log = StringIO()
+
+        def watch():
+            with redirect_stdout(log):
+                compiler.watch_directory(str(src), str(build), jobs=1, stop=stop)
+
+        thread = threading.Thread(target=watch)
+        thread.start()
+        latencies = []
+        try:
+            while not log.getvalue():
+                time.sleep(0.01)
+            for run in range(args.runs):
+                # 重命名模块，输出内容随之改变
+                marker = f'edited{run}'
+                start = time.perf_counter()
+                target.write_text(base.replace('module alu0:', f'module {marker}:', 1), encoding='utf-8')
+                while True:
+                    try:
+                        if marker in output.read_text(encoding='utf-8'):
+                            break
+                    except OSError:
+                        pass
+                    time.sleep(0.001)
+                latencies.append((time.perf_counter() - start) * 1000.0)
+                time.sleep(0.1)
+        finally:
+            stop.set()
+            thread.join()
+
+    print(f"文件数: {args.files}  修改次数: {args.runs}")
+    print(f"编辑到输出的延迟: 中位数 {statistics.median(latencies):.1f} ms, 最大 {max(latencies):.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
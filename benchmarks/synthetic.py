@@ -0,0 +1,146 @@
+"""
+基准测试用的合成GraceHDL源代码生成器
+"""
+
+
+def synth_module(index, run_branches=20, assigns=10):
+    """生成一个包含run/assign段的模块，返回行列表"""
+    lines = [
+        f"module m{index}:",
+        "    input(",
+        "        wire clk,",
+        "        wire(7, 0) a",
+        "    )",
+        "    run (clk.posedge):",
+    ]
+    for j in range(run_branches):
+        lines += [
+            f"        if a == (3, d, 8):",
+            f"            r{j} = a + (1, d, 8)",
+            "        else:",
+            f"            r{j} = b{j} & a  # 注释",
+        ]
+    lines.append("    assign:")
+    for j in range(assigns):
+        lines.append(f"        y{j} = a ^ b{j}")
+    lines.append("")
+    return lines
+
+
+def synth_source(line_count):
+    """生成至少line_count行的多模块源代码"""
+    lines = []
+    index = 0
+    while len(lines) < line_count:
+        lines += synth_module(index)
+        index += 1
+    return '\n'.join(lines[:line_count]) + '\n'
+
+
+def synth_statement_block(count, kind='assign'):
+    """生成单个模块，其assign段（kind='assign'）或run块（kind='run'）包含count条语句"""
+    lines = [
+        "module big:",
+        "    input(",
+        "        wire clk,",
+        "        wire(7, 0) a",
+        "    )",
+    ]
+    if kind == 'assign':
+        lines.append("    assign:")
+        lines += [f"        y{i} = a ^ b{i}" for i in range(count)]
+    elif kind == 'run':
+        lines.append("    run (clk.posedge):")
+        lines += [f"        r{i} = a + b{i}" for i in range(count)]
+    else:
+        raise ValueError(f"未知的语句块类型: {kind}")
+    return '\n'.join(lines) + '\n'
+
+
+def synth_wide_module(port_count):
+    """生成有port_count个输出端口的模块，每个端口由always块中的一条语句驱动"""
+    lines = [
+        "module wide:",
+        "    input(",
+        "        wire(7, 0) a",
+        "    )",
+        "    output(",
+    ]
+    lines += [f"        wire(7, 0) o{i}," for i in range(port_count - 1)]
+    lines += [f"        wire(7, 0) o{port_count - 1}", "    )", "    always:"]
+    lines += [f"        o{i} = a + (1, d, 8)" for i in range(port_count)]
+    return '\n'.join(lines) + '\n'
+
+
+# examples/alu.ghdl 的ALU，按当前语法改写
+ALU_TEMPLATE = """module alu{index}:
+    input(
+        wire(7, 0) a,
+        wire(7, 0) b,
+        wire(2, 0) op
+    )
+    output(
+        wire(7, 0) result,
+        wire zero,
+        wire parity
+    )
+    always:
+        case op:
+            (0, d, 3):
+                result = a + b
+            (1, d, 3):
+                result = a - b
+            (2, d, 3):
+                result = a & b
+            (3, d, 3):
+                result = a | b
+            (4, d, 3):
+                result = a ^ b
+            (5, d, 3):
+                result = ~a
+            (6, d, 3):
+                result = (a << (1, d, 8)) | (b >> (7, d, 8))
+            (7, d, 3):
+                result = (a >> (1, d, 8)) & ~(b << (7, d, 8))
+            default:
+                result = (0, d, 8)
+    assign:
+        zero = (result == (0, d, 8))
+        parity = ((result & (1, h, 8)) != (0, d, 8)) ^ ((result & (2, h, 8)) != (0, d, 8))
+"""
+
+
+def synth_alu_source(copies):
+    """生成copies个ALU模块"""
+    return '\n'.join(ALU_TEMPLATE.format(index=index) for index in range(copies))
+
+
+def synth_body_heavy_source(modules, branches=100):
+    """生成modules个模块，每个模块接口很小，always段的case语句包含branches个分支"""
+    parts = []
+    for index in range(modules):
+        lines = [
+            f"module body{index}:",
+            "    parameter(WIDTH = 8)",
+            "    input(",
+            "        wire(7, 0) a,",
+            "        wire(7, 0) b,",
+            "        wire(7, 0) op",
+            "    )",
+            "    output(",
+            "        wire(7, 0) y",
+            "    )",
+            "    always:",
+            "        case op:",
+        ]
+        for j in range(branches):
+            lines += [
+                f"            ({j % 256}, d, 8):",
+                f"                y = (a + b) ^ (a & ({j % 256}, d, 8))",
+            ]
+        lines += [
+            "            default:",
+            "                y = (0, d, 8)",
+        ]
+        parts.append('\n'.join(lines) + '\n')
+    return '\n'.join(parts)
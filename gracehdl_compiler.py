@@ -5,37 +5,152 @@ GraceHDL编译器主程序
 """
 
 import argparse
+import json
 import sys
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+from io import StringIO
 from pathlib import Path
 from colorama import init, Fore, Style
 
 # 添加src目录到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from src.ast_nodes import ExpressionInterner
+from src.ast_serializer import ASTCache
+from src.build_cache import BuildCache, DEFAULT_CACHE_DIR
+from src.cse import DEFAULT_MIN_SIZE, DEFAULT_MIN_USES, CommonSubexpressionExtractor
 from src.lexer import GraceHDLLexer
+from src.linker import ModuleLinker
+from src.loop_lowering import DEFAULT_UNROLL_LIMIT
+from src.parallel_parse import ParallelParser
 from src.parser import GraceHDLParser
-from src.verilog_generator import VerilogGenerator
+from src.profiler import CompileProfiler, LineCountingSink, TokenReplay, count_ast_nodes
+from src.reachability import prune_unreachable
+from src.specializer import ModuleSpecializer
+from src.verilog_generator import PAREN_STYLES, VerilogGenerator
+from src.watcher import DEFAULT_INTERVAL, DEFAULT_SETTLE, DirectoryWatcher, content_hash
+
+VERSION = '1.0.0'
+
+# configure()接受的编译选项，与同名的命令行选项对应
+COMPILE_OPTIONS = ('link', 'specialize', 'top', 'cse', 'unroll_limit', 'paren', 'share_expressions')
 
 # 初始化colorama
 init()
 
+
+def _no_phase(name):
+    """未开启性能分析时的空阶段"""
+    return nullcontext()
+
 class GraceHDLCompiler:
     """GraceHDL编译器"""
     
     def __init__(self):
-        self.lexer = GraceHDLLexer()
-        self.lexer.build()
         self.parser = GraceHDLParser()
-        self.parser.build(debug=False)
+        self.parser.build()
+        # 复用语法分析器已构建的词法分析器，避免重复构建
+        self.lexer = self.parser.lexer
         self.generator = VerilogGenerator()
+        # 性能分析器（--profile），为None时不记录
+        self.profiler = None
+        # AST缓存，为None时总是重新分析
+        self.ast_cache = None
+        # 单个文件内按顶层项并行分析（--parse-jobs），为None时串行分析
+        self.parallel_parser = None
+        # 目录编译时的跨文件模块链接检查（--link），为None时不检查
+        self.linker = None
+        # 参数特化（--specialize），为None时保持通用的参数化输出
+        self.specializer = None
+        # 顶层模块名列表（--top），只输出从它们可达的模块；为None时输出所有项
+        self.tops = None
+        # 公共子表达式提取（--cse），为None时不提取
+        self.cse = None
+
+    def cache_options(self):
+        """影响生成结果的编译选项，作为构建缓存键的一部分"""
+        options = {}
+        if self.specializer is not None:
+            options['specialize'] = True
+        if self.tops:
+            options['top'] = tuple(sorted(self.tops))
+        if self.cse is not None:
+            options['cse'] = self.cse.options()
+        if self.generator.unroll_limit != DEFAULT_UNROLL_LIMIT:
+            options['unroll_limit'] = self.generator.unroll_limit
+        if self.generator.parentheses != 'minimal':
+            options['paren'] = self.generator.parentheses
+        return options
+
+    def share_expressions(self):
+        """开启表达式结构共享（--share-expressions）：语法分析时结构相同的表达式只保留一个节点，
+        代码生成时共享节点的文本只生成一次。输出与不共享时完全相同"""
+        self.parser.interner = ExpressionInterner()
+        self.generator.shared_expressions = True
+
+    def generator_options(self):
+        """代码生成器的选项，传给并行编译的工作进程"""
+        return {'unroll_limit': self.generator.unroll_limit, 'parentheses': self.generator.parentheses}
+
+    def configure(self, options):
+        """按选项字典设置编译选项（命令行选项、守护进程请求中的options）
+
+        键见COMPILE_OPTIONS：link / specialize / share_expressions 为布尔值，top 为模块名列表，
+        cse 为True或 [最少节点数, 最少出现次数]，unroll_limit 为整数，paren 为 PAREN_STYLES 之一。
+        未给出或为空的选项保持默认；选项无效时抛出ValueError。
+        """
+        unknown = sorted(set(options) - set(COMPILE_OPTIONS))
+        if unknown:
+            raise ValueError(f"未知的编译选项: {', '.join(unknown)}")
+        top = options.get('top')
+        if top and not (isinstance(top, list) and all(isinstance(name, str) for name in top)):
+            raise ValueError("top 必须是模块名列表")
+        cse = options.get('cse')
+        if cse and cse is not True and not (isinstance(cse, list) and len(cse) == 2
+                                            and all(type(value) is int for value in cse)):
+            raise ValueError("cse 必须是 true 或 [最少节点数, 最少出现次数]")
+        unroll_limit = options.get('unroll_limit')
+        if unroll_limit is not None and type(unroll_limit) is not int:
+            raise ValueError("unroll_limit 必须是整数")
+        paren = options.get('paren')
+        if paren is not None and paren not in PAREN_STYLES:
+            raise ValueError(f"paren 必须是 {' / '.join(PAREN_STYLES)} 之一")
+
+        if options.get('link'):
+            self.linker = ModuleLinker()
+        if options.get('specialize'):
+            self.specializer = ModuleSpecializer()
+        if top:
+            self.tops = list(top)
+        if cse:
+            self.cse = CommonSubexpressionExtractor(*(() if cse is True else cse))
+        if unroll_limit is not None:
+            self.generator.unroll_limit = unroll_limit
+        if paren is not None:
+            self.generator.parentheses = paren
+        if options.get('share_expressions'):
+            self.share_expressions()
 
-    def compile_file(self, input_file, output_file=None, verbose=False):
-        """编译单个文件"""
+    def compile_file(self, input_file, output_file=None, verbose=False, source_code=None):
+        """编译单个文件
+
+        source_code为已读入的源代码（如守护进程收到的内联文本）时不读取input_file，
+        input_file只用于显示和推导默认的输出文件名。
+        """
+        profiler = self.profiler
+        phase = profiler.phase if profiler is not None else _no_phase
         try:
+            if profiler is not None:
+                record = profiler.start_file(input_file)
+            
             # 读取输入文件
-            with open(input_file, 'r', encoding='utf-8') as f:
-                source_code = f.read()
+            with phase('read'):
+                if source_code is None:
+                    with open(input_file, 'r', encoding='utf-8') as f:
+                        source_code = f.read()
             
             if verbose:
                 print(f"{Fore.BLUE}正在编译: {input_file}{Style.RESET_ALL}")
@@ -48,28 +163,40 @@ class GraceHDLCompiler:
             if verbose:
                 print(f"{Fore.YELLOW}语法分析中...{Style.RESET_ALL}")
             
-            # 设置词法分析器输入
-            self.lexer.input(source_code)
-            ast = self.parser.parser.parse(source_code, lexer=self.lexer, debug=False)
+            ast = self._parse(source_code, phase)
             
             if ast is None:
                 print(f"{Fore.RED}语法分析失败{Style.RESET_ALL}")
                 return False
             
+            if self.linker is not None:
+                self.linker.add(ast, str(input_file))
+            
+            if self.tops:
+                ast = self._prune(ast, output_file)
+                if ast is None:
+                    return False
+            
+            if self.specializer is not None:
+                ast = self.specializer.specialize(ast, self.tops)
+            
+            if self.cse is not None:
+                ast = self.cse.extract(ast)
+            
             # 代码生成
             if verbose:
                 print(f"{Fore.YELLOW}生成Verilog代码中...{Style.RESET_ALL}")
             
-            verilog_code = self.generator.generate(ast)
-            
             # 确定输出文件名
             if output_file is None:
                 input_path = Path(input_file)
                 output_file = input_path.with_suffix('.v')
             
-            # 写入输出文件
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(verilog_code)
+            # 边生成边写入输出文件
+            self._emit_output(ast, str(output_file), phase)
+            
+            if profiler is not None:
+                record.ast_nodes = count_ast_nodes(ast)
             
             if verbose:
                 print(f"{Fore.GREEN}编译成功: {output_file}{Style.RESET_ALL}")
@@ -83,8 +210,108 @@ class GraceHDLCompiler:
             print(f"{Fore.RED}编译错误: {str(e)}{Style.RESET_ALL}")
             return False
 
-    def compile_directory(self, input_dir, output_dir=None, verbose=False):
-        """编译目录中的所有.ghdl文件"""
+    def _prune(self, ast, output_file=None):
+        """只保留从顶层模块可达的项并报告删除的项，找不到顶层模块时返回None"""
+        defined = {module.name for module in ast.modules}
+        missing = [top for top in self.tops if top not in defined]
+        if missing:
+            print(f"{Fore.RED}错误: 找不到顶层模块 {', '.join(missing)}{Style.RESET_ALL}")
+            return None
+        ast, pruned = prune_unreachable(ast, self.tops)
+        if pruned:
+            # 输出到标准输出时，报告写到标准错误，不混入生成的代码
+            report = sys.stderr if output_file == '-' else sys.stdout
+            print(f"{Fore.BLUE}已删除 {len(pruned)} 个不可达的项: {', '.join(pruned)}{Style.RESET_ALL}", file=report)
+        return ast
+
+    def _parse(self, source_code, phase=_no_phase):
+        """词法分析和语法分析，返回AST（失败时为None）
+
+        启用AST缓存时，源代码未改变则直接加载缓存的AST；
+        只缓存没有报告任何词法或语法错误的结果，以免跳过错误信息。
+        """
+        cache = self.ast_cache
+        if cache is not None:
+            key = cache.key(source_code.encode('utf-8'))
+            with phase('parse'):
+                ast = cache.load_ast(key)
+            if ast is not None:
+                return ast
+        
+        self.parser.error_count = 0
+        if self.profiler is not None:
+            # 性能分析时先完成词法分析，再把token交给语法分析器，分别计时
+            with phase('lex'):
+                tokens = self._tokenize(source_code)
+            self.profiler.current.tokens = len(tokens)
+            with phase('parse'):
+                ast = self.parser.parser.parse(lexer=TokenReplay(tokens), debug=False)
+        elif self.parallel_parser is not None:
+            ast = self.parallel_parser.parse(source_code)
+        else:
+            # 设置词法分析器输入
+            self.lexer.input(source_code)
+            ast = self.parser.parser.parse(source_code, lexer=self.lexer, debug=False)
+        if self.parser.interner is not None:
+            # 共享表只在一个文件内使用，分析完即释放
+            self.parser.interner.clear()
+        
+        if cache is not None and ast is not None and not self.parser.error_count and not self.lexer.error_count:
+            cache.store_ast(key, ast)
+        return ast
+
+    def _emit_output(self, ast, output_file, phase=_no_phase):
+        """把生成的Verilog代码流式写入输出文件，output_file为'-'时写到标准输出
+
+        先写入临时文件，全部生成成功后再替换目标文件，失败时不留下不完整的输出。
+        """
+        if output_file == '-':
+            with phase('generate'):
+                self._generate_to(ast, sys.stdout)
+            with phase('write'):
+                sys.stdout.write('\n')
+                sys.stdout.flush()
+            return
+        
+        tmp_file = output_file + '.tmp'
+        f = open(tmp_file, 'w', encoding='utf-8')
+        try:
+            with phase('generate'):
+                self._generate_to(ast, f)
+            with phase('write'):
+                f.close()
+                os.replace(tmp_file, output_file)
+        finally:
+            if not f.closed:
+                f.close()
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def _generate_to(self, ast, sink):
+        """生成代码写入sink，性能分析时同时统计输出行数"""
+        if self.profiler is None:
+            self.generator.generate_to(ast, sink)
+            return
+        counter = LineCountingSink(sink)
+        self.generator.generate_to(ast, counter)
+        self.profiler.current.output_lines = counter.lines
+        self.profiler.current.loops = list(self.generator.loop_records.values())
+
+    def _tokenize(self, source_code):
+        """完成词法分析，返回全部token"""
+        self.lexer.input(source_code)
+        return list(iter(self.lexer.token, None))
+
+    def compile_directory(self, input_dir, output_dir=None, verbose=False, jobs=1, cache_dir=None):
+        """编译目录中的所有.ghdl文件
+
+        jobs大于1时使用多进程并行编译，每个进程只构建一次编译器；
+        各文件的输出按文件顺序打印，结果与串行编译一致。
+        指定cache_dir时启用构建缓存，内容未变的文件直接使用缓存的输出。
+        开启性能分析时总是串行编译，以便在本进程中记录每个文件的数据。
+        设置了linker时，所有文件编译完成后检查跨文件的模块实例，
+        使用缓存输出的文件从AST缓存加载（或重新分析）AST以收集链接信息。
+        """
         input_path = Path(input_dir)
         if not input_path.is_dir():
             print(f"{Fore.RED}错误: '{input_dir}' 不是一个目录{Style.RESET_ALL}")
@@ -100,26 +327,230 @@ class GraceHDLCompiler:
         if verbose:
             print(f"{Fore.BLUE}找到 {len(ghdl_files)} 个.ghdl文件{Style.RESET_ALL}")
         
+        cache = BuildCache(cache_dir, VERSION, self.cache_options()) if cache_dir else None
+        if cache is not None and self.ast_cache is None:
+            # 输出缓存未命中（如只修改了代码生成器）时，源文件未改变仍可跳过语法分析
+            self.ast_cache = ASTCache(Path(cache_dir) / 'ast')
+        if self.linker is not None:
+            self.linker.take()
         success_count = 0
-        
+        tasks = []
+        cache_keys = []
         for ghdl_file in ghdl_files:
-            # 确定输出文件路径
-            if output_dir:
-                output_path = Path(output_dir)
-                relative_path = ghdl_file.relative_to(input_path)
-                output_file = output_path / relative_path.with_suffix('.v')
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-            else:
-                output_file = ghdl_file.with_suffix('.v')
+            output_file = self._output_path(ghdl_file, input_path, output_dir)
             
-            if self.compile_file(str(ghdl_file), str(output_file), verbose):
-                success_count += 1
+            if cache is not None:
+                hit, key = self._load_cached(cache, ghdl_file, output_file, verbose)
+                if hit:
+                    success_count += 1
+                    if self.linker is not None:
+                        self._link_cached(ghdl_file)
+                    continue
+                cache_keys.append(key)
+            tasks.append((str(ghdl_file), str(output_file), verbose))
+        
+        jobs = min(jobs or 1, len(tasks)) if self.profiler is None else 1
+        if jobs > 1:
+            ast_cache_dir = str(self.ast_cache.cache_dir) if self.ast_cache is not None else None
+            results = self._compile_parallel(tasks, jobs, ast_cache_dir, self.linker, self.specializer is not None,
+                                             self.generator_options(), self.parser.interner is not None,
+                                             self.cse.options() if self.cse is not None else None)
+        else:
+            results = [self.compile_file(*task) for task in tasks]
+        success_count += sum(1 for success in results if success)
+        
+        if cache is not None:
+            # 只缓存编译成功的输出，失败的文件下次仍会重新编译并报告错误
+            for key, task, success in zip(cache_keys, tasks, results):
+                if success and key:
+                    cache.store(key, Path(task[1]).read_bytes())
+            print(f"{Fore.BLUE}{cache.summary()}{Style.RESET_ALL}")
+        
+        linked = self._report_link_errors() if self.linker is not None else True
         
         print(f"{Fore.GREEN}编译完成: {success_count}/{len(ghdl_files)} 个文件成功{Style.RESET_ALL}")
-        return success_count == len(ghdl_files)
+        return success_count == len(ghdl_files) and linked
+
+    def _link_cached(self, ghdl_file):
+        """为使用缓存输出的文件收集链接信息"""
+        with open(ghdl_file, 'r', encoding='utf-8') as f:
+            ast = self._parse(f.read())
+        if ast is not None:
+            self.linker.add(ast, str(ghdl_file))
+
+    def _report_link_errors(self):
+        """检查跨文件的模块实例并打印链接错误，没有错误时返回True"""
+        errors = self.linker.link()
+        for error in errors:
+            print(f"{Fore.RED}链接错误: {error}{Style.RESET_ALL}")
+        if errors:
+            print(f"{Fore.RED}链接失败: {len(errors)} 个错误{Style.RESET_ALL}")
+        return not errors
+
+    def _output_path(self, ghdl_file, input_path, output_dir=None):
+        """目录编译时源文件对应的输出文件路径（需要时创建输出子目录）"""
+        if output_dir:
+            relative_path = ghdl_file.relative_to(input_path)
+            output_file = Path(output_dir) / relative_path.with_suffix('.v')
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            return output_file
+        return ghdl_file.with_suffix('.v')
+
+    def watch_directory(self, input_dir, output_dir=None, verbose=False, jobs=1, cache_dir=None,
+                        stop=None, interval=DEFAULT_INTERVAL, settle=DEFAULT_SETTLE):
+        """编译目录后持续监视，只重新编译内容发生变化的文件
+
+        先按compile_directory编译整个目录，之后轮询目录树；短时间内的连续保存合并为一批，
+        每批只编译内容哈希与上次编译时不同的文件（仅修改时间变化的文件不重新编译）。
+        设置了linker时，每批编译后用各文件最新的链接信息重新检查跨文件的模块实例。
+        按Ctrl+C或设置stop（threading.Event）时结束。
+        """
+        input_path = Path(input_dir)
+        if not input_path.is_dir():
+            print(f"{Fore.RED}错误: '{input_dir}' 不是一个目录{Style.RESET_ALL}")
+            return False
+        
+        # 先记录状态再编译，编译期间的修改会在第一次轮询时发现
+        watcher = DirectoryWatcher(input_path, interval=interval, settle=settle)
+        hashes = {path: content_hash(path) for path in watcher.files}
+        self.compile_directory(input_dir, output_dir, verbose, jobs, cache_dir)
+        print(f"{Fore.BLUE}正在监视 '{input_dir}' 中的.ghdl文件，按 Ctrl+C 退出{Style.RESET_ALL}", flush=True)
+        
+        try:
+            for changed, removed in watcher.batches(stop):
+                for path in removed:
+                    hashes.pop(path, None)
+                    if self.linker is not None:
+                        self.linker.remove(str(path))
+                recompiled = self._recompile_changed(sorted(changed), input_path, output_dir, hashes, verbose)
+                if self.linker is not None and (recompiled or removed):
+                    if self._report_link_errors():
+                        print(f"{Fore.GREEN}链接通过{Style.RESET_ALL}", flush=True)
+        except KeyboardInterrupt:
+            pass
+        return True
+
+    def _recompile_changed(self, files, input_path, output_dir, hashes, verbose=False):
+        """重新编译内容哈希发生变化的文件，并记录编译时的哈希，返回重新编译的文件数
+
+        编译失败的文件同样记录哈希：内容不变时再次编译也会失败，等下次修改后再编译。
+        """
+        recompiled = 0
+        for ghdl_file in files:
+            digest = content_hash(ghdl_file)
+            if digest is None or hashes.get(ghdl_file) == digest:
+                continue
+            hashes[ghdl_file] = digest
+            recompiled += 1
+            start = time.perf_counter()
+            output_file = self._output_path(ghdl_file, input_path, output_dir)
+            if self.compile_file(str(ghdl_file), str(output_file), verbose):
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"{Fore.GREEN}已重新编译: {ghdl_file} ({elapsed:.1f} ms){Style.RESET_ALL}", flush=True)
+        return recompiled
+
+    def _load_cached(self, cache, ghdl_file, output_file, verbose=False):
+        """命中缓存时写出缓存的输出，返回 (是否命中, 缓存键)"""
+        try:
+            key = cache.key(ghdl_file.read_bytes())
+        except OSError:
+            # 无法读取的文件交给compile_file报告错误
+            return False, None
+        output = cache.load(key)
+        if output is None:
+            return False, key
+        # 输出文件内容相同时不重写，保持修改时间不变
+        try:
+            unchanged = output_file.read_bytes() == output
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            output_file.write_bytes(output)
+        if verbose:
+            print(f"{Fore.BLUE}使用缓存: {ghdl_file}{Style.RESET_ALL}")
+        return True, key
+
+    def _compile_parallel(self, tasks, jobs, ast_cache_dir=None, linker=None, specialize=False,
+                          generator_options=None, share_expressions=False, cse=None):
+        """在进程池中编译，按任务顺序打印各文件的输出，返回每个文件是否成功
+
+        指定linker时，工作进程收集的链接信息交回主进程并加入linker。
+        """
+        results = []
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(ast_cache_dir, linker is not None, specialize, generator_options,
+                                           share_expressions, cse)) as executor:
+            for success, output, units in executor.map(_compile_in_worker, tasks, chunksize=chunksize):
+                print(output, end='')
+                results.append(success)
+                if linker is not None:
+                    linker.extend(units)
+        return results
+
+
+# 工作进程中的编译器实例，由_init_worker在进程启动时构建一次
+_worker_compiler = None
+
+
+def _init_worker(ast_cache_dir=None, link=False, specialize=False, generator_options=None,
+                 share_expressions=False, cse=None):
+    """进程池初始化：构建本进程复用的编译器"""
+    global _worker_compiler
+    _worker_compiler = GraceHDLCompiler()
+    for name, value in (generator_options or {}).items():
+        setattr(_worker_compiler.generator, name, value)
+    if ast_cache_dir is not None:
+        _worker_compiler.ast_cache = ASTCache(ast_cache_dir)
+    if link:
+        _worker_compiler.linker = ModuleLinker()
+    if specialize:
+        _worker_compiler.specializer = ModuleSpecializer()
+    if share_expressions:
+        _worker_compiler.share_expressions()
+    if cse is not None:
+        _worker_compiler.cse = CommonSubexpressionExtractor(*cse)
+
+
+def _compile_in_worker(task, compiler=None):
+    """在工作进程中编译一个文件，返回 (是否成功, 编译过程的输出, 链接信息列表)"""
+    compiler = compiler or _worker_compiler
+    output = StringIO()
+    with redirect_stdout(output):
+        success = compiler.compile_file(*task)
+    linker = compiler.linker
+    return success, output.getvalue(), linker.take() if linker is not None else []
+
+
+# 工作进程中按编译选项构建的编译器（守护进程的请求带options时使用），键为规范化的选项
+_option_compilers = {}
+
+
+def _compile_with_options(task, options):
+    """按请求的编译选项编译：没有选项时使用_init_worker构建的编译器，
+    否则使用本进程中为这组选项构建的编译器（每组选项只构建一次）"""
+    if not options:
+        return _compile_in_worker(task)
+    key = json.dumps(options, sort_keys=True)
+    compiler = _option_compilers.get(key)
+    if compiler is None:
+        compiler = GraceHDLCompiler()
+        compiler.configure(options)
+        _option_compilers[key] = compiler
+    return _compile_in_worker(task, compiler)
+
 
 def main():
     """主函数"""
+    if len(sys.argv) > 1 and sys.argv[1] in ('serve', 'client'):
+        # 守护进程子命令
+        from gracehdl_daemon import main as daemon_main
+        sys.exit(daemon_main(sys.argv[1:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'index':
+        # 符号数据库子命令
+        from src.symbol_index import main as index_main
+        sys.exit(index_main(sys.argv[2:]))
+    
     parser = argparse.ArgumentParser(
         description='GraceHDL编译器 - 将GraceHDL代码编译为Verilog HDL',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -127,37 +558,117 @@ def main():
 示例:
   %(prog)s input.ghdl                    # 编译单个文件
   %(prog)s input.ghdl -o output.v        # 指定输出文件
+  %(prog)s input.ghdl -o -               # 输出到标准输出
   %(prog)s src/ -d build/                # 编译目录
+  %(prog)s src/ -d build/ -j 4           # 使用4个进程并行编译目录
+  %(prog)s big.ghdl --parse-jobs 4       # 把大文件按顶层项切分，用4个进程并行分析
+  %(prog)s src/ -d build/ --no-cache     # 不使用构建缓存，重新编译所有文件
   %(prog)s input.ghdl -v                 # 详细输出
+  %(prog)s src/ --profile                # 输出各阶段耗时和内存的汇总表
+  %(prog)s src/ -d build/ --watch        # 监视目录，保存后只重新编译修改过的文件
+  %(prog)s src/ -d build/ --link         # 编译后检查跨文件的模块实例和端口
+  %(prog)s top.ghdl --specialize         # 为每组参数值生成具体模块，不输出 #(...) 参数化实例
+  %(prog)s soc.ghdl --top soc_top        # 只输出从soc_top可达的模块
+  %(prog)s fir.ghdl --unroll-limit 16    # 迭代超过16次的for循环输出为Verilog for循环
+  %(prog)s input.ghdl --paren=full       # 每个表达式都加括号（旧的输出风格）
+  %(prog)s fsm.ghdl --share-expressions  # 重复的子表达式共享一个节点，减少大设计的内存
+  %(prog)s fsm.ghdl --cse                # 重复的比较和逻辑表达式提取为wire
+  %(prog)s serve                         # 启动编译守护进程
+  %(prog)s client input.ghdl             # 通过守护进程编译单个文件
+  %(prog)s index src/ --users alu        # 更新符号数据库，查询哪些模块实例化了alu
         """
     )
     
     parser.add_argument('input', help='输入文件或目录')
-    parser.add_argument('-o', '--output', help='输出文件（仅用于单文件编译）')
+    parser.add_argument('-o', '--output', help='输出文件（仅用于单文件编译，- 表示标准输出）')
     parser.add_argument('-d', '--output-dir', help='输出目录（用于目录编译）')
     parser.add_argument('-v', '--verbose', action='store_true', help='详细输出')
-    parser.add_argument('--version', action='version', version='GraceHDL Compiler 1.0.0')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='目录编译时的并行进程数（默认: CPU核数）')
+    parser.add_argument('--parse-jobs', type=int, default=1,
+                        help='单个文件按顶层项切分并行语法分析的进程数（默认: 1，串行）')
+    parser.add_argument('--no-cache', action='store_true', help='目录编译时不使用构建缓存')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f'构建缓存目录（默认: {DEFAULT_CACHE_DIR}）')
+    parser.add_argument('--profile', action='store_true',
+                        help='记录每个文件各阶段的耗时和峰值内存并输出汇总表')
+    parser.add_argument('--profile-json', metavar='FILE',
+                        help='将性能分析结果写入JSON文件（隐含 --profile）')
+    parser.add_argument('--watch', action='store_true',
+                        help='目录编译后持续监视，只重新编译内容发生变化的文件')
+    parser.add_argument('--link', action='store_true',
+                        help='目录编译后检查所有模块实例引用的模块、端口和参数是否存在')
+    parser.add_argument('--specialize', action='store_true',
+                        help='为每个不同的 (模块, 参数值) 组合生成特化模块（默认保持通用的参数化输出）')
+    parser.add_argument('--top', action='append', metavar='NAME',
+                        help='顶层模块名（可重复），只输出从顶层模块经实例可达的模块及其引用的枚举和函数')
+    parser.add_argument('--unroll-limit', type=int, default=DEFAULT_UNROLL_LIMIT, metavar='N',
+                        help=f'always/run块中迭代次数超过N的for循环输出为Verilog for循环而不展开'
+                             f'（默认: {DEFAULT_UNROLL_LIMIT}）')
+    parser.add_argument('--paren', choices=PAREN_STYLES, default='minimal',
+                        help='表达式括号风格: minimal只输出优先级需要的括号（默认），full给每个运算加括号')
+    parser.add_argument('--share-expressions', action='store_true',
+                        help='共享结构相同的表达式节点，重复的子表达式只分析和生成一次（减少内存，输出不变）')
+    parser.add_argument('--cse', action='store_true',
+                        help='把模块中重复出现的比较、逻辑和归约表达式提取为wire，各处引用改为wire名')
+    parser.add_argument('--cse-min-size', type=int, default=DEFAULT_MIN_SIZE, metavar='N',
+                        help=f'--cse提取的表达式至少包含的节点数（运算符和操作数，默认: {DEFAULT_MIN_SIZE}）')
+    parser.add_argument('--cse-min-uses', type=int, default=DEFAULT_MIN_USES, metavar='N',
+                        help=f'--cse提取的表达式至少出现的次数（默认: {DEFAULT_MIN_USES}）')
+    parser.add_argument('--version', action='version', version=f'GraceHDL Compiler {VERSION}')
     
     args = parser.parse_args()
     
     # 创建编译器实例
     compiler = GraceHDLCompiler()
+    if args.profile or args.profile_json:
+        compiler.profiler = CompileProfiler()
+    compiler.configure({
+        'link': args.link,
+        'specialize': args.specialize,
+        'top': args.top,
+        'cse': args.cse and [args.cse_min_size, args.cse_min_uses],
+        'unroll_limit': args.unroll_limit,
+        'paren': args.paren,
+        'share_expressions': args.share_expressions,
+    })
+    if args.parse_jobs > 1:
+        compiler.parallel_parser = ParallelParser(compiler.parser, args.parse_jobs)
     
     # 检查输入是文件还是目录
     input_path = Path(args.input)
     
     if input_path.is_file():
         # 编译单个文件
+        if args.watch:
+            print(f"{Fore.YELLOW}警告: --watch 只用于目录编译{Style.RESET_ALL}")
+        if args.link:
+            print(f"{Fore.YELLOW}警告: --link 只用于目录编译{Style.RESET_ALL}")
         success = compiler.compile_file(args.input, args.output, args.verbose)
     elif input_path.is_dir():
         # 编译目录
         if args.output:
             print(f"{Fore.YELLOW}警告: 目录编译时忽略 -o 选项，请使用 -d{Style.RESET_ALL}")
-        success = compiler.compile_directory(args.input, args.output_dir, args.verbose)
+        if args.top:
+            print(f"{Fore.YELLOW}警告: 目录编译时忽略 --top 选项，请对单个文件使用{Style.RESET_ALL}")
+            compiler.tops = None
+        cache_dir = None if args.no_cache else args.cache_dir
+        if args.watch:
+            success = compiler.watch_directory(args.input, args.output_dir, args.verbose, args.jobs, cache_dir)
+        else:
+            success = compiler.compile_directory(args.input, args.output_dir, args.verbose, args.jobs, cache_dir)
     else:
         print(f"{Fore.RED}错误: '{args.input}' 不存在{Style.RESET_ALL}")
         success = False
     
+    if compiler.profiler is not None:
+        compiler.profiler.stop()
+        print(compiler.profiler.report())
+        if args.profile_json:
+            compiler.profiler.write_json(args.profile_json)
+    if compiler.parallel_parser is not None:
+        compiler.parallel_parser.close()
+    
     # 返回适当的退出码
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+GraceHDL编译守护进程
+`serve` 启动常驻进程，保持一组已构建好语法分析器的编译器（工作进程池），
+通过Unix域套接字接收编译请求；`client` 把请求发给守护进程，守护进程没有运行时
+在本进程中直接编译。
+
+本模块顶层只导入标准库，客户端不需要导入ply、colorama和编译器本身，
+只有回退到本进程编译或启动守护进程时才导入 gracehdl_compiler。
+
+协议：每个连接发送一行JSON请求，返回一行JSON响应。
+    请求  {"input": 源文件路径, "source": 内联源代码, "output": 输出路径或"-", "verbose": 布尔值,
+           "options": 编译选项}
+          input和source至少给出一个；有source时不读取input，input只用于显示
+          options可选，键与命令行选项对应：specialize、top、cse、unroll_limit、paren、
+          share_expressions（取值见 GraceHDLCompiler.configure）；链接检查（--link）需要整个目录，
+          单个文件的请求不支持
+    响应  {"success": 布尔值, "output": 编译过程打印的内容（输出到"-"时包含生成的代码）}
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+
+ENV_SOCKET = 'GRACEHDL_SOCKET'
+
+# 内联源代码的显示名称
+INLINE_NAME = '<inline>'
+
+# 请求中可以给出的编译选项
+REQUEST_OPTIONS = ('specialize', 'top', 'cse', 'unroll_limit', 'paren', 'share_expressions')
+
+
+def default_socket_path():
+    """默认套接字路径：环境变量 GRACEHDL_SOCKET，否则为临时目录下按用户区分的文件
+
+    不使用 tempfile.gettempdir()：导入tempfile会明显增加客户端的启动时间。
+    """
+    return os.environ.get(ENV_SOCKET) or os.path.join(
+        os.environ.get('TMPDIR') or '/tmp', f'gracehdl-{os.getuid()}.sock')
+
+
+def _send(sock_file, message):
+    sock_file.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+    sock_file.flush()
+
+
+def _receive(sock_file):
+    line = sock_file.readline()
+    if not line:
+        raise ConnectionError('连接已关闭')
+    return json.loads(line)
+
+
+class _CompileHandler(socketserver.StreamRequestHandler):
+    """处理一个连接上的一个编译请求"""
+
+    def handle(self):
+        try:
+            request = _receive(self.rfile)
+        except ConnectionError:
+            # 只检测守护进程是否存在的连接
+            return
+        except ValueError as e:
+            _send(self.wfile, {'success': False, 'output': f'错误: 无效的请求: {e}\n'})
+            return
+        try:
+            task, options = self.server.make_task(request)
+        except (ValueError, TypeError) as e:
+            _send(self.wfile, {'success': False, 'output': f'错误: 无效的请求: {e}\n'})
+            return
+        success, output = self.server.compile(task, options)
+        _send(self.wfile, {'success': success, 'output': output})
+
+
+class CompileServer(socketserver.ThreadingUnixStreamServer):
+    """编译守护进程
+
+    每个连接由一个线程接收，编译在进程池中进行。工作进程启动时各构建一次编译器
+    （与目录并行编译使用同一套初始化），之后的请求不再支付导入和构建语法分析器的开销。
+    带编译选项的请求由工作进程中为该组选项构建的编译器处理，每组选项在每个进程中只构建一次。
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, jobs=1):
+        # 延迟导入：客户端不需要编译器
+        from concurrent.futures import ProcessPoolExecutor
+        from gracehdl_compiler import _compile_with_options, _init_worker
+
+        self._compile_with_options = _compile_with_options
+        self.socket_path = socket_path
+        self.executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker)
+        # 预先启动所有工作进程并构建编译器，第一个请求不必等待
+        for future in [self.executor.submit(os.getpid) for _ in range(jobs)]:
+            future.result()
+        super().__init__(socket_path, _CompileHandler)
+
+    @staticmethod
+    def make_task(request):
+        """把请求转换为 (compile_file 的参数, 编译选项)"""
+        if not isinstance(request, dict):
+            raise ValueError('请求必须是JSON对象')
+        options = request.get('options') or {}
+        if not isinstance(options, dict):
+            raise ValueError('options 必须是JSON对象')
+        if 'link' in options:
+            raise ValueError('链接检查只用于目录编译，单个文件的请求不支持 link')
+        unknown = sorted(set(options) - set(REQUEST_OPTIONS))
+        if unknown:
+            raise ValueError(f"未知的编译选项: {', '.join(unknown)}")
+        source = request.get('source')
+        input_file = request.get('input') or (INLINE_NAME if source is not None else None)
+        if input_file is None:
+            raise ValueError('缺少 input 或 source')
+        output = request.get('output')
+        if output is None and source is not None and request.get('input') is None:
+            output = '-'
+        return (str(input_file), output, bool(request.get('verbose')), source), options
+
+    def compile(self, task, options=None):
+        """在工作进程中按options编译，返回 (是否成功, 编译过程的输出)"""
+        try:
+            success, output, _ = self.executor.submit(self._compile_with_options, task, options).result()
+            return success, output
+        except Exception as e:
+            return False, f'编译错误: {e}\n'
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown()
+        try:
+            os.remove(self.socket_path)
+        except OSError:
+            pass
+
+
+def _daemon_running(socket_path):
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+def serve(socket_path=None, jobs=1):
+    """启动守护进程，直到被中断"""
+    socket_path = socket_path or default_socket_path()
+    if os.path.exists(socket_path):
+        if _daemon_running(socket_path):
+            print(f"错误: 守护进程已在运行: {socket_path}", file=sys.stderr)
+            return False
+        # 上次异常退出留下的套接字文件
+        os.remove(socket_path)
+
+    server = CompileServer(socket_path, jobs)
+    # kill终止时同样清理套接字文件
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"GraceHDL守护进程已启动: {socket_path}（{jobs} 个编译进程）", flush=True)
+    try:
+        server.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        server.server_close()
+    return True
+
+
+def request_compile(request, socket_path=None, timeout=None):
+    """把编译请求发给守护进程，返回响应；守护进程没有运行时返回None"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path or default_socket_path())
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        with sock.makefile('rwb') as sock_file:
+            _send(sock_file, request)
+            return _receive(sock_file)
+    finally:
+        sock.close()
+
+
+def compile_in_process(request):
+    """守护进程不可用时在本进程中编译，返回与守护进程相同格式的响应"""
+    from contextlib import redirect_stdout
+    from io import StringIO
+    from gracehdl_compiler import GraceHDLCompiler
+
+    try:
+        task, options = CompileServer.make_task(request)
+        compiler = GraceHDLCompiler()
+        compiler.configure(options)
+    except (ValueError, TypeError) as e:
+        return {'success': False, 'output': f'错误: 无效的请求: {e}\n'}
+    output = StringIO()
+    with redirect_stdout(output):
+        success = compiler.compile_file(*task)
+    return {'success': success, 'output': output.getvalue()}
+
+
+def client(input_file=None, output_file=None, verbose=False, source=None, socket_path=None, options=None):
+    """编译一个文件或一段内联源代码：优先交给守护进程，否则在本进程中编译
+
+    相对路径按客户端的工作目录解析后再发送，options为编译选项（见模块说明）。返回是否成功。
+    """
+    request = {'verbose': verbose}
+    if options:
+        request['options'] = options
+    if input_file is not None:
+        request['input'] = os.path.abspath(input_file)
+    if source is not None:
+        request['source'] = source
+    if output_file is not None:
+        request['output'] = output_file if output_file == '-' else os.path.abspath(output_file)
+
+    response = request_compile(request, socket_path)
+    if response is None:
+        response = compile_in_process(request)
+    sys.stdout.write(response['output'])
+    sys.stdout.flush()
+    return response['success']
+
+
+def main(argv=None):
+    """命令行入口：serve / client 子命令"""
+    parser = argparse.ArgumentParser(
+        prog='gracehdl',
+        description='GraceHDL编译守护进程',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  %(prog)s serve -j 4                     # 启动守护进程，4个编译进程
+  %(prog)s client input.ghdl              # 通过守护进程编译（未运行时在本进程编译）
+  %(prog)s client input.ghdl -o -         # 输出到标准输出
+  %(prog)s client - < input.ghdl          # 从标准输入读取源代码
+  %(prog)s client top.ghdl --specialize   # 带编译选项的请求
+        """
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--socket', help=f'套接字路径（默认: ${ENV_SOCKET} 或 {default_socket_path()}）')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', parents=[common], help='启动编译守护进程')
+    serve_parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                              help='编译进程数（默认: CPU核数）')
+
+    client_parser = commands.add_parser('client', parents=[common], help='通过守护进程编译文件')
+    client_parser.add_argument('input', help='输入文件，- 表示从标准输入读取源代码')
+    client_parser.add_argument('-o', '--output', help='输出文件（- 表示标准输出）')
+    client_parser.add_argument('-v', '--verbose', action='store_true', help='详细输出')
+    client_parser.add_argument('--specialize', action='store_true', help='为每组参数值生成特化模块')
+    client_parser.add_argument('--top', action='append', metavar='NAME', help='顶层模块名（可重复）')
+    client_parser.add_argument('--cse', action='store_true', help='重复的比较和逻辑表达式提取为wire')
+    client_parser.add_argument('--unroll-limit', type=int, metavar='N',
+                               help='迭代次数超过N的for循环输出为Verilog for循环')
+    client_parser.add_argument('--paren', choices=('minimal', 'full'), help='表达式括号风格')
+    client_parser.add_argument('--share-expressions', action='store_true', help='共享结构相同的表达式节点')
+
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        success = serve(args.socket, max(1, args.jobs))
+        return 0 if success else 1
+    # 只发送给出的选项，其余使用守护进程的默认值
+    options = {name: getattr(args, name) for name in REQUEST_OPTIONS}
+    options = {name: value for name, value in options.items() if value not in (None, False)}
+    if args.input == '-':
+        success = client(source=sys.stdin.read(), output_file=args.output,
+                         verbose=args.verbose, socket_path=args.socket, options=options)
+    else:
+        success = client(args.input, args.output, args.verbose, socket_path=args.socket, options=options)
+    return 0 if success else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
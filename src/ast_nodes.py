@@ -3,12 +3,32 @@ GraceHDL抽象语法树节点定义 - 新语法版本
 定义所有AST节点类，用于表示解析后的新GraceHDL语法结构
 """
 
+from operator import attrgetter as _attrgetter
+
+# 节点类型 -> 字段名元组
+_FIELDS = {}
+
 class ASTNode:
-    """AST节点基类"""
-    pass
+    """AST节点基类
+
+    所有节点类都声明 __slots__（没有新字段的子类声明空元组），实例不带 __dict__，
+    大型设计的AST内存占用明显减小。节点不能再添加 __slots__ 以外的属性。
+    """
+    __slots__ = ()
+
+    def fields(self):
+        """按声明顺序返回 (字段名, 值) 列表，包括基类的字段"""
+        names = _FIELDS.get(type(self))
+        if names is None:
+            names = _FIELDS[type(self)] = tuple(
+                name for klass in reversed(type(self).__mro__)
+                for name in klass.__dict__.get('__slots__', ()))
+        return [(name, getattr(self, name)) for name in names]
 
 class CommentNode(ASTNode):
     """注释节点"""
+    __slots__ = ('content',)
+
     def __init__(self, content):
         self.content = content
 
@@ -17,6 +37,8 @@ class CommentNode(ASTNode):
 
 class SourceText(ASTNode):
     """源代码根节点"""
+    __slots__ = ('modules', 'items')
+
     def __init__(self, modules, items=None):
         self.modules = modules
         self.items = items or []  # 所有源代码项（包括枚举、函数等）
@@ -26,6 +48,8 @@ class SourceText(ASTNode):
 
 class ModuleDeclaration(ASTNode):
     """模块声明"""
+    __slots__ = ('name', 'parameters', 'ports', 'sections')
+
     def __init__(self, name, parameters, ports, sections):
         self.name = name
         self.parameters = parameters or []
@@ -39,6 +63,8 @@ class ModuleDeclaration(ASTNode):
 
 class InputSection(ASTNode):
     """输入端口段"""
+    __slots__ = ('ports',)
+
     def __init__(self, ports):
         self.ports = ports or []
 
@@ -47,6 +73,8 @@ class InputSection(ASTNode):
 
 class OutputSection(ASTNode):
     """输出端口段"""
+    __slots__ = ('ports',)
+
     def __init__(self, ports):
         self.ports = ports or []
 
@@ -55,6 +83,8 @@ class OutputSection(ASTNode):
 
 class RegisterSection(ASTNode):
     """寄存器段"""
+    __slots__ = ('registers',)
+
     def __init__(self, registers):
         self.registers = registers or []
 
@@ -63,6 +93,8 @@ class RegisterSection(ASTNode):
 
 class ParameterSection(ASTNode):
     """参数段"""
+    __slots__ = ('parameters',)
+
     def __init__(self, parameters):
         self.parameters = parameters or []
 
@@ -71,6 +103,8 @@ class ParameterSection(ASTNode):
 
 class RunSection(ASTNode):
     """run语句段（时序逻辑）"""
+    __slots__ = ('clock_edge', 'statements')
+
     def __init__(self, clock_edge, statements):
         self.clock_edge = clock_edge
         self.statements = statements or []
@@ -80,6 +114,8 @@ class RunSection(ASTNode):
 
 class AlwaysSection(ASTNode):
     """always语句段（组合逻辑）"""
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements or []
 
@@ -88,6 +124,8 @@ class AlwaysSection(ASTNode):
 
 class AssignSection(ASTNode):
     """assign语句段（连续赋值）"""
+    __slots__ = ('assignments',)
+
     def __init__(self, assignments):
         self.assignments = assignments or []
 
@@ -96,6 +134,8 @@ class AssignSection(ASTNode):
 
 class ClockEdge(ASTNode):
     """时钟边沿"""
+    __slots__ = ('signal', 'edge_type')
+
     def __init__(self, signal, edge_type):
         self.signal = signal
         self.edge_type = edge_type  # 'posedge' or 'negedge'
@@ -105,6 +145,8 @@ class ClockEdge(ASTNode):
 
 class PortDeclaration(ASTNode):
     """端口声明"""
+    __slots__ = ('direction', 'net_type', 'range_spec', 'names')
+
     def __init__(self, direction, net_type, range_spec, names):
         self.direction = direction
         self.net_type = net_type
@@ -116,6 +158,8 @@ class PortDeclaration(ASTNode):
 
 class RegisterDeclaration(ASTNode):
     """寄存器声明"""
+    __slots__ = ('range_spec', 'names')
+
     def __init__(self, range_spec, names):
         self.range_spec = range_spec
         self.names = names
@@ -124,6 +168,8 @@ class RegisterDeclaration(ASTNode):
         return f"RegisterDeclaration({self.range_spec}, {self.names})"
 
 class ArrayRegisterDeclaration(ASTNode):
+    __slots__ = ('range_spec', 'identifier', 'array_range')
+
     def __init__(self, range_spec, identifier, array_range):
         self.range_spec = range_spec  # 位宽范围，如 (7:0)
         self.identifier = identifier  # 数组名
@@ -134,6 +180,8 @@ class ArrayRegisterDeclaration(ASTNode):
 
 class ParameterDeclaration(ASTNode):
     """参数声明"""
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
@@ -143,6 +191,8 @@ class ParameterDeclaration(ASTNode):
 
 class RangeSpec(ASTNode):
     """位宽范围规格"""
+    __slots__ = ('msb', 'lsb')
+
     def __init__(self, msb, lsb):
         self.msb = msb
         self.lsb = lsb
@@ -154,6 +204,8 @@ class RangeSpec(ASTNode):
 
 class AssignmentStatement(ASTNode):
     """赋值语句"""
+    __slots__ = ('target', 'expression')
+
     def __init__(self, target, expression):
         self.target = target
         self.expression = expression
@@ -163,6 +215,8 @@ class AssignmentStatement(ASTNode):
 
 class ToAssignmentStatement(ASTNode):
     """to赋值语句（时序逻辑赋值）"""
+    __slots__ = ('expression', 'target')
+
     def __init__(self, expression, target):
         self.expression = expression  # 源值
         self.target = target         # 目标变量
@@ -172,6 +226,8 @@ class ToAssignmentStatement(ASTNode):
 
 class IfStatement(ASTNode):
     """if语句"""
+    __slots__ = ('condition', 'then_statements', 'else_statements', 'elif_statements')
+
     def __init__(self, condition, then_statements, else_statements=None, elif_statements=None):
         self.condition = condition
         self.then_statements = then_statements or []
@@ -183,6 +239,8 @@ class IfStatement(ASTNode):
 
 class ElifStatement(ASTNode):
     """elif语句"""
+    __slots__ = ('condition', 'statements')
+
     def __init__(self, condition, statements):
         self.condition = condition
         self.statements = statements or []
@@ -192,6 +250,8 @@ class ElifStatement(ASTNode):
 
 class CaseStatement(ASTNode):
     """case语句"""
+    __slots__ = ('expression', 'case_items')
+
     def __init__(self, expression, case_items):
         self.expression = expression
         self.case_items = case_items or []
@@ -201,6 +261,8 @@ class CaseStatement(ASTNode):
 
 class CaseItem(ASTNode):
     """case项"""
+    __slots__ = ('expression', 'statements')
+
     def __init__(self, expression, statements):
         self.expression = expression  # None for default case
         self.statements = statements or []
@@ -212,6 +274,8 @@ class CaseItem(ASTNode):
 
 class EnumDeclaration(ASTNode):
     """枚举类型声明"""
+    __slots__ = ('name', 'items')
+
     def __init__(self, name, items):
         self.name = name
         # 过滤掉None项和空名称项
@@ -222,6 +286,8 @@ class EnumDeclaration(ASTNode):
 
 class EnumItem(ASTNode):
     """枚举项"""
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value=None):
         self.name = name
         self.value = value
@@ -231,6 +297,8 @@ class EnumItem(ASTNode):
 
 class EnumReference(ASTNode):
     """枚举引用（如 State.IDLE）"""
+    __slots__ = ('enum_name', 'item_name')
+
     def __init__(self, enum_name, item_name):
         self.enum_name = enum_name
         self.item_name = item_name
@@ -242,6 +310,8 @@ class EnumReference(ASTNode):
 
 class FunctionDeclaration(ASTNode):
     """函数声明"""
+    __slots__ = ('name', 'parameters', 'statements')
+
     def __init__(self, name, parameters, statements):
         self.name = name
         self.parameters = parameters or []
@@ -252,6 +322,8 @@ class FunctionDeclaration(ASTNode):
 
 class FunctionParameter(ASTNode):
     """函数参数"""
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -260,6 +332,8 @@ class FunctionParameter(ASTNode):
 
 class ReturnStatement(ASTNode):
     """return语句"""
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
 
@@ -268,6 +342,8 @@ class ReturnStatement(ASTNode):
 
 class FunctionCall(ASTNode):
     """函数调用"""
+    __slots__ = ('name', 'arguments')
+
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments or []
@@ -279,6 +355,8 @@ class FunctionCall(ASTNode):
 
 class InterfaceDeclaration(ASTNode):
     """接口声明"""
+    __slots__ = ('name', 'parameters', 'ports')
+
     def __init__(self, name, parameters, ports):
         self.name = name
         self.parameters = parameters or []
@@ -289,6 +367,8 @@ class InterfaceDeclaration(ASTNode):
 
 class PortDeclarationInterface(ASTNode):
     """接口端口声明"""
+    __slots__ = ('interface_name', 'instance_name', 'parameters')
+
     def __init__(self, interface_name, instance_name, parameters=None):
         self.interface_name = interface_name
         self.instance_name = instance_name
@@ -301,6 +381,8 @@ class PortDeclarationInterface(ASTNode):
 
 class GenerateSection(ASTNode):
     """generate语句段"""
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements or []
 
@@ -309,6 +391,8 @@ class GenerateSection(ASTNode):
 
 class ForGenerateStatement(ASTNode):
     """for生成语句"""
+    __slots__ = ('variable', 'start', 'end', 'step', 'statements')
+
     def __init__(self, variable, start, end, step, statements):
         self.variable = variable
         self.start = start
@@ -323,6 +407,8 @@ class ForGenerateStatement(ASTNode):
 
 class AssertStatement(ASTNode):
     """断言语句"""
+    __slots__ = ('condition', 'message')
+
     def __init__(self, condition, message=None):
         self.condition = condition
         self.message = message
@@ -332,6 +418,8 @@ class AssertStatement(ASTNode):
 
 class CoverStatement(ASTNode):
     """覆盖率语句"""
+    __slots__ = ('condition', 'message')
+
     def __init__(self, condition, message=None):
         self.condition = condition
         self.message = message
@@ -343,6 +431,8 @@ class CoverStatement(ASTNode):
 
 class ClockedRegisterDeclaration(ASTNode):
     """带时钟域的寄存器声明"""
+    __slots__ = ('range_spec', 'names', 'clock_signal')
+
     def __init__(self, range_spec, names, clock_signal):
         self.range_spec = range_spec
         self.names = names
@@ -355,6 +445,8 @@ class ClockedRegisterDeclaration(ASTNode):
 
 class ReduceOperation(ASTNode):
     """归约运算"""
+    __slots__ = ('operator', 'operand')
+
     def __init__(self, operator, operand):
         self.operator = operator  # 'and', 'or', 'xor'
         self.operand = operand
@@ -364,6 +456,8 @@ class ReduceOperation(ASTNode):
 
 class ForStatement(ASTNode):
     """for循环生成语句"""
+    __slots__ = ('loop_var', 'range_expr', 'statements')
+
     def __init__(self, loop_var, range_expr, statements):
         self.loop_var = loop_var  # 循环变量名
         self.range_expr = range_expr  # range表达式
@@ -374,16 +468,21 @@ class ForStatement(ASTNode):
 
 class ModuleInstantiation(ASTNode):
     """模块实例化"""
-    def __init__(self, module_name, instance_name, port_connections):
+    __slots__ = ('module_name', 'instance_name', 'port_connections', 'parameters')
+
+    def __init__(self, module_name, instance_name, port_connections, parameters=None):
         self.module_name = module_name
         self.instance_name = instance_name
         self.port_connections = port_connections or []
+        self.parameters = parameters or []  # 参数覆盖，ParameterAssignment列表
 
     def __repr__(self):
-        return f"ModuleInstantiation({self.module_name}, {self.instance_name}, {self.port_connections})"
+        return f"ModuleInstantiation({self.module_name}, {self.instance_name}, {self.port_connections}, {self.parameters})"
 
 class PortConnection(ASTNode):
     """端口连接"""
+    __slots__ = ('port_name', 'signal_name')
+
     def __init__(self, port_name, signal_name):
         self.port_name = port_name
         self.signal_name = signal_name
@@ -395,10 +494,12 @@ class PortConnection(ASTNode):
 
 class Expression(ASTNode):
     """表达式基类"""
-    pass
+    __slots__ = ()
 
 class IdentifierExpression(Expression):
     """标识符表达式"""
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -407,6 +508,8 @@ class IdentifierExpression(Expression):
 
 class NumberExpression(Expression):
     """数字表达式"""
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -415,6 +518,8 @@ class NumberExpression(Expression):
 
 class NewNumberExpression(Expression):
     """新数值格式表达式 (value, base, width)"""
+    __slots__ = ('value', 'base', 'width')
+
     def __init__(self, value, base, width):
         self.value = value
         self.base = base
@@ -424,12 +529,16 @@ class NewNumberExpression(Expression):
         return f"NewNumberExpression({self.value}, {self.base}, {self.width})"
 
 class BinaryExpression(ASTNode):
+    __slots__ = ('operator', 'left', 'right')
+
     def __init__(self, operator, left, right):
         self.operator = operator
         self.left = left
         self.right = right
 
 class UnaryExpression(ASTNode):
+    __slots__ = ('operator', 'operand')
+
     def __init__(self, operator, operand):
         self.operator = operator
         self.operand = operand
@@ -439,6 +548,8 @@ class UnaryExpression(ASTNode):
 
 class UnaryExpression(Expression):
     """一元表达式"""
+    __slots__ = ('operator', 'operand')
+
     def __init__(self, operator, operand):
         self.operator = operator
         self.operand = operand
@@ -448,6 +559,8 @@ class UnaryExpression(Expression):
 
 class ConditionalExpression(Expression):
     """条件表达式 (三元运算符)"""
+    __slots__ = ('condition', 'true_expr', 'false_expr')
+
     def __init__(self, condition, true_expr, false_expr):
         self.condition = condition
         self.true_expr = true_expr
@@ -458,6 +571,8 @@ class ConditionalExpression(Expression):
 
 class IndexExpression(Expression):
     """索引表达式"""
+    __slots__ = ('array', 'index')
+
     def __init__(self, array, index):
         self.array = array
         self.index = index
@@ -467,6 +582,8 @@ class IndexExpression(Expression):
 
 class SliceExpression(Expression):
     """切片表达式"""
+    __slots__ = ('array', 'msb', 'lsb')
+
     def __init__(self, array, msb, lsb):
         self.array = array
         self.msb = msb
@@ -477,6 +594,8 @@ class SliceExpression(Expression):
 
 class ConcatenationExpression(Expression):
     """拼接表达式"""
+    __slots__ = ('expressions',)
+
     def __init__(self, expressions):
         self.expressions = expressions
 
@@ -485,6 +604,8 @@ class ConcatenationExpression(Expression):
 
 class RangeExpression(Expression):
     """range表达式"""
+    __slots__ = ('start', 'end', 'step')
+
     def __init__(self, start, end, step=None):
         self.start = start  # 起始值
         self.end = end      # 结束值
@@ -500,27 +621,31 @@ class RangeExpression(Expression):
 
 class Range(RangeSpec):
     """位宽范围（兼容性别名）"""
-    pass
+    __slots__ = ()
 
 class Assignment(AssignmentStatement):
     """赋值语句（兼容性别名）"""
+    __slots__ = ()
+
     def __init__(self, lvalue, rvalue):
         super().__init__(lvalue, rvalue)
 
 class Identifier(IdentifierExpression):
     """标识符（兼容性别名）"""
-    pass
+    __slots__ = ()
 
 class Number(NumberExpression):
     """数字（兼容性别名）"""
-    pass
+    __slots__ = ()
 
 class BinaryOp(BinaryExpression):
     """二元操作（兼容性别名）"""
-    pass
+    __slots__ = ()
 
 class ContinuousAssign(ASTNode):
     """连续赋值（兼容性）"""
+    __slots__ = ('assignments',)
+
     def __init__(self, assignments):
         self.assignments = assignments
 
@@ -529,6 +654,8 @@ class ContinuousAssign(ASTNode):
 
 class NetDeclaration(ASTNode):
     """网络声明（兼容性）"""
+    __slots__ = ('net_type', 'range_spec', 'names')
+
     def __init__(self, net_type, range_spec, names):
         self.net_type = net_type
         self.range_spec = range_spec
@@ -539,6 +666,8 @@ class NetDeclaration(ASTNode):
 
 class AlwaysConstruct(ASTNode):
     """always块（兼容性）"""
+    __slots__ = ('event_control', 'statements')
+
     def __init__(self, event_control, statements):
         self.event_control = event_control
         self.statements = statements
@@ -548,6 +677,8 @@ class AlwaysConstruct(ASTNode):
 
 class EventControl(ASTNode):
     """事件控制（兼容性）"""
+    __slots__ = ('event_expression',)
+
     def __init__(self, event_expression):
         self.event_expression = event_expression
 
@@ -556,6 +687,8 @@ class EventControl(ASTNode):
 
 class EventExpression(ASTNode):
     """事件表达式（兼容性）"""
+    __slots__ = ('edge_type', 'expression')
+
     def __init__(self, edge_type, expression):
         self.edge_type = edge_type
         self.expression = expression
@@ -567,6 +700,8 @@ class EventExpression(ASTNode):
 
 class TestbenchDeclaration(ASTNode):
     """测试台声明"""
+    __slots__ = ('module_name', 'parameters', 'body')
+
     def __init__(self, module_name, parameters, body):
         self.module_name = module_name  # 被测模块名
         self.parameters = parameters or []  # 测试台参数
@@ -577,6 +712,8 @@ class TestbenchDeclaration(ASTNode):
 
 class ClockDeclaration(ASTNode):
     """时钟声明"""
+    __slots__ = ('clock_name', 'period')
+
     def __init__(self, clock_name, period):
         self.clock_name = clock_name
         self.period = period
@@ -586,6 +723,8 @@ class ClockDeclaration(ASTNode):
 
 class SignalDeclaration(ASTNode):
     """测试信号声明"""
+    __slots__ = ('signal_name', 'signal_type', 'range_spec', 'initial_value')
+
     def __init__(self, signal_name, signal_type, range_spec=None, initial_value=None):
         self.signal_name = signal_name
         self.signal_type = signal_type  # 'wire' or 'reg'
@@ -597,6 +736,8 @@ class SignalDeclaration(ASTNode):
 
 class DutInstantiation(ASTNode):
     """被测模块实例化"""
+    __slots__ = ('instance_name', 'module_name', 'parameters', 'port_connections')
+
     def __init__(self, instance_name, module_name, parameters, port_connections):
         self.instance_name = instance_name
         self.module_name = module_name
@@ -608,6 +749,8 @@ class DutInstantiation(ASTNode):
 
 class TestSequence(ASTNode):
     """测试序列"""
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements or []
 
@@ -616,6 +759,8 @@ class TestSequence(ASTNode):
 
 class WaitStatement(ASTNode):
     """等待语句"""
+    __slots__ = ('duration',)
+
     def __init__(self, duration):
         self.duration = duration
 
@@ -624,6 +769,8 @@ class WaitStatement(ASTNode):
 
 class DumpWavesStatement(ASTNode):
     """波形输出语句"""
+    __slots__ = ('filename',)
+
     def __init__(self, filename):
         self.filename = filename
 
@@ -632,6 +779,8 @@ class DumpWavesStatement(ASTNode):
 
 class ReportCoverageStatement(ASTNode):
     """覆盖率报告语句"""
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -640,9 +789,68 @@ class ReportCoverageStatement(ASTNode):
 
 class ParameterAssignment(ASTNode):
     """参数赋值"""
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
 
     def __repr__(self):
-        return f"ParameterAssignment({self.name}, {self.value})"
\ No newline at end of file
+        return f"ParameterAssignment({self.name}, {self.value})"
+
+# 表达式节点的结构共享（hash-consing）
+
+# 可以共享的表达式类型：字段都是字符串、整数或其他表达式节点，创建后不再修改
+INTERNABLE_EXPRESSIONS = (IdentifierExpression, NumberExpression, NewNumberExpression, BinaryExpression,
+                          UnaryExpression, ConditionalExpression, IndexExpression, SliceExpression,
+                          EnumReference, ReduceOperation)
+
+# 节点类 -> 取出全部字段值的函数，只包含可以共享的类型本身（不含兼容性子类）；
+# 这些类型的字段都直接声明在类本身的 __slots__ 中
+_INTERN_FIELDS = {cls: _attrgetter(*cls.__slots__) for cls in INTERNABLE_EXPRESSIONS}
+
+
+class ExpressionInterner:
+    """表达式节点的结构共享表
+
+    语法分析器自底向上构造表达式，子表达式在父节点之前已经共享，所以结构相同只需比较
+    节点类型、运算符等字面字段和子节点的身份。intern返回已登记的相同节点，或登记并返回
+    node本身；重复出现的子表达式（如 state == IDLE、同一总线的切片）只保留一个对象。
+    共享的节点被多处引用，之后不能再修改。
+    """
+
+    def __init__(self):
+        self.nodes = {}  # (节点类型, 字段值) -> 节点
+        self.hits = 0
+
+    def intern(self, node):
+        fields = _INTERN_FIELDS.get(type(node))
+        if fields is None:
+            return node
+        key = (type(node), fields(node))
+        existing = self.nodes.setdefault(key, node)
+        if existing is not node:
+            self.hits += 1
+        return existing
+
+    def clear(self):
+        """分析下一个文件前清空，共享只在一个文件内进行，表不会无限增长"""
+        self.nodes.clear()
+
+
+def shared_nodes(root):
+    """返回被多处引用的节点的id集合（如SourceText的modules和items共享的模块节点、共享的表达式）"""
+    seen = set()
+    shared = set()
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ASTNode):
+            if id(item) in seen:
+                shared.add(id(item))
+                continue
+            seen.add(id(item))
+            stack.extend(value for _, value in item.fields())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return shared
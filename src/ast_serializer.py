@@ -0,0 +1,293 @@
+"""
+GraceHDL AST二进制序列化
+把 src/ast_nodes.py 的语法树编码为紧凑的带版本二进制格式，并提供按源代码哈希
+索引的磁盘缓存：源文件未改变时直接加载AST，跳过词法分析和语法分析。
+
+格式（所有整数为无符号LEB128变长整数）:
+    文件头  MAGIC  格式版本  类型数  类型名...
+    值      一个标记字节，后跟该标记的内容
+        NONE / FALSE / TRUE
+        INT     zigzag编码的变长整数
+        STR     长度 + UTF-8字节，同时加入字符串表
+        STRREF  字符串表中的序号（重复出现的字符串只保存一次）
+        LIST / TUPLE  元素个数 + 各元素
+        SHARED  后跟一个节点，该节点被多处引用，按出现顺序加入共享节点表
+        NODEREF 共享节点表中的序号（被多处引用的节点只保存一次，加载后仍是同一个对象）
+        >= NODE_BASE  节点：标记减去NODE_BASE为文件头类型表中的序号，
+                      后跟按 __slots__ 声明顺序排列的各字段值
+                      （NewNumberExpression 即 (value, base, width) 三个字面值）
+"""
+
+import gc
+import os
+import struct
+from itertools import islice
+
+try:
+    from . import ast_nodes
+    from .ast_nodes import ASTNode, shared_nodes
+    from .build_cache import DEFAULT_CACHE_DIR, BuildCache, compiler_fingerprint
+except ImportError:
+    import ast_nodes
+    from ast_nodes import ASTNode, shared_nodes
+    from build_cache import DEFAULT_CACHE_DIR, BuildCache, compiler_fingerprint
+
+MAGIC = b'GHAST'
+
+# 节点类的字段或编码方式改变时递增
+FORMAT_VERSION = 2
+
+NONE, FALSE, TRUE, INT, STR, STRREF, LIST, TUPLE, SHARED, NODEREF, FLOAT = range(11)
+NODE_BASE = 16
+MAX_NODE_TYPES = 256 - NODE_BASE
+
+DEFAULT_AST_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'ast')
+
+# 决定AST内容的源文件；只修改代码生成器等其他文件时，缓存的AST仍然有效
+AST_SOURCES = ('ast_nodes.py', 'ast_serializer.py', 'lexer.py', 'lextab.py', 'parser.py', 'parsetab.py')
+
+
+class ASTFormatError(ValueError):
+    """数据不是可识别的AST序列化格式（或版本不同）"""
+
+
+def _node_classes():
+    """ast_nodes中所有节点类，按名称索引"""
+    return {name: value for name, value in vars(ast_nodes).items()
+            if isinstance(value, type) and issubclass(value, ASTNode)}
+
+
+_NODE_CLASSES = _node_classes()
+
+# 节点类 -> 按声明顺序的字段名
+_FIELD_NAMES = {}
+
+
+def _field_names(cls):
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(
+            name for klass in reversed(cls.__mro__) for name in klass.__dict__.get('__slots__', ()))
+    return names
+
+
+def _write_varint(out, value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def dump_ast(root):
+    """把AST编码为bytes"""
+    body = bytearray()
+    types = {}
+    strings = {}
+    shared = shared_nodes(root)
+    written = {}
+    append = body.append
+
+    def write(value):
+        if value is None:
+            append(NONE)
+        elif value is True:
+            append(TRUE)
+        elif value is False:
+            append(FALSE)
+        elif isinstance(value, str):
+            index = strings.get(value)
+            if index is None:
+                strings[value] = len(strings)
+                data = value.encode('utf-8')
+                append(STR)
+                _write_varint(body, len(data))
+                body.extend(data)
+            else:
+                append(STRREF)
+                _write_varint(body, index)
+        elif isinstance(value, ASTNode):
+            if id(value) in shared:
+                index = written.get(id(value))
+                if index is not None:
+                    append(NODEREF)
+                    _write_varint(body, index)
+                    return
+                written[id(value)] = len(written)
+                append(SHARED)
+            cls = type(value)
+            type_index = types.get(cls)
+            if type_index is None:
+                if _NODE_CLASSES.get(cls.__name__) is not cls:
+                    raise TypeError(f'无法序列化 {cls.__name__}：不是ast_nodes中的节点类')
+                type_index = types[cls] = len(types)
+                if type_index >= MAX_NODE_TYPES:
+                    raise ValueError('节点类型过多')
+            append(NODE_BASE + type_index)
+            for name in _field_names(cls):
+                write(getattr(value, name))
+        elif isinstance(value, int):
+            append(INT)
+            _write_varint(body, value << 1 if value >= 0 else (-value << 1) - 1)
+        elif isinstance(value, (list, tuple)):
+            append(LIST if isinstance(value, list) else TUPLE)
+            _write_varint(body, len(value))
+            for item in value:
+                write(item)
+        elif isinstance(value, float):
+            append(FLOAT)
+            body.extend(struct.pack('<d', value))
+        else:
+            raise TypeError(f'无法序列化 {type(value).__name__} 类型的值')
+
+    write(root)
+
+    header = bytearray(MAGIC)
+    _write_varint(header, FORMAT_VERSION)
+    _write_varint(header, len(types))
+    for cls in types:
+        name = cls.__name__.encode('utf-8')
+        _write_varint(header, len(name))
+        header.extend(name)
+    return bytes(header + body)
+
+
+def _node_reader(cls, setters, readers, read_byte):
+    """返回读取一个cls节点的函数：创建实例后按字段顺序读取各字段值"""
+    new = cls.__new__
+
+    def read_node():
+        node = new(cls)
+        for setter in setters:
+            setter(node, readers[read_byte()]())
+        return node
+    return read_node
+
+
+def load_ast(data):
+    """从dump_ast生成的bytes还原AST"""
+    if not data.startswith(MAGIC):
+        raise ASTFormatError('不是GraceHDL AST数据')
+    stream = iter(memoryview(data)[len(MAGIC):])
+    read_byte = stream.__next__
+
+    def read_varint():
+        byte = read_byte()
+        if byte < 0x80:
+            return byte
+        value = byte & 0x7f
+        shift = 7
+        while True:
+            byte = read_byte()
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def read_bytes(length):
+        value = bytes(islice(stream, length))
+        if len(value) != length:
+            raise ASTFormatError('AST数据不完整')
+        return value
+
+    try:
+        version = read_varint()
+        if version != FORMAT_VERSION:
+            raise ASTFormatError(f'AST格式版本 {version} 与当前版本 {FORMAT_VERSION} 不一致')
+        # 节点类型表：每个类型的构造方式和字段设置函数
+        builders = []
+        for _ in range(read_varint()):
+            name = read_bytes(read_varint()).decode('utf-8')
+            cls = _NODE_CLASSES.get(name)
+            if cls is None:
+                raise ASTFormatError(f'未知的节点类型: {name}')
+            setters = tuple(getattr(cls, field).__set__ for field in _field_names(cls))
+            builders.append((cls, setters))
+    except StopIteration:
+        raise ASTFormatError('AST数据不完整') from None
+
+    strings = []
+    shared = []
+
+    # 标记 -> 读取函数
+    def unknown_tag():
+        raise ASTFormatError('未知的标记')
+
+    readers = [unknown_tag] * 256
+
+    def read():
+        return readers[read_byte()]()
+
+    def read_list():
+        return [readers[read_byte()]() for _ in range(read_varint())]
+
+    def read_str():
+        value = read_bytes(read_varint()).decode('utf-8')
+        strings.append(value)
+        return value
+
+    def read_int():
+        value = read_varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def read_shared():
+        # 被多处引用的节点：先登记序号再读取字段，与编码顺序一致
+        index = len(shared)
+        shared.append(None)
+        node = shared[index] = read()
+        return node
+
+    readers[NONE] = lambda: None
+    readers[FALSE] = lambda: False
+    readers[TRUE] = lambda: True
+    readers[INT] = read_int
+    readers[STR] = read_str
+    readers[STRREF] = lambda: strings[read_varint()]
+    readers[LIST] = read_list
+    readers[TUPLE] = lambda: tuple(read_list())
+    readers[SHARED] = read_shared
+    readers[NODEREF] = lambda: shared[read_varint()]
+    readers[FLOAT] = lambda: struct.unpack('<d', read_bytes(8))[0]
+    for index, (cls, setters) in enumerate(builders):
+        readers[NODE_BASE + index] = _node_reader(cls, setters, readers, read_byte)
+
+    # 加载期间只创建对象、不产生循环引用，暂停循环垃圾回收，避免大量分配反复触发回收
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return read()
+    except (StopIteration, IndexError):
+        raise ASTFormatError('AST数据不完整') from None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class ASTCache(BuildCache):
+    """按源代码内容哈希保存序列化AST的磁盘缓存"""
+
+    def __init__(self, cache_dir=DEFAULT_AST_CACHE_DIR):
+        super().__init__(cache_dir, f'ast-{FORMAT_VERSION}', suffix='.ast',
+                         fingerprint=compiler_fingerprint(AST_SOURCES))
+
+    def load_ast(self, key):
+        """读取缓存的AST，不存在或无法解码时返回None"""
+        data = self.load(key)
+        if data is None:
+            return None
+        try:
+            return load_ast(data)
+        except ASTFormatError:
+            self.hits -= 1
+            self.misses += 1
+            return None
+
+    def store_ast(self, key, ast):
+        """保存AST；嵌套深度超过Python递归限制的树（如上万层的表达式）不缓存"""
+        try:
+            data = dump_ast(ast)
+        except RecursionError:
+            return
+        self.store(key, data)
+
+    def summary(self):
+        return f"AST缓存: 命中 {self.hits}, 未命中 {self.misses}"
@@ -0,0 +1,86 @@
+"""
+GraceHDL构建缓存
+以源文件内容、编译器版本/实现和编译选项的哈希为键，保存生成的Verilog代码，
+未改变的输入无需重新进行词法分析、语法分析和代码生成。
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = '.gracehdl_cache'
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def compiler_fingerprint(names=None):
+    """编译器实现的指纹：src下Python源文件内容的哈希
+
+    names为参与计算的文件名，默认为所有.py文件。
+    修改词法/语法规则或代码生成器后，旧的缓存条目自动失效。
+    """
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(SRC_DIR)):
+        if name.endswith('.py') and (names is None or name in names):
+            digest.update(name.encode('utf-8'))
+            with open(os.path.join(SRC_DIR, name), 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """基于内容哈希的构建缓存
+
+    缓存条目保存在 cache_dir/<键前两位>/<键><suffix>，写入时先写临时文件再重命名，
+    多个编译进程可以同时使用同一个缓存目录。
+    fingerprint为编译器实现的指纹，默认使用compiler_fingerprint()。
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, version='', options=None, suffix='.v', fingerprint=None):
+        self.cache_dir = Path(cache_dir)
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        # 与源文件无关的部分只计算一次
+        salt = hashlib.sha256()
+        salt.update(version.encode('utf-8'))
+        salt.update((fingerprint or compiler_fingerprint()).encode('utf-8'))
+        salt.update(repr(sorted((options or {}).items())).encode('utf-8'))
+        self._salt = salt
+
+    def key(self, source):
+        """计算源文件内容（bytes）对应的缓存键"""
+        digest = self._salt.copy()
+        digest.update(source)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / (key + self.suffix)
+
+    def load(self, key):
+        """读取缓存的输出（bytes），不存在时返回None"""
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def store(self, key, output):
+        """保存输出（bytes）"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(output)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def summary(self):
+        return f"构建缓存: 命中 {self.hits}, 未命中 {self.misses}"
@@ -0,0 +1,88 @@
+"""
+GraceHDL分析表生成工具
+在打包/发布时运行一次，生成只读的词法表(lextab.py)和LALR分析表(parsetab.py)，
+编译器运行时直接导入这些模块，不再生成或写入任何表文件。
+
+用法: python -m src.build_tables
+"""
+
+import os
+import pickle
+import runpy
+import tempfile
+import zlib
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+try:
+    from .lexer import GraceHDLLexer
+    from .parser import GraceHDLParser
+except ImportError:
+    from lexer import GraceHDLLexer
+    from parser import GraceHDLParser
+
+TABLE_DIR = os.path.dirname(os.path.abspath(__file__))
+LEXTAB = 'lextab'
+PARSETAB = 'parsetab'
+
+# PLY生成的临时分析表模块名（仅在生成过程中使用）
+_RAW_PARSETAB = '_parsetab_raw'
+
+# 分析表以压缩的pickle数据内嵌在模块中，导入时无需编译大段字面量
+_PARSETAB_TEMPLATE = """# {name}.py
+# 由 src/build_tables.py 自动生成，请勿手动修改
+
+import pickle as _pickle
+import zlib as _zlib
+
+_tabversion = {tabversion!r}
+_lr_method = {method!r}
+_lr_signature = {signature!r}
+
+_lr_action, _lr_goto, _lr_productions = _pickle.loads(_zlib.decompress(
+    {payload!r}))
+"""
+
+
+def build_lextab(outputdir=TABLE_DIR):
+    """生成词法表模块"""
+    lexer = GraceHDLLexer()
+    # 不使用已有词法表，重新校验并生成主正则表达式
+    lexobj = lex.lex(module=lexer, optimize=False)
+    lexobj.writetab(LEXTAB, outputdir)
+    return os.path.join(outputdir, LEXTAB + '.py')
+
+
+def build_parsetab(outputdir=TABLE_DIR):
+    """生成LALR分析表模块"""
+    parser = GraceHDLParser()
+    parser.lexer.build(optimize=False)
+    # 先由PLY在临时目录生成标准分析表，再转换为紧凑格式
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yacc.yacc(module=parser, tabmodule=_RAW_PARSETAB, outputdir=tmpdir,
+                  debug=False, write_tables=True)
+        raw = runpy.run_path(os.path.join(tmpdir, _RAW_PARSETAB + '.py'))
+
+    payload = pickle.dumps((raw['_lr_action'], raw['_lr_goto'], raw['_lr_productions']),
+                           protocol=4)
+    path = os.path.join(outputdir, PARSETAB + '.py')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_PARSETAB_TEMPLATE.format(
+            name=PARSETAB,
+            tabversion=raw['_tabversion'],
+            method=raw['_lr_method'],
+            signature=raw['_lr_signature'],
+            payload=zlib.compress(payload, 9),
+        ))
+    return path
+
+
+def main():
+    """命令行入口"""
+    for path in (build_lextab(), build_parsetab()):
+        print(f"已生成: {path}")
+
+
+if __name__ == "__main__":
+    main()
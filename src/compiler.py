@@ -13,12 +13,12 @@ class GraceHDLCompiler:
     """GraceHDL编译器"""
     
     def __init__(self):
-        self.lexer = GraceHDLLexer()
         self.parser = GraceHDLParser()
         self.generator = VerilogGenerator()
         
-        # 构建解析器
+        # 构建解析器（加载预生成的分析表，词法分析器随之构建一次）
         self.parser.build()
+        self.lexer = self.parser.lexer
     
     def compile_file(self, input_file, output_file=None):
         """编译GraceHDL文件"""
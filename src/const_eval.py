@@ -0,0 +1,316 @@
+"""
+GraceHDL编译时常量求值
+对表达式AST求整数值：覆盖表达式文法中的全部运算符、数字字面量（包括新数值格式和
+8'hFF 形式）、模块参数、枚举项以及只由赋值、if和return组成的纯 def 函数。
+每个模块一个求值器，不依赖循环变量的子表达式按节点身份缓存结果，函数调用按
+(函数名, 实参值) 缓存；表达式不是编译时常量时抛出 ConstantError 并指明原因。
+"""
+
+try:
+    from .ast_nodes import AssignmentStatement, BinaryExpression, ConditionalExpression, EnumReference, \
+        FunctionCall, IdentifierExpression, IfStatement, IndexExpression, NewNumberExpression, \
+        NumberExpression, ParameterDeclaration, ParameterSection, ReduceOperation, ReturnStatement, \
+        SliceExpression, UnaryExpression
+except ImportError:
+    from ast_nodes import AssignmentStatement, BinaryExpression, ConditionalExpression, EnumReference, \
+        FunctionCall, IdentifierExpression, IfStatement, IndexExpression, NewNumberExpression, \
+        NumberExpression, ParameterDeclaration, ParameterSection, ReduceOperation, ReturnStatement, \
+        SliceExpression, UnaryExpression
+
+# 函数调用的最大嵌套深度，超过时认为是无限递归
+MAX_CALL_DEPTH = 64
+
+
+# 用显式栈求值的表达式节点
+_COMPOUND = (BinaryExpression, UnaryExpression, ConditionalExpression)
+
+
+class ConstantError(ValueError):
+    """表达式不是编译时常量"""
+
+
+def _shift_count(count):
+    if count < 0:
+        raise ConstantError(f"移位位数 {count} 为负数")
+    return count
+
+
+# 按位和算术运算在无限位宽的整数上进行；比较和逻辑运算的结果为0或1
+BINARY_OPERATORS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '<<': lambda a, b: a << _shift_count(b),
+    '>>': lambda a, b: a >> _shift_count(b),
+    '&': lambda a, b: a & b,
+    '|': lambda a, b: a | b,
+    '^': lambda a, b: a ^ b,
+    '==': lambda a, b: int(a == b),
+    '!=': lambda a, b: int(a != b),
+    '<': lambda a, b: int(a < b),
+    '<=': lambda a, b: int(a <= b),
+    '>': lambda a, b: int(a > b),
+    '>=': lambda a, b: int(a >= b),
+}
+
+UNARY_OPERATORS = {
+    '-': lambda a: -a,
+    '~': lambda a: ~a,
+    '!': lambda a: int(not a),
+}
+
+_BASES = {'b': 2, 'o': 8, 'd': 10, 'h': 16}
+
+
+def literal_value(text):
+    """8'hFF、'b1010 形式字面量的整数值（按位宽截断），格式不对时返回None"""
+    width, _, rest = str(text).partition("'")
+    base = _BASES.get(rest[:1].lower())
+    if base is None or (width and not width.isdigit()):
+        return None
+    try:
+        value = int(rest[1:].replace('_', ''), base)
+    except ValueError:
+        return None
+    return value & ((1 << int(width)) - 1) if width else value
+
+
+def parameter_declarations(module):
+    """模块参数段中的参数声明"""
+    return [parameter for section in module.sections if isinstance(section, ParameterSection)
+            for parameter in section.parameters if isinstance(parameter, ParameterDeclaration)]
+
+
+class ConstantEvaluator:
+    """一个模块范围内的常量求值器
+
+    parameters: 参数名 -> 取值表达式（或整数），取值可以引用其他参数；
+    overridable: 参数可以被实例覆盖时为True，此时引用参数不算常量（通用输出）；
+    enums / functions: 名称 -> EnumDeclaration / FunctionDeclaration。
+    """
+
+    def __init__(self, parameters=None, enums=None, functions=None, module=None, overridable=False):
+        self.parameters = {} if parameters is None else parameters
+        self.enums = {} if enums is None else enums
+        self.functions = {} if functions is None else functions
+        self.module = module
+        self.overridable = overridable
+        self.memo = {}  # id(表达式) -> (表达式, 值)，只缓存不依赖局部绑定的表达式
+        self.calls = {}  # (函数名, 实参值元组) -> 返回值
+        self._named = {}  # 参数和枚举项的值
+        self._resolving = set()
+        self._local_reads = 0  # 读取局部绑定（循环变量、函数形参）的次数
+        self._depth = 0
+        self.hits = 0
+
+    def evaluate(self, expr, bindings=None):
+        """求expr的整数值；bindings是循环变量等局部绑定。不是常量时抛出ConstantError"""
+        try:
+            return self._eval(expr, bindings or {})
+        except ConstantError as e:
+            if self.module is not None and not str(e).startswith('模块 '):
+                raise ConstantError(f"模块 {self.module}: {e}") from None
+            raise
+
+    def _eval(self, expr, bindings):
+        if isinstance(expr, bool):
+            return int(expr)
+        if isinstance(expr, int):
+            return expr
+        entry = self.memo.get(id(expr))
+        if entry is not None and entry[0] is expr:
+            self.hits += 1
+            return entry[1]
+        if isinstance(expr, _COMPOUND):
+            return self._eval_compound(expr, bindings)
+        reads = self._local_reads
+        value = self._compute(expr, bindings)
+        if self._local_reads == reads:
+            self.memo[id(expr)] = (expr, value)
+        return value
+
+    def _eval_compound(self, root, bindings):
+        """用显式栈求二元、一元和条件表达式的值，很深的表达式树不受Python递归深度限制
+
+        栈帧是 [节点, 已求值的子表达式个数, 开始时的局部绑定读取次数]，子表达式的值压入values。
+        """
+        values = []
+        frames = [[root, 0, self._local_reads]]
+        while frames:
+            frame = frames[-1]
+            node, step, reads = frame
+            child = None
+            if isinstance(node, BinaryExpression):
+                operator = node.operator
+                if step == 0:
+                    child = node.left
+                elif step == 1:
+                    # && 和 || 短路求值，未求值的一侧可以不是常量
+                    if operator == '&&' and not values[-1]:
+                        values[-1] = 0
+                    elif operator == '||' and values[-1]:
+                        values[-1] = 1
+                    else:
+                        child = node.right
+                else:
+                    right = values.pop()
+                    if operator == '&&' or operator == '||':
+                        values[-1] = int(bool(right))
+                    else:
+                        operation = BINARY_OPERATORS.get(operator)
+                        if operation is None:
+                            raise ConstantError(f"不支持的二元运算 {operator}")
+                        values[-1] = operation(values[-1], right)
+            elif isinstance(node, UnaryExpression):
+                if step == 0:
+                    child = node.operand
+                else:
+                    operation = UNARY_OPERATORS.get(node.operator)
+                    if operation is None:
+                        raise ConstantError(f"不支持的一元运算 {node.operator}")
+                    values[-1] = operation(values[-1])
+            elif step == 0:
+                child = node.condition
+            elif step == 1:
+                child = node.true_expr if values.pop() else node.false_expr
+
+            if child is None:
+                frames.pop()
+                if self._local_reads == reads:
+                    self.memo[id(node)] = (node, values[-1])
+                continue
+            frame[1] = step + 1
+            if isinstance(child, _COMPOUND):
+                entry = self.memo.get(id(child))
+                if entry is not None and entry[0] is child:
+                    self.hits += 1
+                    values.append(entry[1])
+                else:
+                    frames.append([child, 0, self._local_reads])
+            else:
+                values.append(self._eval(child, bindings))
+        return values[0]
+
+    def _compute(self, expr, bindings):
+        if isinstance(expr, NewNumberExpression):
+            if not isinstance(expr.value, int):
+                raise ConstantError(f"无法识别的数值 {expr.value}")
+            return expr.value & ((1 << expr.width) - 1) if expr.width else expr.value
+        if isinstance(expr, NumberExpression):
+            value = expr.value if isinstance(expr.value, int) else literal_value(expr.value)
+            if value is None:
+                raise ConstantError(f"无法识别的数值 {expr.value}")
+            return value
+        if isinstance(expr, IdentifierExpression):
+            return self._lookup(expr.name, bindings)
+        if isinstance(expr, str):
+            return self._lookup(expr, bindings)
+        if isinstance(expr, IndexExpression):
+            return (self._lookup(expr.array, bindings) >> _shift_count(self._eval(expr.index, bindings))) & 1
+        if isinstance(expr, SliceExpression):
+            msb = self._eval(expr.msb, bindings)
+            lsb = _shift_count(self._eval(expr.lsb, bindings))
+            if msb < lsb:
+                raise ConstantError(f"切片 {expr.array}[{msb}:{lsb}] 的高位小于低位")
+            return (self._lookup(expr.array, bindings) >> lsb) & ((1 << (msb - lsb + 1)) - 1)
+        if isinstance(expr, ReduceOperation):
+            return self._reduce(expr, bindings)
+        if isinstance(expr, EnumReference):
+            return self._enum_value(expr.enum_name, expr.item_name)
+        if isinstance(expr, FunctionCall):
+            return self._call(expr, bindings)
+        raise ConstantError(f"{type(expr).__name__} 不是编译时常量")
+
+    def _reduce(self, expr, bindings):
+        value = self._eval(expr.operand, bindings)
+        if expr.operator == 'or':
+            return int(value != 0)
+        if expr.operator == 'xor' and value >= 0:
+            return bin(value).count('1') & 1
+        if expr.operator == 'and' and isinstance(expr.operand, NewNumberExpression) and expr.operand.width:
+            return int(value == (1 << expr.operand.width) - 1)
+        raise ConstantError(f"reduce_{expr.operator} 的操作数位宽不确定")
+
+    def _lookup(self, name, bindings):
+        if name in bindings:
+            self._local_reads += 1
+            return bindings[name]
+        if name not in self.parameters:
+            raise ConstantError(f"'{name}' 不是编译时常量（不是参数、枚举项或循环变量）")
+        if self.overridable:
+            raise ConstantError(f"'{name}' 是可以被实例覆盖的模块参数")
+        return self._named_value(name, self.parameters[name], f"参数 {name}")
+
+    def _enum_value(self, enum_name, item_name):
+        declaration = self.enums.get(enum_name)
+        if declaration is None:
+            raise ConstantError(f"未定义的枚举 {enum_name}")
+        for index, item in enumerate(declaration.items):
+            if item is not None and item.name == item_name:
+                # 没有指定值的枚举项从1开始递增，与生成的localparam一致
+                value = index + 1 if item.value is None else item.value
+                return self._named_value((enum_name, item_name), value, f"枚举项 {enum_name}.{item_name}")
+        raise ConstantError(f"枚举 {enum_name} 没有枚举项 {item_name}")
+
+    def _named_value(self, key, expr, description):
+        """参数和枚举项的值只计算一次，并检查循环引用"""
+        if key in self._named:
+            return self._named[key]
+        if key in self._resolving:
+            raise ConstantError(f"{description} 循环引用自身")
+        self._resolving.add(key)
+        try:
+            value = self._eval(expr, {})
+        finally:
+            self._resolving.discard(key)
+        self._named[key] = value
+        return value
+
+    def _call(self, expr, bindings):
+        function = self.functions.get(expr.name)
+        if function is None:
+            raise ConstantError(f"未定义的函数 {expr.name}")
+        names = [parameter.name for parameter in function.parameters]
+        if len(names) != len(expr.arguments):
+            raise ConstantError(f"函数 {expr.name} 需要 {len(names)} 个参数，实际传入 {len(expr.arguments)} 个")
+        arguments = tuple(self._eval(argument, bindings) for argument in expr.arguments)
+        key = (expr.name, arguments)
+        if key in self.calls:
+            return self.calls[key]
+        if self._depth >= MAX_CALL_DEPTH:
+            raise ConstantError(f"函数 {expr.name} 调用嵌套超过 {MAX_CALL_DEPTH} 层")
+        # 函数体读取形参不影响调用表达式本身能否缓存：返回值只取决于实参
+        reads = self._local_reads
+        self._depth += 1
+        try:
+            value = self._run(function, function.statements, dict(zip(names, arguments)))
+        finally:
+            self._depth -= 1
+            self._local_reads = reads
+        if value is None:
+            raise ConstantError(f"函数 {expr.name} 没有返回值")
+        self.calls[key] = value
+        return value
+
+    def _run(self, function, statements, local):
+        """执行纯函数的语句，遇到return时返回其值，否则返回None"""
+        for statement in statements or ():
+            if statement is None:
+                continue
+            if isinstance(statement, ReturnStatement):
+                return self._eval(statement.expression, local)
+            if isinstance(statement, AssignmentStatement) and isinstance(statement.target, str):
+                local[statement.target] = self._eval(statement.expression, local)
+            elif isinstance(statement, IfStatement):
+                branches = [(statement.condition, statement.then_statements)]
+                branches += [(branch.condition, branch.statements) for branch in statement.elif_statements or ()]
+                body = statement.else_statements
+                for condition, branch_statements in branches:
+                    if self._eval(condition, local):
+                        body = branch_statements
+                        break
+                value = self._run(function, body, local)
+                if value is not None:
+                    return value
+            else:
+                raise ConstantError(f"函数 {function.name} 不是纯函数：不支持 {type(statement).__name__} 语句")
+        return None
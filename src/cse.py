@@ -0,0 +1,404 @@
+"""
+GraceHDL公共子表达式提取（--cse）
+在模块的assign、always和run段中查找重复出现的表达式，提取为模块内的wire：
+声明 wire cse_0; 并输出 assign cse_0 = ...;，原来的各处引用改为wire名。
+
+Verilog中运算的位宽由上下文决定（如 a + b 赋给更宽的目标时保留进位），提取为固定位宽
+的wire会改变结果，所以只提取结果为一位、位宽与上下文无关的表达式：比较、逻辑与或非和
+归约运算（如 state == IDLE、a[3:0] != 0 && en）。它们内部可以是除函数调用和拼接以外的任意表达式。
+以下出现不提取：
+- 读取了同一个always/run段中阻塞赋值（=）的信号：段内赋值之后读到的是新值，wire只有最终值
+- 引用了外层for循环的循环变量
+"""
+
+try:
+    from .ast_nodes import AlwaysSection, AssignmentStatement, AssignSection, ASTNode, BinaryExpression, CaseItem, \
+        CaseStatement, ConditionalExpression, EnumReference, ExpressionInterner, ForStatement, IdentifierExpression, \
+        IfStatement, IndexExpression, InputSection, ModuleDeclaration, NetDeclaration, NewNumberExpression, \
+        NumberExpression, OutputSection, ParameterSection, ReduceOperation, RegisterSection, RunSection, \
+        SliceExpression, SourceText, ToAssignmentStatement, UnaryExpression
+except ImportError:
+    from ast_nodes import AlwaysSection, AssignmentStatement, AssignSection, ASTNode, BinaryExpression, CaseItem, \
+        CaseStatement, ConditionalExpression, EnumReference, ExpressionInterner, ForStatement, IdentifierExpression, \
+        IfStatement, IndexExpression, InputSection, ModuleDeclaration, NetDeclaration, NewNumberExpression, \
+        NumberExpression, OutputSection, ParameterSection, ReduceOperation, RegisterSection, RunSection, \
+        SliceExpression, SourceText, ToAssignmentStatement, UnaryExpression
+
+# 表达式的最小节点数（运算符和操作数都计数，state == IDLE 为3）和最少出现次数
+DEFAULT_MIN_SIZE = 3
+DEFAULT_MIN_USES = 2
+
+# 结果为一位的二元运算符
+ONE_BIT_OPERATORS = frozenset(['==', '!=', '<', '<=', '>', '>=', '&&', '||'])
+
+# 提取的wire名前缀，与模块中已有的名字冲突时跳过该编号
+WIRE_PREFIX = 'cse_'
+
+# 声明段：提取的wire声明在这些段之后、第一个其他段之前
+_DECLARATION_SECTIONS = (InputSection, OutputSection, ParameterSection, RegisterSection)
+
+
+def _one_bit(node):
+    """node的结果是否为一位（与上下文无关）"""
+    cls = type(node)
+    if cls is BinaryExpression:
+        return node.operator in ONE_BIT_OPERATORS
+    if cls is UnaryExpression:
+        return node.operator == '!'
+    return cls is ReduceOperation
+
+
+def _base_name(target):
+    """赋值目标的信号名：y、y[i]、y[7:0] 都是y"""
+    while isinstance(target, (IndexExpression, SliceExpression)):
+        target = target.array
+    if isinstance(target, IdentifierExpression):
+        return target.name
+    return target if isinstance(target, str) else None
+
+
+def blocking_targets(statements):
+    """语句（包括if、case和for的分支）中阻塞赋值的信号名集合"""
+    names = set()
+    stack = list(statements or ())
+    while stack:
+        stmt = stack.pop()
+        if isinstance(stmt, AssignmentStatement):
+            names.add(_base_name(stmt.target))
+        elif isinstance(stmt, IfStatement):
+            stack.extend(stmt.then_statements or ())
+            for branch in stmt.elif_statements or ():
+                stack.extend(branch.statements or ())
+            stack.extend(stmt.else_statements or ())
+        elif isinstance(stmt, CaseStatement):
+            for item in stmt.case_items or ():
+                if isinstance(item, CaseItem):
+                    stack.extend(item.statements or ())
+        elif isinstance(stmt, ForStatement):
+            stack.extend(stmt.statements or ())
+    names.discard(None)
+    return names
+
+
+def _module_names(module):
+    """模块中出现的所有字符串（信号名、实例名等），生成的wire名不与它们重复"""
+    names = set()
+    stack = [module]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            names.add(item)
+        elif type(item) in _CHILD_FIELDS:
+            names.add(_reads(item))
+            stack.extend(getattr(item, name) for name in _CHILD_FIELDS[type(item)])
+        elif isinstance(item, ASTNode):
+            stack.extend(value for _, value in item.fields())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return names
+
+
+class _Candidate:
+    """一个可提取的表达式（按结构去重后的节点）"""
+    __slots__ = ('node', 'size', 'order', 'top', 'children', 'name')
+
+    def __init__(self, node, size, order):
+        self.node = node
+        self.size = size
+        self.order = order  # 第一次出现的顺序，决定wire的编号
+        self.top = 0  # 不在其他可提取表达式之内的出现次数
+        self.children = None  # 最近一层可提取子表达式的列表（有重复），第一次出现时记录
+        self.name = None  # 提取后的wire名，不提取时为None
+
+
+class CommonSubexpressionExtractor:
+    """公共子表达式提取，extract()返回新的SourceText，不修改传入的AST"""
+
+    def __init__(self, min_size=DEFAULT_MIN_SIZE, min_uses=DEFAULT_MIN_USES):
+        self.min_size = min_size
+        self.min_uses = min_uses
+        self.extracted = 0  # 上一次extract()提取的wire数
+
+    def options(self):
+        """影响输出的设置，作为构建缓存键的一部分"""
+        return (self.min_size, self.min_uses)
+
+    def extract(self, ast):
+        self.extracted = 0
+        rewritten = {id(module): self.extract_module(module) for module in ast.modules}
+        items = [rewritten.get(id(item), item) for item in ast.items]
+        modules = [rewritten[id(module)] for module in ast.modules]
+        return SourceText(modules, items)
+
+    def extract_module(self, module):
+        """返回提取了公共子表达式的模块副本；没有可提取的表达式时返回module本身"""
+        self._interner = ExpressionInterner()
+        self._candidates = {}  # id(结构去重后的节点) -> _Candidate
+        self._sizes = {}  # id(结构去重后的节点) -> 节点数
+        self._sites = []  # 第一遍记录的每个表达式的可提取节点，第二遍按相同顺序取出
+        self._collecting = True
+        for section in module.sections:
+            self._section(section)
+
+        selected = self._select()
+        if not selected:
+            self._interner = self._candidates = self._sizes = self._sites = None
+            return module
+        used = _module_names(module)
+        number = 0
+        for candidate in selected:
+            while f'{WIRE_PREFIX}{number}' in used:
+                number += 1
+            candidate.name = f'{WIRE_PREFIX}{number}'
+            number += 1
+
+        self._collecting = False
+        self._sites.reverse()
+        sections = [self._section(section) for section in module.sections]
+        # 定义中包含的更小的公共子表达式同样引用wire
+        definitions = [AssignmentStatement(candidate.name, self._rewrite(candidate.node, self._scan(
+            candidate.node, frozenset()), candidate.node)) for candidate in selected]
+
+        first = len(sections)
+        last = 0
+        for index, section in enumerate(sections):
+            if isinstance(section, _DECLARATION_SECTIONS):
+                last = index + 1
+            elif section is not None and first == len(sections):
+                first = index
+        sections.insert(max(first, last), AssignSection(definitions))
+        sections.insert(first, NetDeclaration('wire', None, [candidate.name for candidate in selected]))
+        self.extracted += len(selected)
+        self._interner = self._candidates = self._sizes = self._sites = None
+        return ModuleDeclaration(module.name, module.parameters, module.ports, sections)
+
+    def _select(self):
+        """从大到小决定提取哪些表达式，返回按第一次出现排序的提取列表
+
+        表达式E提取后，它内部的子表达式只在E的定义中出现一次；不提取时随E的每次出现而出现。
+        所以子表达式D的出现次数 = D不在任何可提取表达式之内的次数 + 每个直接包含D的E中D的
+        个数 × (E提取时为1，否则为E的出现次数)。包含D的表达式都比D大，先于D决定。
+        """
+        candidates = sorted(self._candidates.values(), key=lambda candidate: -candidate.size)
+        uses = {id(candidate): candidate.top for candidate in candidates}
+        selected = []
+        for candidate in candidates:
+            count = uses[id(candidate)]
+            if count >= self.min_uses:
+                selected.append(candidate)
+                count = 1
+            for child in candidate.children:
+                uses[id(child)] += count
+        selected.sort(key=lambda candidate: candidate.order)
+        return selected
+
+    def _section(self, section):
+        if isinstance(section, AssignSection):
+            assignments = [self._copy(assignment, expression=self._expression(assignment.expression, frozenset()))
+                           if isinstance(assignment, AssignmentStatement) else assignment
+                           for assignment in section.assignments]
+            return self._copy(section, assignments=assignments)
+        if isinstance(section, (AlwaysSection, RunSection)):
+            unsafe = frozenset(blocking_targets(section.statements))
+            return self._copy(section, statements=self._statements(section.statements, unsafe))
+        return section
+
+    def _copy(self, node, **changes):
+        """复制节点并修改部分字段；第一遍只统计，不复制"""
+        if self._collecting:
+            return node
+        copy = type(node).__new__(type(node))
+        for name, value in node.fields():
+            setattr(copy, name, changes.get(name, value))
+        return copy
+
+    def _statements(self, statements, unsafe):
+        if statements is None:
+            return None
+        return [self._statement(stmt, unsafe) for stmt in statements]
+
+    def _statement(self, stmt, unsafe):
+        """处理语句中的表达式，返回替换后的语句副本"""
+        if isinstance(stmt, (AssignmentStatement, ToAssignmentStatement)):
+            return self._copy(stmt, expression=self._expression(stmt.expression, unsafe))
+        if isinstance(stmt, IfStatement):
+            condition = self._expression(stmt.condition, unsafe)
+            then_statements = self._statements(stmt.then_statements, unsafe)
+            branches = [self._copy(branch, condition=self._expression(branch.condition, unsafe),
+                                   statements=self._statements(branch.statements, unsafe))
+                        for branch in stmt.elif_statements or ()]
+            return self._copy(stmt, condition=condition, then_statements=then_statements,
+                              elif_statements=branches, else_statements=self._statements(stmt.else_statements, unsafe))
+        if isinstance(stmt, CaseStatement):
+            expression = self._expression(stmt.expression, unsafe)
+            items = [self._copy(item, statements=self._statements(item.statements, unsafe))
+                     if isinstance(item, CaseItem) else item for item in stmt.case_items or ()]
+            return self._copy(stmt, expression=expression, case_items=items)
+        if isinstance(stmt, ForStatement):
+            # 循环变量在展开时取不同的值
+            return self._copy(stmt, statements=self._statements(stmt.statements, unsafe | {stmt.loop_var}))
+        return stmt
+
+    def _expression(self, root, unsafe):
+        """第一遍统计root中可提取的表达式，第二遍把提取的表达式替换为wire"""
+        if not isinstance(root, ASTNode):
+            return root
+        if self._collecting:
+            extractable = self._scan(root, unsafe)
+            self._count(root, extractable)
+            self._sites.append(extractable)
+            return root
+        return self._rewrite(root, self._sites.pop())
+
+    def _scan(self, root, unsafe):
+        """后序遍历root，返回 {id(可提取的节点): 结构去重后的节点}
+
+        可提取：结果为一位，节点数不小于min_size，只由_CHILD_FIELDS中的表达式类型组成，
+        并且不读取unsafe中的信号。
+        """
+        extractable = {}
+        info = {}  # id(节点) -> (结构去重后的节点, 节点数, 是否可以整体提取)
+        intern = self._interner.intern
+        stack = [(root, None)]
+        while stack:
+            node, names = stack.pop()
+            if names is None:
+                if id(node) in info:
+                    continue
+                names = _CHILD_FIELDS.get(type(node))
+                if names is None:
+                    info[id(node)] = (node, 1, False)
+                    continue
+                # 先处理子表达式
+                stack.append((node, names))
+                for name in names:
+                    child = getattr(node, name)
+                    if isinstance(child, ASTNode):
+                        stack.append((child, None))
+                continue
+
+            clean = _reads(node) not in unsafe
+            size = 1
+            changed = False
+            values = []
+            for name in names:
+                child = getattr(node, name)
+                if isinstance(child, ASTNode):
+                    canonical, child_size, child_clean = info[id(child)]
+                    size += child_size
+                    clean = clean and child_clean
+                    changed = changed or canonical is not child
+                    child = canonical
+                elif isinstance(child, int):
+                    size += 1
+                values.append(child)
+            canonical = node
+            if clean:
+                if changed:
+                    canonical = _replace(node, names, values)
+                canonical = intern(canonical)
+                if size >= self.min_size and _one_bit(node):
+                    extractable[id(node)] = canonical
+                    self._sizes[id(canonical)] = size
+            info[id(node)] = (canonical, size, clean)
+        return extractable
+
+    def _count(self, root, extractable):
+        """前序遍历，记录每个可提取表达式的出现次数和它最近一层的可提取子表达式"""
+        candidates = self._candidates
+        stack = [(root, None)]
+        while stack:
+            node, parent = stack.pop()
+            canonical = extractable.get(id(node))
+            if canonical is not None:
+                candidate = candidates.get(id(canonical))
+                if candidate is None:
+                    candidate = candidates[id(canonical)] = _Candidate(canonical, self._sizes[id(canonical)],
+                                                                      len(candidates))
+                if parent is None:
+                    candidate.top += 1
+                elif parent.recording:
+                    parent.children.append(candidate)
+                # 子表达式的结构相同，只在第一次出现时记录
+                recording = candidate.children is None
+                if recording:
+                    candidate.children = []
+                parent = _Scope(candidate, recording)
+            for name in reversed(_CHILD_FIELDS.get(type(node), ())):
+                child = getattr(node, name)
+                if isinstance(child, ASTNode):
+                    stack.append((child, parent))
+
+    def _rewrite(self, root, extractable, keep=None):
+        """把root中提取的表达式替换为wire名，只复制包含替换的节点；keep为不替换的根节点"""
+        candidates = self._candidates
+        results = []
+        stack = [(root, None)]
+        while stack:
+            node, names = stack.pop()
+            if names is not None:
+                # 子节点都已处理，有替换时复制
+                start = len(results) - len(names)
+                values = results[start:]
+                del results[start:]
+                if any(value is not getattr(node, name) for name, value in zip(names, values)):
+                    node = _replace(node, names, values)
+                results.append(node)
+                continue
+            canonical = extractable.get(id(node))
+            if canonical is not None and node is not keep:
+                name = candidates[id(canonical)].name
+                if name is not None:
+                    results.append(IdentifierExpression(name))
+                    continue
+            names = _CHILD_FIELDS.get(type(node))
+            if not names:
+                results.append(node)
+                continue
+            stack.append((node, names))
+            stack.extend((getattr(node, name), None) for name in reversed(names))
+        return results[0]
+
+
+class _Scope:
+    """_count中最近一层的外层可提取表达式"""
+    __slots__ = ('children', 'recording')
+
+    def __init__(self, candidate, recording):
+        self.children = candidate.children
+        self.recording = recording
+
+
+# 可提取的表达式由这些类型组成：类型 -> 子表达式字段。都是ExpressionInterner可以共享的类型；
+# 其他表达式（函数调用、拼接）不提取，也不在其中查找
+_CHILD_FIELDS = {
+    IdentifierExpression: (),
+    NumberExpression: (),
+    NewNumberExpression: (),
+    EnumReference: (),
+    BinaryExpression: ('left', 'right'),
+    UnaryExpression: ('operand',),
+    ReduceOperation: ('operand',),
+    ConditionalExpression: ('condition', 'true_expr', 'false_expr'),
+    IndexExpression: ('index',),
+    SliceExpression: ('msb', 'lsb'),
+}
+
+
+def _replace(node, names, values):
+    """复制表达式节点，names字段改为values"""
+    copy = type(node).__new__(type(node))
+    for name in type(node).__slots__:
+        setattr(copy, name, getattr(node, name))
+    for name, value in zip(names, values):
+        setattr(copy, name, value)
+    return copy
+
+
+def _reads(node):
+    """节点本身直接读取的信号名（标识符、下标和切片的数组名），不读取信号时为None"""
+    if isinstance(node, IdentifierExpression):
+        return node.name
+    if isinstance(node, (IndexExpression, SliceExpression)) and isinstance(node.array, str):
+        return node.array
+    return None
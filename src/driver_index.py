@@ -0,0 +1,74 @@
+"""
+GraceHDL信号驱动索引
+每个模块遍历一次，记录每个信号由哪些结构驱动（always、run、assign、模块实例），
+输出端口的reg/wire推断等检查直接查询索引，无需对每个信号重新遍历语句。
+"""
+
+try:
+    from .ast_nodes import AlwaysSection, AssignSection, ModuleInstantiation, PortConnection, RunSection
+except ImportError:
+    from ast_nodes import AlwaysSection, AssignSection, ModuleInstantiation, PortConnection, RunSection
+
+# 驱动结构类型
+ALWAYS = 'always'
+RUN = 'run'
+ASSIGN = 'assign'
+INSTANCE = 'instance'
+
+_MISSING = object()
+
+
+def target_name(target):
+    """赋值目标的信号名：字符串直接返回，对象取其name属性，无法确定时返回None"""
+    if isinstance(target, str):
+        return target
+    return getattr(target, 'name', None)
+
+
+def build_driver_index(sections):
+    """构建模块的驱动索引，返回 {信号名: 驱动结构类型集合}"""
+    index = {}
+    for section in sections:
+        if isinstance(section, AlwaysSection):
+            _index_statements(index, section.statements, ALWAYS)
+        elif isinstance(section, RunSection):
+            _index_statements(index, section.statements, RUN)
+        elif isinstance(section, AssignSection):
+            for assignment in section.assignments:
+                if hasattr(assignment, 'target'):
+                    _add(index, target_name(assignment.target), ASSIGN)
+        elif isinstance(section, ModuleInstantiation):
+            # 端口方向要到链接时才知道，连接到实例的信号都视为可能由实例驱动
+            for connection in section.port_connections:
+                if isinstance(connection, PortConnection):
+                    _add(index, connection.signal_name, INSTANCE)
+    return index
+
+
+def _add(index, name, kind):
+    if name is not None:
+        drivers = index.get(name)
+        if drivers is None:
+            index[name] = {kind}
+        else:
+            drivers.add(kind)
+
+
+def _index_statements(index, statements, kind):
+    """记录语句中被赋值的信号：进入case项、if的then/elif/else分支"""
+    stack = list(statements or ())
+    while stack:
+        stmt = stack.pop()
+        target = getattr(stmt, 'target', _MISSING)
+        if target is not _MISSING:
+            _add(index, target_name(target), kind)
+        elif hasattr(stmt, 'case_items'):
+            for case_item in stmt.case_items:
+                if hasattr(case_item, 'statements'):
+                    stack.extend(case_item.statements or ())
+        elif hasattr(stmt, 'then_statements'):
+            stack.extend(stmt.then_statements or ())
+            for branch in getattr(stmt, 'elif_statements', None) or ():
+                stack.extend(branch.statements or ())
+            if hasattr(stmt, 'else_statements') and stmt.else_statements:
+                stack.extend(stmt.else_statements)
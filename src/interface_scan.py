@@ -0,0 +1,100 @@
+"""
+GraceHDL接口扫描
+只提取每个模块的模块名和 parameter/input/output 段，run/always/assign 等段按缩进
+整段跳过，不进行词法分析，也不构建语句的AST。用于跨文件解析模块实例化目标等
+只需要模块接口的场合。
+"""
+
+import re
+
+try:
+    from .ast_nodes import InputSection, ModuleDeclaration, OutputSection, ParameterDeclaration, \
+        ParameterSection, PortDeclaration
+except ImportError:
+    from ast_nodes import InputSection, ModuleDeclaration, OutputSection, ParameterDeclaration, \
+        ParameterSection, PortDeclaration
+
+_MODULE_RE = re.compile(r'module[ \t]+([A-Za-z_][A-Za-z_0-9]*)[ \t]*:')
+_HEADER_RE = re.compile(r'(?:parameter|input|output)[ \t]*\(')
+_TOP_LEVEL_RE = re.compile(r'(?:enum|def|interface|testbench)\b')
+_COMMENT_RE = re.compile(r'//.*|#.*|/\*.*?\*/')
+
+
+class ModuleInterface:
+    """模块接口记录"""
+    __slots__ = ('name', 'line', 'parameters', 'inputs', 'outputs')
+
+    def __init__(self, name, line, parameters=None, inputs=None, outputs=None):
+        self.name = name
+        self.line = line  # 模块声明所在行
+        self.parameters = parameters or []  # ParameterDeclaration列表
+        self.inputs = inputs or []  # PortDeclaration列表
+        self.outputs = outputs or []  # PortDeclaration列表
+
+    def __repr__(self):
+        return f"ModuleInterface({self.name}, {self.parameters}, {self.inputs}, {self.outputs})"
+
+
+def _paren_delta(line):
+    code = _COMMENT_RE.sub('', line)
+    return code.count('(') - code.count(')')
+
+
+def extract_module_headers(source_code):
+    """按缩进提取模块头部
+
+    返回 (头部源代码, [(模块名, 行号)])。头部源代码与原文行号一一对应：
+    模块声明行和 parameter/input/output 段保留，其余行替换为空行，
+    语法错误报告的行号与原文件一致。
+    """
+    lines = source_code.split('\n')
+    kept = [''] * len(lines)
+    modules = []
+    in_module = False
+    depth = 0  # 正在保留的段中未闭合的括号数
+    for index, line in enumerate(lines):
+        if depth > 0:
+            kept[index] = line
+            depth += _paren_delta(line)
+            continue
+        stripped = line.lstrip()
+        if not stripped or stripped[0] == '#' or stripped.startswith('//'):
+            continue
+        if len(stripped) == len(line):
+            # 顶层：模块声明，或模块之外的枚举、函数等（模块的段也可以不缩进）
+            match = _MODULE_RE.match(line)
+            if match is not None:
+                in_module = True
+                kept[index] = match.group(0)
+                modules.append((match.group(1), index + 1))
+                continue
+            if _TOP_LEVEL_RE.match(line):
+                in_module = False
+                continue
+        if in_module and _HEADER_RE.match(stripped):
+            kept[index] = line
+            depth = _paren_delta(line)
+    return '\n'.join(kept), modules
+
+
+def module_interface(module, line):
+    """从只含头部段的ModuleDeclaration构建接口记录"""
+    interface = ModuleInterface(module.name, line)
+    for section in module.sections:
+        if isinstance(section, ParameterSection):
+            target, items, kind = interface.parameters, section.parameters, ParameterDeclaration
+        elif isinstance(section, InputSection):
+            target, items, kind = interface.inputs, section.ports, PortDeclaration
+        elif isinstance(section, OutputSection):
+            target, items, kind = interface.outputs, section.ports, PortDeclaration
+        else:
+            continue
+        target.extend(item for item in items if isinstance(item, kind))
+    return interface
+
+
+def modules_in(ast):
+    """AST中的模块声明"""
+    if ast is None:
+        return []
+    return [item for item in ast.modules if isinstance(item, ModuleDeclaration)]
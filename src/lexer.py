@@ -3,8 +3,23 @@ GraceHDL词法分析器
 使用PLY库实现词法分析
 """
 
+
+import itertools
+import re
+import sys
+from functools import partial
+
 import ply.lex as lex
 
+# 预生成的词法表（主正则表达式），由 python -m src.build_tables 生成
+try:
+    from . import lextab as _lextab
+except ImportError:
+    try:
+        import lextab as _lextab
+    except ImportError:
+        _lextab = None
+
 class GraceHDLLexer:
     # 保留字
     reserved = {
@@ -156,12 +171,21 @@ class GraceHDLLexer:
     # 忽略空格和制表符（但不忽略换行符）
     t_ignore = ' \t'
 
-    def __init__(self):
+    # 缩进处理模式：'forward' 单遍前向扫描（默认），'rewind' 旧的回退重扫实现
+    INDENT_MODES = ('forward', 'rewind')
+
+    def __init__(self, indent_mode='forward'):
+        if indent_mode not in self.INDENT_MODES:
+            raise ValueError(f"未知的缩进处理模式: {indent_mode}")
+        self.indent_mode = indent_mode
         self.lexer = None
         self.indent_stack = [0]  # 缩进栈
         self.at_line_start = True
         self.paren_level = 0
         self.pending_dedents = 0  # 待处理的DEDENT数量
+        self.error_count = 0  # 当前输入中的非法字符数
+        self._next_token = None  # forward模式：返回下一个token的可调用对象
+        self._scanner = None  # forward模式：合并所有规则的扫描正则
 
     def t_COMMENT(self, t):
         r'//.*|/\*(.|\n)*?\*/|\#.*'
@@ -171,35 +195,17 @@ class GraceHDLLexer:
 
     def t_NEW_NUMBER_FORMAT(self, t):
         r'\(\s*[0-9a-fA-F]+\s*,\s*[dbho]\s*,\s*\d+\s*\)'  # 支持各种进制的数字格式
-        # 解析新的数值格式
-        content = t.value[1:-1]  # 去掉括号
-        parts = [part.strip() for part in content.split(',')]
-        if len(parts) == 3:
-            try:
-                value_str, base_str, width_str = parts
-                # 解析数值
-                if base_str == 'd':
-                    value = int(value_str, 10)
-                elif base_str == 'b':
-                    value = int(value_str, 2)
-                elif base_str == 'h':
-                    value = int(value_str, 16)
-                elif base_str == 'o':
-                    value = int(value_str, 8)
-                else:
-                    value = int(value_str, 10)
-                
-                width = int(width_str)
-                t.value = (value, base_str, width)
-                return t
-            except ValueError:
-                pass
-        # 如果解析失败，当作普通的括号处理
-        return None
+        t.value = _parse_number_format(t.value)
+        if t.value is None:
+            # 如果解析失败，当作普通的括号处理
+            return None
+        return t
 
     def t_IDENTIFIER(self, t):
         r'[a-zA-Z_][a-zA-Z_0-9]*'
         t.type = self.reserved.get(t.value, 'IDENTIFIER')
+        # 同名标识符共享一个字符串对象，AST中不再为每次出现保存一份
+        t.value = sys.intern(t.value)
         return t
 
     def t_HEX_NUMBER(self, t):
@@ -231,23 +237,214 @@ class GraceHDLLexer:
 
     def t_error(self, t):
         print(f"非法字符 '{t.value[0]}' 在行 {t.lineno}")
+        self.error_count += 1
         t.lexer.skip(1)
 
     def build(self, **kwargs):
+        """构建词法分析器，存在预生成词法表时直接加载，不做任何文件写入"""
+        if _lextab is not None:
+            kwargs.setdefault('optimize', True)
+            kwargs.setdefault('lextab', _lextab)
         self.lexer = lex.lex(module=self, **kwargs)
+        if self.indent_mode == 'forward':
+            self._build_scanner()
         return self.lexer
-    
-    def input(self, data):
-        """设置输入数据"""
+
+    def _build_scanner(self):
+        """为forward模式构建扫描正则
+
+        把忽略字符和所有规则合并为一个正则，每个规则后附加一个空的标记分组，
+        用 lastindex 直接定位匹配到的规则。规则的正则、处理函数和顺序都取自PLY
+        构建的词法分析器（见 _ply_rules），规则方法照常调用；最后附加匹配任意单个
+        非忽略字符的错误分组，扫描时不会跳过无法匹配的字符。
+        连续的字面量规则（运算符、标点）合并为一个分组，匹配后按文本查token类型。
+        """
+        rules, ignore_chars, flags = _ply_rules(self.lexer, self)
+        alternatives = []
+        # 标记分组名 -> (处理方式, token类型, 处理函数)；字面量分组的token类型为 文本 -> 类型 的表
+        handlers = {}
+        for literals, run in itertools.groupby(rules, key=lambda rule: _rule_literal(rule, flags) is not None):
+            run = list(run)
+            if literals:
+                literals = [_rule_literal(rule, flags) for rule in run]
+                pattern = _literal_alternative(literals)
+                if pattern is not None:
+                    name = '_literal%d' % len(alternatives)
+                    alternatives.append('(?:%s)(?P<%s>)' % (pattern, name))
+                    types = {}
+                    for literal, rule in zip(literals, run):
+                        types.setdefault(literal, rule[3])  # 相同的字面量以先出现的规则为准
+                    handlers[name] = (_RULE_LITERAL, types, None)
+                    continue
+            for name, pattern, func, toktype in run:
+                alternatives.append('(?:%s)(?P<%s>)' % (pattern, name))
+                handlers[name] = (_RULE_PLAIN if func is None else _RULE_CALL, toktype, func)
+
+        if ignore_chars:
+            ignore = '[%s]*' % re.escape(ignore_chars)
+            alternatives.append('(?P<_error>[^%s])' % re.escape(ignore_chars))
+        else:
+            ignore = ''
+            alternatives.append('(?P<_error>[\\s\\S])')
+        handlers['_error'] = (_RULE_ERROR, None, None)
+        self._scanner = re.compile('(%s)(?:%s)' % (ignore, '|'.join(alternatives)), flags)
+
+        # 标记分组序号 -> 处理方式 / token类型 / 处理函数
+        size = self._scanner.groups + 1
+        self._rule_kinds = [None] * size
+        self._rule_types = [None] * size
+        self._rule_funcs = [None] * size
+        for name, index in self._scanner.groupindex.items():
+            self._rule_kinds[index], self._rule_types[index], self._rule_funcs[index] = handlers[name]
+
+    def input(self, data, first_line=1):
+        """设置输入数据，first_line为data第一行在原文件中的行号"""
         self.lexer.input(data)
-        # 重置状态
+        # 重置状态（PLY的input不会重置行号）
+        self.lexer.lineno = first_line
         self.indent_stack = [0]
         self.at_line_start = True
         self.paren_level = 0
         self.pending_dedents = 0
+        self.error_count = 0
+        self._next_token = None
 
     def token(self):
         """处理缩进的token方法"""
+        if self.indent_mode == 'forward':
+            if self._next_token is None:
+                batches = itertools.chain.from_iterable(self._forward_batches())
+                self._next_token = partial(next, batches, None)
+            return self._next_token()
+        return self._rewind_token()
+
+    def _forward_batches(self):
+        """单遍前向扫描，按批产生token列表
+
+        各行的行首空白预先由 _line_indents 一次取出，每行第一个有效token处按行号
+        查表，INDENT/DEDENT直接插入到该token之前，不回退lexpos重新扫描。
+        带处理函数的规则与PLY中一样调用；每遇到一次换行检查批的大小。
+        """
+        lexer = self.lexer
+        data = lexer.lexdata
+        pos = lexer.lexpos
+        scanner = self._scanner.scanner
+        rule_kinds = self._rule_kinds
+        rule_types = self._rule_types
+        rule_funcs = self._rule_funcs
+        stack = self.indent_stack
+        first_line_start = data.rfind('\n', 0, pos) + 1
+        indents = _line_indents(data, first_line_start)
+        line = data.count('\n', first_line_start, pos)  # 当前行在缩进表中的序号
+        same_level_indent = None
+        LexToken = lex.LexToken
+
+        batch = []
+        append = batch.append
+        restart = True
+        while restart:
+            restart = False
+            # 错误分组能匹配任何非忽略字符，各次匹配首尾相接，逐个在上次结束处匹配即可
+            for m in iter(scanner(data, pos).match, None):
+                start = m.end(1)
+                pos = m.end()
+                index = m.lastindex
+                kind = rule_kinds[index]
+                text = data[start:pos]
+                if '\n' in text:
+                    line += text.count('\n')
+                tok = LexToken()
+                tok.value = text
+                tok.lineno = lexer.lineno
+                tok.lexpos = start
+                if kind == _RULE_CALL:
+                    tok.type = rule_types[index]
+                    tok.lexer = lexer
+                    lexer.lexmatch = m
+                    lexer.lexpos = pos
+                    tok = rule_funcs[index](tok)
+                    if lexer.lexpos != pos:
+                        # 处理函数修改了扫描位置，从新位置重新扫描
+                        pos = lexer.lexpos
+                        line = data.count('\n', first_line_start, pos)
+                        restart = True
+                    if not tok:
+                        if restart:
+                            break
+                        continue
+                    del tok.lexer
+                    toktype = tok.type
+                    if toktype == 'NEWLINE' or toktype == 'COMMENT':
+                        append(tok)
+                        if restart:
+                            break
+                        if len(batch) >= _BATCH_SIZE:
+                            yield batch
+                            batch = []
+                            append = batch.append
+                        continue
+                elif kind == _RULE_LITERAL:
+                    tok.type = rule_types[index][text]
+                elif kind == _RULE_PLAIN:
+                    toktype = rule_types[index]
+                    if toktype is None:
+                        continue
+                    tok.type = toktype
+                else:
+                    pos = self._forward_error(start, append)
+                    line = data.count('\n', first_line_start, pos)
+                    restart = True
+                    break
+
+                if self.at_line_start:
+                    # 行首的第一个有效token：查本行的缩进，产生INDENT/DEDENT
+                    self.at_line_start = False
+                    indent = indents[line]
+                    if indent != same_level_indent:
+                        level = len(indent) + 7 * indent.count('\t')  # 制表符算8列
+                        if level > stack[-1]:
+                            stack.append(level)
+                            append(_make_token('INDENT', tok.lineno, tok.lexpos))
+                        else:
+                            while stack[-1] > level:
+                                stack.pop()
+                                append(_make_token('DEDENT', tok.lineno, tok.lexpos))
+                        # 下一行的行首空白与本行相同时缩进级别等于栈顶，不必再比较
+                        same_level_indent = indent if stack[-1] == level else None
+                append(tok)
+                if restart:
+                    break
+
+        # 扫描到末尾：剩余部分只能是忽略字符
+        lexer.lexpos = len(data)
+        # 文件结束，生成所有剩余的DEDENT
+        while len(stack) > 1:
+            stack.pop()
+            append(_make_token('DEDENT', lexer.lineno, lexer.lexpos))
+        yield batch
+
+    def _forward_error(self, pos, append):
+        """非法字符：与PLY一致，交给t_error处理，返回新的扫描位置"""
+        lexer = self.lexer
+        data = lexer.lexdata
+        if not lexer.lexerrorf:
+            raise lex.LexError(f"Illegal character '{data[pos]}' at index {pos}", data[pos:])
+        tok = lex.LexToken()
+        tok.value = data[pos:]
+        tok.lineno = lexer.lineno
+        tok.type = 'error'
+        tok.lexer = lexer
+        tok.lexpos = pos
+        lexer.lexpos = pos
+        tok = lexer.lexerrorf(tok)
+        if pos == lexer.lexpos:
+            raise lex.LexError(f"Scanning error. Illegal character '{data[pos]}'", data[pos:])
+        if tok:
+            append(tok)
+        return lexer.lexpos
+
+    def _rewind_token(self):
+        """旧的缩进处理实现：回退lexpos并重新扫描行首token"""
         # 如果有待处理的DEDENT，先返回它们
         if self.pending_dedents > 0:
             self.pending_dedents -= 1
@@ -340,6 +537,96 @@ class GraceHDLLexer:
         # 缩进级别相同，不返回缩进标记
         return None
 
+
+# forward模式读取其内部结构（lexre、lexreflags、_get_regex）验证过的PLY版本
+_PLY_VERSIONS = ('3.11',)
+
+# 只匹配固定文本的规则：转义的标点或普通字符（VERBOSE模式下的空白和#除外）
+_LITERAL_PATTERN_RE = re.compile(r'(?:\\[^A-Za-z0-9\s]|[^\\.^$*+?{}\[\]|()#\s])+')
+
+# 每行的行首空白
+_LINE_INDENT_RE = re.compile(r'^[ \t]*', re.MULTILINE)
+
+# forward模式中规则的处理方式：调用处理函数、不带处理函数、合并的字面量、非法字符
+_RULE_CALL, _RULE_PLAIN, _RULE_LITERAL, _RULE_ERROR = range(4)
+
+# 数值格式中进制字母对应的基数
+_NUMBER_BASES = {'d': 10, 'b': 2, 'h': 16, 'o': 8}
+
+# forward模式每批产生的token数量
+_BATCH_SIZE = 256
+
+
+def _ply_rules(lexer, module):
+    """取出PLY词法分析器的规则，返回 ([(规则名, 正则, 处理函数, token类型)], 忽略字符, 正则标志)
+
+    规则按PLY主正则的匹配顺序排列。forward模式只在这里读取PLY的内部属性，
+    PLY版本不在 _PLY_VERSIONS 中时报错，不在未验证的结构上构建扫描正则。
+    """
+    if lex.__version__ not in _PLY_VERSIONS:
+        raise RuntimeError(f"forward缩进模式未在PLY {lex.__version__} 上验证，请使用 indent_mode='rewind'")
+    rules = []
+    for regex, indexfunc in lexer.lexre:
+        for name, index in sorted(regex.groupindex.items(), key=lambda item: item[1]):
+            func, toktype = indexfunc[index]
+            pattern = getattr(module, name) if func is None else lex._get_regex(func)
+            rules.append((name, pattern, func, toktype))
+    return rules, lexer.lexignore, lexer.lexreflags
+
+
+def _rule_literal(rule, flags):
+    """只匹配固定文本的字符串规则返回该文本，否则返回None"""
+    pattern, func, toktype = rule[1:]
+    if func is not None or toktype is None or flags & re.IGNORECASE or not _LITERAL_PATTERN_RE.fullmatch(pattern):
+        return None
+    return re.sub(r'\\(.)', r'\1', pattern)
+
+
+def _literal_alternative(literals):
+    """按给定顺序依次尝试这些字面量的正则：多字符的保持原顺序，单字符的合成一个字符集放在最后
+
+    单字符的字面量排在以它开头的多字符字面量之前时，顺序不能这样调整，返回None。
+    """
+    singles = []
+    for literal in literals:
+        if len(literal) == 1:
+            singles.append(literal)
+        elif literal[0] in singles:
+            return None
+    patterns = [re.escape(literal) for literal in literals if len(literal) > 1]
+    if singles:
+        patterns.append('[%s]' % ''.join(map(re.escape, singles)))
+    return '|'.join(patterns)
+
+
+def _line_indents(data, start=0):
+    """缩进表：从start处的行首开始，第i项为第i行的行首空白"""
+    return _LINE_INDENT_RE.findall(data, start)
+
+
+def _parse_number_format(text):
+    """解析 (数值, 进制, 位宽) 格式，返回 (value, base, width)；解析失败返回None"""
+    parts = [part.strip() for part in text[1:-1].split(',')]  # 去掉括号
+    if len(parts) != 3:
+        return None
+    value_str, base_str, width_str = parts
+    try:
+        value = int(value_str, _NUMBER_BASES.get(base_str, 10))
+        width = int(width_str)
+    except ValueError:
+        return None
+    return (value, base_str, width)
+
+
+def _make_token(toktype, lineno, lexpos):
+    """创建INDENT/DEDENT等不携带值的token"""
+    tok = lex.LexToken()
+    tok.type = toktype
+    tok.value = None
+    tok.lineno = lineno
+    tok.lexpos = lexpos
+    return tok
+
 if __name__ == "__main__":
     # 测试词法分析器
     lexer = GraceHDLLexer()
@@ -357,7 +644,7 @@ module test_module
             counter <= counter + 1
 """
     
-    lexer.lexer.input(test_code)
+    lexer.input(test_code)
     
     while True:
         tok = lexer.token()
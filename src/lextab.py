@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ALWAYS', 'AND', 'AND_KW', 'ASSERT', 'ASSIGN', 'ASSIGN_NB', 'ASSIGN_OP', 'AT', 'BEGIN', 'BINARY_NUMBER', 'CASE', 'CLOCK', 'CLOCKED_BY', 'COLON', 'COMMA', 'COMMENT', 'COVER', 'DEDENT', 'DEF', 'DEFAULT', 'DIVIDE', 'DOT', 'DUMP_WAVES', 'ELIF', 'ELSE', 'ELSIF', 'END', 'ENDMODULE', 'ENUM', 'EQ', 'FOR', 'FUNCTION', 'GE', 'GENERATE', 'GT', 'HEX_NUMBER', 'IDENTIFIER', 'IF', 'IMPLIES', 'IN', 'INDENT', 'INITIAL', 'INOUT', 'INPUT', 'INTERFACE', 'LAND', 'LBRACE', 'LBRACKET', 'LE', 'LNOT', 'LOCALPARAM', 'LOR', 'LPAREN', 'LSHIFT', 'LT', 'MINUS', 'MODULE', 'MODULO', 'NAND', 'NE', 'NEGEDGE', 'NEWLINE', 'NEW_NUMBER_FORMAT', 'NOR', 'NOT', 'NOT_KW', 'NUMBER', 'OCTAL_NUMBER', 'OR', 'OR_KW', 'OUTPUT', 'PARAMETER', 'PERIOD', 'PLUS', 'PORT', 'POSEDGE', 'QUESTION', 'RANGE', 'RBRACE', 'RBRACKET', 'REDUCE_AND', 'REDUCE_OR', 'REDUCE_XOR', 'REG', 'REGISTER', 'REPORT_COVERAGE', 'RETURN', 'RPAREN', 'RSHIFT', 'RUN', 'SEMICOLON', 'SIGNAL', 'STRING', 'TASK', 'TESTBENCH', 'TIMES', 'TO', 'WAIT', 'WHILE', 'WIRE', 'WITH', 'XNOR', 'XOR', 'XOR_KW'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_COMMENT>//.*|/\\*(.|\\n)*?\\*/|\\#.*)|(?P<t_NEW_NUMBER_FORMAT>\\(\\s*[0-9a-fA-F]+\\s*,\\s*[dbho]\\s*,\\s*\\d+\\s*\\))|(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_HEX_NUMBER>[0-9]*\'h[0-9a-fA-F_]+)|(?P<t_BINARY_NUMBER>[0-9]*\'b[01_]+)|(?P<t_OCTAL_NUMBER>[0-9]*\'o[0-7_]+)|(?P<t_NUMBER>\\d+)|(?P<t_STRING>"([^"\\\\]|\\\\.)*")|(?P<t_NEWLINE>\\n+)|(?P<t_LOR>\\|\\|)|(?P<t_NOR>~\\|)|(?P<t_XNOR>~\\^)|(?P<t_ASSIGN_NB><=)|(?P<t_DOT>\\.)|(?P<t_EQ>==)|(?P<t_GE>>=)|(?P<t_LAND>&&)|(?P<t_LBRACE>\\{)|(?P<t_LBRACKET>\\[)|(?P<t_LE><=)|(?P<t_LPAREN>\\()|(?P<t_LSHIFT><<)|(?P<t_NAND>~&)|(?P<t_NE>!=)|(?P<t_OR>\\|)|(?P<t_PLUS>\\+)|(?P<t_QUESTION>\\?)|(?P<t_RBRACE>\\})|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_RSHIFT>>>)|(?P<t_TIMES>\\*)|(?P<t_XOR>\\^)|(?P<t_AND>&)|(?P<t_ASSIGN_OP>=)|(?P<t_AT>@)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GT>>)|(?P<t_LNOT>!)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_MODULO>%)|(?P<t_NOT>~)|(?P<t_SEMICOLON>;)', [None, ('t_COMMENT', 'COMMENT'), None, ('t_NEW_NUMBER_FORMAT', 'NEW_NUMBER_FORMAT'), ('t_IDENTIFIER', 'IDENTIFIER'), ('t_HEX_NUMBER', 'HEX_NUMBER'), ('t_BINARY_NUMBER', 'BINARY_NUMBER'), ('t_OCTAL_NUMBER', 'OCTAL_NUMBER'), ('t_NUMBER', 'NUMBER'), ('t_STRING', 'STRING'), None, ('t_NEWLINE', 'NEWLINE'), (None, 'LOR'), (None, 'NOR'), (None, 'XNOR'), (None, 'ASSIGN_NB'), (None, 'DOT'), (None, 'EQ'), (None, 'GE'), (None, 'LAND'), (None, 'LBRACE'), (None, 'LBRACKET'), (None, 'LE'), (None, 'LPAREN'), (None, 'LSHIFT'), (None, 'NAND'), (None, 'NE'), (None, 'OR'), (None, 'PLUS'), (None, 'QUESTION'), (None, 'RBRACE'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'RSHIFT'), (None, 'TIMES'), (None, 'XOR'), (None, 'AND'), (None, 'ASSIGN_OP'), (None, 'AT'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GT'), (None, 'LNOT'), (None, 'LT'), (None, 'MINUS'), (None, 'MODULO'), (None, 'NOT'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
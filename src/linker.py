@@ -0,0 +1,150 @@
+"""
+GraceHDL模块链接
+跨文件的设计展开检查：从每个文件的AST中提取模块接口和模块实例（LinkUnit，
+可以在编译进程之间传递），建立全工程的模块表，再把每个 ModuleInstantiation /
+DutInstantiation 与模块表对照，一遍报告未定义的模块、不存在的端口和参数，
+以及重复定义的模块。每个文件只需分析一次。
+"""
+
+try:
+    from .ast_nodes import AlwaysSection, AssignSection, ASTNode, DutInstantiation, InputSection, \
+        ModuleDeclaration, ModuleInstantiation, OutputSection, ParameterAssignment, ParameterSection, \
+        PortConnection, RegisterSection, RunSection, TestbenchDeclaration
+    from .interface_scan import module_interface
+except ImportError:
+    from ast_nodes import AlwaysSection, AssignSection, ASTNode, DutInstantiation, InputSection, \
+        ModuleDeclaration, ModuleInstantiation, OutputSection, ParameterAssignment, ParameterSection, \
+        PortConnection, RegisterSection, RunSection, TestbenchDeclaration
+    from interface_scan import module_interface
+
+INSTANCE_TYPES = (ModuleInstantiation, DutInstantiation)
+
+# 文法上不会包含模块实例的段（实例只出现在模块段、生成语句和测试台中），查找时不进入
+_NO_INSTANCES = (InputSection, OutputSection, RegisterSection, ParameterSection,
+                 RunSection, AlwaysSection, AssignSection)
+
+
+def find_instantiations(node, types=(ModuleInstantiation,)):
+    """按源代码顺序返回node内（包括生成语句中）所有types类型的实例节点"""
+    found = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, types):
+            found.append(item)
+        elif isinstance(item, _NO_INSTANCES):
+            continue
+        elif isinstance(item, ASTNode):
+            stack.extend(reversed([value for _, value in item.fields()]))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+    return found
+
+
+class LinkUnit:
+    """一个文件的链接信息，只包含字符串和元组，可以直接在进程之间传递"""
+    __slots__ = ('path', 'modules', 'instances')
+
+    def __init__(self, path, modules, instances):
+        self.path = path
+        # [(模块名, 端口名元组, 参数名元组)]
+        self.modules = modules
+        # [(所在模块, 实例名, 被实例化的模块, 连接的端口名元组, 设置的参数名元组)]
+        self.instances = instances
+
+
+def link_unit(ast, path):
+    """从AST提取链接信息"""
+    modules = []
+    instances = []
+    for item in ast.items:
+        if isinstance(item, ModuleDeclaration):
+            interface = module_interface(item, 0)
+            ports = tuple(name for port in interface.inputs + interface.outputs for name in port.names)
+            modules.append((item.name, ports, tuple(parameter.name for parameter in interface.parameters)))
+            parent = item.name
+            body = item.sections
+        elif isinstance(item, TestbenchDeclaration):
+            parent = f'testbench for {item.module_name}'
+            body = item.body
+        else:
+            continue
+        for instance in find_instantiations(body, INSTANCE_TYPES):
+            connections = tuple(connection.port_name for connection in instance.port_connections
+                                if isinstance(connection, PortConnection))
+            parameters = tuple(assignment.name for assignment in instance.parameters
+                               if isinstance(assignment, ParameterAssignment))
+            instances.append((parent, instance.instance_name, instance.module_name, connections, parameters))
+    return LinkUnit(path, modules, instances)
+
+
+class LinkError:
+    """链接错误"""
+    __slots__ = ('path', 'module', 'instance', 'message')
+
+    def __init__(self, path, module, instance, message):
+        self.path = path
+        self.module = module  # 出错的实例所在的模块（重复定义时为模块名）
+        self.instance = instance  # 实例名，重复定义时为None
+        self.message = message
+
+    def __str__(self):
+        where = f"{self.module}.{self.instance}" if self.instance else self.module
+        return f"{self.path}: {where}: {self.message}"
+
+    def __repr__(self):
+        return f"LinkError({self})"
+
+
+class ModuleLinker:
+    """收集各文件的链接信息，全部收集后一次检查"""
+
+    def __init__(self):
+        self.units = {}  # 文件路径 -> LinkUnit
+
+    def add(self, ast, path):
+        """收集一个文件的链接信息，替换同一文件之前收集的信息（监视模式下重新编译）"""
+        self.units[path] = link_unit(ast, path)
+
+    def extend(self, units):
+        for unit in units:
+            self.units[unit.path] = unit
+
+    def remove(self, path):
+        """删除已不存在的文件的链接信息"""
+        self.units.pop(path, None)
+
+    def take(self):
+        """取出并清空已收集的链接信息（工作进程把它们交回主进程）"""
+        units, self.units = list(self.units.values()), {}
+        return units
+
+    def link(self):
+        """建立模块表并检查所有实例，返回LinkError列表"""
+        errors = []
+        table = {}
+        # 按文件路径排序，报告顺序和"首次定义"与收集顺序（如并行编译的完成顺序）无关
+        units = sorted(self.units.values(), key=lambda unit: unit.path)
+        for unit in units:
+            for name, ports, parameters in unit.modules:
+                if name in table:
+                    errors.append(LinkError(unit.path, name, None,
+                                            f"模块重复定义，首次定义在 {table[name][0]}"))
+                    continue
+                table[name] = (unit.path, frozenset(ports), frozenset(parameters))
+
+        for unit in units:
+            for parent, instance, target, connections, parameters in unit.instances:
+                definition = table.get(target)
+                if definition is None:
+                    errors.append(LinkError(unit.path, parent, instance, f"未定义的模块 {target}"))
+                    continue
+                _, ports, known_parameters = definition
+                for port in connections:
+                    if port not in ports:
+                        errors.append(LinkError(unit.path, parent, instance, f"模块 {target} 没有端口 {port}"))
+                for parameter in parameters:
+                    if parameter not in known_parameters:
+                        errors.append(LinkError(unit.path, parent, instance,
+                                                f"模块 {target} 没有参数 {parameter}"))
+        return errors
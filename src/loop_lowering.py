@@ -0,0 +1,96 @@
+"""
+GraceHDL for循环降级策略
+`for i in range(...)` 可以在编译时展开，也可以输出为带 integer 下标的Verilog for循环。
+迭代次数不超过展开上限的循环展开；次数更多（或范围依赖外层Verilog for循环的下标、
+通用输出中可以被实例覆盖的模块参数）且位于过程块中、循环体可以直接用变量下标表示的循环输出为Verilog for循环。
+每个循环记录所用策略、迭代次数和输出的行数。
+"""
+
+try:
+    from .ast_nodes import ASTNode, IdentifierExpression, IndexExpression, ModuleInstantiation, SliceExpression
+except ImportError:
+    from ast_nodes import ASTNode, IdentifierExpression, IndexExpression, ModuleInstantiation, SliceExpression
+
+# 默认展开上限：迭代次数超过它的循环输出为Verilog for循环
+DEFAULT_UNROLL_LIMIT = 64
+
+UNROLL = 'unroll'
+EMIT = 'emit'
+
+STRATEGY_NAMES = {UNROLL: '展开', EMIT: 'Verilog for'}
+
+
+def trip_count(start, end, step):
+    """range(start, end, step) 的迭代次数"""
+    return len(range(start, end, step))
+
+
+def referenced_names(node):
+    """node中引用的标识符名集合（包括数组索引、切片的数组名）"""
+    names = set()
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, IdentifierExpression):
+            names.add(item.name)
+        elif isinstance(item, ASTNode):
+            if isinstance(item, (IndexExpression, SliceExpression)) and isinstance(item.array, str):
+                names.add(item.array)
+            stack.extend(value for _, value in item.fields())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return names
+
+
+def native_loop_blocker(node):
+    """循环体不能用Verilog for循环的变量下标表示时返回原因，可以时返回None"""
+    loop_var = node.loop_var
+    stack = list(node.statements)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ModuleInstantiation):
+            return '循环体包含模块实例'
+        if isinstance(item, SliceExpression):
+            if loop_var in referenced_names([item.msb, item.lsb]):
+                return f'切片范围依赖循环变量 {loop_var}'
+        if isinstance(item, (IndexExpression, SliceExpression)) and item.array == loop_var:
+            return f'循环变量 {loop_var} 用作数组名'
+        if isinstance(item, ASTNode):
+            stack.extend(value for _, value in item.fields())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return None
+
+
+class LoopRecord:
+    """一个for循环的降级记录；循环位于被展开的外层循环中时，每次出现都累计到同一记录"""
+    __slots__ = ('module', 'loop_var', 'strategy', 'trips', 'expansions', 'lines')
+
+    def __init__(self, module, loop_var):
+        self.module = module
+        self.loop_var = loop_var
+        self.strategy = None
+        self.trips = 0  # 各次出现的迭代次数之和，有范围不是常量的出现时为None
+        self.expansions = 0  # 出现次数
+        self.lines = 0  # 输出的总行数
+
+    def add(self, strategy, trips, lines):
+        self.strategy = strategy
+        self.trips = None if trips is None or self.trips is None else self.trips + trips
+        self.expansions += 1
+        self.lines += lines
+
+    def to_dict(self):
+        return {
+            'module': self.module,
+            'loop_var': self.loop_var,
+            'strategy': self.strategy,
+            'trips': self.trips,
+            'expansions': self.expansions,
+            'lines': self.lines,
+        }
+
+    def describe(self):
+        trips = '?' if self.trips is None else self.trips
+        return (f"{self.module or '-'}: for {self.loop_var} - {STRATEGY_NAMES[self.strategy]}, "
+                f"{self.expansions} 处共 {trips} 次迭代, 输出 {self.lines} 行")
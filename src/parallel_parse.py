@@ -0,0 +1,140 @@
+"""
+GraceHDL并行语法分析
+在第0列的顶层关键字（module/enum/def/interface/testbench）处切分源文件，把连续的
+若干顶层项合成一块，在进程池中分别分析，再按原顺序拼接成一个SourceText。
+每块从它在原文件中的行号开始计数，行号与串行分析一致；任何一块报告错误时，
+整个文件改为串行分析，错误信息和错误恢复的结果与串行分析完全相同。
+
+工作进程用 ast_serializer 的二进制格式返回各块的顶层项：对 __slots__ 节点，
+它的编码和解码都比pickle快，解码在主进程中串行进行，是并行分析的主要额外开销。
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+
+try:
+    from .ast_nodes import ExpressionInterner, ModuleDeclaration, SourceText
+    from .ast_serializer import dump_ast, load_ast
+    from .parser import GraceHDLParser
+except ImportError:
+    from ast_nodes import ExpressionInterner, ModuleDeclaration, SourceText
+    from ast_serializer import dump_ast, load_ast
+    from parser import GraceHDLParser
+
+_TOP_LEVEL_RE = re.compile(r'^(?:module|enum|def|interface|testbench)\b', re.MULTILINE)
+
+# 小于这个字符数的源文件直接串行分析，进程间传递的开销大于并行的收益
+DEFAULT_MIN_SIZE = 64 * 1024
+
+
+def split_top_level(source_code):
+    """在第0列的顶层关键字处切分，返回 [(起始行号, 文本)]
+
+    第一个顶层项之前的注释和空行并入第一块。
+    """
+    starts = [match.start() for match in _TOP_LEVEL_RE.finditer(source_code)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    chunks = []
+    line = 1
+    for start, end in zip(starts, starts[1:] + [len(source_code)]):
+        text = source_code[start:end]
+        chunks.append((line, text))
+        line += text.count('\n')
+    return chunks
+
+
+def group_chunks(chunks, groups):
+    """把相邻的块合并为大小接近的groups组，返回 [(起始行号, 文本)]"""
+    total = sum(len(text) for _, text in chunks)
+    target = total / groups
+    merged = []
+    first_line, texts, size = None, [], 0
+    for line, text in chunks:
+        if first_line is None:
+            first_line = line
+        texts.append(text)
+        size += len(text)
+        if size >= target * (len(merged) + 1):
+            merged.append((first_line, ''.join(texts)))
+            first_line, texts = None, []
+    if texts:
+        merged.append((first_line, ''.join(texts)))
+    return merged
+
+
+class ParallelParser:
+    """多进程语法分析器，进程池在第一次并行分析时创建并在多次分析间复用"""
+
+    def __init__(self, parser, jobs, min_size=DEFAULT_MIN_SIZE):
+        self.parser = parser  # 串行分析和回退时使用的GraceHDLParser
+        self.jobs = jobs
+        self.min_size = min_size
+        self._executor = None
+
+    def parse(self, source_code):
+        """分析源代码，返回与串行分析相同的AST（失败时为None）"""
+        chunks = split_top_level(source_code) if len(source_code) >= self.min_size else []
+        if self.jobs > 1 and len(chunks) > 1:
+            ast = self._parse_chunks(group_chunks(chunks, min(self.jobs, len(chunks))))
+            if ast is not None:
+                self.parser.error_count = 0
+                self.parser.lexer.error_count = 0
+                return ast
+        lexer = self.parser.lexer
+        lexer.input(source_code)
+        return self.parser.parser.parse(lexer=lexer, debug=False)
+
+    def _parse_chunks(self, chunks):
+        """并行分析各块并拼接，有块报告错误时返回None"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                                 initargs=(self.parser.interner is not None,))
+        items = []
+        for data in self._executor.map(_parse_in_worker, chunks):
+            if data is None:
+                return None
+            items.extend(load_ast(data))
+        modules = [item for item in items if isinstance(item, ModuleDeclaration)]
+        return SourceText(modules, items)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# 工作进程中的语法分析器，由_init_worker在进程启动时构建一次（加载预生成的分析表）
+_worker_parser = None
+
+
+def _init_worker(share_expressions=False):
+    global _worker_parser
+    _worker_parser = GraceHDLParser()
+    _worker_parser.build()
+    if share_expressions:
+        # 块内共享的表达式节点序列化为共享引用，主进程加载后仍是同一个对象
+        _worker_parser.interner = ExpressionInterner()
+
+
+def _parse_in_worker(chunk):
+    """分析一块源代码，返回其顶层项列表的序列化数据
+
+    有词法或语法错误，或语法树太深无法序列化时返回None，由主进程串行分析。
+    """
+    first_line, text = chunk
+    parser = _worker_parser
+    parser.error_count = 0
+    parser.lexer.input(text, first_line)
+    with redirect_stdout(StringIO()):
+        ast = parser.parser.parse(lexer=parser.lexer, debug=False)
+    if parser.interner is not None:
+        parser.interner.clear()
+    if ast is None or parser.error_count or parser.lexer.error_count:
+        return None
+    try:
+        return dump_ast(ast.items)
+    except RecursionError:
+        return None
@@ -3,20 +3,35 @@ GraceHDL语法分析器 - 新语法版本
 支持新的GraceHDL语法特性：run语句、always语句、新数值格式等
 """
 
+from contextlib import redirect_stdout
+from io import StringIO
+
 import ply.yacc as yacc
 try:
     from .lexer import GraceHDLLexer
     from .ast_nodes import *
+    from .interface_scan import extract_module_headers, module_interface, modules_in
 except ImportError:
     from lexer import GraceHDLLexer
     from ast_nodes import *
+    from interface_scan import extract_module_headers, module_interface, modules_in
+
+# 预生成的LALR分析表（由 python -m src.build_tables 生成）
+try:
+    from . import parsetab as _parsetab
+except ImportError:
+    try:
+        import parsetab as _parsetab
+    except ImportError:
+        _parsetab = None
 
 class GraceHDLParser:
     def __init__(self):
         self.lexer = GraceHDLLexer()
-        self.lexer.build()
         self.tokens = self.lexer.tokens
         self.parser = None
+        self.error_count = 0  # 报告过的语法错误数，由调用方在分析前清零
+        self.interner = None  # 表达式节点的结构共享表（ExpressionInterner），为None时不共享
 
     # 运算符优先级定义
     precedence = (
@@ -31,10 +46,6 @@ class GraceHDLParser:
         ('right', 'UMINUS', 'NOT'),
     )
 
-    def build(self, **kwargs):
-        self.parser = yacc.yacc(module=self, **kwargs)
-        return self.parser
-
     # 语法规则定义
 
     def p_source_text(self, p):
@@ -49,9 +60,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_source_item(self, p):
         '''source_item : module_declaration
@@ -85,9 +95,8 @@ class GraceHDLParser:
                 p[0] = [p[1]] if p[1] is not None else []
         elif len(p) == 3:  # module_body module_section
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
         else:  # len(p) == 5, NEWLINE INDENT module_body DEDENT
             p[0] = p[3]
 
@@ -160,9 +169,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_port_item(self, p):
         '''port_item : port_declaration
@@ -195,9 +203,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_register_item(self, p):
         '''register_item : register_declaration
@@ -245,9 +252,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_parameter_item(self, p):
         '''parameter_item : parameter_declaration
@@ -290,9 +296,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_assign_statement(self, p):
         '''assign_statement : IDENTIFIER ASSIGN_OP expression
@@ -331,9 +336,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         elif len(p) == 3:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
         else:  # len(p) == 4, INDENT statement_list DEDENT
             p[0] = p[2]
 
@@ -401,7 +405,8 @@ class GraceHDLParser:
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_elif_statement(self, p):
         '''elif_statement : ELSIF expression COLON statement_list'''
@@ -426,14 +431,12 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         elif len(p) == 3:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
         else:  # len(p) == 4, with NEWLINE
             if p[3] is not None:
-                p[0] = p[1] + [p[3]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[3])
+            p[0] = p[1]
 
     def p_case_item(self, p):
         '''case_item : expression COLON statement_list
@@ -469,11 +472,17 @@ class GraceHDLParser:
 
     def p_module_instantiation(self, p):
         '''module_instantiation : IDENTIFIER IDENTIFIER LPAREN port_connection_list RPAREN
-                               | IDENTIFIER IDENTIFIER LPAREN RPAREN'''
+                               | IDENTIFIER IDENTIFIER LPAREN RPAREN
+                               | IDENTIFIER LPAREN parameter_assignments RPAREN IDENTIFIER LPAREN port_connection_list RPAREN
+                               | IDENTIFIER LPAREN parameter_assignments RPAREN IDENTIFIER LPAREN RPAREN'''
         if len(p) == 6:  # 有端口连接
             p[0] = ModuleInstantiation(p[1], p[2], p[4])
-        else:  # 无端口连接
+        elif len(p) == 5:  # 无端口连接
             p[0] = ModuleInstantiation(p[1], p[2], [])
+        elif len(p) == 9:  # 参数覆盖: module(WIDTH = 16) inst(.a(x))
+            p[0] = ModuleInstantiation(p[1], p[5], p[7], p[3])
+        else:  # 参数覆盖，无端口连接
+            p[0] = ModuleInstantiation(p[1], p[5], [], p[3])
 
     def p_port_connection_list(self, p):
         '''port_connection_list : port_connection_list COMMA port_connection
@@ -481,7 +490,8 @@ class GraceHDLParser:
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_port_connection(self, p):
         '''port_connection : DOT IDENTIFIER LPAREN IDENTIFIER RPAREN
@@ -572,6 +582,8 @@ class GraceHDLParser:
             elif operator == 'xor':
                 operator = '^'
             p[0] = BinaryExpression(operator, p[1], p[3])
+        if self.interner is not None:
+            p[0] = self.interner.intern(p[0])
 
     # 枚举类型语法规则
     def p_enum_declaration(self, p):
@@ -586,18 +598,12 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         elif len(p) == 3:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
         else:  # len(p) == 4, with NEWLINE
             if p[3] is not None:
-                p[0] = p[1] + [p[3]]
-            else:
-                p[0] = p[1]
-        
-        # 过滤掉None项
-        if isinstance(p[0], list):
-            p[0] = [item for item in p[0] if item is not None]
+                p[1].append(p[3])
+            p[0] = p[1]
 
     def p_enum_item(self, p):
         '''enum_item : IDENTIFIER ASSIGN_OP expression
@@ -632,7 +638,8 @@ class GraceHDLParser:
         if len(p) == 2:
             p[0] = [FunctionParameter(p[1])]
         else:
-            p[0] = p[1] + [FunctionParameter(p[3])]
+            p[1].append(FunctionParameter(p[3]))
+            p[0] = p[1]
 
     def p_return_statement(self, p):
         '''return_statement : RETURN expression'''
@@ -654,9 +661,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_interface_section(self, p):
         '''interface_section : parameter_section
@@ -685,9 +691,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_generate_statement(self, p):
         '''generate_statement : for_generate_statement
@@ -761,7 +766,8 @@ class GraceHDLParser:
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     # 测试台语法规则
     def p_testbench_declaration(self, p):
@@ -779,9 +785,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_testbench_section(self, p):
         '''testbench_section : parameter_section
@@ -833,7 +838,8 @@ class GraceHDLParser:
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_parameter_assignment(self, p):
         '''parameter_assignment : IDENTIFIER ASSIGN_OP expression'''
@@ -846,9 +852,8 @@ class GraceHDLParser:
             p[0] = [p[1]] if p[1] is not None else []
         else:
             if p[2] is not None:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_port_connection(self, p):
         '''port_connection : DOT IDENTIFIER LPAREN IDENTIFIER RPAREN
@@ -883,15 +888,23 @@ class GraceHDLParser:
         p[0] = None
 
     def p_error(self, p):
+        self.error_count += 1
         if p:
             print(f"语法错误在标记 {p.type} ('{p.value}') 行 {p.lineno}")
         else:
             print("语法错误：意外的文件结束")
 
     def build(self, **kwargs):
-        """构建语法分析器"""
-        self.lexer = GraceHDLLexer()
-        self.lexer.build()
+        """构建语法分析器
+
+        默认直接加载预生成的分析表，不写入 parsetab.py/parser.out；
+        若分析表与当前文法签名不一致，则在内存中重新生成。
+        """
+        if self.lexer.lexer is None:
+            self.lexer.build()
+        kwargs.setdefault('tabmodule', _parsetab if _parsetab is not None else 'parsetab')
+        kwargs.setdefault('debug', False)
+        kwargs.setdefault('write_tables', False)
         self.parser = yacc.yacc(module=self, **kwargs)
         return self.parser
     
@@ -901,6 +914,36 @@ class GraceHDLParser:
             self.build()
         return self.parser.parse(source_code, lexer=self.lexer.lexer)
 
+    def scan_interfaces(self, source_code):
+        """接口扫描模式：只分析模块名和 parameter/input/output 段，返回ModuleInterface列表
+
+        run/always/assign等段按缩进整段跳过，不构建它们的AST。
+        所有模块头部一起分析；有语法错误时逐个模块重新分析并报告错误，跳过出错的模块。
+        """
+        if self.parser is None:
+            self.build()
+        header_source, modules = extract_module_headers(source_code)
+        if not modules:
+            return []
+
+        self.error_count = 0
+        with redirect_stdout(StringIO()):
+            declarations = modules_in(self.parser.parse(header_source, lexer=self.lexer))
+        if not self.error_count and len(declarations) == len(modules):
+            return [module_interface(module, line) for module, (_, line) in zip(declarations, modules)]
+
+        lines = header_source.split('\n')
+        ends = [line - 1 for _, line in modules[1:]] + [len(lines)]
+        interfaces = []
+        for (_, line), end in zip(modules, ends):
+            # 前面补空行，错误信息中的行号与原文件一致
+            text = '\n' * (line - 1) + '\n'.join(lines[line - 1:end])
+            self.error_count = 0
+            declarations = modules_in(self.parser.parse(text, lexer=self.lexer))
+            if not self.error_count and len(declarations) == 1:
+                interfaces.append(module_interface(declarations[0], line))
+        return interfaces
+
 if __name__ == "__main__":
     parser = GraceHDLParser()
     parser.build()
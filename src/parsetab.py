@@ -0,0 +1,12 @@
+# parsetab.py
+# 由 src/build_tables.py 自动生成，请勿手动修改
+
+import pickle as _pickle
+import zlib as _zlib
+
+_tabversion = '3.10'
+_lr_method = 'LALR'
+_lr_signature = 'leftLORleftLANDleftORleftXORleftANDleftEQNEleftLTLEGTGEleftPLUSMINUSrightUMINUSNOTALWAYS AND AND_KW ASSERT ASSIGN ASSIGN_NB ASSIGN_OP AT BEGIN BINARY_NUMBER CASE CLOCK CLOCKED_BY COLON COMMA COMMENT COVER DEDENT DEF DEFAULT DIVIDE DOT DUMP_WAVES ELIF ELSE ELSIF END ENDMODULE ENUM EQ FOR FUNCTION GE GENERATE GT HEX_NUMBER IDENTIFIER IF IMPLIES IN INDENT INITIAL INOUT INPUT INTERFACE LAND LBRACE LBRACKET LE LNOT LOCALPARAM LOR LPAREN LSHIFT LT MINUS MODULE MODULO NAND NE NEGEDGE NEWLINE NEW_NUMBER_FORMAT NOR NOT NOT_KW NUMBER OCTAL_NUMBER OR OR_KW OUTPUT PARAMETER PERIOD PLUS PORT POSEDGE QUESTION RANGE RBRACE RBRACKET REDUCE_AND REDUCE_OR REDUCE_XOR REG REGISTER REPORT_COVERAGE RETURN RPAREN RSHIFT RUN SEMICOLON SIGNAL STRING TASK TESTBENCH TIMES TO WAIT WHILE WIRE WITH XNOR XOR XOR_KWsource_text : source_itemssource_items : source_items source_item\n                       | source_itemsource_item : module_declaration\n                      | enum_declaration\n                      | function_declaration\n                      | testbench_declaration\n                      | comment\n                      | NEWLINEmodule_declaration : MODULE IDENTIFIER COLON module_body\n                             | MODULE IDENTIFIER COLON NEWLINE module_bodymodule_body : module_body module_section\n                      | module_section\n                      | NEWLINE INDENT module_body DEDENT\n                      | emptymodule_section : input_section\n                         | output_section\n                         | register_section\n                         | parameter_section\n                         | run_section\n                         | always_section\n                         | assign_section\n                         | module_instantiation\n                         | enum_declaration\n                         | function_declaration\n                         | interface_declaration\n                         | generate_section\n                         | comment\n                         | NEWLINEcomment : COMMENTinput_section : INPUT LPAREN port_list RPAREN\n                        | INPUT LPAREN NEWLINE port_list RPAREN\n                        | INPUT LPAREN NEWLINE INDENT port_list DEDENT RPARENoutput_section : OUTPUT LPAREN port_list RPAREN\n                         | OUTPUT LPAREN NEWLINE port_list RPAREN\n                         | OUTPUT LPAREN NEWLINE INDENT port_list DEDENT RPARENregister_section : REGISTER LPAREN register_list RPAREN\n                           | REGISTER LPAREN NEWLINE register_list RPARENparameter_section : PARAMETER LPAREN parameter_list RPAREN\n                            | PARAMETER LPAREN NEWLINE parameter_list RPARENport_list : port_list port_item\n                    | port_itemport_item : port_declaration\n                    | comment\n                    | NEWLINEport_declaration : net_type IDENTIFIER\n                           | net_type IDENTIFIER COMMA\n                           | net_type range_spec IDENTIFIER\n                           | net_type range_spec IDENTIFIER COMMAregister_list : register_list register_item\n                        | register_itemregister_item : register_declaration\n                        | comment\n                        | NEWLINEregister_declaration : REG IDENTIFIER\n                               | REG IDENTIFIER COMMA\n                               | REG range_spec IDENTIFIER\n                               | REG range_spec IDENTIFIER COMMA\n                               | REG IDENTIFIER LBRACKET expression COLON expression RBRACKET\n                               | REG IDENTIFIER LBRACKET expression COLON expression RBRACKET COMMA\n                               | REG range_spec IDENTIFIER LBRACKET expression COLON expression RBRACKET\n                               | REG range_spec IDENTIFIER LBRACKET expression COLON expression RBRACKET COMMAparameter_list : parameter_list parameter_item\n                         | parameter_itemparameter_item : parameter_declaration\n                         | comment\n                         | NEWLINEparameter_declaration : IDENTIFIER ASSIGN_OP expression\n                                | IDENTIFIER ASSIGN_OP expression COMMArun_section : RUN LPAREN clock_edge RPAREN COLON statement_listalways_section : ALWAYS COLON statement_list\n                          | ALWAYS COLON NEWLINE INDENT statement_list DEDENTassign_section : ASSIGN COLON assign_statement_list\n                         | ASSIGN COLON NEWLINE INDENT assign_statement_list DEDENTassign_statement_list : assign_statement_list assign_statement\n                                | assign_statementassign_statement : IDENTIFIER ASSIGN_OP expression\n                           | IDENTIFIER LBRACKET expression RBRACKET ASSIGN_OP expression\n                           | IDENTIFIER LBRACKET expression COLON expression RBRACKET ASSIGN_OP expression\n                           | comment\n                           | NEWLINEclock_edge : POSEDGE IDENTIFIER\n                     | NEGEDGE IDENTIFIER\n                     | IDENTIFIER DOT POSEDGE\n                     | IDENTIFIER DOT NEGEDGEstatement_list : statement_list statement\n                         | statement\n                         | INDENT statement_list DEDENTstatement : assignment_statement\n                    | if_statement\n                    | case_statement\n                    | for_statement\n                    | return_statement\n                    | assert_statement\n                    | cover_statement\n                    | wait_statement\n                    | dump_waves_statement\n                    | report_coverage_statement\n                    | comment\n                    | NEWLINEassignment_statement : IDENTIFIER ASSIGN_OP expression\n                                | IDENTIFIER LBRACKET expression RBRACKET ASSIGN_OP expression\n                                | IDENTIFIER LBRACKET expression COLON expression RBRACKET ASSIGN_OP expression\n                                | expression TO IDENTIFIER\n                                | expression TO IDENTIFIER LBRACKET expression RBRACKET\n                                | expression TO IDENTIFIER LBRACKET expression COLON expression RBRACKETif_statement : IF expression COLON statement_list\n                       | IF expression COLON statement_list elif_list\n                       | IF expression COLON statement_list ELSE COLON statement_list\n                       | IF expression COLON statement_list elif_list ELSE COLON statement_listelif_list : elif_list elif_statement\n                    | elif_statementelif_statement : ELSIF expression COLON statement_listcase_statement : CASE expression COLON case_item_list\n                         | CASE expression COLON NEWLINE case_item_list\n                         | CASE expression COLON NEWLINE INDENT case_item_list DEDENTcase_item_list : case_item_list case_item\n                         | case_item_list NEWLINE case_item\n                         | case_itemcase_item : expression COLON statement_list\n                    | DEFAULT COLON statement_list\n                    | expression COLON NEWLINE INDENT statement_list DEDENT\n                    | DEFAULT COLON NEWLINE INDENT statement_list DEDENTfor_statement : FOR IDENTIFIER IN range_expression COLON statement_list\n                        | FOR IDENTIFIER IN range_expression COLON NEWLINE INDENT statement_list DEDENTrange_expression : RANGE LPAREN expression COMMA expression RPAREN\n                           | RANGE LPAREN expression COMMA expression COMMA expression RPARENmodule_instantiation : IDENTIFIER IDENTIFIER LPAREN port_connection_list RPAREN\n                               | IDENTIFIER IDENTIFIER LPAREN RPAREN\n                               | IDENTIFIER LPAREN parameter_assignments RPAREN IDENTIFIER LPAREN port_connection_list RPAREN\n                               | IDENTIFIER LPAREN parameter_assignments RPAREN IDENTIFIER LPAREN RPARENport_connection_list : port_connection_list COMMA port_connection\n                               | port_connectionnet_type : WIRE\n                   | REGrange_spec : LBRACKET expression COLON expression RBRACKET\n                     | LPAREN expression COMMA expression RPAREN\n                     | LPAREN expression COLON expression RPARENexpression : expression PLUS expression\n                     | expression MINUS expression\n                     | expression LSHIFT expression\n                     | expression RSHIFT expression\n                     | expression AND expression\n                     | expression OR expression\n                     | expression XOR expression\n                     | expression LAND expression\n                     | expression LOR expression\n                     | expression AND_KW expression\n                     | expression OR_KW expression\n                     | expression XOR_KW expression\n                     | expression EQ expression\n                     | expression NE expression\n                     | expression LT expression\n                     | expression LE expression\n                     | expression GT expression\n                     | expression GE expression\n                     | NOT expression\n                     | NOT_KW expression\n                     | LNOT expression\n                     | MINUS expression %prec UMINUS\n                     | LPAREN expression RPAREN\n                     | IDENTIFIER LBRACKET expression RBRACKET\n                     | IDENTIFIER LBRACKET expression COLON expression RBRACKET\n                     | IDENTIFIER\n                     | NUMBER\n                     | NEW_NUMBER_FORMAT\n                     | BINARY_NUMBER\n                     | HEX_NUMBER\n                     | enum_reference\n                     | function_call\n                     | reduce_operationenum_declaration : ENUM IDENTIFIER COLON NEWLINE enum_item_listenum_item_list : enum_item_list NEWLINE enum_item\n                         | enum_item_list enum_item\n                         | enum_itemenum_item : IDENTIFIER ASSIGN_OP expression\n                    | IDENTIFIER\n                    | NEWLINEfunction_declaration : DEF IDENTIFIER LPAREN parameter_name_list RPAREN COLON statement_list\n                               | DEF IDENTIFIER LPAREN RPAREN COLON statement_list\n                               | DEF IDENTIFIER LPAREN parameter_name_list RPAREN COLON NEWLINE INDENT statement_list DEDENT\n                               | DEF IDENTIFIER LPAREN RPAREN COLON NEWLINE INDENT statement_list DEDENTparameter_name_list : parameter_name_list COMMA IDENTIFIER\n                              | IDENTIFIERreturn_statement : RETURN expressioninterface_declaration : INTERFACE IDENTIFIER COLON interface_body\n                                | INTERFACE IDENTIFIER COLON NEWLINE interface_bodyinterface_body : interface_body interface_section\n                         | interface_sectioninterface_section : parameter_section\n                            | input_section\n                            | output_section\n                            | comment\n                            | NEWLINEgenerate_section : GENERATE COLON generate_statement_list\n                           | GENERATE COLON NEWLINE INDENT generate_statement_list DEDENTgenerate_statement_list : generate_statement_list generate_statement\n                                  | generate_statementgenerate_statement : for_generate_statement\n                             | module_instantiation\n                             | comment\n                             | NEWLINEfor_generate_statement : FOR IDENTIFIER IN function_call COLON generate_statement_list\n                                 | FOR IDENTIFIER IN function_call COLON NEWLINE INDENT generate_statement_list DEDENTassert_statement : ASSERT LPAREN expression COMMA STRING RPAREN\n                           | ASSERT LPAREN expression RPARENcover_statement : COVER LPAREN expression COMMA STRING RPAREN\n                          | COVER LPAREN expression RPARENreduce_operation : REDUCE_AND LPAREN expression RPAREN\n                           | REDUCE_OR LPAREN expression RPAREN\n                           | REDUCE_XOR LPAREN expression RPARENenum_reference : IDENTIFIER DOT IDENTIFIERfunction_call : IDENTIFIER LPAREN argument_list RPAREN\n                        | IDENTIFIER LPAREN RPARENargument_list : argument_list COMMA expression\n                        | expressiontestbench_declaration : TESTBENCH FOR IDENTIFIER COLON testbench_body\n                                | TESTBENCH FOR IDENTIFIER COLON NEWLINE testbench_bodytestbench_body : testbench_body testbench_section\n                         | testbench_sectiontestbench_section : parameter_section\n                            | clock_declaration\n                            | signal_declaration\n                            | dut_instantiation\n                            | test_sequence\n                            | dump_waves_statement\n                            | report_coverage_statement\n                            | comment\n                            | NEWLINEclock_declaration : CLOCK IDENTIFIER WITH PERIOD expressionsignal_declaration : SIGNAL IDENTIFIER COLON net_type ASSIGN_OP expression\n                             | SIGNAL IDENTIFIER COLON net_type range_spec ASSIGN_OP expression\n                             | SIGNAL IDENTIFIER COLON net_type\n                             | SIGNAL IDENTIFIER COLON net_type range_specdut_instantiation : IDENTIFIER COLON IDENTIFIER LPAREN parameter_assignments RPAREN port_connections\n                            | IDENTIFIER COLON IDENTIFIER LPAREN RPAREN port_connections\n                            | IDENTIFIER COLON IDENTIFIER port_connectionsparameter_assignments : parameter_assignments COMMA parameter_assignment\n                                | parameter_assignmentparameter_assignment : IDENTIFIER ASSIGN_OP expressionport_connections : port_connections port_connection\n                           | port_connectionport_connection : DOT IDENTIFIER LPAREN IDENTIFIER RPAREN\n                          | NEWLINEtest_sequence : IDENTIFIER COLON statement_list\n                        | IDENTIFIER COLON NEWLINE INDENT statement_list DEDENTwait_statement : WAIT FOR expressiondump_waves_statement : DUMP_WAVES TO STRINGreport_coverage_statement : REPORT_COVERAGEempty :'
+
+_lr_action, _lr_goto, _lr_productions = _pickle.loads(_zlib.decompress(
+    b'x\xda\xec\xddw`Uu\x9a\xff\xf1\t6b\xc1QA\xec\x8aeJ*\xc5\x11\xec"`F\x0e\x17\x10H\x03\xd2H\xbb\ti$\xb9\xb6Y\xd4]\x04\x05.#h$tR\xe8\xb3\xbb\xf62N\xdf\xe9\xbd\xef\xd8\xcb\x8c\xbd\xeb8;ug\x7f\xf7\x9e\xd7\x85\x803\xea\x0eD\xfd\xfd\xb1\xfe\xe1\xf7\xdc\x9bs\xce\xf3\xf9\xbe\xdf\xcf)\xb7$\\\xb7\xff\xad\x03>\x92\xf6\x91\xe4\x7f\xf3;>\x11$\xff\x17?h\xf2\x84\xc2I\x97N\x9e\xd0\x11\xa4\xc7\x0f\x8cL\x19\x9f?)\xb1xp|\xff\t\x93\xf3#\x1d\xc1!\xf1\xfd\xc6O\xb8\xa4#84\x9e>c\xc2\xf4\x19\x17O\x98<\xee\xd3\x1d\xc1a\xf1\x83\xc6M\x89D&L\x9e\xd1\x11\x0c\x8a\x05\x03\x12\xfb\x89\x0e\x08\xd2\xa3\xfb\x05\x07G\xf7\x0f\x0e\x89\x1e\x10\x1c\x1a=08,zP0(\xbe\xff\xe9\xd5MU\x1d\x13\xff\'\xf1_,\xd8/\\s\xe2\x7f\'\x1eD\xf73\xeco8\xc0p\xa0\xe1 Cz8\xc4\x82\xfdm\xf6\x17\x9b\xfd\xc5f\x7f\xb1\xd9_l\xf6\x17\x9b\xfd\xc5f\x7f\t7;\xc0f\x7f\xb6\xd9\x9fm\xf6g\x9b\xfd\xd9f\x7f\xb6\xd9\x9fm\xf6\xe7p\xb3\x03m\xf6\'\x9b\xfd\xc9f\x7f\xb2\xd9\x9fl\xf6\'\x9b\xfd\xc9f\x7f\n7;\xc8f\x7f\xb4\xd9\x1fm\xf6G\x9b\xfd\xd1f\x7f\xb4\xd9\x1fm\xf6\xc7p\xb3\x816\xfb\x83\xcd\xfe`\xb3?\xd8\xec\x0f6\xfb\x83\xcd\xfe`\xb3?\x84\x9b\xa5\xdb\xec\xf76\xfb\xbd\xcd~o\xb3\xdf\xdb\xec\xf76\xfb\xbd\xcd~\x1fn6\xc8f\xbf\xb6\xd9\xafm\xf6k\x9b\xfd\xdaf\xbf\xb6\xd9\xafm\x96\x1c\xe2\x07_:>\xe1\xfa\xd2K.\x9d0\xad\xc33\xfb]2e\xe7\xe2\x01\x97N\x9e\x9a?#\xf5\xe0\xc0)\xf93\xfa\x1e\r\x9c6!\xef\xd2\xe93vm\x95>u\xec\xb4\xb1\x91\t}O\xec7-\x7f\xf2\xce-\xc7N*\x1c[<}\xd7\xa3\xe9\xd3/\xcd\xdb\xf9\xb3\xf4K\'\'\xb6\xb9d\xec\xb8\t;w\x9c7a\xf2\x84icg\xec||\xc0\xb8IS\xc6\x05;\xb7Mn9vR\xea\xd1\xc1\xe3\xf3#S\xcb\n\xc7\x16L\xd8\xb9\xef\xc3\xa7M\x98:e\xda\x8c\xb2qS\n\x12\xfb\xc8\xdb\xb9\x8f\x03\xc7OH\xcer\xe7\xa3i\x89\xac\x13v\x06\xd8\xbf\xf0\xd2i\x13ve\x9e\x90\x97Z\x1cp\xe9%;W\x187v\xfa\xae\x1dM\x9b0#\x7f\xda\xe4\xddf2a\xda\x8c]A\x93Ew\xedu\xec\xa5;\x7f\xb0\xdf\xe4)\xbbJ\'\x16\xcb\x82\xc2\x9d+M\xea\xfb\xc9\x01\x91K\'\xe7\xefB4i\xf7\x84\x07&\x0e\xd7\x8bw\xed\xf9\x88\xc4A]\xe6\x99\xb2\x84\xa9\xc8\xd8\x9d{8\xec\xe2K\'\x8f\x9dV\\\xb6\xc7\xda\x07\x7fzB\xd1\xdb\x9e\x996a|\xfe\xb8\tec\'\x8f\xdf\xa9 \xf5\xcc\x94\xb7\xafR\xb4\xeb\x99\xfd\'L\xda\xc5\xe0\x80\xc4\xf2.8\x07%N!c\xf3\'\xa52\xc4\x82\xc35\xe1_5\xe1_5\xe1_5\xe1_5\xe1_5\xe1_5\xe1_\xc3\xcd\x06;\xcd\x1c\x97\xd8\xe6\xc0p\x9b\x9dg\x1a\x0f\x13\'\x9b\xc4\xaa\xe1\xe2\x91\xc11\xd1\xc1AFtH\x90\x19=:\xc8\x8a\x0e\r\xb2\xa3\xc7\x049\xd1c\x83\xdc\xe8q\xc1\xf0\xe8\xf1\xc1\x88\xe8\t\xc1\xc8X0d~Gb\x8f\xa3\xda\x82c\xed\xfb\xdc\xc4\xbe\xffk\xcf}\xffW\xdf\xbe\xff\xeb\x1f\xda\xf7qvy^b\x97\xbf\xd9s\x97\xbf\xe9\xdb\xe5o\xfe\x81]\xc6\x0f\xbctr\xd8\xa1\xc1\x05\xb1\xe0x\x0c\x7f\x8b\xe1o1\xfc-\x86\xbf\xc5\xf0\xb7\x18\xfe\x16\xc3p8\xd20\xd80\xc4p\xb4a\xa8\xe1\x18\xc3\xb1\x86\xe3\x0c\xc7\x1bN0\x0c\x0b\x87Xp\x82\x0co\xc8\xf0\x86\x0co\xc8\xf0\x86\x0co\xc8\xf0\x86\x0co\xc8\xf0\x86\x0co\xc8\xf0\x86\x0co\xc8\xf0\x86\x0co\xc8\xf0\x86\x0co\xc8\xf0\x86\x0co\xc8\xf0F\x98\xe1D\x19^\x97\xe1u\x19^\x97\xe1u\x19^\x97\xe1u\x19^\x97\xe1u\x19^\x97\xe1u\x19^\x97\xe1u\x19^\x97\xe1u\x19^\x97\xe1u\x19^\x97\xe1\xf50\xc3I2\xbc&\xc3k2\xbc&\xc3k2\xbc&\xc3k2\xbc&\xc3k2\xbc&\xc3k2\xbc&\xc3k2\xbc&\xc3k2\xbc&\xc3k2\xbc&\xc3ka\x86\x93exU\x86WexU\x86WexU\x86WexU\x86WexU\x86WexU\x86WexU\x86WexU\x86WexU\x86W\xc3\x0c\xa7\xc8\xf0\x8a\x0c\xaf\xc8\xf0\x8a\x0c\xaf\xc8\xf0\x8a\x0c\xaf\xc8\xf0\x8a\x0c\xaf\xc8\xf0\x8a\x0c\xaf\xc8\xf0\x8a\x0c\xaf\xc8\xf0\x8a\x0c\xaf\xc8\xf0\x8a\x0c\xaf\xc8\xf0\x8a\x0c\xaf\x84\x19\x86\xc9\xf0\xb2\x0c/\xcb\xf0\xb2\x0c/\xcb\xf0\xb2\x0c/\xcb\xf0\xb2\x0c/\xcb\xf0\xb2\x0c/\xcb\xf0\xb2\x0c/\xcb\xf0\xb2\x0c/\xcb\xf0\xb2\x0c/\xcb\xf0\xb2\x0c/\x87\x19N\x95\xe1%\x19^\x92\xe1%\x19^\x92\xe1%\x19^\x92\xe1%\x19^\x92\xe1%\x19^\x92\xe1%\x19^\x92\xe1%\x19^\x92\xe1%\x19^\x92\xe1%\x19^\n3\x9c&\xc3\x8b2\xbc(\xc3\x8b2\xbc(\xc3\x8b2\xbc(\xc3\x8b2\xbc(\xc3\x8b2\xbc(\xc3\x8b2\xbc(\xc3\x8b2\xbc(\xc3\x8b2\xbc(\xc3\x8b2\xbc\x18f8]\x86\x17dxA\x86\x17dxA\x86\x17dxA\x86\x17dxA\x86\x17dxA\x86\x17dxA\x86\x17dxA\x86\x17dxA\x86\x17dx!\xccp\x86\x0c\xcf\xcb\xf0\xbc\x0c\xcf\xcb\xf0\xbc\x0c\xcf\xcb\xf0\xbc\x0c\xcf\xcb\xf0\xbc\x0c\xcf\xcb\xf0\xbc\x0c\xcf\xcb\xf0\xbc\x0c\xcf\xcb\xf0\xbc\x0c\xcf\xcb\xf0\xbc\x0c\xcf\xcb\xf0|\x98\xe1c2<\'\xc3s2<\'\xc3s2<\'\xc3s2<\'\xc3s2<\'\xc3s2<\'\xc3s2<\'\xc3s2<\'\xc3s2<\'\xc3sa\x86\x8f\xcb\xf0\xac\x0c\xcf\xca\xf0\xac\x0c\xcf\xca\xf0\xac\x0c\xcf\xca\xf0\xac\x0c\xcf\xca\xf0\xac\x0c\xcf\xca\xf0\xac\x0c\xcf\xca\xf0\xac\x0c\xcf\xca\xf0\xac\x0c\xcf\xca\xf0\xac\x0c\xcf\x86\x19>!\xc332<#\xc332<#\xc332<#\xc332<#\xc332<#\xc332<#\xc332<#\xc332<#\xc332<\x13f\xf8\xa4\x0cO\xcb\xf0\xb4\x0cO\xcb\xf0\xb4\x0cO\xcb\xf0\xb4\x0cO\xcb\xf0\xb4\x0cO\xcb\xf0\xb4\x0cO\xcb\xf0\xb4\x0cO\xcb\xf0\xb4\x0cO\xcb\xf0\xb4\x0cO\xcb\xf0t\x98a\x94;\x83K\x13\x17\xfeO\xc7\x82\xd1\x1e]\x16\xde\x11\x1c\x19L\t/\xff\'\x06\xb3\xa2\'\x05\xb3\xa3\'\x07%\xd1S\x82\xd2Xp\x8e\xdco\xc9\xfd\x96\xdco\xc9\xfd\x96\xdco\xc9\xfd\x96\xdco\xc9\xfd\x96\xdco\xc9\xfd\x96\xdco\xc9\xfd\x96\xdco\xc9\xfd\x96\xdco\xc9\xfd\x96\xdco\xc9\xfdV\x98\xfb\\\x19~#\x83\x9b\x1a\xc3\x01\x86\x9d\xb76\x86\x9dw7\x86\xc1\x86!\x86\xa3\rC\r\xc7\x18\x8e5\x1cg8\xdep\x82aX8\xc4\x82\xf3>\xf4\x0c\xd1\x0b\x93\xf7_\xe7\xf7\xdd0\xfen\xcf\xbb\xbb\xdf\xf5\xdd\xdd\xfd\xee\x1f\xbaa\xbc`\xe7\r\xe3\xce}i\x88\xff\xd5\xd6\x89l\x07\x86|.\xb4\x93\xeap\xe3\xd3\x82\xfa\xe8\xe9\xc1\xdcXp\x91g\x1b\xf7|v\xacg\x9b\xc3gO\x0f\xdab\xc1\xc5\x9e\x89\xa5J_\x15\x0b\xc6{\xe6\xda\xd43\xcb\xa2G\x05+vve\xf4\x8c\xe0\xa6\xe8\xc7\x82\xe5\xd1\x8f\x077G?\x11\xdc\x12\xfddpk4#X\x19\xcd\x0cVE\xb3\x82\xd5\xd1\xec`M4\'\xe8\x8c\xe6\x06\x1d\xd1\xe1\xc1\xda\xe8\x88`]td\xb0>:*\xd8\x10=3\xe8\x89~*\xe8\x8d\x9e\x15lJ\x10\xbd.\x16LPiK\xaa\xd2\xb6X\x90\xe7\x99\x7f\xdd\x05\xe2\xa8\xe0\x8eX\xf0i\x1d0E\x07L\xd1\x01St\xc0\x14\x1d0E\x07L\xd1\x01St\xc0\x14\x1d0E\x07L\xd1\x01St\xc0\x14\x1d0E\x07L\xd1\x01St\xc0\x14\x1d0E\x07L\t_\x0cyuZ6ejGpg,\xb8T\xa2\xc9\x12M\x96h\xb2D\x93%\x9a,\xd1d\x89&K4Y\xa2\xc9\x12M\x96h\xb2D\x93%\x9a,\xd1d\x89&K4Y\xa2\xc9\x12M\x0e\xbdO\xc4\xea\xaeD\x80\x19\x02\xcc\x10`\x86\x003\x04\x98!\xc0\x0c\x8d\xf9\xe9D\xf5\x19\xaa\xcfP}\x86\xea3T\x9f\xa1\xfa\x0c\xd5g\xa8>C\xf5\x19\xaa\xcf\x08\xab\x07\x08\\\x86\xc0e\x02\\&\xc0e\x02\\&\xc0e\x02\\\x86\xc0e\x08\\&\xc3e2\\&\xc3e2\\&\xc3e2\\&\xc3e2\\&\xc3ea\x86\xc9\x08\xdc\xff\xfew\xeaT\x95\xbe\x90\x98\xea\xc7M\xf5\xe3\xa6\xfaqS\xfdx\xdf\x19\xe0\xe3@\xbf\xc3I\xfd\xb2\xbe\x1d\x1doG\xc7\xdb\xd1\xf1vt|\xdf\x8e\x8e\x7f\xd7\x1dM\xc3\xfft\xfcO\xb7\xaf\xd3\xed\xebt\xfb:\x1d\xff\xd3\xf1?\x1d\xff\xd3\xa1\x0e\x87\x13\r\'\x19N6\x9c\x12\x0e\xb1`\xba\x02\xa7)p\x9a\x02\xa7)p\x9a\x02\xa7)p\x9a\x02\xa7)p\x9a\x02\xa7)p\x9a\x02\xa7)p\x9a\x02\xa7\x85\x05f(p\xaa\x02\xa7*p\xaa\x02\xa7*p\xaa\x02\xa7*p\xaa\x02\xa7*p\xaa\x02\xa7*p\xaa\x02\xa7*pjX _\x81a\n\x0cS`\x98\x02\xc3\x14\x18\xa6\xc00\x05\x86)0L\x81a\n\x0cS`\x98\x02\xc3\x14\x18\x16\x16(P\xe0\x14\x05NQ\xe0\x14\x05NQ\xe0\x14\x05NQ\xe0\x14\x05NQ\xe0\x14\x05NQ\xe0\x14\x05NQ\xe0\x94\xb0@\xa1\x02\'+p\xb2\x02\'+p\xb2\x02\'+p\xb2\x02\'+p\xb2\x02\'+p\xb2\x02\'+p\xb2\x02\'\x87\x05\x8a\x148I\x81\x93\x148I\x81\x93\x148I\x81\x93\x148I\x81\x93\x148I\x81\x93\x148I\x81\x93\x148),P\xac\xc0\x89\n\x9c\xa8\xc0\x89\n\x9c\xa8\xc0\x89\n\x9c\xa8\xc0\x89\n\x9c\xa8\xc0\x89\n\x9c\xa8\xc0\x89\n\x9c\xa8\xc0\x89a\x81\x99\n\x9c\xa0\xc0\t\n\x9c\xa0\xc0\t\n\x9c\xa0\xc0\t\n\x9c\xa0\xc0\t\n\x9c\xa0\xc0\t\n\x9c\xa0\xc0\t\n\x9c\x10\x16(U\xe0 \x05\x0eR\xe0 \x05\x0eR\xe0 \x05\x0eR\xe0 \x05\xc2\xe1(\xc3`\xc3\x10\xc3\xd1\x86\xa1\x86c\x0c\xc7\x1a\x8e3\x1co8\xc1p\xa2\xe1$\xc3\xc9\x86S\x0c\xc3\x0cg\x18>f\xf8\xb8\xe1\x13\x86O\x1a2\x0c\x99\x86,C\xb6!\xc7\x90k\x18n\x18a\x18i\x18e8\xd3\xf0)\xc3Y\x86\xd1\x861\x86\xb3\xc3!\x16\x949\xd7}#zj\xf0\xb5\xf8~\xe3\xa7\xcc\xe8\x08\xbe\x1e\x0b*w\xdeF\xed\xd5=O\xf0\x9dXPe\x0f\xdf\x0f\xb7<5\xf8n\xdf\xedM\xf5\x1e?\x99\xf8\xf3d\x9a\xd4\x0f\x13\xe7\xf1\x1f\xc6\x82\x1a2\xff\x93\xb0\xff\x040\x1cN5\x9cf8=\x1cbA\xad\xf5\x7fi\xfd_Z\xff\x97\xd6\xff\xa5\xf5\x7fi\xfd_\x86\xebG\xad\xff\x0b\xeb\xff\xc2\xfa\xbf\xb0\xfe/\xac\xff\x0b\xeb\xff"\\\xbf\xde\xfaWk\xae\xab5\xd7\xd5\x9a\xebj\xcdu\xb5}]\xad\xb9\xae\xd6\\Wk\xa0\xabu\xc7\xd5\xba\xe3j\xddq\xb5\xee\xb8\x9a\xd0p(\r\x87\xf8\xc0I\x17O\x1b;.\x980\xa3#|\x1c\x0b\xe6*\x7f\x95\xf2W)\x7f\x95\xf2W)\x7f\x95\xf2W)\x7f\x95\xf2W)\x7f\x95\xf2W)\x7f\x95\xf2W)\x7f\x95\xf2W)\x1f\x0eW\x86C,h\xd8\xd3\xdf\xcf\xfa\xfc5\xbe\xab\xbf_\xc4\x82&+\xfc*\xb5\xe9/\xdd\xc36\xef\xf1\xec\xc4\xef\x85\x84\x93?h1\xbf\x1f\x9a\xc3\x0fy\xf8!\x01?\x0c\xb3\xcc\xb3\xc6\x0f\xac\xf1\x03k\xfc\xc0\x1a?\x08\xd7h\xb5\xc6\xf7\xad\xf1}k|\xdf\x1a\xdf\x0f\xd7hW\xfe\xb1\x9d\xb7\xd0\x89`\x8f\xc4\x82\xd8\xdf<;\xf1K\xe1\xea\x97\xdb\xe1W\xed\xf0\xab\x88~\xd5~\xbf\x1a\xaeq\x855\xbeb\x8d\xafX\xe3+\xd6\xf8J\xb8\xc6\x95\xd6\xf8\xb25\xbel\x8d/[\xe3\xcb\xe1\x1a\xd7(\xffL\xc2\xeb\xe7y\xfd<\xaf\x9f\xe7\xf5\xf3}7\x1a\x9fw\xa3\xe1\xf6i\xb0\x87C\x0cG\x1b\x86\x1a\x8e1\x1ck8\xcep\xbc\xe1\x04\xc3\xce\xbb\xafa\x1e\xf6\xd3MX,\xb8\xd6\x84\xd7\xe9\xd4uf\xb4\xce\x8c\xd6\x99\xd1:0\xd6\xe9\xd4u\x98\xacs\x16^\xe7,\xbc\xce\xd4\xd6\x99\xda:S[gj\xebLm\x9d\xa9\xad3\xb5u\xa6\xb6Nk\xaf\xd3\xda\xeb\x1c\xd6\xeb\x9cw\xd79\xef\xaes\xde]\xe7\xbc\xbb\xceyw\x9d\xf3\xee:\xe7\xddu\xce\xbb\xeb\x9cw\xd79\xef\xaes\x9c\xacs\xde]\xe7\xbc\xbb\xceyw\x9d\xf3\xee:\xe7\xddu\xce\xbb\xeb\x9cw\xd7y]\xfal,\xb8n\xa7\xe9\xf7\xfd.\xf8\x9fI\xd8N\xc2v\x12\xb6\x93\xb0\x9d\x84\xed$l\'a;\t\xdbI\xd8N\xc2v\x12\xb6\x93\xb0\x9d\x84\xed$l\'a;\t\xdbI\xd8N\xc2vg\x9b\xed\xce6\xdb)\xd9N\xc9vJ\xb6S\xb2\x9d\x92\xed\x94l\xa7d;%\xdb)\xd9N\xc9vJ\xb6S\xb2\x9d\x92\xed\x94l\xa7d;%\xdb)\xd9N\xc9vJ\xb6S\xb2\x9d\x92\xed.\x85\xdb]\n\xb7\xbb\x14n\x0f\x8f\xc6\x7fAn+r[\x91\xdb\x8a\xdcV\xe4\xb6"\xb7\x15\xb9\xad\xc8mEn+r[\x91\xdb\x8a\xdcV\xe4\xb6"\xb7\x15\xb9\xad\xc8mEn+r[\x91\xdb\x8a\xdcV\xe4\xb6"\xb7\x15\xb9\xad\xc8mEn+r[\x91\xdb\x8a\xdcV\xe4\xb6"\xb7\x15\xb9\xad\xc8mEn+r[\x91\xdb\x8a\xdcV\xe4\xb6"\xb7\x15\xb9\xad\xc8mEn+r[\x91\xdb\x8a\xdc\xd6\x90\xdc\x02\xe4\xb6 \xb7\x05\xb9-\xc8mAn\x0br[\x90\xdb\x82\xdc\x16\xe4\xb6 \xb7\x05\xb9-\xc8mAn\x0br[\x90\xdb\x82\xdc\x16\xe4\xb6 \xb7\x05\xb9-\xc8mAn\x0br[\x90\xdb\x82\xdc\x16\xe4\xb6 \xb7\x05\xb9-\xc8mAn\x0br[\x90\xdb\x82\xdc\x16\xe4\xb6 \xb7\x05\xb9-\xc8mAn\x0br[\x90\xdb\x82\xdc\x16\xe4\xb6 \xb7\x05\xb9-\xc8m\t\xc9]\x8f\xdcf\xe46#\xb7\x19\xb9\xcd\xc8mFn3r\x9b\x91\xdb\x8c\xdcf\xe46#\xb7\x19\xb9\xcd\xc8mFn3r\x9b\x91\xdb\x8c\xdcf\xe46#\xb7\x19\xb9\xcd\xc8mFn3r\x9b\x91\xdb\x8c\xdcf\xe46#\xb7\x19\xb9\xcd\xc8mFn3r\x9b\x91\xdb\x8c\xdcf\xe46#\xb7\x19\xb9\xcd\xc8mFn3r\x9b\x91\xdb\x8c\xdcf\xe46#\xb7\x19\xb9\xcd!\xb9\x85\xc8mBn\x13r\x9b\x90\xdb\x84\xdc&\xe46!\xb7\t\xb9M\xc8mBn\x13r\x9b\x90\xdb\x84\xdc&\xe46!\xb7\t\xb9M\xc8mBn\x13r\x9b\x90\xdb\x84\xdc&\xe46!\xb7\t\xb9M\xc8mBn\x13r\x9b\x90\xdb\x84\xdc&\xe46!\xb7\t\xb9M\xc8mBn\x13r\x9b\x90\xdb\x84\xdc&\xe46!\xb7\t\xb9M\xc8mBn\x13r\x9b\x90\xdb\x14\x92[\x84\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x8b\\/r\xbd\xc8\xf5"\xd7\x1b\x92\xbb\x01\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\x07\xb9\x1e\xe4z\x90\xebA\xae\'$w#r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\7r\xdd\xc8u#\xd7\x8d\\wHn1r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\\x17r]\xc8u!\xd7\x85\\WHn\tr\x1b\x91\xdb\x88\xdcF\xe46"\xb7\x11\xb9\x8d\xc8mDn#r\x1b\x91\xdb\x88\xdcF\xe46"\xb7\x11\xb9\x8d\xc8mDn#r\x1b\x91\xdb\x88\xdcF\xe46"\xb7\x11\xb9\x8d\xc8mDn#r\x1b\x91\xdb\x88\xdcF\xe46"\xb7\x11\xb9\x8d\xc8mDn#r\x1b\x91\xdb\x88\xdcF\xe46"\xb7\x11\xb9\x8d\xc8mDn#r\x1b\x91\xdb\x88\xdcF\xe46\x86\xe4\x96"\xb7\x01\xb9\r\xc8m@n\x03r\x1b\x90\xdb\x80\xdc\x06\xe46 \xb7\x01\xb9\r\xc8m@n\x03r\x1b\x90\xdb\x80\xdc\x06\xe46 \xb7\x01\xb9\r\xc8m@n\x03r\x1b\x90\xdb\x80\xdc\x06\xe46 \xb7\x01\xb9\r\xc8m@n\x03r\x1b\x90\xdb\x80\xdc\x06\xe46 \xb7\x01\xb9\r\xc8m@n\x03r\x1b\x90\xdb\x80\xdc\x06\xe46 \xb7\x01\xb9\r\xc8m@nCH.\x8e\xdcz\xe4\xd6#\xb7\x1e\xb9\xf5\xc8\xadGn=r\xeb\x91[\x8f\xdcz\xe4\xd6#\xb7\x1e\xb9\xf5\xc8\xadGn=r\xeb\x91[\x8f\xdcz\xe4\xd6#\xb7\x1e\xb9\xf5\xc8\xadGn=r\xeb\x91[\x8f\xdcz\xe4\xd6#\xb7\x1e\xb9\xf5\xc8\xadGn=r\xeb\x91[\x8f\xdcz\xe4\xd6#\xb7\x1e\xb9\xf5\xc8\xadGn=r\xeb\x91[\x8f\xdcz\xe4\xd6#\xb7\x1e\xb9\xf5!\xb9\xb5\xc8\xcdBn\x16r\xb3\x90\x9b\x85\xdc,\xe4f!7\x0b\xb9Y\xc8\xcdBn\x16r\xb3\x90\x9b\x85\xdc,\xe4f!7\x0b\xb9Y\xc8\xcdBn\x16r\xb3\x90\x9b\x85\xdc,\xe4f!7\xcb;7\xb3\x00\x9c\x05\xe0,\x00g\x018\x0b\xc0Y\x00\xce\x02p\x16\x80\xb3\x00\x9c\x05\xe0,\x00g\x018\x0b\xc0Y\x00\xce\x02p\x16\x80\xb3\x00\x9c\x05\xe0,\x00g\x018\x0b\xc0Y\xa9\xaf\xb0N\x9a2\xb9c\xd7\x83Hdl\xea\xc1\x80\x19SRK\xfbO\x9d\x94\xfc\x9e\xea,\xdfS\x9d\xfe\xe9K/\x99\xb1\xf3\xd1\xb4\xdd\x1f\xed\x17~\xc1\xd4\xc6\xc9\xef\x91z\xb2h\xd7\xe2\xfe\x93\xfaV\xd8o\xd2\xae\xa7\x0fL<\x1b~CV\x86)\xd3\xfa\x1e\x1cX\xb4\xfb\xa3\x01\x13.\xdb\xb94y\xc2\xce\xa5I3v-\xedz.o\xd7sy;\x9f\x1b8m\xd7\xfb\xa3\xb3\xc2\xc6Y\xa7qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9qfj\x9c\x99\x1ag\xa6\xc6\x99\xa9q\xc2a\xa5\xa1\xd3\xb0\xca\xb0\xda\xb0\xc6\xb0\xd6\xb0\xce\xb0\xde\xb0\xc1\xb0\xd1\xd0e\xe86\xf4\x18z\r\x9b\x0c\x9b\r[\x0c[\r\xdb\x0c\xdb\r;\xc2!\x16\xac\xe7\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3bN\x8b9-\xe6\xb4\x98\xd3\xe2\xd0\xe9\x06N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\xe2\xb4\x88\xd3"N\x8b8-\n\x9dn\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3BN\x0b9-\xe4\xb4\x90\xd3\xc2\xd0i\x17\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16pZ\xc0i\x01\xa7\x05\x9c\x16\x84N\xbb9\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74\x9f\xd3|N\xf39\xcd\xe74?t\xba9t\x1a\xf9hZ\xc2\xe8}\x8c\xde\xc7\xe8}\x8c\xde\xd7\xf7\xe9\xf1}>=\xde\x96\x90x\x1f\x89\xf7\x91x\x1f\x89\xf7\x91x\x1f\x89\xf7\x91x\x1f\x89\xf7\x91x\x1fQ\xf7\x85\xb5\xb7\xe8\xa7\xdb\xf4\xd3m\xaa\xdf\xa6\xfam\xaa\xdf\xa6\x9fn\xd3O\xb7\xe9\xa7\xdb4\xd2m2\xdc&\xc3m2\xdc&\xc3m2\xdc&\xc3m2\xdc&\xc3m2\x84\xc3\x85\x91#\xd2b\xc1VA\xee\x16\xe4nA\xee\x16\xe4nA\xee\x16\xe4nA\xee\x16\xe4nA\xee\x16\xe4nA\xee\x16\xe4nA\xee\x16\xe4nA\xee\x16\xe4nA\xee\x16\xe4\xee\x10\xc6v\x19n\x97\xe1v\x19n\x97\xe1v\x19n\x97\xe1v\x19n\x97\xe1v\x19n\x97\xe1v\x19n\x97\xe1v\x19n\x97\xe1v\x19n\x97\xe1v\x19n\x97\xe1\xf60\xc3\x0e\xcd0$-\x14\xbe\xf3[:C\x83\xecX\xf09?:!\xd9\'\xe7\x0bw\xbep\xe7\x0bw~_\x9f\x9c\xbf\xf3\x9b\xd1G\x05w$\xa2\x9d/\xda\xf9\xa2\x9d/\xda\xf9\xa2\x9d/\xda\xf9\xa2\x9d/\xda\xf9\xa2\x9d/\xda\xf9a\xb4\x7f\x85\xe7,x\xce\x92\xe0,\t\xce\x92\xe0,x\xce\x82\xe7,x\xcer\xee9\x0b\xa5\xb3D9K\x94\xb3D9K\x94\xb3D9K\x94\xb3D9K\x94\xb3D9K\xcb\x9c\x98h\x99\x7f\x93\xe7\x1cy\xce\x91\xe7\x1cy\xce\x91\xe7\x1cy\xce\x91\xe7\x1cy\xce\x91\xe7\x1cy\xce\x91\xe7\x1cy\xce\x91\xe7\x1cy\xce\x91\xe7\x1cy\xce\x91\xe7\x1cy\xce\x91\xe7\x9c\x10\xcd\xbf\x8br\xb6(g\x8br\xb6(g\x8br\xb6(g\x8br\xb6(g\x8br\xb6(g\x8br\xb6(g\x8br\xb6(g\x8br\xb6(g\x8br\xb6(g\x8brv\x18\xe56Q\xc6\x882F\x941\xa2\x8c\x11e\x8c(cD\x19#\xca\x18Q\xc6\x882F\x941\xa2\x8c\x11e\x8c(cD\x19#\xca\x18Q\xc6\x882F\x941a\x94\xdbE\x19-\xcahQF\x8b2Z\x94\xd1\xa2\x8c\x16e\xb4(\xa3E\x19-\xcahQF\x8b2Z\x94\xd1\xa2\x8c\x16e\xb4(\xa3E\x19-\xcahQF\x87Q\xee\xda\xf9+!\xff\xc0\xf7\xc7\xc3\xafo\xf7\xcb\x97\xc7\xef\x06b\x1a\x10\xd3\x04\x98&\xc04\x01\xa6\t0M\x80i@LC`\x9a\x0c\xd3d\x98&\xc34\x19\xa6\xc90M\x86i2L\x93a\x9a\x0c\xd3\xc2\x0c\xf78{\x9c\x9a\xf6\xfe\x7fs\xe5\xbe\xbeoCM2\xd7I\xe6:\xc9\\\'\xf5\x9d\xa7&\xed\xf9m\xa8If:\xc9L\'\x99\xe9$3\x9dd\xa6\x93\xcct\x92\x99N2\xd3I{~\x1bjR\xbf~\x1b\xea\xfe\xff\xfb6\xd4\xdf\xfb6T\xe4\xb4\xc49\xf8\xf3\xba\xeac\xa9\xae\x8a\x9c\x9e\xf6\xfe\xb5\xd5\x03<\x9c\xc1\xc3\x19<\x9c\xc1\xc3\x19<\x9c\xc1\xc3\x19<\x9c\xc1\xc3\x19X\x9f\xe1\xe6\xf5\x0c7\xafg\xc0z\x06\xacg\x84\x87\xc8\x17\x148^\x81w\xf9\x8d\x01\xc3\xce_\x1a0\x0c5\x9ch8\xc9p\xb2\xe1\x94p\x88\x05_\xec\xfb}\x84\x8f\xd9\xfb\xc7\xec\xfdc\xf6\xfe\xb1\xbe\x03\xe3c\xef\xfa\xfb\x08_\x93\xf4ZI\xaf\xb5\xafk\xed\xebZ\xfb\xbaV\xd2k%\xbdV\xd2k\xb5\xe4\xb5Z\xf2Z-y\xad\x96\xbc\xd6,\xae\xd5\x92\xd7j\xc9k\xb5\xe4\xb5Z\xf2Z-y\xad&\xbc6\x9c\xd37D9T\x94CE9T\x94CE9T\x94CE9T\x94C\x95;\x14\xb4CA;\x14\xb4CA;\xd4k\x89C\xdd\xb1\x87CK8\xc4\x82\xef\xa8\xfa\xa6\xaao\xaa\xfa\xa6\xaao\xaa\xfa\xa6\xaao\xaa\xfa\xa6\xaao\x9a\xf9\x9bf\xfe\xa6\x99\xbf)\xca\x9bf\xfe\xa6\x99\xbfi\xe6o\x9a\xf9\x9bf\xfe\xa6\x99\xbf\x19f\xf8\xae\x0cO\xc9\xf0\x94\x0cO\xc9\xf0\x94\x0cO\xc9\xf0\x94\x0cO\xc9\xf0\x94\x0cO\xc9\xf0\x94\x0cO\xc9\xf0\x94\x0cO\xc9\xf0\x94\x0cO\xc9\xf0\x94\x0cO\xc9\xf0T\x98\xe1{2\xfcJ\x9d_\xf9\xd1\xafp\xfb\x95\xaf@\xff\xca\xb7g\x7f\x15\xae\xff}\xeb\xff\xdc\xfa?\xb7\xfe\xcf\xad\xef\x0b\xc0\x86\xd3\xc3!\x16\xfc`\x8f\xef\x08G\x86\xa7\xf5}}\xf8\x87\xbb\xffh\xd7\xb3?R\xe0g\n\xfcL\x81\x9f)\xf03\x05~\xa6@8tFF&\xce"?\xb3\xd1\xe3H>\x8e\xe4\xe3H>\x8e\xe4\xe3v\xf88\x92\x8f#\xf98\x92\x8f#\xf98\x92\x8f#\xf98\x92\x8f#\xf98\x92\x8f#\xf98\x92\x8fK\xf7x8\xd3\x9f\xef9\xd3\xb3v\x9b\xe9/\xfe\xeeL\x7f)\xf4#B?"\xf4#B?"\xf4#B?"\xf4#B?"\xf4#B?"\xf4#B?"\xf4#B?"\xf4#B?"\xf4#B?\x12\x86\xfeO\x19~\xa4\xce\x8f`\xfe\x11\xbe?\n\xd7\xf8\x955\xbeg\x8d\xefY\xc3w\xb6\xc3!\x16<\xb8\xc7\xf7\xb9#c\xd2|\x9b\xfb!\x1b~\xd7\x86\xdf\xb5\xe1wm\xf8]\xea\xceN\x8b^\x199\'\xe1\xef\x11\xeb>\x04\xc5CP<\x04\xc5CP<d?\x0fA\xf1\x10\x14\x0fA\xf1\x10\x14\x0fA\xf1\x10\x14\x0fA\xf1\x10\x14\x0fA\xf1\x10\x14\x0fA\xf1\x90s\xc7C\xce\x1d\x0f9w<\xe4\xdc\xf1\x10L\x0f\x85S|T\xbe\xaf\xc9\xf05\xc5\xbffJ_\x0b\xd7x\xcc\x1a_\xb2\xc6\x97\xac\xf1%k\xf8"\xf9\xe3\x7f\xf3\r\xf3\xc8y\x89\xa9?m\xc3\x1d\xa6\xbe\xc3\xd4w\x98\xfa\x0eS\xdfa\xa7;L}\x87}\xefp&\xde\x81\xc0\x0e\x04v \xb0\x03\x81\x1d\x08\xec@`\x07\x02;\x10\xd8\x81\xc0\x0e\x04v \xb0\x03\x81\x1d\x08\xec@`\x87[\x85\x1dn\x15v\xb8U\xd8\xe1Va\x87[\x85\x1dn\x15v\xb8U\xd8\xe1Va\x87[\x85\x1dn\x15v\xb8U\xd8\xe1Va\x87[\x85\x1dn\x15v\xb8U\xd8\xe1Va\x87[\x85\x1dn\x15vx\'f\x87wbvx\'fG\x08\xf4\x99\x0f\xff\xb6\xeaD\xc3I\xff\xdf\xded\x8d6\x8c1\x9c\x1d\x0e\xb1\xe0\xd9\x0f\xec;\xe8\xcf\xbd[\xa5a\x91\x8b\xd3\xfa\xed.;\xf2\x914\xfd0[?\xcc\xd6\x0f\xb3\xf5\xc3l\xfd0[?\xcc\xd6\x0f\xb3\xf5\xc3l\xfd0[?\xcc\xd6\x0f\xb3\xf5\xc3l\xfd0[?\xcc\xd6\x0f\xb3\xf5\xc3l\xfd0[?\xcc\xd6\x0f\xb3\xf5\xc3l\xfd0[?\xcc\xd6\x0f\xb3\x9d\x0efk\x8b\xd9\xdab\xb6\xb6\x98\xad-fk\x8b\xd9\xdab\xb6\xb6\x98\xad-fk\x8b\xd9\xda"\x1cr\x83\x97\x12=1[O\xcc\xd6\x13\xb3\xf5\xc4l=1[O\xcc\xd6\x13\xb3\xf5\xc4l=1[O\xcc\xf6\xbe\xe6lwI\xb3\xbd\xaf\x19\x0e-\xc1\x8b\x89\x13tIZt\xb5\xc7k\x0ck\r\xeb\x0c\xeb\r\x1b\x0c\x1b\r]\x86nC\x8f\xa1\xd7\xb0\xc9\xb0\xd9\xb0\xc5\xb0\xd5\xb0\xcd\xb0\xdd\xb0#\x1cb\x91\xfdRj\xf3\xa8\xcd\xa36\x8f\xda<j\xf3\xa8\xcd\xa36\x8f\xda<j\xf3\xa8\xcd\xa36\x8f\xda<j\xf3\xa8\xcd\xa36\x8f\xda<j\xf3\xa8\xcd\xa36\x8f\xda<j\xf3\xa8\xcd\xa36\x8f\xd3<N\xf38\xcd\xe34\x8f\xd3<N\xf38\xcd\xe34\x8f\xd3p\xc8\t^M\x1c\xe7y\x8e\xf3<N\xf38\xcd\xe34\x8f\xd3<N\xf38\xcd\xe34\x8f\xd3<N\xc3au\xf0JtM\xf0Ztm\xf0zt]\xf0Ft}\xf0ftC\xf0\xdb\xe8\xc6\xe0\xadhW\xf0\xbbhw\xf0_\xd1\x9e\xe0\xf7\xd1\xde\xe0\x0f\xd1M\xc1\x1f\xa3\x9b\x83?E\xb7\x04\x7f\x8en\r\xfe\x12\xdd\x16\xfcwt{\xf0\xd7Xd`\x8a}9\xf6\xe5\xd8\x97c_\x8e}9\xf6\xe5\xd8\x97c_\x8e}9\xf6\xe5\xd8\x97c_\x8e}9\xf6\xe5\xd8\x97c_\x8e}9\xf6\xe5\xd8\x97c_\x8e}9\xf6\xe5\xd8\x97;\xac\xca)(\xa7\xa0\x9c\x82r\n\xca)(\xa7\xa0\x9c\x82r\n\xca)(wX\x95;\xdb\x96\xb3P\xceB9\x0b\xe5,\x94\xb3P\xceB9\x0b\xe5,\x94\xb3P\xceB\xb9#\xab\xdc\x91U\xee\xc8*\xf7\x89A\xb9\x03\xaa\xdc\x01U\xee\x80*w@\x95;\xa0\xca\x1dP\xe5\x0e\xa8r\x07T\xb9\x03\xaa\xdc\x01U\xee\x80*w@\x95;\xa0\xca\x1dP\xe5\x0e\xa8r\x07T\xb9\x03\xaa<<\xa0\xd2SR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad$\xb5\x92\xd4JR+I\xad\x0c\xa5\x1e\x9c\x92:\x87\xd49\xa4\xce!u\x0e\xa9sH\x9dC\xea\x1cR\xe7\x90:\x87\xd49\xa4\xce!u\x0e\xa9sH\x9dC\xea\x1cR\xe7\x90:\x87\xd49\xa4\xce!u\x0e\xa9sH\x9dC\xea\x1cR\xe7\x90:\x87\xd49\xa4\xce!u\x0e\xa9sH\x9dC\xea\x1cR\xe7\x90:\xa7\xefd9\x87\xd19\x8c\xceat\x0e\xa3s\x18\x9d\xc3\xe8\x1cF\xe70:\x87\xd19\x8c\xceat\x0e\xa3s\x18\x9d\xd3Og\xd0\x84\x9e9\xa1\x9eCRz*\xe8\xa9\xa0\xa7\x82\x9e\nz*\xe8\xa9\xa0\xa7\x82\x9e\nz*\xe8\xa9\xa0\xa7\x82\x9e\nz*\xe8\xa9\xa0\xa7\x82\x9e\nz*\xe8\xa9\xa0\xa7\x82\x9e\nz*\xe8\xa9\xa0\xa7\x82\x9e\nz*\xe8\xa9\xa0\xa7\x82\x9e\nz*\xe8\xa9\xa0\xa7\x82\x9e\nz*\xfa\xf4T\xd0SAO\x05=\x15\xf4T\xd0SAO\x05=\x15\xf4T\xd0SAO\x05=\x15\xf4T\xd0S\xd1\x7fz*B=\x87\xa7\xf4\xdcC\xcf=\xf4\xdcC\xcf=\xf4\xdcC\xcf=\xf4\xdcC\xcf=\xbc\xdc\xc3\xcb=\xbc\xdc\xc3\xcb=\xbc\xdc\xc3\xcb=\xbc\xdc\xc3\xcb=\xbc\xdc\x83\xfd=a\x88\x8f\xa6}\xe8\x1f\xa7\xc6"G\xa4\xed\xfa<y\xe7_\xfa\x89\x0cN=77\xf9\xd9\xe1%b]"\xd6%b]\xd2\xf7\xd6\xe3%2\x85\xc3\xae?\x13\xe0a\xf8\x97\x02,\x1ek8\xcep\xbc\xe1\x04\xc3\xb0p\x88E\x86\xec^\xf6\x02e/P\xf6\x02e/\xe8+{\x81\xb2\x17\xecY\xf6\x82\xbe\xb2\x17({\x81\xb2\x17({\x81\xb2\x17({AX\xf6\xe8\x94\x86q4\x8cSx\x9c\xc2\xe3\x14\x1eG\xc38\x1a\xc6\xa9=\x8e\x86q4\x8c\xa3a\x1c\r\xe3h\x18\'\xc48!\xc6\t1N\x88qB\x8c\x0bC\x0cM\x85\xb8X\x88\x8b\x85\xb8X\x88\x8b\x85\xb8X\x88\x8b\x85\xb8X\x88\x8b\x85\xb8X\x88\x8b\x85\xb8X\x88\x8b\x85\xb8X\x88\x8b\x85\xb8X\x88\x8b\x85\xb8X\x88\x8b\xc3\x10\xc7\xa4B\x8c\x15b\xac\x10c\x85\x18+\xc4X!\xc6\n1V\x88\xb1B\x8c\x15b\xac\x10c\x85\x18+\xc4X!\xc6\n1V\x88\xb1B\x8c\x15bl\x18\xe2\xd8T\x88\x8b\x84\xb8H\x88\x8b\x84\xb8H\x88\x8b\x84\xb8H\x88\x8b\x84\xb8H\x88\x8b\x84\xb8H\x88\x8b\x84\xb8H\x88\x8b\x84\xb8H\x88\x8b\x84\xb8H\x88\x8b\x84\xb8(\x0cq\\*\xc4\x85B\\(\xc4\x85B\\(\xc4\x85B\\(\xc4\x85B\\(\xc4\x85B\\(\xc4\x85B\\(\xc4\x85B\\(\xc4\x85B\\(\xc4\x85B\\\x18\x868>\x15\xe2\\!\xce\x15\xe2\\!\xce\x15\xe2\\!\xce\x15\xe2\\!\xceu\r9W\x96se9W\x96se9W\x96se9W\x96se9W\x96se97\xccrB\xda\xff/\x1f\xe7\xc7"\'\xa6\xed\xfaj\xc3\xee\x7f\x8a,rr*\xe3T\x19\xa7\xca8U\xc6\xa92N\x95q\xaa\x8cSe\x9c*\xdcT\xe1\xa6\n7U\xb8\xa9\xc2M\x15n\xaapS\x85\x9b*\xdcT\xe1\xa6\xee\xbc\x14\xf6\xcb+\xb1SR\x93\x99n2\xd3Mf\xba\xc9L7\x99\xe9&3\xddd\xa6\x9b\xcct\x93\x99n2\xd3Mf\xba\xc9L7\x99\xe9&3\xddd\xa6\x9b\xcct\x93\x99n2\xd3C\xd2\xc3\xd2\xfa>\x9b\x8dH\x10\x91 "A\xa4\xef\x84\x1c\xd9\xf3\xb3\xd9\x88\xfa\x11\xf5#\xeaG\xd4\x8f\xa8\x1fQ?\xa2~D\xfd\xc8\x9e\x9f\xcdF\xfa\xf3\xb3\xd9\xc8\xa9i\xff\xf7\xe1\xec\xdf\xfdp\xb69-\x169-\xed\x83z\xa30rz\xda\xce??\xb4\xf3\xad\xad\xc8\xbc\xb4hi\xf0\xfc\xae\xf7\xa2"mi\xd1+\x83\x17>\xa4\xf7\xa2b\x913v\xeb\xfcC\xb4\xc9!\xda\xe4\x10mrH_\xe7\x1f\xb2{\xe7\x0f\xf5\xf0D\xc3I\x86~\x86\x18\x8b|\xac?\x1ay\xe8{\xbf\xad\xfda\xf7e,\xd1\x97\x9fL\xcdu\xa0\xb9\x0e4\xd7\x81\xe6:\xd0\\\x07\x9a\xeb@s\x1dh\xae\x03\xcdu\xa0\x83v\xa0\x83v\xa0\x83v \x00\x03\x1d\xb4\x03\x1d\xb4\x03\x1d\xb4\x03\x1d\xb4\x03\x1d\xb4\x031\x1a\x88\xd1@\x8c\x06b4\xd0!<\x10\xaa\x81P\r\x84j T\x03\xa1\x1a\x08\xd5@\xa8\x06B5\x10\xaa\x81P\r\x84j T\x03\xa1\x1a\x08\xd5@\xa8\x06B5\x10\xaa\x81P\r\xf42j\xa0\x97Q\x03\xbd\x8c\x1a\x18vqF\n\xddu\xd0]\x07\xddu\xd0]\x07\xddu\xd0]\x07\xddu\xd0]\x07\xddu\xd0]\x07\xddu\xd0]\x07\xddu\xd0]\x07\xddu\xd0]\x07\xddu\xd0]\x07\xcfua\x96\xcc]\xc7|K\xf0\xf5Xdx*\xda\x93\xa2=)\xda\x93\xa2=)\xda\x93\xa2=)\xda\x93\xa2=)\xd3\x932=)\xd3\x932=)\xd3\x932=)\xd3\x932=)\xd3\x932=\x19f\x1a\x91\xb6\xfbg\xb5\xc3"\x9f\xe9\xfb\x18722\x15\xf0\xa7B\xfc\xd4v?\xf5\xaa\xf9\xa7>\x9b\xfe\xa9\x0f8\x7f\x1a\xeelTj\x83\x9f\xd8\xe0\'6\xf8\x89\r~b\x83\x9f\xd8\xe0\'>\x11\xfd\xa7Dw\x9f\x95\xda\xea1\x1c\x1e\xc3\xe11\x1c\x1e\xc3\xe11{|\x0c\x87\xc7px\x0c\x87\xc7px\x0c\x87\xc7px\x0c\x87\xc7px\x0c\x87\xc7px\x0c\x87\xc7\xc4{,\x8c>\xfam\x1c\xae\xdb\x8d\xc3\x98T\xc0\x87\x05|X\xc0\x87\x05|X\xc0\x87\x05|X\xc0\x87\x05|X\xc0\x87\x05|X\xc0\x87\x05|X\xc0\x87\x05|X\xc0\x87\x05|X\xc0\x87\x05|8\x0cxv*\xc4w\x14\xfa\x0e\xa8\xdfA\xf3;\xe1*\xe7\xa6V\xf9\xb6U\xbem\x95o[\xe5\xdb\x80\xffK\xf2#\xe8\x05\t\xea\xe7\xa5V~\xd0\xa4\x1e4\xa9\x07M\xeaA\x93z\xd0\x8e\x1e4\xa9\x07M\xeaA\x93z\xd0\xa4\x1e4\xa9\x07M\xeaA\x93z\xd0\xa4\x1e4\xa9\x07M\xeaA\x93z\xd0\xc9\xe4A\'\x93\x07\x9dL\x1et2y\xd0\x84\x1f\x0cgs~*\xe0\x17\x85\xf8\xa2\xea_4\xa9/\xee\xbc\xd3\xec\x8c\\\x9f\xd6?\xb7\x9b\x17|p\x17\xff\xb1i\xef\xfe1\xe1\xa2~\xfc\x98\xf0\xe2\x14\xc6m<o\xe3y\x1b\xcf\xdbx\xde\x06\xf16\x9e\xb7!\xbd\xcd\tp\x1b\xdd\xdb\xe8\xdeF\xf76\xba\xb7\xd1\xbd\x8d\xeemto\xa3{\x1b\xdd\xdb\xe8\xdeF\xf76\xba\xb7\xd1\xbd\x8d\xeem\xae\x1d\xdb\\;\xb6\xb9vls\xed\xd8\xe6\xda\xb1\xcd\xb5c\x9bk\xc76\xd7\x8em\xae\x1d\xdb\\;\xb6\xb9vls\xed\xd8\xe6\xda\xb1\xcd\xb5c\x9bk\xc76\xd7\x8em\xae\x1d\xdb\\;\xb6\xb9vls\xed\xd8\xe6\xda\xb1-\xec\xc0q)tk\xa1[\x0b\xddZ\xe8\xd6B\xb7\x16\xba\xb5\xd0\xad\x85n-tk\xa1[\x0b\xddZ\xe8\xd6B\xb7\x16\xba\xb5\xd0\xad\x85n-tk\xa1[\x0b\xddZ\xe8\xd6B\xb7\x16\xba\xb5\xd0\xad\x85n-tk\xa1[\x0b\xddZ\xe8\xd6B\xb7\x16\xba\xb5\xd0\xad\x85nm\xdf[\x97kq[\x8b\xdbZ\xdc\xd6\xe2\xb6\x16\xb7\xb5\xb8\xad\xc5m-nkq[\x8b\xdb\xda~\xfb\x18nB\x8a}\x16\xf6Y\xd8ga\x9f\x85}\x16\xf6Y\xd8ga\x9f\x85}\x16\xf6Y\xd8ga\x9f\x85}\x16\xf6Y\xd8ga\x9f\x85}\x16\xf6Y\xd8ga\x9f\x85}\x16\xf6Y\xd8g9\x13eQ\x90EA\x16\x05Y\x14dQ\x90EA\x16\x05Y\x14dQ\x90\xa5{\xb3to\x16\x0bY,d\xb1\x90\xc5B\x16\x0bY,d\xb1\x90\xc5B\x16\x0bY,dy\x039\xcb\x1b\xc8Y\xde@\xce\xf2\x89M\x96\xd7\x12Y^Kdy-\x91\xe5\xb5D\x96\xd7\x12Y^Kdy-\x91\xe5\xb5D\x96\xd7\x12Y^Kdy-\x91\xe5\xb5D\x96\xd7\x12Y^Kdy-\x91\xe5\xb5D\x96Ol\xb2\xc2\x03*/%5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x0cR3H\xcd 5\x83\xd4\x8cP\xea\xa5)\xa9\xabH]E\xea*RW\x91\xba\x8a\xd4U\xa4\xae"u\x15\xa9\xabH]E\xea*RW\x91\xba\x8a\xd4U\xa4\xae"u\x15\xa9\xabH]E\xea*RW\x91\xba\x8a\xd4U\xa4\xaebs\x15\x9b\xab\xd8\\\xc5\xe6*6W\xb1\xb9\x8a\xcdUl\xaebs\x15\x9b\xab\xd8\\\xc5\xe6*6W\xb1\xb9\x8a\xcdUl\xaebs\x15\x9b\xab\xd8\\\xc5\xe6*6\xc3\xe1\xca\xc8\xd2\xc4\x8d\xd8\xc4\x14\xbf\x18~1\xfcb\xf8\xc5\xf0\x8b\xe1\x17\xc3/\x86_\x0c\xbf\x18~1\xfcb\xf8\xc5\xf0\x8b\xe1\x17\xc3/\x86_\x0c\xbf\x18~1\xfcb\xf8\xc5\xf0\x8b\xe1\x17\xc3/\xe6\xa0\x88\xc1\x18\x831\x06c\x0c\xc6\x18\x8c1\x18c0\xc6`\x8c\xc1\x18\x831\x06c\x0c\xc6\x18\x8c1\x18c0\xc6`\x8c\xc1\x18\x831\x06c\x0c\xc6\x18\x8c1\x07E\xccA\x11sP\xc4\x1c\x141\x07E\xccA\x11sP\xc4\x1c\x141\x07E\xccA\x11sP\xc4\x1c\x141\x07E\xccA\x11sP\xc4\x1c\x141\x07E\xccA\x11sP\xc4\x1c\x141\x07E,<(\x82\x94\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbIm\'\xb5\x9d\xd4vR\xdbC\xa9\x93RR\xdbHm#\xb5\x8d\xd46R\xdbHm#\xb5\x8d\xd46R\xdbHm#\xb5\x8d\xd46R\xdbHm#\xb5\x8d\xd46R\xdbHm#\xb5\x8d\xd46R\xdbHm#\xb5\x8d\xd46R\xdbHm#\xb5\x8d\xd46R\xdbHm#\xb5\x8d\xd46R\xdb\xfan\x0b\xdb\x18mc\xb4\x8d\xd16F\xdb\x18mc\xb4\x8d\xd16F\xdb\x18mc\xb4\x8d\xd16F\xdb\x18m\xeb\xbfO\xb4\xdbB=\x91\x94\x9eVzZ\xe9i\xa5\xa7\x95\x9eVzZ\xe9i\xa5\xa7\x95\x9eVzZ\xe9i\xa5\xa7\x95\x9eVzZ\xe9i\xa5\xa7\x95\x9eVzZ\xe9i\xa5\xa7\x95\x9eVzZ\xe9i\xa5\xa7\x95\x9eVzZ\xe9i\xa5\xa7\x95\x9eVzZ\xe9i\xa5\xa7\x95\x9e\xd6>=\xad\xf4\xb4\xd2\xd3JO+=\xad\xf4\xb4\xd2\xd3JO+=\xad\xf4\xb4\xd2\xd3JO+=\xad\xf4\xb4\xf6\x9f\x9e\xd6P\xcf\xe4\x94\x9ey\xf4\xcc\xa3g\x1e=\xf3\xe8\x99G\xcf<z\xe6\xd13\x8f\x9ey\xf4\xcc\xa3g\x1e=\xf3\xe8\x99G\xcf<z\xe6\xd13\x8f\x9ey\xf4\xcc\xa3g\x1e=\xf3\xe8\x99G\xcf<z\xe6\xd13\x8f\x9ey\xf4\xcc\xa3g\x1e=\xf3\xe8\x99G\xcf<z\xe6\xd13\x8f\x9ey}z\xe6\xd13\x8f\x9ey\xf4\xcc\xa3g\x1e=\xf3\xe8\x99G\xcf<z\xe6\xd13\x8f\x9ey\xf4\xcc\xa3g\x1e=\xf3v\xe9\xb1\xb8\xd6\xb0\xce\xb0\xde\xb0\xc1\xb0\xd1\xd0e\xe86\xf4\x18z\r\xef,o^(oJJ^\x0by-\xe4\xb5\x90\xd7B^\x0by-\xe4\xb5\x90\xd7B^\x0by-\xe4\xb5\x90\xd7B^\x0by-\xe4\xb5\x90\xd7B^\x0by-\xe4\xb5\x90\xd7B^\x0by-\xe4\xb5\x90\xd7B^\x0by-\xe4\xb5\x90\xd7B^\x0by-\xe4\xb5\x90\xd7B^K\x9f\xbc\x16\xf2Z\xc8k!\xaf\x85\xbc\x16\xf2Z\xc8k!\xaf\x85\xbc\x16\xf2Z\xc8k!\xaf\x85\xbc\x16\xf2Z\xfa\xe4\xb5\x90\x17\x0e\xe1\x11f1<\xc8,v\x19\xba\r=\x86^\xc3;kk\t\xb5MMik\xa6\xad\x99\xb6f\xda\x9aik\xa6\xad\x99\xb6f\xda\x9aik\xa6\xad\x99\xb6f\xda\x9aik\xa6\xad\x99\xb6f\xda\x9aik\xa6\xad\x99\xb6f\xda\x9aik\xa6\xad\x99\xb6f\xda\x9aik\xa6\xad\x99\xb6f\xda\x9aik\xa6\xad\x99\xb6f\xda\x9aik\xee\xd3\xd6L[3m\xcd\xb45\xd3\xd6L[3m\xcd\xb45\xd3\xd6L[3m\xcd\xb45\xd3\xd6L[s\x9f\xb6f\xda\x9a\xfb\xb45;\xe0\x9a\x1dp\xcd\xcc53\xd7\xcc\\3s\xcd\xefn\xae94wY\xca\\\x13sM\xcc51\xd7\xc4\\\x13sM\xcc51\xd7\xc4\\\x13sM\xcc51\xd7\xc4\\\x13sM\xcc51\xd7\xc4\\\x13sM\xcc51\xd7\xc4\\\x13sM\xcc51\xd7\xc4\\\x13sM\xcc51\xd7\xc4\\\x13sM\xcc51\xd7\xc4\\S\x9f\xb9&\xe6\x9a\x98kb\xae\x89\xb9&\xe6\x9a\x98kb\xae\x89\xb9&\xe6\x9a\x98kb\xae\x89\xb9&\xe6\x9a\xfa\xcc51\xd7\xb4\xcb\xdc\xceK\x9a\xa7\xba\x0c\xdd\x86\x1eC\xaf\xe1\x9d\x9d5\x85\xce\xa6\xa5\x9c5r\xd6\xc8Y#g\x8d\x9c5r\xd6\xc8Y#g\x8d\x9c5r\xd6\xc8Y#g\x8d\x9c5r\xd6\xc8Y#g\x8d\x9c5r\xd6\xc8Y#g\x8d\x9c5r\xd6\xc8Y#g\x8d\x9c5r\xd6\xc8Y#g\x8d\x9c5r\xd6\xc8Y#g\x8d\x9c5\xf69k\xe4\xac\x91\xb3F\xce\x1a9k\xe4\xac\x91\xb3F\xce\x1a9k\xe4\xac\x91\xb3F\xce\x1a9k\xe4\xac\xb1\xcfY#g\x8d\x7f\xe3,y\x1b\xe2\xe9nC\x8f\xa1\xd7\xf0\xce\xc2\x1aCa\xd3S\xc2\x1a\x08k \xac\x81\xb0\x06\xc2\x1a\x08k \xac\x81\xb0\x06\xc2\x1a\x08k \xac\x81\xb0\x06\xc2\x1a\x08k \xac\x81\xb0\x06\xc2\x1a\x08k \xac\x81\xb0\x06\xc2\x1a\x08k \xac\x81\xb0\x06\xc2\x1a\x08k \xac\x81\xb0\x06\xc2\x1a\x08k \xac\x81\xb0\x06\xc2\x1a\xfa\x845\x10\xd6@X\x03a\r\x845\x10\xd6@X\x03a\r\x845\x10\xd6@X\x03a\r\x845\x10\xd6\xd0\x7fw\x8c\r\xa1\x9e\x19)=s\xe9\x99K\xcf\\z\xe6\xd23\x97\x9e\xb9\xf4\xcc\xa5g.=s\xe9\x99K\xcf\\z\xe6\xd23\x97\x9e\xb9\xf4\xcc\xa5g.=s\xe9\x99K\xcf\\z\xe6\xd23\x97\x9e\xb9\xf4\xcc\xa5g.=s\xe9\x99K\xcf\\z\xe6\xd23\x97\x9e\xb9\xf4\xcc\xa5g.=s\xfb\xf4\xcc\xa5g.=s\xe9\x99K\xcf\\z\xe6\xd23\x97\x9e\xb9\xf4\xcc\xa5g.=s\xe9\x99K\xcf\\z\xe6\xf6\x9f\x9e\xb9\xa1\x9e\xfc\x94\x9ezz\xea\xe9\xa9\xa7\xa7\x9e\x9ezz\xea\xe9\xa9\xa7\xa7\x9e\x9ezz\xea\xe9\xa9\xa7\xa7\x9e\x9ezz\xea\xe9\xa9\xa7\xa7\x9e\x9ezz\xea\xe9\xa9\xa7\xa7\x9e\x9ezz\xea\xe9\xa9\xa7\xa7\x9e\x9ezz\xea\xe9\xa9\xa7\xa7\x9e\x9ezz\xea\xe9\xa9\xa7\xa7\x9e\x9e\xfa>=\xf5\xf4\xd4\xd3SOO==\xf5\xf4\xd4\xd3SOO==\xf5\xf4\xd4\xd3SOO==\xf5\xf4\xd4\xf7\x9f\x9e\xfaPOAJO\x1d=u\xf4\xd4\xd1SGO\x1d=u\xf4\xd4\xd1SGO\x1d=u\xf4\xd4\xd1SGO\x1d=u\xf4\xd4\xd1SGO\x1d=u\xf4\xd4\xd1SGO\x1d=u\xf4\xd4\xd1SGO\x1d=u\xf4\xd4\xd1SGO\x1d=u\xf4\xd4\xd1SGO]\x9f\x9e:z\xea\xe8\xa9\xa3\xa7\x8e\x9e:z\xea\xe8\xa9\xa3\xa7\x8e\x9e:z\xea\xe8\xa9\xa3\xa7\x8e\x9e:z\xea\xfa\xaeFu\xaeFu^o\xd5y\xbdU\xe7\xf6\xaf\xce\xed_\x9d[\x89:W\xa6:W\xa6:W\xa6:o>\xd5y\xf3)\x1c\xfeVa]\xa8\xb00\xa50Ja\x94\xc2(\x85Q\n\xa3\x14F)\x8cR\x18\xa50Ja\x94\xc2(\x85Q\n\xa3\x14F)\x8cR\x18\xa50Ja\x94\xc2(\x85Q\n\xa3\x14F)\x8cR\x18\xa50Ja\x94\xc2(\x85Q\n\xa3\x14F)\x8cR\x18\xa50\xda\xa70Ja\x94\xc2(\x85Q\n\xa3\x14F)\x8cR\x18\xa50Ja\x94\xc2(\x85Q\n\xa3\x14F\xfb\x14F)\x8cR\x18\xa50Ja\x94\xc2(\x85Q\n\xa3\x14F)\x8cR\x18\xa50\xfa\xf7\x15FC\x85E)\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5}\nk)\xac\xa5\xb0\x96\xc2Z\nk)\xac\xa5\xb0\x96\xc2Z\nk)\xac\xa5\xb0\x96\xc2Z\nk)\xac\xedSXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6RXKa-\x85\xb5\x14\xd6z\x0b\xb8\xd6[\xc0\xb5\xde\x02\xae\xf5\x16p\xad\xb7\x80kC\x9d\xc5)\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5}:k\xe8\xac\xa1\xb3\x86\xce\x1a:k\xe8\xac\xa1\xb3\x86\xce\x1a:k\xe8\xac\xa1\xb3\x86\xce\x1a:k\xe8\xac\xe9\xd3YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0YCg\r\x9d5t\xd6\xd0Y\x13\xea\x9c\x99\xd2YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3Y\xdd\xa7\xb3\x9a\xcej:\xab\xe9\xac\xa6\xb3\x9a\xcej:\xab\xe9\xac\xa6\xb3\x9a\xcej:\xab\xe9\xac\xa6\xb3\x9a\xce\xea>\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5tV\xd3YMg5\x9d\xd5\xa1\xceY)\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dU}:\xab\xe8\xac\xa2\xb3\x8a\xce*:\xab\xe8\xac\xa2\xb3\x8a\xce*:\xab\xe8\xac\xa2\xb3\x8a\xce*:\xab\xe8\xac\xea\xd3YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1YEg\x15\x9dUtV\xd1Y\x15\xea\x9c\xfd\xc1}#\xaf4\xf5\x0b5\xcb\xd3\xa2GF>\x92\xf6\x0f\xef\xe4\xec\xc8\xcdi\xb1HE\xaa\xff\xca\xf4_\x99\xfe+\xd3\x7fe\xfa\xafL\xff\x95\xe9\xbf2\xfdW\xa6\xff\xca\xf4_\x99\xfe+\xd3\x7fe\xfa\xafL\xff\x95\xe9\xbf2\xfdW\xa6\xff\xca\xf4_\x99\xfe+\xd3\x7fe\xfa\xafL\xff\x95\xe9\xbf2\xfdW\xa6\xff\xca\xf4_\x99\xfe+\xd3\x7fe\xfa\xafL\xff\x95\xe9\xbf2\xfdW\xa6\xff\xca|\xea[\xe6S\xdf2-X\xa6\x05\xcb\xb4`\x99\x16,\xd3\x82eZ\xb0L\x0b\x96i\xc12-X\xa6\x05\xcb\xb4`\x99\x16,\xd3\x82e>\xf5-\xf3\xa9o\x99.,\xd3\x85e\xba\xb0L\x17\x96\xe9\xc22]X\xa6\x0b\xcbta\x99.,\xd3\x85e\xba\xb0L\x17\x96\xe9\xc22]X\xa6\x0b\xcbtaY\xd8\x85\x95)\xa9\xe9\xa4\xa6\x93\x9aNj:\xa9\xe9\xa4\xa6\x93\x9aNj:\xa9\xe9\xa4\xa6\x93\x9aNj:\xa9\xe9\xa4\xa6\x93\x9aNj:\xa9\xe9\xa4\xa6\x93\x9aNj:\xa9\xe9\xa4\xa6\x93\x9a\xcef:\x9b\xe9l\xa6\xb3\x99\xcef:\x9b\xe9l\xa6\xb3\x99\xcefz\xdf\xd9$\x9d\xcat*\xd3\xa9L\xa72\x9d\xcat*\xd3\xa9L\xa72\x9d\xcat*\xd3\xfb\xed[\x80\xb5\x7f\xf3\xab\xb9\xd1a\x91u\x89#-\x9a\x92r\x17)w\x91r\x17)w\x91r\x17)w\x91r\x17)w\xb1q\x17\x1bw\xb1q\x17\x1bw\xb1q\x17\x1bw\xb1q\x17\x1bw\xb1q\x17\xe2w\xf5\xeb/\xba\xd5\xa7&3\xded\xc6\x9b\xccx\x93\x19o2\xe3Mf\xbc\xc9\x8c7\x99\xf1&3\xded\xc6\x9b\xccx\x93\x19o2\xe3Mf\xbc\xc9\x8c7\x99\xf1&3\xded\xc6\x87m>7\x15\xe2\x02!\xde\xe5\x97\x8f\ro\xfb\xfdc\xc3\x10\xc3\xce\xdfB6\xfc\x03\xbf\x88\xdc\xb0\xfb\xef?O\x10a\x82\x08\x13D\x98\xd0\xf7KG\x13\xd4\x9f\xb0\xe7\xef?O\xe8\xfb\xfd\xe7\t\xcaNPv\x82\xb2\x13\x94\x9d\xa0\xec\x84\xb0l\xe3\xdf\xfdu\xcaD\xabmL\xb4Z\xf3\x07w\x15jy\x8f\xef\x85\xf7\xf6\xe3\xf7\xc2[w\xfd2\xca~\x13\x8fB\xfa(\xa4\x8fB\xfa(\xb2\x8f"\xfb(\xb0\x8f\xe2\xf5(\'\xa5\xa3\x9c\x94\x8erR:\xcaI\xe9(\x7fI\xe9\xeb\xb1H{\xaa\xa5\x06i\xa9A\xaa\x0cRe\x90*\x83T\x19\xa4\xca U\x06\xa92H\x95A\xaa\x0cRe\x90*\x83\xfcq\xcbA\xa1\xbf\xd8\x07\xa7\xe8\x8a\xd4\x9c\x86\x9a\xd3Ps\x1ajNC\xcdi\xa89\r5\xa7\xa1\xe64\xd4\x9c\x86\x9a\xd3Ps\x1ajNC\xcdi\xa8?q\xf5\xd3hi\xe4s\xc9\xdf\xfd\xfbI,r\xf5.K\xa7F\xfe=\r\xd6\x7fJE\xf8\xb12?\xd6\xc9?ve\xff\xb1\xdf\xb2\xf9\xb1_\xfa\xf8q\x88\xe7_R\x1b|\xcb\x06\xdf\xb2\xe6\xb7\xac\xf2\xadp\x95\xebS\xab|\xc1*_\x90\xf9\x0b\xd6\xfcB\xb8\xca\xc2\xdd~\x1f\xf0\x01\xd3~\xc0\xb4\x1f0\xed\x07\xfa\x0e\xcd\x07\xf6\xfcM\xd8\x07\x9c\x1b\x1epnx\x00\x89\x07\x9c\x1b\x1ep\x90>\xe0 }\xc0A\xfa\x80\x83\xf4\x81=\x7f\x13\xf6\x81~\xfdM\xd8E\xa9)\xdf\xcf\xe4\xfd\xa6t\xbf)\xddoJ\xf7\xc3q?\x93\xf7\xa3r\xbf\x13\xde\xfd&u\xbfI\xddoR\xf7\x9b\xd4\xfd&u\xbfI\xddoR\xf7\x9b\xd4\xfd|\xdd\x1fB]\x9c\n\x91)D\xa6\x10\x99Bd\n\x91)D\xa6\x10\x99Bd\xba\xb9\xc8\x94%S\x96LY2e\xc9\x94%S\x96LY2e\xc9\x94%S7f\xea\xc6L\xdd\x98\xa9\x1b3\xe5\xcc\xd4\x03\x99\xee12\xddcd\xba\xc7\xc8t\x8f\x91\xe9\x1e#\xd3=F\xa6{\x8cL\xf7\x18\x99\xee12\xdd1f\xbac\xcct\x9b\x91\xe96#\xd3mF\xa6\xdb\x8cL\xb7\x19\x99n32\xddfd\xba\xcd\xc8t\x9b\x91\xe96#\xd3\x1dc\xa6;\xc6Lw\x8c\x99\xee\x183\xdd1f\xbac\xcct\xc7\x98\xe9\x8e1\xd3\x1dc\xa6;\xc6Lw\x8c\x99\xee\x183\xdd1f\xbac\xcct\xc7\x98\xe9\x8e1\xd3\x1dc\xa6;\xc6Lw\x8c\x99\xee\x183\xdd1f\x86R\xe3\xbb\x1d)\xb72z+\xa3\xb72zk\xdf\x91r\xeb\x9eG\xca\xadD\xdeJ\xe4\xadD\xdeJ\xe4\xadD\xdeJ\xe4\xadD\xdeJ\xe4\xadD\xdeJ\xe4\xad{\x1e7\xb7\xf6\xe3q\x13\x1d\x1d\xf9bZtL\xe4\xcbi\t\x03\xb7\x86\xd3\xbd)u\xf5\xfcz\xf2\xa2\xfdY\xf3\xfd\xac\xf9~\xd6|?\xab\x83?\xab\x83\xc3!|\x95u\x94\xe5\xc1\x86!\x86\xa3\rC\r\xc7\x18\x8e5\x1cg8\xdep\x82\xe1D\xc3I\x86\x93\r\xa7\x18\x86\x19\xce0|\xcc\xf0q\xc3\'\x0c\x9f4d\x18\xfea\x1c6\x1bc\xf02pE\xea\xa0^\xec\xa0^\x0c\xc9bH\x16C\xb2\x18\x92\xc5\x90,vP/vP/\x06e1(\x8bAY\x0c\xcabP\x16\x83\xb2\x18\x94\xc5\xa0,\x06e1(\x8bAY\x0c\xcabP\x16\x83\xb2\x18\x94\xc5\xa0,\x06e1(\x8bAY\x0c\xcabG\xf3bG\xf3bG\xf3bG\xf3bG\xf3bG\xf3bG\xf3bG\xf3bG\xf3bG\xf3bG\xf3bG\xf3bG\xf3b\xe0\x16;\x9a\x17\x87\xbd\xb42\x85n$t#\xa1\x1b\t\xddH\xe8FB7\x12\xba\x91\xd0\x8d\x84n$t#\xa1\x1b\t\xddH\xe8FB7\x12\xba\x91\xd0\x8d\x84n$t#\xa1\x1b\t\xddH\xe8FB7\x12\xba\x91\xd0\x8d\x84n$t#\xa1\x1b\t\xddH\xe8FB7\x12\xba\x91\xd0\x8d\x84n$t#\xa1\x1b\t\xddH\xe8FB7\x12\xba\x91\xd0\x8d\x84n$t#\xa1\x1b\t\xdd\xc8\x10\xdd\xaa\x14\xba\xe1\xd0\r\x87n8t\xc3\xa1\x1b\x0e\xddp\xe8\x86C7\x1c\xba\xe1\xd0\r\x87n8t\xc3\xa1\x1b\x0e\xddp\xe8\x86C7\x1c\xba\xe1\xd0\r\x87n8t\xc3\xa1\x1b\x0e\xddp\xe8\x86C7\x1c\xba\xe1\xd0\r\x87n8t\xc3\xa1\x1b\x0e\xddp\xe8\x86C7\x1c\xba\xe1\xd0\r\x87n8t\xc3\xa1\x1b\x0e\xddp\xe8\x86C7\x1c\xba\xe1\xd0\r\x87n8t\xc3Ct\xabS\xe8r\xa1\xcb\x85.\x17\xba\\\xe8r\xa1\xcb\x85.\x17\xba\\\xe8r\xa1\xcb\x85.\x17\xba\\\xe8r\xa1\xcb\x85.\x17\xba\\\xe8r\xa1\xcb\x85.\x17\xba\\\xe8r\xa1\xcb\x85.\xd7U8\x17\xc1\\\x04s\x11\xccE0\x17\xc1\\\x04s\x11\xccE0\x17\xc1\\\x04s\x11\xccE0\x17\xc1\\\x04s\x11\xccE0\x17\xc1\\\x04s\x11\xccE0\x17\xc1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\\W\xe1\xdcP\xea\x9a\x94\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsH\xcd!5\x87\xd4\x1cRsB\xa9kSR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd&5\x9b\xd4lR\xb3I\xcd\x0e\xa5\xaeKI\xbd\x97\xd4{I\xbd\x97\xd4{I\xbd\x97\xd4{I\xbd\x97\xd4{\xd9\xbc\x97\xcd{\xd9\xbc\x97\xcd{\xd9\xbc\x97\xcd{\xd9\xbc\x97\xcd{\xd9\xbc\x97\xb1{\xc3\x10\x1bS!\xce\x13\xe2<!\xce\x13\xe2<!\xce\x13\xe2<!\xce\x13\xe2<!\xce\x13\xe2<!\xce\x13\xe2<!\xce\x13\xe2<!\xce\x13\xe2<!\xce\x13\xe2\xbc0D\xcf{\xbc\x01\xf4\xa3~|\x03\xa875\xe1\x89&<\xd1\x84\'\x9a\xf0D\x13\x9eh\xc2\x13Mx\xa2\tO4\xe1\x89&<\xd1\x84\'\x9a\xf0D\x13\x9eh\xc2\x13Mx\xa2\tO4\xe1\x89&<1\x9c\xf0\x96\xdd\xfe\x0c\xd2\xee\xbf\xd3\xda\x12|\xfdC\xfa\xbd\xd6Xdk\n\xcc\xe1\xc0\x1c\x0e\xcc\xe1\xc0\x1c\x0e\xcc\xe1\xc0\x1c\x0e\xcc\xe1\xc0\x1c\x8e\xc1\xe1N\x12\x87;I\x1c\xee$q\xb8\x93\xc4\xe1\xde\xb6:<,\xb4\xfd=l\xff\xb4\x1fm\xefHM\xea8\x93:\xce\xa4\x8e3\xa9\xe3L\xea8\x93:\xce\xa4\x8e3\xa9\xe3L\xea8\x93:\xce\xa4\x8e3\xa9\xe3L\xea\xb8~}7\xfc_SI\x8f\x96\xf4hI\x8f\x96\xf4hI\x8f\x96\xf4hI\x8f\x96\xf4hI\x8f\x96\xf4hI\x8f\x96\xf4hI\xc3\xa14\xf2\xf3\xc4\x8b\xb4\x7fO\x95\x99\xaf\xcc|e\xe6+3_\x99\xf9\xca\xccWf\xbe2\xf3]I\xe6;\n\xe6;\n\xe6;\n\xe6\x8b0\xdfQ0\xdfQ0\xdfQ0\xdfQ0\xdfQ0\xdfQ0?l\x84\xdbSY\x9e\x90\xe5\tY\x9e\x90\xe5\tY\x9e\x90\xe5\tY\x9e\x90\xe5\t!\x9e\x10\xe2\t!\x9e\x10\xe2\t!\x9e\x10\xe2\t!\x9e\x10\xe2\t!\x9e\x10\xe2\x890\xc4\xdd\xa9\x10\x8f\n\xf1\xa8\x10\x8f\n\xf1\xa8\x10\x8f\n\xf1\xa8\x10\x8f\n\xf1\xa8\x10\x8f\n\xf1\xa8\x10\x8f\n\xf1\xa8\x10\x8f\n\xf1\xa8\x10\x8f\n\xf1\xa8\x10\x8f\n\xf1h\x18\xe2\x0b\xa9\x10\x1dBt\x08\xd1!D\x87\x10\x1dBt\x08\xd1!D\x07+\x1d\xb2t\xc8\xd2!K\x87,\x1d\xb2t\xc8\xd2!K\x87,\x1d\xb2t\xe8\x9d\x0e\xbd\xd3\xa1w:\xf4N\x87\x9c\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\x1d.\xec\xe10:\xf2\xc4\xae\xb7`:Bl_Ja[\x0e\xdbr\xd8\x96\xc3\xb6\x1c\xb6\xe5\xb0-\x87m9l\xcba[\x0e\xdbr\xd8\x96\xc3\xb6\x1c\xb6\xe5\xb0-\x87m9l\xcba[\x0e\xdbr\xd8\x96\xc3\xb6\x1c\xb6\xe5\xb0-\x87m9l\xcba[\x0e\xdbr\xd8\x96\xc3\xb6\x1c\xb6\xe5\xb0-\x87m9l\xcba[\x0e\xdbr\xd8\x96\xc3\xb6\x1c\xb6\xe5\xb0-\x87m9l\xcba[\xee~h\xb9\xfb\xa1\xe5\xee\x87\x96\x87\xe8\xbe\x92BW\n])t\xa5\xd0\x95BW\n])t\xa5\xd0\x95BW\n])t\xa5\xd0\x95BW\n])t\xa5\xd0\x95BW\n])t\xa5\xd0\x95BW\n])t\xa5\xee(K\x11,E\xb0\x14\xc1R\x04K\x11,E\xb0\x14\xc1R\x04K\x11,E\xb0\x14\xc1R\x04K\x11,E\xb0\x14\xc1R\x04K\x11,E\xb0\x14\xc1R\x04K\x11,uGY\xea\x8e\xb2\xd4\xf5\xbb\xd4\x1de\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9kw\xa9;\xca\xd2P\xea\xd7RoI>\xf3\xfe\xff\xe3\x8d\x91\xffH5\xd0R\r\xb4T\x03-\xd5@K5\xd0R\r\xb4T\x03-\xd5@K5\xd0R\r\xb4T\x03-\xd5@K5\xd0R\r\xb4T\x03-\xd5@K5\xd0R\r\xb4T\x03-\xd5@K5\xd0R\r\xb4T\x03-\xd59Ku\xceR\x9d\xb3T\xe7,\xd59Ku\xceR\x9d\xb3T\xe7,\xd59Ku\xceR\x9d\xb3T\xe7,\xd59Ku\xceR\x9d\xb3T\xe7,\xd59Ku\xceR\x9d\xb3T\xe7,\xd59KCM\xdf\xd8\xfd\x9d\xe3e\xc0-\x03n\x19p\xcb\x80[\x06\xdc\xb2\xdd\xde9^\x06\xdb2\xd8\x96\xc1\xb6\x0c\xb6e\xb0-\x83m\x19l\xcb`[\x06\xdb2\xd8\x96\xc1\xb6\x0c\xb6e\xb0-\x83m\x19l\xcb`[\x06\xdb2\xd8\x96\xc1\xb6\x0c\xb6e{\xf7\xce\xf12H\x96\xf5\xbds\xfc\xad\x14\x90\x17>\x80\xbe\xfdv\xaa\xd6K\x1f@\xad\x1f\xa6j\xbd\xf9\xb6\xbfW\xfc\xa3\xd4\xb1\x138v\x02-\x10h\x81@\x0b\x04Z \xd0\x02\x81c\'`?`?`?`?`?`?`?`?`?`8\x08\xbb\xf0\xc7{\xfeY\xc6\x9f\xec\xf6\xc1\xf8`\x81\x06\x0b4X\xa0\xc1\x02\r\x16h\xb0@\x83\xd5\x1e\xac\xad\x06k\xab\xc1\xdaj\xb0\xb6\x1a\xbc\xeb\x83\xf1\x9f\xa6\xa6}\xb0i\x1f\xac\xca\xc1\xaa\x1c\xac\xca\xc1\xaa\x1c\xac\xca\xc1\xaa\x1c\xac\xca\xc1\xaa\x1c\xac\xca\xc1\xaa\x1c\xac\xca\xc1\xe1\x9c~\x96\xaap\xac\n\xc7\xaap\xac\n\xc7\xaap\xac\n\xc7\xaap\xac\n\xc7\xaap\xac\n\xc7\xaap\xac\n\xc7\xaapl\xbf\xde\xee\xff"\x95\xf40I\x0f\x93\xf40I\x0f\x93\xf40I\x0f\x93\xf40I\x0f\x93\xf40I\x0f\x93\xf40I\x0f\x93\xf40W\xce\xc3\\\x9f\x0e\xf3\xda\xeb\xb0\x10\xd0/Se\xafQ\xf6\x1ae\xafQ\xf6\x1ae\xafQ\xf6\x1ae\xafQ\xf6\x1ag\xedk4\xe05\x1a\xf0\x1a\rx\x8dH\xd7h\xc0k4\xe05\x1a\xf0\x1a\rx\x8d\x06\xbcF\x03^\x13f\xf9\xcfT\x96+e\xb9R\x96+e\xb9R\x96+e\xb9R\x96+e\xb9R\xbd+!\xb8\x12\x82+!\xb8\x12\x82p(\r\x87X\xe4W\xa9BW(t\x85BW(t\x85BW(t\x85BW(t\x85BW(t\x85BW(t\x85BW(tEX\xe8\xc1T\xa1\xcb\x15\xba\\\xa1\xcb\x15\xba\\\xa1\xcb\x15\xba\\\xa1\xcb\x15\xba\\\xa1\xcb\x15\xba\\\xa1\xcb\x15\xba\\\xa1\xcb\x15\xba<,\xf4H\xaa\xd0\x1a\x85\xd6(\xb4F\xa15\n\xadQh\x8dBk\x14ZC\xe3\x1a\x1a\xd7\xd0\xb8\x86\xc65B\xac\xa1q\r\x8dkh\\C\xe3\x1a\x1a\xd7\xc8\xb9F\xce5r\xae\x91s\r\xc5k\\E\xd6\xb8\x8a\xacq\x15Y\xe3*\xb2\xc6Ud\x8d\xab\xc8\x1a\x17\xdf5.\xbek\\|\xd7\xf4}9o\x8d+\xef\x1aW\xde5\xae\xbck\\y\xd7\xb8\xf2\xaeq\xe5]\xe3\xca\xbb\xc6\x95w\x8d\xcb\xcc\x1aW\xde5\xfd\xf6\xe5\xbc\xc7R\xec;\xb1\xef\xc4\xbe\x13\xfbN\xec;\xb1\xef\xc4\xbe\x13\xfbN\xec;\xb1\xef\xc4\xbe\x13\xfbN\xec;\xb1\xef\xc4\xbe\x13\xfbN\xec;\xb1\xef\xc4\xbe\x13\xfbN\xec;\xb1\xef\xc4\xbe\x13\xfbN\xec;\xb1\xef\xc4\xbe\x13\xfbN\xec;\xb1\xef\xc4\xbe\x13\xfbN7>\x9dn|:\xe1\xef\x84\xbf\x13\xfeN\xf8;\xe1\xef\x84\xbf\x13\xfeN\xf8;\xe1\xef\x84\xbf3l\xdb\'S\xe8V@\xb7\x02\xba\x15\xd0\xad\x80n\x05t+\xa0[\x01\xdd\n\xe8V@\xb7\x02\xba\x15\xd0\xad\x80n\x05t+\xa0[\x01\xdd\n\xe8V@\xb7\x02\xba\x15\xd0\xad\x80n\x05t+\xa0[\x01\xdd\n\xe8V@\xb7\x02\xba\x15\xd0\xad\x80n\x05t+\xa0[\x01\xdd\n\xe8V@\xb7\x02\xba\x15\xd0\xad\x80n\x05t+\xa0[\x01\xdd\n\xe8V@\xb7\x02\xba\x15\xd0\xad\x08\xd1=\xf5\xc1}\xd7\xeb\xe9\xdd\xbe\xc7q#E7Rt#E7\xf6}\x8f\xe3\xc6=\xbf\xc7q#372s#372s#372s#372s#372s\xe3\x9e\xdf\xe3\xb8\xb1_\xbf\xc7awc\x0cg\x87C,\xf1\x82\xe9\xff\xfe\x91\xd1\xbd\xfaGF\xa3\x17F\xfe;q\x03\xffl\x8a\xdf\x12\xfc\x96\xe0\xb7\x04\xbf%\xf8-\xc1o\t~K\xf0[\x82\xdf\x12\xfc\x96\xe0\xb7\x04\xbf%\xf8-\xc1o\t~K\xf0[\x82\xdf\x12\xfc\x96\xe0\xb7\x04\xbf%\xf8-\xc1o\t~K\xf0[\x82\xdf\x12\xfc\x96\xe0\xb7\x04\xbf%\xf8-\xc1o\t~K\xf0[\x82\xdf\x12\xfc\x96\xe0\xb7\x04\xbf%\xf8-\xc1o\t~K\xf0[\x82\xdf\x12\xfc\x96\xe0\xb7\x04\xbf%a\xeb=\xd7\xf7b0|\x897,\xf2\xd7\xbd\xfd=\x8c\xe7w;po\xa0\xe0\x06\nn\xa0\xe0\x86\xbe\x03\xf7\x86=\x0f\xdc\x1b\x90\xbf\x01\xf9\x1b\x90\xbf\x01\xf9\x1b\x90\xbf\x01\xf9\x1b\x90\xbf\x01\xf9\x1b\x90\xbf\x01\xf9\x1b\xf6<po\xe8\xdf\x03\xf7\x06\xf4n@\xef\x86\x90\xde\x0b\xffw\xe0\xee\xf5\x81\xfb?\x89\x96yq\xb7\x96\xb9\x1e\xbc\xeb\xc1\xbb\x1e\xbc\xeb\xfbZ\xe6\xfa=[\xe6z\xcc\xae\xc7\xecz\xcc\xae\xc7\xecz\xcc\xae\xc7\xecz\xcc\xae\xc7\xecz\xcc\xae\xc7\xec\xfa=[\xe6\xfa\xfem\x99\xeb\xcd\xfbz\xf3\xbe>l\x99\x97\xfe\xafe\xf6\xbae>2 \x16y%\xc5o\x14~\xa3\xf0\x1b\x85\xdf(\xfcF\xe17\n\xbfQ\xf8\x8d\xc2o\x14~\xa3\xf0\x1b\x85\xdf(\xfcF\xe17\n\xbfQ\xf8\x8d\xc2o\x14~\xa3\xf0\x1b\x85\xdf(\xfcF\xe17\n\xbfQ\xf8\x8d\xc2o\x14~\xa3\xf0\x1b\x85\xdf(\xfcF\xe17\n\xbfQ\xf8\x8d\xc2o\x14~\xa3\xf0\x1b\x85\xdf(\xfcF\xe17\n\xbfQ\xf8\x8d\xc2o\x14~\xa3\xf0\x1b\x85\xdf\xa8\xb0\xf5^M\xa1\x1b\x01\xdd\x08\xe8F@7\x02\xba\x11\xd0\x8d\x80n\x04t#\xa0\x1b\x01\xdd\x08\xe8F@7\x02\xba\x11\xd0\x8d\x80n\x04t#\xa0\x1b\x01\xdd\x08\xe8F@7\x02\xba\x11\xd0\x8d\x80n\x04t#\xa0\x1b\x01\xdd\x08\xe8F@7\x02\xba\x11\xd0\x8d\x80n\x04t#\xa0\x1b\x01\xdd\x08\xe8F@7\x02\xba\x11\xd0\x8d\x80n\x04t#\xa0\x1b\x01\xdd\x08\xe8F@7"D\xf7Z\n\xdd\x9d\xd0\xdd\t\xdd\x9d\xd0\xdd\t\xdd\x9d\xd0\xdd\t\xdd\x9d\xd0\xdd\x89\xd9\x9d\x98\xdd\x89\xd9\x9d\x98\xdd\x89\xd9\x9d\x98\xdd\x89\xd9\x9d\x98\xdd\x89\xd9\x9d\xb8\xdc\xd9\xafo\xfe\xbc\xd1\xf7\x8b7\xfbM\xfc\x94\xa9|\xcaT>e*\x9f\xea;\xed~\xcai\xd7\xef\xe6\x0c\xf6p\x88\xe1h\xc3P\xc31\x86c\r\xc7\x19\x8e7\x9c`\x18\x16\x0e\xb1\xc8\x9b\xff\xdf\xfc\xa3n\x89\x93\xca~\x89\x93\xcaow{\xf7q\x884C\xa4\x19"\xcd\x10i\x86H3D\x9a!*\x0e\xd1\xd7C\xf4\xf5\x10}=D_\x0f\xd9\xf5\xee\xe3[\xa99\x1fc\xce\xc7\xa8r\x8c*\xc7\xa8r\x8c*\xc7\xa8r\x8c*\xc7\xa8r\x8c*\xc7\xa8r\x8c*\xc7\xa8rL\xbf\xb6\xc7\xefRI\xbf)\xcd7\xbd\x9d\xf7M\xbf\xb8\xf2M\xff\xa0\xc9\xfe\th\x7f\xfc\xe0^\x13\xfei\xb7\xfb\x84[\x90\xbb\x05\xb9[\x90\xbb\xa5\xafao\xd9\xf3>\xe1\x16Mr\x8b&\xb9\x05\xcc[4\xc9-\x9a\xe4\x16Mr\x8b&\xb9E\x93\xdc\x82\xf7-x\xdf\xb2\xe7}\xc2-\xfd{\x9fp\x8b3\xce-\xce8\xb7\x84\xc7\xc8\x9f?8\xba\x7fI\t/\xd1\x9a%\x00\x97\x00\\\x02p\x89f(\xd1\x9a%Z\xb3\xc4\xe1X\xe2p,A\xba\x04\xe9\x12\xa4K\x90.A\xba\x04\xe9\x12\xa4K\x90.A\xba\x04\xe9\x12\x9d]\xa2\xb3K\x1c\xaa%z\xb0\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\xc4\xe5\xa1\x84\xac\x12\xb2J|\x18[\xe2\xcd\xee\x12\x1f\xc6\x96\xf80\xb6\xc4\x87\xb1%>\x8c-\xf1al\x89\x0fcK|\x18[\xe2\xc3\xd8\x12\x1f\xc6\x96\xf80\xb6\xc4\x87\xb1%>\x8c-\xf1al\x89\x0fcK|\x18[\xe2\xc3\xd8\x12\x1f\xc6\x96\xf80\xb6\xc4\x87\xb1%a\xff\xfc\xf7\x07\xd7?\x7fM\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xff\xc4\xf5O\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc45N\\\xe3\xc4CK\xff\xf3\xc1Y\xfa\xc8\x80\x0f\xac\xd4~\x03\xfe\xfe?\x94\xba\xbf\xe7\'~C3|\xc3Q\xfd\rW\x96o\x84@\x0eH\xad\xf2u\xab|\xdd*_\xb7\xca\xd7]|>\x9a\xb8\xf8\x1c\x98Zo\xb5\x9e[\xad\xe7V\xeb\xb9\xd5zn\xb5}\xac\xd6s\xab\xf5\xdcj=\xb7Z\xcf\xad\xd6s\xab\xf5\xdcj=\xb7Z\xcf\xad\xd6s\xab\xf5\xdcj=\xb7Z\xcf\xad\xd6s\xab\xf5\xdcj=\xb7Z\xcf\xad\xd6s\xab\xf5\xdcj=\xb7Z\xcf\xad\xd6s\xab\xf5\xdcj=\xb7Z\xcf\xad\xd6s\xab\xf5\xdc\xea\xbe\x8f Vk\xb8\xd5\x1an\xb5\x86[\xad\xe1Vk\xb8\xd5\x1an\xb5\x86[\xad\xe1Vk\xb8\xd5\x1anu\xbf}\x04qP\x8a\xfdJ\xecWb\xbf\x12\xfb\x95\xd8\xaf\xc4~%\xf6+\xb1_\x89\xfdJ\xecWb\xbf\x12\xfb\x95\xd8\xaf\xc4~%\xf6+\xb1_\x89\xfdJ\xecWb\xbf\x12\xfb\x95\xd8\xaf\xc4~%\xf6+\xb1_\x89\xfdJ\xecWb\xbf\x12\xfb\x95\xd8\xaf\xc4~%\xf6+\xb1_\xe9x_\xe9x_\t\xffJ\xf8W\xc2\xbf\x12\xfe\x95\xf0\xaf\x84\x7f%\xfc+\xe1_\t\xffJ\xf8W\x86\xed=p@\xdf\x8d\xcc\xcd\xb8\xdd\x8c\xdb\xcd\xb8\xdd\xdcw#s\xf3\x9e727\xc3u3\\7\xc3u3\\7\xc3u3\\7\xc3u3\\7\xc3u3\\7\xefy#ss\xff\xde\xc8\xdcl\xca7\x9b\xf2\xcd\xe1\x94\xd3w\x9b\xf2M\xa6|\x93)\xdfd\xca7\xf5M\xf9\xa6=\xa7|\x93)\xdfd\xca7\x99\xf2M\xa6|\x93)\xdfd\xca7\x99\xf2M\xa6|\x93)\xdfd\xca7\xed9\xe5\x9b\xfaw\xca7\x99\xf2M\xa6|S8\xe5\x83\x07\xbc\xfbW\x8c\x8f\x18\xd0\x7f_1>\xe4=j\x1d\xd9\x8f\xb5\x0e}\x8fZG\xf5c\xadA\xa9\x93\xcc\x1dN2w\xe8\x9c;t\xce\x1d:\xe7\x0e\'\x99;\x9cd\xeep\x92\xb9\xc3\xd9\xe5\x0e\xbds\x87\xde\xb9C\xef\xdc\xa1w\xee\xd0;w\xe8\x9d;\xf4\xce\x1dz\xe7\x0eg\x90;\xfa\xf5%\xd5\xe1\x03\xde\xe1O]\x1c\x9d\xb8\x94}45\xd3\xff0\x9b\xffp\xc9\xfb\x0f\x97\xbc\xff\x08\x1b\xea\x88\xd4*\x8b\xc0X\x04\xc6"0\x16\x81\xb1\xc8\xe6\x8b\xc0X\x04\xc6"g\xdcE\x98,\xc2d\x11&\x8b0Y\x84\xc9"L\x16a\xb2\x08\x93E\x98,r<-r<-r\xc6]\xe4\x8c\xbb\x08\xafE\xce\xb8\x8b\x9cq\x179\xe3.r\xc6]\xe4\x8c\xbb\xc8\x19w\x913\xee"g\xdcE\xce\xb8\x8b\x9cq\x179\xe3.r\xc6]\xe4\x8c\xbb\xc8\x19w\x913\xee"g\xdcE\xce\xb8\x8b\x9cq\x179\xe3.r,.r,.\n\xd1\x1d\x99B\xb7\x10\xba\x85\xd0-\x84n!t\x0b\xa1[\x08\xddB\xe8\x16B\xb7\x10\xba\x85\xd0-\x84n!t\x0b\xa1[\x08\xddB\xe8\x16B\xb7\x10\xba\x85\xd0-\x84n!t\x0b\xa1[\x08\xddB\xe8\x16B\xb7\x10\xba\x85\xd0-\x84n!t\x0b\xa1[\x08\xddB\xe8\x16B\xb7\x10\xba\x85\xd0-\x84n!t\x0b\xa1[\x08\xddB\xe8\x16B\xb7\x10\xba\x85\xd0-\x84na\x88\xee\xa8\x14\xba\x05\xd0-\x80n\x01t\x0b\xa0[\x00\xdd\x02\xe8\x16@\xb7\x00\xba\x05\xd0-\x80n\x01t\x0b\xa0[\x00\xdd\x02\xe8\x16@\xb7\x00\xba\x05\xd0-\x80n\x01t\x0b\xa0[\x00\xdd\x02\xe8\x16@\xb7\x00\xba\x05\xd0-\x80n\x01t\x0b\xa0[\x00\xdd\x02\xe8\x16@\xb7\x00\xba\x05\xd0-\x80n\x01t\x0b\xa0[\x00\xdd\x02\xe8\x16@\xb7\x00\xba\x05\xd0-\x80n\x01t\x0bBtG\xa7\xd0\x9d\t\xdd\x99\xd0\x9d\t\xdd\x99\xd0\x9d\t\xdd\x99\xd0\x9d\t\xdd\x99\xd0\x9d\t\xdd\x99\xd0\x9d\t\xdd\x99\xd0\x9d\t\xdd\x99\xd0\x9d\t\xdd\x99\xd0\x9d\t\xdd\x99\xf0$\x87X\xf2\x1f\xc5\x8a\xa6\x07\x1fi\x0b\x0eN,\x1c\x19|\xb4-8$\\8\xa2-84\\8\xb2-8*\\\x18\xda\x16\x1c\x9d\xcc}dpf\xf4\xd4\xe0\xacXp\x8cGc\x12\xa7\xeb\xb3c\xc1\x88p\xa5K\xda\x82\xb3\xc3\x85\xf2\xb6`\x9c\x9f\xffS\xfc\xa0\xa9S\xa6O\x18\x9f7\xa1#\xf8L\xfc\xa0\xc9\x13\xf2,\xcf\x8f\x05\x91p\xd5{\xdb\x82Y\xe1\xc2\x97\xda\x82\xd9\xe1\xc2\x97\xdb\x82:\x1b\xff(\xfc\xe3+\xc9\xbf\xbb\x12\xb4y\xe6\xa1\xbeg>\x13\xae\xfcT[0?\\\xf8M[pS\xb8\xce^\xfc\xb5\xb8X\xb0|\xef7]\x91,\x1f\x19\x90\xd6\x16\xdc\xbc\xf7;\xe9\xd8\xfbM;\xf7~\xd3U{\xbf\xe9\xea\xbd\xdft\xcd\xdeozG\xc8\xfa\xa4\x04\xeb;\xf7~\'_\x0fw\x92\x95\xd8\xc97\xf7~\'\xdf\nw\x92\x93\xd8\xc9\xb7wv\xfc\x8f\xc3\xa7F%\x9e\xfa\xc9\xde\xef\xf7\xa7{\xbf\xe9\xc3a\xfds\x13\xf5\x9f\xd8\xfb\x9d<\xbf\xf7\x9b\xbe\xb0\xf7\x9b\xbe\x18F\x9f\x90\x88\xfe\xd2\xae\x9d\x9c\x1a\xc9\xdb\x8b=\xbd\x1c\xee\xe9\xd2\xc4\x9e^\xd9\xfb8\xaf\xee\xfd\xa6\xaf\xed\xfd\xa6\xaf\xef\xfd\xa6o\xec\xfd\xa6o\xee\xfd\xa6\xbf\xdd\xfbM\xdf\xda\xfbM\x7f\xb7\xf7\x9b\xfe\xd7\xdeo\xfa\xfb\xbd\xdf\xf4\x0f{\xbf\xe9\x1f\xf7~\xd3?\xed\xfd\xa6\x7f\xde\xfbM\xff\xb2\xf7\x9b\xfe\xf7\xdeo\xfa\xd7\xbd\xde4\xb2\x7f\xda\xdeo{\xe0>l{\xd0>l{\xe8>l{\xd8>l;h\x1f\xb6=r\x1f\xb6=j\x1f\xb6=g\x1f\xb6-\xd9\x87m\x9b\xd2\xc2\x0bQWZ[d^j7\x9b\x92\xd7\xb4-{\xb1\xaf6\xfb\xda\x96\xd8\xd7\xe5\xfb\x10\xe9*\xbb\xf9\xb7\xc4n\xe6\xef\xc3n\xae\xd9\x87m\xaf\xdd\x87m\x17\xec\xc3\xb67\xee\xc3\xb6K\xf6a\xdb\xa5\xfb\xb0\xed\xf2\xbd\xde6\xfc\xd2e\xf4\xc2\xc87\xd3b\x91\r\xfb\x90\xe0s\xfb\xb0\xed=\xfb\xb0\xed}\xfb\xb0\xed\x97\xf7a\xdb\xaf\xee\xc3\xb6_\xdf7[\xb1\x84\xac}\xdc\xc1w\xf6!\xfd\xf7\xf7a\xdb\x9f\xef\xc3\xb6\x0f\xef\xc3\xb6\x8f\xef\xc3\xb6\xbf\xdf\x87m\xd3\x06\xec\xfd\xb6\x03\xf6a\xdb\xc1{\xbfmpX\xe2\xcc\x7fTpT[\xb02\xb9\x90\xb8\xf9h\x0b\xceL\xee\xed\xd4\x89\x9f\xf6\xed\x84O\x87o\x07}*|.\x98\x14\xed\x0c"\xb1\xa0\xc2\xa3o%\x1e};\x16\xcc\xb1\xfe\x11\xd6?"\\\xff\xea\xc4\xdeN\r\x9el\x0b\xee\xf5\xc3K\xfd\xf0\xd2\xf0\x87_\r\x9f\x8bd\xa4E;#\x99i\xb1\xe0?\xac\xf3\x19\xeb|&\\\xe7\xa9\xe4\x0e&\xfe{b\xb9-\xf8M\xb8\xfco\xc9\xe5\xc8\x01i6\xaeH\xeb\xbf7\xda\xb3\xeds\xe2Gw\xbe}\xdfi\xb1_v\x9e\x9b\xda\xf9\x91fwd\xf8N\xdf\x85i\xe1\x94\xfe5\x9c\xd2E\x1e|.|pIj~\x8b\x93p\x96$\x0e\xdeO\xa7\xb6\xffD_\xb8O\xf4[\xb8\xf2T\xb5\x95hvFnM\xeb\x9f\x1d\xcfI\xedx\xd5\xce\x1dw\xf6\xd3\x8e\xabR;^\xdd\x8f\xfe\xabS\xfb\\\xd3\x8f\xfb\xacI\xedsm?\xee\xf3\xcaT+\xfc\x93V\xfa\xa7\xb0\x95>\x13vO\xe4\xf6\xc4\xbd\xdbu\x16\xefN,nJ\xad:\xdb\x9b\xd5\xb3\xfd\xb9\xea\x97\x12[\x85\x8b\xa5\xc17\xa3-\xc1\x8b\xd1+\x13w\xb2\xd1\xd5\x9e[cXkXgXo\xd8`\xd8h\xe82t\x1bz\x0c\xbd\x86M\x86\xcd\x86-\x86\xad\x86m\x86\xed\xe1\x10\x8blN!\xfaqZx\x1eI\xdc~\x86\xf1\x7f\x91\x88\x7f[\xeaG\xbfL\x9d""w\xa6\x9e\xf8U?\xe2\xbc+\xb5\xcf\x07\xfbq\x9f\x9fOq\xffd\xdf\xd1\xfa\xc9~;Z\xbf\x0b\xd0+\t@\xdf\xb3\xf8jb\xf1\xb0\x01\xa61d@\xeaP\x1b<\xa0\x7f\xca\rM\xed\xf8\x98\x01\xfd\xc7\xe7\x13!\x9f\xd3\x82\xfa\xe8\xe9\xc1\xdcX\xb0,\xf9h\xb7\xf6,\r\x9e\x8f\xae\xf20l\xcf\xe0\x85\x0f\xab;\x83\xcf\x86\xd1\x12\xf3^\x15\xbc\xdc/s\x0f\xfeg\xe7\x1eWFf\xf7\xd3\xd90-\xado\x9f\xa5\xfd\xb4\xcf3w\xdb\xe7\xfc~\xda\xe7\xa7v\xdb\xe7\xb5\xc9c\xfa\x9a~\xda\xf1\xf8\xddv|cZ\xff\xfc\xa3\x9c\x91\x1b\x12\'\x9c\xba\xddv\xbc\xa1\xbfv\xbc>\xb1\xe3\x7f\xdem\xc7\xf7\xf4\x13\x85\x1b\xec\xd3\x1f\xd6)M\xbcJ\xfap\xff\xb6O,\xb2l\xb7I~\xb5\xbf\xe8}%A\xef\xb3\xbb\xed\xf8k\xfdDo[\x8a^Vx\x16\x8a\\\x95\xa4\x97\x85^\x16zY\xe8e\xa1\x97\x85^\x16zY\xe8e\xa1\x97\x85^\x16zY\xe8e\xa1\x97\x85^\x16zY\xe8e\xa1\x97\x85^VH\xef\x8e]\x93\xec\x1fp\xff\x99\x00w\xefn\xe0\x1e\xee\'p\xf7\xf7s\xceG\x139\x1f\xd8-\xe7\xe3\xfd\xd59\x8f%v\xfc\x83~\x0e\xfbzb\x9f\x0f\xf5\xf3>\x7f\x97\xd8\xe7\xa3\xa9n,q,\xff>\xed\xc3\xfdjx,\xf2\xeb\xdd\x8c\xfc\xb9\x9f:\xe77\xfd\x0c\xee/\tp/\xef\xdagg\xe2\x95x\xff\xe4\xfc\xaf~\xcey\xc0\x80X\xe4\x0f\xfd\xbc\xcf\x83\x06\xc4\x82#\x13w\x83\xb9\xc1\xd1mAF\xb8pa[\x90\x19.\\\xd4\x16d\x85\x0bc\xdb\x82\xecp\xe1\xe2\xb6 \'\\\x18\xd7\x16\x8c\t\x17\xca\xda\x82[\x92\x0b\x91\xfd\x13\xaf\xfdo\r\x97\x0eL,\xf5\x84K\x87&\x96z\xc3\xa5\xc3\x12K\x9b\xc2\xa5Aim\xb7\xb6]\xfd\x91\xf0\xbfHVZ\xf8\xdcU\x89\x1b\xd1\x1c\x8bW\'\x16;,~\'\xb1\xd8\x15.\x06/\xb5\x05\x1fM,\xac\x0c\x06\xb7\x05G\x84\x0bC\xda\x82\xa1\xe1\xc2\xe8\xb6 7\\\x18\xdf\x16\x0c\x0f\x17&\xb4\x05#\xc3\x85\xbc\xb6\xe0\xacpar[pI\xb8\xb0\xa3-\x98\x14.\xdc\xd3\x16L\t\x17>\xdf\x16|9\xb9\x90\xb8\xb7l\x0b\x9e\x0c\x97.H\xd4\xbd9-\\\xfcVb\xf1\x16\x8b\xdfN,v[\xfcab\xf1\x8b\x16\x9fJ,>a\xf1\x8f\x89\xc5!\x03\x92\x8b\x13\xff%|1~\x8c\x07\xff\x1c\xbe\x0b\xf1\xeb\x84\xb6\xfa[\xd3\x12s\xbe0\xad~er\xbc(-\x16\x94\'\xd6H\xbc\x9aj\x0b\xae\n\x17\x9eh\x0b\xb6%\xf5\x96F\x8eLK\xbc\xba:*\xd1\x97\xeb\x93;/\x8d|?\xb1\xf3\xd7-\x0e\x18\xd0\x16\x94$\x96V\x05_i\x0b\xfe)\xb1\xd0\x12\xfc\xba-\xf8\xd2\xfc\x8e\xf8\xfe\x85\x97\xce\xf8tG\xe4\xe3\x89\x99|%\xf1\xf0\xc0\xe93\xa6]:9\xaf#\xf2\xc9\xc4\xc6\xb7&6\xae/\x1b\x90\xa8\xfb\xdd\xc4\xa3\xce]\x8f\xbe\x97x4 \xf1(>\xe0\xd2\xc9\x1d\x91\xb2\xc4\xa3\x93\x92?\xabL\xfe\xac)\xf1\xe8\xe3\xc9\x9f\x1d8u\xc2\xb4K\xa7\x8c\xef\x88\\\x9ex\xa6,\xf9\xcc\x01\xd3\xc6N\xce\x9b\xd0\x91P\xd5\x16K$\x0e>\x92\xf8_\xfc\x90\xb6\xe6XkeuY{\xf5\x95\xed\x1dAZ\xfc\xd0\xd4\xe3\xba\xf6\xea\xc6\xb6\x8e`\xc0\xae\x15\x92Ot\x04\xfb\xc5\x8fll\xae\x8a5T\x97UUW6T\xb4V\xb4\xd757u\x04\xfb\xc7?Z\xdd\x14k\xdc\xf3\xc9\x03\xe2\x83kbM\x95\xc9\x07{\xfe\xe0\xc0\xf8\x90\xf6\xea\xb6\xf69\xd5M\x95\xd1=\x7frP\xfc\xa0\xca\xe6\xc6\xc6\xea\xa6D\x96\x81\xb1 \xf9r\xa4\xbe11\xad\xe0\xf0\xfa\xa6\xe4\xb0\x7f}sr8\xa0\xbe%9\x1cX?/9\x1cT\xdf\x9a\x1c\x12\xeb\x0fN\xae\x1f\xaeq\x865>\xe6G\x9f\x8c\x1f\x92J=\xa7\xb9\xea\xaa\x8e\xe0\xd8\xf8\xa0\xd4\xe3\xb6\xeaJ\x95\x8f\x8f\x1fP\xdd\xd8\xd2\x9e\xf8\xe1\t\xf1\xc3\xea\x9aZb\xed}?;1>\xa89\xd6\xbe\xc7S\'\xc5?\xdaZ][\xd7\xd6^\xdd\xda\xf7\xe4\xc9\xf1#Z\x12Si\xac\xde\xe3\xd9S\xe2\x87\xb4\xc6\x9a\xfa\x1e\x0f\x8b\x0f\xaah\xb8\xa2\xe2\xaa\xb6\xbe\xa7NM<\xd5\xd6VW\xbb\xdbZ\xa7\xc5\x07\xa7"\xd65\xb5\xb5W4\xb5\xd7\xa5\x10\x9d\x1e\x1fR\xd7\x94(PSQ\xf96\t\x1f\x8f\x7f\xb4\xb6\xba\xa9:\xf1p\xb7y}"\x16\x1c\xfbNT\xea/O\x0e\xe7\xd4_\x99\x1cN\xac\xbf*9\x9cT\x7fur8\xb9\xfe3\xc9\xe1\x94\xfa\x7fJ\x0e\xc3\xea\xe7\'\x87S\xeb\xafI\x0e\xa7\xd5_\x9b\x1cN\xaf\xbf.9|\xbc\xfe\x9f\x93C\xa2\xceq\xefX\'\x96\x1c\xceW\xee\xf8\xfa+\x92\xc3\t\xfdU\xf5\xfc\x0fhv\x17\xbc\xfb\xec*\xdf\x9f\xd9U~@\xb3\x1b\x9d\xac\x13\xeey\xa6\xad\xa7\xc7\x07\xf5\x1d\xa3\x8e\x9a\xa9\xf1#\xfa\x9e\xda\xd5`\xd3\xe2GT64W\xce\xdd\xb3\x17g\xc4\x8fL\xf6sE\xc3\x9eO\xe7\xc7\x8f\xa8J\x1cFok\xe9\x82\xf8a\xc9\x1d\'\xf69/\x96\xd8yuGP\x18\x1f\\\x15kl)\xbb\xa2\xe2\xf2\xea\xc4q\xd2\x9ehi\'\x85\xa2\xf8\xb1\xad\xd5-\xcd\xad\xede\x95\xcd\x97\'Z\xbd\xb6z\xf7\x9f\x16\xc7\x82\x0bwM$\x1aO\x0fWlH\x1c\xa5\x1dAU\xea\x91\xd3XM\xfc\xa3\xe1\xa3=\xc2\xd5\xc6\x076U\xb7\x97\xb5_\xd5\x92HP\x17\x0b.\xea\xdbU\xfd\x8a\xe4\xd0P\x7fsr\xa8\xa9\xbf%9\xd4\xd6w$\x87\xc4\x8acw\xad\xd8\x1a?l\xd7iA\xdd\xa6\xdd\x9eQ\xbb%>x\xd73{\xd4\x9f\x17\x0b.\xde\xb5\xa7+\xe3\x83\xfa\xce%v\xd5\xbe\xfbS\xf6uy|H\xdfS{\xec\xec\x8aX0~\xd7\xce\xe2\xf5\x9fM\x0eK\xeaoJ\x0eK\xe3\x83v1K\xed\xfa\x9ax\xfan\x18\xff9>\xd8\xe9(\\c\xb7\x1f\xfcK\xfc\xd0\xba\x9a\xdd\x9fX\x10\x1fTY\xd1\xb6\x87\x83\xeb\xe3\x87\xd54\xb7\xee\xfe\xcc\xc2\xe4\xb9\xb2=\xd6\xda\xb4\xfb\x93\x8b\xe2\x1fM\xd4\xa8n\xddc\xff7\xc4\x0f\x0f\xb5\xee\xfe\xdc\x8d\xf1AWT\xd4\xed\xb1\xda\xe2\xf8\xc1\xd5W\xb6\xb4V\'2&\xa7\xfa\xd9\xf8\xa0\xf0\xe2\xd3Z]S\xdd\xaa\x7f6&B\xec\xbc\xf4TV44t\x04]\xc9\x10U\xb1\xc49\xb3\xb9\xa5z\'\xa4\xeeX0a\x17\xa4\xed\xf1!;O\xc2o\xa3\xb39\xcc\xba\xc7O:\x82\xad\xb1 o\xd7\xb6\xb7;\xacn\x8b\x0f\xed;\x03\xbfm\'\x9f\x8b\x1f\xf9\xb7?\xeb\x08\xfe-~t\x12\xd7\xdf\xfb\xd1\xbf\xc7\x82\xc9\xef\xa4\xb0~cr\xb8\xaf\xbe+9\xfcs}wr\xf8\x97\xfa\x9e\xe4\xb0\xa0\xbe79\\_\xbf)9,\xac\xdf\x9c\x1c\x16\xd5oI\x0e7\xd4oM\x0e7\xd6oK\x0e\x8b\xeb\xb7\'\x87\xcf\xd6\xefH\x0e\x1b\xeb?\x97\x1c\xba\xea\xff59$\xd0L\xfd\x9bsB\xfd\xe2\xe4\xf0@\xfd\x92\xe40\xa3~ir\xc8\xaf\x8f\'\x87\x82\xfae\xc9\xa1P\xcc"1\x13\xc7\xe3e\x7f\xbb\x93\x1b\x93\xc3\x17\xedk\xda?\xb2\xaf\xaa\xdd\x0e\xc8\xf0H\xfc\xde\xdb\x8f\xc4\xea\xb7\x1f\xb2?x\x87C\xb6\xe1=w\xd5\xf8\xf6]\xfd\xfc\x1dv\xd5\xd4w\xf4\xd7\xafJ\x0e\xffY\xbf:9$\x0e\xe7\xe6\xdd~\xd4\x99\x1c\x1e\xb4F\xcb\xae5\xda\xfb\x0e\xf8\xfau\xc9\xe1\xd1\xfa\xf5\xc9!q\xf8\xc6v\xfb\xd1\xda\xe4\xf0\xb85.\xdf\xb5\xc65\xef\xd8\x1da[<\xfd\xfe\xb4\xc5u\xef\xde\x93\xcf\xbd\xaf=\xb9\xb9\xefp\xad\xbf-y\xbf{x\xe2\x8e|\xc7\xce\'#\xc7\xa5\x85\x17\xc4\xc81i\xe1\x151rlZ\xd8t\x91\xa1i\xf1A}wM\xe1\xe5,28-~D\xdfs;\xafg\x91\xa3\x13;\xfc\xdc\xdf\x1c\xd8\xf5w&ws|Z\xfd]\xc9\x87\x89#\xf3\x9ew\xa5\x10\x19\x96\xf6\xbeb\xb8\xefC1\xff\xf9w\x9f\xf3\x19\xef\xef\x9c\xbf\xd8\x1f\xa7\xa3\x1f\xbc\xe7q\xff\xc3\xb7\x1d\xf7\x91\x11i\xefp\xe0\xff\xfc=\xf7\xf5\x8b\xb7\xefk\xf4;\xed\xeb\xc1w>\x89<\xfe\xce\xa7\x88g\xdf]\xc8\xd8\xf7W\xc8s\x1fF\x13F\x8eH\xdb\xed\x14\xf0\xef\xc9i\xd6\xa6\x85\xa7\x82\xc4\x159qL\xff/N\x05\xf5\xdfH\x8e\xf5\x89\x17\xeaC\xfeW\xab\x7f=96\xa46K\x9c\x1e"\'\xa6\xfd\xed\xf9\xe1\x8e\xe4\x0f\x1b\xd3\xc2\xf3D\xf0o;O\x13\x89\xf3\xc0\x87\x02\xe9\xb4\xb4w\xef\x8c\x96\xf7\xb53\x12g\x82\x0fe\xd6#\xd2\xde\xeb\x88L\x1c\x80\xef\xb9\xca\x05\xef\xc1n\xe1\xfb\xcbn\xec\x87\xc3n\xf6{\xcc:\xfe\xfe\xce\xba6\xed\xef\\\xd8\xfd\x8b\xf3\xff\xfb\xc3\xb91\xed=\xaf\xdb\xfe\xc1\xf8w\x99g\xcf\xfb;\xcf\x96\x0f\xc7n\xec=f\xbd\xfd\xfd\x9d\xf5\xc2\x0fg\xd6\xf1\x0f\xa3l<\xbd\xba!\xf1"9|\xd1\x17\xf9B\xe2\xbe3|\xd8\xf7\xb2.\xf2\xa5\xb4\xd4?%\xf7\xc1\x03\xd9\xfe\xe1\x94\xfd\xda{t\xdf\xd3\xefo\xf7}\xeb=\xca?\xff\xfe\x96\xff\xf6{\x94\x7f\xf1\xfd-\xff\xc3w\xbaYy\xe3onV\x9ez\x8f\xa4\x7fz\x7f\x93>\xfd\xe1t\xe7\xf3\x1fN\xd9\x17?\x9c\xb2o\xfc/\xae\x91\x7f|\x8f>\x188\xe0}\xed\x83?}8d\xfe\xfc\x1e\xb3N\x7f\x7fg\xfd\xdf\xefQ\xfe\xe0\xf7\xb7\xfc\xff\xbcG\xf9C\xde\xdf\xf2\xe1_\x1d{\x97\xf2\x87\xbe\xbf\xe5\xf7\x1b\xf0\x0e\'\xc9\xc3\x07\xbc\xfd$9p\xc0\x87\xd2\x9d\xe9\x1fN\xd9\x83?\x9c\xb2\x87|8e\x0f\xfdp\xca\x1e>\xe0\xbd\xdfo<z~G\xfc\xa8\xbe\xcfz\x9a\x12c\xea\x83\x85O\xb5\x05\xa3\x92\x9f\xe4\xfb\x10$\xf9\xb9P\xea\x07\x13\x13\xb7\xa2;\x9f\xea\x08\x82X0q~G\xfd\xfe\xfb%\xf6ww[pWj9rJZ\xf8\x87:>\xb1\xfb\'I}\x9f\xfe\xb4u\x04\x15\xf1\xc1\x7f\xef\'\x1d\xc1\x9c\x98_g\xac\x1f\x98\xdc\xcf\xe6\xffW\xdb\x95GIQ\x9cq{f\x0f\x96\xfb\x92\x1bYn<8UP\xa2\xc4\xd9\xddYXv\x8euv\x96\x05\r\x8c\x80\x1b\xb0\x04\x9c\xb0\x90\x08>5\xc6D\x8d\xac\xc1c\x92\x88G\x14\xe3\x11\x95\x84\xa8/Q4/\xcf\x18}\x9a\xc4\xf7"\x9a\x97\xf7\xe2\x9d\x0b\xcc\xd3\xc4xD\xc1DM\xd7\xf7u\x7f]g\xf7\xcc\xa2\x7f\xe9\x0e\xbf\xe3\xab\xea\xea\xea\xaa\xea\xaf\xaa\x1dV\xc7\xb5\xd7@Y\xd3K\x1c\xf3\xe8x\xc0\xea\xcd\xeb\xb6\x06\xafE\xd2\xcd\xceV~j\x02p\xd3\xb3\x9dn\xc8\x17\x86\xb9x\xfak\x0e\x9c\x1c\xd2\xd3\x17\xdf/v\x9d\xbb\xae\xab\xd4\xba\x1d\x8f\xf6\xc0\n\xfd\xd4\xb22u\xad\x8fH;\x8e\x05r=A\xe26H\x89 \xd56\xc8\xf7\t\xd2\xc7\x06\xb9\x91 u6\xc8.\x82\xf4\xb5An"H?\x1b\xe4A\x82L\xb0A\x9e"\xc8L\x1b\xe49\x82\x9cd\x83\xec\'\xc8\xc96\xc8k\x049\xdd\x06y\x83 \x8d6\xc8?\x08\xd2d\x83\xbcI\x10K\x83c\xfdx\xc3\xe2\xad\xec\x9f\x04]jS\xfb\x17AZm\x90\xb7\t\x92\xb2A\xfeM\x90\xb4\r\xf2\x0eA26\xc8\xbb\x04\xc9\xda \xef\x11\xa4\xcd\x06y\x9f g\xda \xff!H\xce\x06\xf9\x80 \xed6\xc8\x87\x04\xc9\xdb \x87\x08\xd2a\x83\x1c&\xc82\x1b\xe4#\x82t\xda \xff%\xc8r\x1b\xe4\x7f\x04Ya\x83|L\x90\xb3l\x90O\x08r\xb6\x05\x82g\n \xe6\x1c\x1b\xa6&\xc0\xac\xb1aj\x03\xccZ\x1b\xa6\x7f\x809\xd7\x86\x19\x10`\xbal\x98\x81\x01\xe6\xcb6\xcc\xd0\x00\xb3\xde\x86\x19\x16`\xce\xb3a\x16\x06\x98\xcbl\x98\x95\x01\xe6\x1a\x1bfU\x80\xf9\x8e\xe5\xd1\x83\xa9\n\xc1\x032\xbd\xd3\xe9\xa9\xa3\xdfJ\xe9\xeb\x9c\xad\xb8\xa7\x1ee\xee\xb3Y]\x1c`\x1e\xb0a.\t0\x0f\xda0\x97\x06\x98\x87l\x98\xcb\x03\xcc\xcfm\x98\xab\x02\xcc#6\xcc\xd5\x01f\x9f\r\xb3#\xc0<j\xc3\xec\x8c\xacf\xb6\x88w\xb8O8\xde\xa6\xf5p\xec\xe9\x1c\xfb\xa4\x83\x9c\xeb\xfc-\xea\xc8y\xd6\x16\xc3\xfd\x01\xe6y\x1b\xe6g\x01\xe6O6\xcc\xc3\x01\xe6%\x1b\xe6\x97\x01\xe6/6\xcc\xe3\x01\xe6\xaf6\xcc\xaf\xcb\xac\xb7\x03\x8e\xf7\xe1\xdd2\xeb\xf8\xa92\xeb\xf8\xa0P\xc7\xcf\x04\x9c\xb7l\xf1\xfe.\xc0\xbcm\xc3\xbc\x10`\xde\xb7a^\x0c0\x1f\xd80\xaf\x06\x98C6\xcc\xc1\n\xea\xe4\xc3\x00[\x13\xb3\xe8\xc1\xc6m\xc4\x0c\xb0ab\x01f\xa0\r3<\xc0\x8c\xb4a\xf8\xf1\x1f\xf0[z\xb7;\xa2-\xf0\xb1\xf6p/\x85m\xd3&L;\xf0F\xec\x8f\xf7\x0cR\xfe\xa1\xd4\xfa\xc4\xd6\xf4v(\xd0*^\xbe\xbd\x0e+\xf0Q\xb6\xfb\xeb\x14\xf8\x95\xff\x95\xde\xe2x\xf9l\x01\xb1\xbb\x94\xde\xec\xd6\xc5\xf1\x904\xcc1\x17\xbac\xeb\xcd\xf4\xd7=\xee_w\x8b\x02l\r\xff\xefs\x8e\xf7\xc5]\xf9\xe7\xf7\x1c\xfc\xf2n\xc0}O\xfc\x8b\x1f\xd1\xd7\xd3w\xf3\xeaM<\x1b\xaf\xd8\xb5\xb6\xd4\xfa\xfbn~H\x1fc<\xd4\x17\xbb\xdd\x91\xbc\xf7Gz\x8f\x9f\x8c<\x18\xe1B\x1eW\xfa\x06\xf7\xdf\x1e\xe3\xc8\x83\xbc\xae^w\xba\xb7\xae,\xcd\x98\xd13\xa4}z\xfd\xccE\xf5b\x9erO\xac}z\xa9\xd5\xc9d2[\xdc\xca\x1c+\xfc\x93\x80\xc4\x0cfv>\xbf\nN\xcf\x80bAR\xa8s\xe74\xdd]\x9bg\x15\xb7\x95ZO\xe4*3D\x9a*#\xfeQb\x1b\xb8d\xacg IzV_\xe5\xc5=E\x0c\xc9$\xe6\xf1\x1d\xb6\xcd\x85#\xe7T\xce\x99(`8\xc5\x90g\x8d\xb9\xd0baP\x10D\x1a\xb8\xc8\x04ED\xcb\xca\xf6$\xd8%d\xde\xc8y\x93\x15\x9e1q[\xe76q\xee\x14\x85k\xce\xed\xd6\xc9IN\x1e\xa1\x90\xfd\xf4o\x1d\xdel\x82g\x92\x9d\xa9\x96L\xd2\x00_\xcc\xe1\xa7\xea\x95\xc8Y\xe9lSG*Y\xdf\xd2\x94\xcc\xe4[\x9a[\x92\xb9\xfa\xc6l*\x9b\xa9\x17\x93\xc4\xbd\x84s\xf7V-\x98\xae\x04x@\xf3KT\xe6\xe1El\xf0\xaaf;(\xfa,W>V\xc0\x08-\x02\xfeT\xf2\xd71\t9\xc6[\x86$\x0cb\xcb\xb8\xd8x\xb3\x98,\xe0\xb0k)\x84N\xce\x9a\xa3\xb0\xfc\xe8[2\xbc\\RDMI\xfe\x93\'T%\x08-\xe7B\xc3\x15!L\xb6\xd7]W@+\x96\x83\xe3x9%\x1f\xb3\x9fy\xafWP\xcb\x01*\xeb\xb8J\xbd\xae\xa2\xa4\xf1{2l\x17\xd9\xaf\xe7\xc4I:QK\xf6\xd7\xa9\xe7\xc1}\xa4S\xf5-\x01:\x97\x89WH\xb4\x156\x0e\xe8\xac\xf3-\xa5T\xb6\x17\xe8\xc4\r6\xa2\xbc\tA\'n\xe4\xc4i:\xd1\xb8UA\xa7o\xb2\xd4\xae\xdeKi\xd4\x0b,\xce\xe6\x8eJ\xa3\x179}\xba\xa9Y\x99\xb6R\xe8\xfc\xafX"\xd76\\\xe8\xd4\xcd\x9c:Z\xa7RO\xa71\xba-\x0c\xea\xec4\xc6\x16\xce\x18\xea)rhc6\x9d\x86\xbbq3\xde(u\xc5B\xe0\xc7\x19\x17q\xc6,\xe9\xae\xe2\xbc\x96L[G\xbe>\xd5\x96\xc8%3\xf5\x94>_\x9f\x83\x1fJ\xb8\xdb\xa0\xca\x1d\xa5\x14\xd4\xfb\x91k^\xca5\xe7\x87k\xfa\x1d\x88E\xbb\x9a\xed\xa3B}\x9d\xcb5\x95\'\xe7\xf5G\x81*\xf6F\xb2x\xad ~\x19\xf4nr\x7f\xc0\xd5\xb3\x1d\xf9\xd0\x1a\xd8\x865\xe0v<Z_\xc2e\xaf\xe6\xb2\xa7D\xc9\xda+a\x1bV\xc2\xe3\x14\xe7\x0e.\xd8\\\xae`T5l\xc3j\x08\xe4{ ^\xb5w\xe3\x06\xb9\xe4\xe2\x96\xf6\xbc\xfb\xd8\xf2,\xa4}\r$\xb8\x1d\xabch\xb1`\xe8!\xb9\xc1w\xb9\xc1\x19\xe5\x18\xf8e\x081\xaafOS\xe4\xdf\xe3\xc2_\xd0:W\xae\xecR\x12\xe9\xa4 -\xef\xa4 \xcd\x8b0\xf8a\xc5\x82\xa9\x8f\xe6&\xb7r\x93\xc6\xf2L\xe8\xa2\x86\x98U\xb3g\xa9\x00?\x80N8\xb8T\xfcQA\x7f\x04{U0\xf9<\xd6\xd3\xcf\x8d\x92\xb6\xb3\xa0\xc2]0"\xd2\x15\x04\x9e\xc3\xf6\x93\xe1\xdd\xf0\x90!\x04\xc1\xa5\x9e\xefz\xec/|7a|\xb9w\x0bM\\\xb4\xc1\x1a\xb2\xd8\x1f\xc9\xeb\xa7:\x98z/\r\xfc\x00t\xcej,\x9c\xe3\xef\xc7\x11\x86Q%\xcc\xd7\x8b\xf16\xa7\x87\x0fz\x8fp\xbd\x99e\xeaAW\x99\xf0T\xe3\xec\x15\x8aj\x1fW\x99\x17\xaa\x12Ly\xf4\x00E\xa9G\xe1.\xab\\J\x8a\xadJ\x10|\x8c\x0b\x9e \xdf)\xe2(\x05~\x90\xf7\x1d\xe1\x06\x84\x18\xef\xbb\xe5-J\xa8\xf84W<\xc6\xae(h8\xec\x00\x05\xf2\x0c\xa7M\x95P\x12M\xba87b\xdb\x12#\x10\xda\xd7~.5J\x93\xa26\x86l\xf6&y?o&P;\xd3\x08/\xc0\x18\xc2\x14\x9b\xd7\x1fIWq\x17\xd6\xd7\x08!Z\xbd\xa9\xbd(_\x88PI\xffj\xee\xc2\xe6\xf1.\xc5\xf5\x12\x17\x99\x1b&bih\x9a\xd2\xcb\\iA\xc5JRdU\x82\xde+\\/_f\xf1R\r\xb9Dck2_\x1fL\xea\xbd9\x8f\xf0C\xce\x03yf\xb5\x82\xd9\xab\xdc\xec\xac\xcf\xc3L*_\x1f\xc1\xf25nY\xa8\xbc\xbezST\xd1\xf7u\xee\xdb\xf59\xfbJ\xa5\xae\x13\xdc\xff\xcc\xddg+\xcf)i\xa6\x82\xcf y\xb3!nB\x8a\xf1\xa1\x8f\xb23\x11U\x0f\xe1\xf3,DU\x90qX\xbc\xca\x0f\xe70v\xff\x12L&J\xf7\xdd-4\xf5S\x95\xb9Z:\xe6\xc0\xe8Y\x97\xa3\x8e\x04\x05X\x1f?\x80t\xdcF\xa1\xaeD\xa3T9\xd8\xa5\x9bB\x84Ajp\xcd\x12\xed\xed-\x8b3\x85l\x9bp\x8dJ\xb8\x85#\xde3R,\x85\xd6\xbd\xa4\xfb\x81\xcd\xa2\xde\xda\xf8-\xe0V\xbc\xaf\x07Q\xf8\xfd\x1d\x1c\x96\x05\xd3Khw\x1d\x19\x7f0\x13\xbcr\xf7\x060^3Sv5\xe2\x16\xe3\x1a\xbe\xec OU\xb9\xc9`0\x99)\xcfF\xb9O"\xd5\x99X\xd1nQ\xbc\x18+\xc6\xbd\xbc\xda4\x96\x8b\x0e\x07\xd1\xc6\x08Qe<,{\xd0J\xc5\xc5x\x88\xc0H\xaa\x96\xa3A\xfc$y\x1a\x0c\xe2P\xb9\x9e\xb8y\x97(\xee\xaf\xc6\xc0\xd5i4\xd7\x1e\x07\xdaK#\xb4\x95\xc0\x8dV\x14\xff%\x18\xff8\x8a\x7f<x|\xd1\xcc\x12\xe6\xf7\xf2?h{[a[\x8d{\xa7\x8f\x0c\x8a\xa2\x94\x15\xdc\xa6\x80\xdb\xb1e\xbby\xba\x0e\x9bH\x01O\x05\x89\x13UdYw\xd0^\xac\xef\xa1z\x90^|\xb3@\xbc-B\xdc\xd4\xa5R\x0f\x1a\xe2\\\xc3\xa6Q1f\x83\xd3\xea^8\xd9;\xef\x10\xeb>\x82\xf5\x1c\xb0\x1ek\xb2\xa6\x0eo/V{@\x9ak\'Q\x97\xa7\x91\xe6\x01I\xec\x19\xf8,\x08\xbf\xe7#\x8dJ\x06\xc5\xa1\xf5\xf4/\x16\x84\xc4\x1d\xd4H\x984\xbc\xef\x00\x194\xd8\\ro\x00\xe6\x14\x99)TnS6\xef\x07\xe3\xb1\xe3\x02\xbb\xb1\x0c\xb6\xff9"\x9d\xdd\x04\xec\xe3\xf4\x16\xae\xfc"4\xc0\xdb\xe8Yi\xbcuZ\xf1\x02\x84(z\x12\x0e[Ha\xa4\x804K\'\x85\xf7r\xb7\xe1 1\xd0I;\xf8\xbaA\xbc\xec\xc6\xfd\xfe\x98\xf4\x06\x93A\xf5\xdeZ\x8e\x8fLIC\xda\xe6\xe0qY\x82lW(e\x86&*\x1f\x1e\xa0\x93\xce\x02\xd2\x18\x89$\x1f/\xa0s\xce\x06\xcex\x89\xa3\x1d@\xa0\xd3\xbed\xa0iG\x14\xe8\xb4\x95@\x1b\xa7\xdcy\xf2!\x06:k\x95\xa12\x94c\x0etR\xc1p\xe1\x8c\xc7d\xe8\xd4s\x80:M\xa9\x13\xdbA\x1a:\x7f5\xf0\x87\x9b\xfb\x17\r\xbd\xc6\x80\xa6\x8eEC\xaf\x05\xf4\x02S\x13,\xebA\xb0\x1b\x1f\x04#\x8a\x05s+\x06\x13\x06&\xf92Lz\xf1@\xd8\x8d\x0f\x84\xb3\xa8H\xe7\x83[W/\xdd*}(\xec\xc6\x87B`\xbf\x01\xec\xe7\xd8\xec\x05\xe5|V\xeav\xb1*\x05\xa5\x8d\xa0\x94\xaeT)\xb4\x12\r\xf5\xb5\tlV}&6!\xf30\xad\xa2.\x00\xdfyb\xcf\x05\xd7\xa7Y\x17T\xfb\xf1;p\xf1p`\xb1 \xf7{\xa0\xfbM\xd0=\xadr\xdd\xfa`\xf3\x18:T\xb3u\x14\xed\xb7@5\xd5\x0b\xd5d\xaa=\x19V\x8eZ\xc1\xe5\npYv$\xb1G\xfa\xf5\x11\xfc\xae\x04\xbf\xa9\x01\x99_p\xfaC\xd9=\xc7\x0e\xd0j\xa8PS\xa0s=v\xa9\xba\x8e\xcavX\x91\xcco\xc0\xbeG\xc6q\xa6[\x82rZ\xc1Az\x1d\xa0Z\x81\xfc\xcd ?_~\xcc\xc1\xfb\x99\x84[A\x9a\xba\x92\xa0\x86\xf9\xe5\xa0\xae>(A\xfd6\x9c\x1d\x96\xab\xee\xcf-\x8c.\xd5\xecB\xaa\x94\xdb\xb1\x9dU\xaa\xeb\rCdy\x1a\x86\xfc\x10\xdbY\xe0\xb2\x1bGU\n\xdc\x1f\x14\x04\xbf\x04\x19z\x90\xca\x84\xa3*\xb5\x0c\xa0x\x1f\xde\xcd\x91\x8aZEx\xcaqv)Ew?\xb6\xa6\x10-\x8f\xe4\x08\xa4=@:\x81 J\xdfenB\x8b\xc0\x9a\xb7hA\x1a\xe4\xf6\xe1\x04K\x92kJ6\':R\xf9P-v\x05E\xf4(H4\x84GT\xdel\x19\xb4k\x04\xed\xc7p\xb6\x19\x12^/\x85\x7f\x01\xc2K\xa4q\x1e\x17o\xce\xe6\xc4\xce\xbf%S\xaf&\x11Y\xaa\xe5N\\\xa5\x18T,(cG\xb0\xfb\r>|zoW^1\xef\xc4e\xb8\x9dT\xcc\xdf\xe2R\x86&\xcaWb\xf8I\x8d\xfeZ\x8c\xba\x9e#=\xdb\xbc\xb7K\x9b\xa0\x0e\xe1=\x9c\x9aW\x85f\xfbq\xfcsDf\xe1\xee}X\x89\x8a\xf6<N\xbdMi\x01\xca\xf8G|\x98\x0b\xef\\\x95\xd48r\x82\xdd1\xd5|\xacgI9\x88C\xc6\'\xbc\x1b\xec\x95\xbbdT\xc5vQ\x91^\x04\xd1-e\x88j/\x1d\x85\xed4\xfejZo\x8a\xddG\x88\xe6%\x88\xa6\xf0\xb9E#\x19\xd7\n\xc6/c\x87b\x8c\xd6\x7f\xa1\xa8\xfe\x8e\xedF\xcdl\x84\x84F\x1c\xb7\x1b\xb3!\xd1\xef\xa0\x13\xbc\x1c\x8c\xf6\xf3D\x1dv\x07\x05\xfc\x06\x08\x0c\xa6\x17m.\xa9\xb3%\x97\xc4=F\xee\xe4\xb6o\xb1@\xa7\xfe!\xe3\x100\x06\x89\x8c\\r\xb1O`\xf7\x90\xf4alg\xc2R\xbd\x0b\xadpH\n)\x92\xd5|\xb1D\xc8\x9fD\xf9\x8fql\xa2\xc8\x97\xdf\'\xa04\xdbC\xf1~R\xae\xa0\x1a\xadM\xf0S\x10\x9c!w\'\xc2_m\xa9\x8evi\xa6r/N\xd5\xdc\xd2j\x1dTU\x0c\x1evV\xadtK\xc6(\xc6\x1e\xa2p\xaaA\xe28\xabD\xaa}IKs>\\\xa3&B#W\x86F-hL\xb7j$2M\xe1\x02}@`\x9aU\xc0}0\x85\xf2\xeb"\x02X\x1e%\xd07\x16~aS\x91E\xe8\x17\x11B**\x84\xfe\x11\x17\xc2\x8d\xa0\xd0\xda\x19\xae1 \xa2Mes\x91\x12\x03#\xc2X^\x86\xc6\xa0\x88\xcb\x99<3\x9c?8\x82\x9fI\x86\xf3\x87D\xf0S\x11\xedyh\x14?\xc2\x7fX\x04\x7fq\x84\xff\xf0(~\x84\xff\xd1\xc0\x1f\'\xf33Y\x83kL`\x8d\x00\xd6\x04\x8de\xbc\xdc"q$\x10\xc7\xcb\xc4T\xa4\xdf(\xa0\x1d#\xd3,\xbd\x9e\xc8\x1bm\xaa\x1d\xbdW\xf7;q\xadv\xc6\x00\xffd\x99_\xf6R\xce\xbd8N\n\xe4\xc6\x82\\sEr!\xcf\xc7{q\xa9(\xd0\x1f\x07\xfa\xa3l\xfa\x1e\xc3\x11\x18\xe3\x811\\\xb9\x90\x1d\xe9\x06#\xfa\x18\xe3eOv\x16\x90Qpg\x05\xe9D\xde@\x9c\x10\xc3\xf5\x07\x89\xd8\xd0\x92I\xe4V\x14\xacn\xf5\xa6\xd2,I.\xb73&\x9a\x1a\xb3r\xfe\xad\xce\x9ad\nN>"W\'M6\xb5H\xed\x14]\x9d7\x05xg\xa8Y\xbd\xb0\xac\xe2\x96\xcb\x9e\x13\xaf\xec`\xf7\x0e{\xe7\xb3\x1aC\x860\xbcG\x01\xa7y2\x8f*D\x9f\xf1\x07\xfb\xe1Y<\xee\xbf\xaeU]A9\xeb\xf5\xfbQ\xca\xaab\x8c\x1d\xa6zh\xf3*\xdd\xae\xe1\x91\x1c\x81t&\x90N HYK\xe0U\xb4\x86 H\xe3\x8b\x06\x90\x1bi\x91\xf3\x98\x0e;\xaa\x9a^2xw\x8bH\xa0\xb5{\r}\x0e\xa0W\x9a\xb2\xb0\xbd\xe5\x80\xd0\xb9\x08\x1dc\x10\x9ee\x00\'\x9f\xd7\xf2\x99\x82%\xdd\x1b\xd6\xdc!\x94\x96\xcaB\x89\xb6\xada\xb5T\xda\r`\xd1\xfd\x19\x97\xb6\xbc\xe5\x03\x08\xa6\xaf\x10\xccF\x08\xa6p\x04\xe5\xad\xc0\xb8N0\xde\x14SRo\x83rIY;\xc1\xcf8E\x11\x9b\x9d\x83\r\xf6h1\xfd%8\xd3\x02}\xb6\x81\xcfD\x8b\x8f\xa6\xe6\xb0\xc1\x14\xe2\xf6\x98\x97\x97(\xbf\xf5\xc3\xa9\\\xbe#\x97\x91\xee\x9e\xbb(\xa1T\x7fM\x08r\xdf\x00\xb9\x06\xe3f\x01|\x01\x9bO\xe6\x9a\x13\x8d\x86\xed>\xca\xa9\xc3x\xee~\x15O\xad\xb0m=\x805q0\\\xda\x1bC\xff\xa2\x1a\x8d\xab\xd9(\xaa\xa3\xab\xb0\xef\x94q\xf2\x9e\x08\xf8E?#\x19ND\xc5uX\xd5\x05\x94w\x82\xf2\xe40eY\xcaa\xe3)\xackq8\xa3A-[i\x9e\xc4Y\xfc01\x149\xf1f\x17\x08N2\n*\xbb\x18P\x8cM\xa2`nRK\x12\xb2\x97H#\xdf\x8cOj#\x99\xde\x9dj\xac[BX\xd4\x0fk\xac[\x81\xb5P\xdd\x8e\xc2I\x8b\x93\x99d.\x91\xf7\xdf\xc7\xd8\x0e\xa8\xc7OA@>\x8daS\x0b\x9c\xf0\x02\x1emex(\x1d\x8b\xc5\x92z\x98\xcb\xb0\x9f\x9dI\xa5\xb9\x1b\x9c\x926\x9e\xb4\xefF\xfe\'\xc39\xfap\x90\x93\xdbZG\x17\x0b\xd6\xb2\x83\xeb\x8f\xc1ufE\xae\x9e\xba\xc3\xe6Q\xf0?\xc1\x07\xb8\x8e\xf5s\x17L*\x0fb3\x1e^4\xfe+\xe8>\x8c#\x12\xb3\xaey5\x14U\xd9\x02\x8a\xed\x11\x9c\x9a\x985\xa8Mj\xb4}a4j\x94\x1a\xedQ\xa0u\x9a\xcbl^a\x97\x86\xa4Q-\xf6!\\\xd6\x1f\x85\xcb\xfa\xd6\x8a\xfb\x15\x84\xb1\xf1H\xc3\xa8\xb0Q?\x84\x8f\xcd3\xa86\x9e\xc0Q\xb1\x9aR\xe2\xa5\x00&sy\xeb\xda\x1e~\x13\x8afpw\xc7\xfc\xb5~==\x05\x9c^\x88\xf9Yu\xe5;I\xe2U,Ia\xff!\x86/\x19\xe5\x94\x16\xdcc\xb6,\x18XD\x05}\x0f\x06=\xa4X\xd0\x92cpA\x1bl\xe6V`#)W\xb1\xa5\x14\xf1\xcb1/\x0b^\x9e\xa8\xe0\xc3\xbf\xa9\xa31Y\xe0\xabWv\xc1=\xc2\x9e&u\xae\x03\x06\x7f\x03\x83\xf9!\x06\xd9\\\xa4>\xcbR\xc0\x7f\x8f\x0cxye\x82\x07@\xf0xyVhHy\x13\xc7P\xf7\xc5\xa4\xf9\x900\x99\x04\xc9\xb70F\xf9\xc60\xbei\x90\x0e\xf8\xa2\x18\xef\xa7\x9d\x83\xca\xac\x13\xd4\xdf\xc1\x85\xba2\xd4%\xbd8[Ae~\x17$f\xcb\xee<\x85K\xfaA],/\xc1\xf9Pn\xb9\xdd\xc0\xe4\x93\xc9\xbc%~\x9c\xc2i\xaa\x9a\x82\xc3VQ(\x1f\xe1\x12\x88q\x1f<\'\xe7\x93\xed\xf9\x86d\xa6q\x89\xda\xf3`G\xa3|w\t?rV\xcd\x87\x8c\x96\x9d\xf5\x98\xc4\x1e\xe7\xa6\x99\xde\x9a\xfa\xbd\x9b\xd1\xbc\x86\xad\xa5\xc2U\x81\xcf<\x19\'o\xfb\x87_\xf4OE\xe1\x87_`\xd8\xa8\xba\xe0\x921(O\x0eS\x96\xa5\x1c\xb6\x9e\xc2\xea\x0f\xe4i\x1a\xd42l\xfc6\r\x1b\r\xe2\xb8h\x18"\xa8\x7f\xf0\xca\x13d\x1b)\xa0\x11\xc0\x9fn\xe4\x1b>\x8d\xa5\x0b\x8c\x0c\t@\xff\x88\x96\xce\x1f\x05\xfcIF\xbe\xfc\xb9-\x9d;\x1a\xb8\xc7Z\xbcM\x19\x87\x9a\xc4\x18\x90\x98e\x94\x08\xc9<\xd4t\xc6\x82\xce8\xf3u\xf0G,\x1ak\\\x08\x8b\x06,\x1ak<\xb0N\xd3./<\x86R\xd9\xc6V\xf1\xbe\xe1\x1fn\xac\xc7\x8f,J\xdd\xc1\xd5x\xbb\x0e\xf3\xd3\x9f\xf5[u\n\xd8\xb4\xea\xad\x80\xfb\xf0\xe5\x9dDJ\xbfA\xe9u\xa4y\x05h\x07>_\xdd\x01\xa4\xa9q\x81\xed\x0c\xb0]\xd6K[\xe1\xadaH\x04\xb5\xecr\xaa\xcdc\xc1o~\xef\xfc<\xbd*A\xef8\xd0K\x1cq\xfc\x9et\xb5 }<Hwi\xb7\x95\xf2\x0cB\xc9\n_\xaek\x07\xf3\xe0\x17jjy\x0b1\xdc\xc7\x10\xcf|\x88\'\xdb\xdbx\xc2\x9dkX\x0f\x15|\x01\xd6i\xc5F\x16\xe9*A\xfa\x14\x90n1\xd7\x8d\xd4+\x8b\xff\xe0\xe5\n\x98\x0e\x1c\x85sF\xd5=S\xe2Q\xa5\xde\x1e\x838n\xff\xad\xc4\xd7\xd3v\xd8\r\x14~\x03\xc8,0\xa1\xcbZ\x92\xad\x0b\xb2\x1b\x8c\x86`\xb2\x14LNRk\xd3\x90\xd9\xd0\xad\xa7:\xac\x89K\xfb\xa0\xa5\xab\x01\xea\x19|\xa0\x96\xa1\xee\x899\xecf*\x7f\x16\xc8\x0b\x15 \xac,J#G\xbf\xcd\t\xbf\xf8c\xb4\x02\xe66\x0c\xd1\x02\xf47\x11\x80\xc5\x18\x83\x05u\xd1\x05\x0c\xebv\nk\x05p\xe6H\x0f0ccU\'\x8b\xd7\xc4\xfcq\x9e\xf2\xf0\xc3u\xec8\r\xd9\xc2e\xcb[3\xbd\x06\xef\xb3\xbb(\xec\xd5\xa0?UN\xf1\x87\\\x94DK\x1eFdb\xdb\xf9\x11\x8d\xc5\xd5=\x01 \xb6\x1e\xc4N0=\x88\xe1\xfat\xa4\xdb\n\x9d\x89e\xc9v\x9e-\xed}P\x18\x8f3\x86\xf6h~\x80\xe3\x02w\xdc\xdb\xcfly>\xe3\x94\xa4-\x9b\xcb\x17`Z\x96\xe0\xfbev\xe2Xj,\x9f/Y\x9f\xeb _\x04\xf9\xc1p\xf6\x0f\x97:\r\xfeoQ\t?\x9azTO\xad;\xf9\xc0s\x81\x00\xbe\xc5\x85w]Y\x9a\xf5\x7f\xcb\xda\r\x99'))
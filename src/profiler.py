@@ -0,0 +1,191 @@
+"""
+GraceHDL编译性能分析
+按文件记录读取、词法分析、语法分析、代码生成和写入各阶段的耗时与峰值内存，
+以及token数、AST节点数、输出行数和每个for循环的降级方式与输出行数，输出汇总表或JSON。
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import partial
+
+try:
+    from .ast_nodes import ASTNode
+except ImportError:
+    from ast_nodes import ASTNode
+
+PHASES = ('read', 'lex', 'parse', 'generate', 'write')
+
+PHASE_NAMES = {
+    'read': '读取',
+    'lex': '词法分析',
+    'parse': '语法分析',
+    'generate': '代码生成',
+    'write': '写入',
+}
+
+
+def count_ast_nodes(root):
+    """统计AST中的节点数量"""
+    count = 0
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ASTNode):
+            count += 1
+            stack.extend(value for _, value in item.fields())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return count
+
+
+class FileProfile:
+    """单个文件的性能记录"""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.times = {}  # 阶段 -> 耗时（秒）
+        self.peaks = {}  # 阶段 -> 峰值内存（字节）
+        self.tokens = 0
+        self.ast_nodes = 0
+        self.output_lines = 0
+        self.loops = []  # LoopRecord列表
+
+    @property
+    def total_time(self):
+        return sum(self.times.values())
+
+    def to_dict(self):
+        return {
+            'file': self.path,
+            'phases': {phase: {'time': self.times[phase], 'peak_memory': self.peaks[phase]}
+                       for phase in PHASES if phase in self.times},
+            'total_time': self.total_time,
+            'tokens': self.tokens,
+            'ast_nodes': self.ast_nodes,
+            'output_lines': self.output_lines,
+            'loops': [loop.to_dict() for loop in self.loops],
+        }
+
+
+class CompileProfiler:
+    """编译性能分析器
+
+    峰值内存由tracemalloc统计（各阶段开始时重置峰值），开启后各阶段耗时会偏高。
+    """
+
+    def __init__(self):
+        self.files = []
+        self.current = None
+
+    def start_file(self, path):
+        """开始记录一个文件"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.current = FileProfile(path)
+        self.files.append(self.current)
+        return self.current
+
+    def stop(self):
+        """停止内存跟踪"""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name):
+        """记录一个阶段的耗时和峰值内存"""
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - base
+            record = self.current
+            record.times[name] = record.times.get(name, 0.0) + elapsed
+            record.peaks[name] = max(record.peaks.get(name, 0), peak)
+
+    def report(self):
+        """返回汇总表文本"""
+        if not self.files:
+            return "性能分析: 没有编译任何文件"
+
+        header = f"{'文件':<40}" + ''.join(f"{phase + '(ms)':>14}" for phase in PHASES) \
+            + f"{'总计(ms)':>12}{'峰值(KB)':>12}{'tokens':>10}{'节点':>10}{'输出行':>10}"
+        lines = ['性能分析:', header, '-' * len(header)]
+        for record in self.files:
+            peak = max(record.peaks.values(), default=0)
+            lines.append(
+                f"{_shorten(record.path, 40):<40}"
+                + ''.join(f"{record.times.get(phase, 0.0) * 1000:>14.2f}" for phase in PHASES)
+                + f"{record.total_time * 1000:>12.2f}{peak / 1024:>12.1f}"
+                + f"{record.tokens:>10}{record.ast_nodes:>10}{record.output_lines:>10}")
+
+        total_time = sum(record.total_time for record in self.files)
+        tokens = sum(record.tokens for record in self.files)
+        output_lines = sum(record.output_lines for record in self.files)
+        lines.append('-' * len(header))
+        lines.append(f"{'阶段':<12}{'耗时(ms)':>12}{'占比':>10}{'峰值(KB)':>12}")
+        for phase in PHASES:
+            elapsed = sum(record.times.get(phase, 0.0) for record in self.files)
+            peak = max((record.peaks.get(phase, 0) for record in self.files), default=0)
+            share = elapsed / total_time * 100 if total_time else 0.0
+            lines.append(f"{PHASE_NAMES[phase]:<12}{elapsed * 1000:>12.2f}{share:>9.1f}%{peak / 1024:>12.1f}")
+
+        loops = [(record, loop) for record in self.files for loop in record.loops]
+        if loops:
+            lines.append('for循环:')
+            for record, loop in loops:
+                lines.append(f"  {_shorten(record.path, 40)} {loop.describe()}")
+
+        lex_time = sum(record.times.get('lex', 0.0) for record in self.files)
+        lines.append(f"文件: {len(self.files)}  总耗时: {total_time * 1000:.2f} ms  "
+                     f"tokens: {tokens}  输出行: {output_lines}")
+        if lex_time:
+            lines.append(f"词法分析吞吐量: {tokens / lex_time:.0f} tokens/s")
+        if total_time:
+            lines.append(f"编译吞吐量: {output_lines / total_time:.0f} 输出行/s")
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        return {
+            'phases': list(PHASES),
+            'files': [record.to_dict() for record in self.files],
+            'total_time': sum(record.total_time for record in self.files),
+        }
+
+    def write_json(self, path):
+        """将性能记录写入JSON文件"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+class LineCountingSink:
+    """统计写入行数的文本输出包装"""
+
+    def __init__(self, sink):
+        self._sink = sink
+        self._written = False
+        self.newlines = 0
+
+    def write(self, text):
+        self._written = True
+        self.newlines += text.count('\n')
+        return self._sink.write(text)
+
+    @property
+    def lines(self):
+        return self.newlines + 1 if self._written else 0
+
+
+class TokenReplay:
+    """按顺序返回预先词法分析得到的token，供语法分析器使用"""
+
+    def __init__(self, tokens):
+        self.token = partial(next, iter(tokens), None)
+
+
+def _shorten(text, width):
+    return text if len(text) <= width else '...' + text[-(width - 3):]
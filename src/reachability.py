@@ -0,0 +1,86 @@
+"""
+GraceHDL死模块消除
+从指定的顶层模块出发，沿模块实例建立可达集合，只保留可达的模块，
+以及它们（直接或经由其他函数）引用的枚举和函数；被测模块可达的测试台也保留。
+"""
+
+try:
+    from .ast_nodes import ASTNode, EnumDeclaration, EnumReference, FunctionCall, FunctionDeclaration, \
+        ModuleDeclaration, SourceText, TestbenchDeclaration
+    from .linker import find_instantiations
+except ImportError:
+    from ast_nodes import ASTNode, EnumDeclaration, EnumReference, FunctionCall, FunctionDeclaration, \
+        ModuleDeclaration, SourceText, TestbenchDeclaration
+    from linker import find_instantiations
+
+
+def _references(node, enums, functions):
+    """收集node中引用的枚举名和函数名"""
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, EnumReference):
+            enums.add(item.enum_name)
+        elif isinstance(item, ASTNode):
+            if isinstance(item, FunctionCall):
+                functions.add(item.name)
+            stack.extend(value for _, value in item.fields())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+
+
+def reachable_modules(ast, tops):
+    """从tops出发经模块实例可达的模块名集合（只包括ast中定义的模块）"""
+    modules = {module.name: module for module in ast.modules}
+    reachable = set()
+    stack = [name for name in tops if name in modules]
+    while stack:
+        name = stack.pop()
+        if name in reachable:
+            continue
+        reachable.add(name)
+        stack.extend(instance.module_name for instance in find_instantiations(modules[name].sections)
+                     if instance.module_name in modules)
+    return reachable
+
+
+def prune_unreachable(ast, tops):
+    """只保留从tops可达的项，返回 (新的SourceText, 删除的项名列表)；不修改传入的AST"""
+    reachable = reachable_modules(ast, tops)
+    enums = set()
+    functions = set()
+    for module in ast.modules:
+        if module.name in reachable:
+            _references(module, enums, functions)
+
+    # 函数可以调用其他函数、引用枚举
+    declared = {item.name: item for item in ast.items if isinstance(item, FunctionDeclaration)}
+    pending = list(functions)
+    while pending:
+        function = declared.get(pending.pop())
+        if function is None:
+            continue
+        called = set()
+        _references(function, enums, called)
+        pending.extend(called - functions)
+        functions |= called
+
+    items = []
+    pruned = []
+    for item in ast.items:
+        if isinstance(item, ModuleDeclaration):
+            keep = item.name in reachable
+        elif isinstance(item, EnumDeclaration):
+            keep = item.name in enums
+        elif isinstance(item, FunctionDeclaration):
+            keep = item.name in functions
+        elif isinstance(item, TestbenchDeclaration):
+            keep = item.module_name in reachable
+        else:
+            keep = True
+        if keep:
+            items.append(item)
+        else:
+            pruned.append(getattr(item, 'name', None) or f'testbench for {item.module_name}')
+    modules = [item for item in items if isinstance(item, ModuleDeclaration)]
+    return SourceText(modules, items), pruned
@@ -0,0 +1,243 @@
+"""
+GraceHDL参数特化
+为每个不同的 (模块, 参数取值) 组合生成一个具体模块：参数引用替换为常量，
+位宽和for循环范围等常量表达式直接折叠，实例改为引用特化后的模块。
+特化结果按 (模块名, 参数取值) 缓存，共用同一组参数的实例只生成一个模块体。
+通用的参数化模块保留（其他文件可能实例化它），只有 --top 证明不可达时才删除。
+参数取值无法在编译时确定的实例（如引用了外层通用模块的参数）保持通用输出。
+"""
+
+try:
+    from .ast_nodes import ASTNode, BinaryExpression, EnumDeclaration, FunctionDeclaration, \
+        IdentifierExpression, ModuleDeclaration, ModuleInstantiation, NewNumberExpression, NumberExpression, \
+        ParameterSection, SourceText, TestbenchDeclaration, UnaryExpression
+    from .const_eval import BINARY_OPERATORS, ConstantError, ConstantEvaluator, parameter_declarations
+    from .linker import find_instantiations
+except ImportError:
+    from ast_nodes import ASTNode, BinaryExpression, EnumDeclaration, FunctionDeclaration, \
+        IdentifierExpression, ModuleDeclaration, ModuleInstantiation, NewNumberExpression, NumberExpression, \
+        ParameterSection, SourceText, TestbenchDeclaration, UnaryExpression
+    from const_eval import BINARY_OPERATORS, ConstantError, ConstantEvaluator, parameter_declarations
+    from linker import find_instantiations
+
+
+def constant_value(node):
+    """常量表达式节点的整数值，不是整数常量时返回None
+
+    带位宽的 (value, base, width) 字面值不算：折叠成无位宽的整数会改变表达式的位宽，
+    例如4位的 (1, d, 4) << 4 在Verilog中截断为0，折叠后却是16。
+    """
+    if isinstance(node, bool):
+        return None
+    if isinstance(node, int):
+        return node
+    if isinstance(node, NumberExpression) and isinstance(node.value, int):
+        return node.value
+    if isinstance(node, NewNumberExpression) and isinstance(node.value, int) and not node.width:
+        return node.value
+    return None
+
+
+def fold(node):
+    """折叠操作数都是整数常量的二元运算和取负，返回新的节点（不能折叠时返回node）"""
+    if isinstance(node, BinaryExpression):
+        operation = BINARY_OPERATORS.get(node.operator)
+        left = constant_value(node.left)
+        right = constant_value(node.right)
+        if operation is not None and left is not None and right is not None:
+            try:
+                return NumberExpression(operation(left, right))
+            except ConstantError:
+                pass
+    elif isinstance(node, UnaryExpression) and node.operator == '-':
+        operand = constant_value(node.operand)
+        if operand is not None:
+            return NumberExpression(-operand)
+    return node
+
+
+def substitute(node, values):
+    """复制node，把values中的参数引用替换为常量并折叠常量表达式；不修改原节点
+
+    用显式栈按后序复制（先复制子节点再组装父节点），很深的表达式不受递归深度限制。
+    被多处引用的节点（--share-expressions 共享的表达式）只复制一次，副本同样共享。
+    """
+    results = []
+    copies = {}  # id(原节点) -> 副本
+    stack = [(node, None)]
+    while stack:
+        item, names = stack.pop()
+        if names is not None:
+            # 子节点都已复制，取出结果组装
+            start = len(results) - len(names)
+            children = results[start:]
+            del results[start:]
+            if isinstance(item, ASTNode):
+                cls = type(item)
+                copy = cls.__new__(cls)
+                for name, value in zip(names, children):
+                    setattr(copy, name, value)
+                copy = copies[id(item)] = fold(copy)
+                results.append(copy)
+            else:
+                results.append(children if isinstance(item, list) else tuple(children))
+        elif isinstance(item, ASTNode) and id(item) in copies:
+            results.append(copies[id(item)])
+        elif isinstance(item, IdentifierExpression):
+            value = values.get(item.name)
+            results.append(NumberExpression(value) if value is not None else item)
+        elif isinstance(item, ASTNode):
+            fields = item.fields()
+            stack.append((item, [name for name, _ in fields]))
+            stack.extend((value, None) for _, value in reversed(fields))
+        elif isinstance(item, (list, tuple)):
+            stack.append((item, item))
+            stack.extend((child, None) for child in reversed(item))
+        else:
+            results.append(item)
+    return results[0]
+
+
+def retarget(node, replacements):
+    """复制node中通向replacements里实例的路径，把这些实例（id -> 新实例）替换掉；不修改原节点
+
+    不包含被替换实例的子树原样共享，不复制也不折叠，输出与原模块逐字相同。
+    """
+    results = []
+    stack = [(node, None)]
+    while stack:
+        item, values = stack.pop()
+        if values is not None:
+            start = len(results) - len(values)
+            children = results[start:]
+            del results[start:]
+            if all(child is value for child, value in zip(children, values)):
+                results.append(item)
+            elif isinstance(item, ASTNode):
+                cls = type(item)
+                copy = cls.__new__(cls)
+                for (name, _), child in zip(item.fields(), children):
+                    setattr(copy, name, child)
+                results.append(copy)
+            else:
+                results.append(children if isinstance(item, list) else tuple(children))
+        elif id(item) in replacements:
+            results.append(replacements[id(item)])
+        elif isinstance(item, ASTNode):
+            values = [value for _, value in item.fields()]
+            stack.append((item, values))
+            stack.extend((value, None) for value in reversed(values))
+        elif isinstance(item, (list, tuple)):
+            stack.append((item, list(item)))
+            stack.extend((child, None) for child in reversed(item))
+        else:
+            results.append(item)
+    return results[0]
+
+
+def _mangle(value):
+    return str(value).replace('-', 'n')
+
+
+class ModuleSpecializer:
+    """参数特化，specialize()返回新的SourceText，不修改传入的AST"""
+
+    def __init__(self):
+        self.cache = {}  # (模块名, ((参数名, 值), ...)) -> 特化后的模块名
+        self.hits = 0
+        self.misses = 0
+
+    def specialize(self, ast, tops=None):
+        """特化ast中参数取值确定的实例
+
+        通用的参数化模块默认保留，其他文件或库仍可以用 #(...) 实例化它；
+        给出顶层模块名tops（--top）时，从顶层不再可达的通用版本不输出。
+        """
+        self.cache = {}
+        self._modules = {module.name: module for module in ast.modules}
+        self._names = set(self._modules)
+        self._specialized = {}  # 原模块名 -> [特化后的模块]
+        self._enums = {item.name: item for item in ast.items if isinstance(item, EnumDeclaration)}
+        self._functions = {item.name: item for item in ast.items if isinstance(item, FunctionDeclaration)}
+
+        rewritten = {module.name: self._rewrite_instances(module) for module in ast.modules}
+
+        unused = set()
+        if tops:
+            # 顶层模块、特化后的模块体和测试平台都不再引用的通用版本不可达
+            referenced = set(tops)
+            for module in list(rewritten.values()) + [body for bodies in self._specialized.values() for body in bodies]:
+                referenced.update(instance.module_name for instance in find_instantiations(module.sections))
+            referenced.update(item.module_name for item in ast.items if isinstance(item, TestbenchDeclaration))
+            unused = set(self._specialized) - referenced
+        items = []
+        for item in ast.items:
+            if isinstance(item, ModuleDeclaration):
+                if item.name not in unused:
+                    items.append(rewritten[item.name])
+                items.extend(self._specialized.get(item.name, ()))
+            else:
+                items.append(item)
+        modules = [item for item in items if isinstance(item, ModuleDeclaration)]
+        return SourceText(modules, items)
+
+    def _rewrite_instances(self, module):
+        """把模块中参数取值确定的实例改为引用特化模块，只复制这些实例和通向它们的节点"""
+        replacements = {}
+        for instance in find_instantiations(module.sections):
+            target = self._resolve(instance)
+            if target is not None:
+                replacements[id(instance)] = ModuleInstantiation(
+                    target, instance.instance_name, instance.port_connections)
+        if not replacements:
+            return module
+        return retarget(module, replacements)
+
+    def _resolve(self, instance):
+        """计算实例的参数取值，返回特化模块名；无法确定时返回None"""
+        target = self._modules.get(instance.module_name)
+        if target is None:
+            return None
+        declarations = parameter_declarations(target)
+        if not declarations:
+            return None
+        overrides = {assignment.name: assignment.value for assignment in instance.parameters}
+        if not overrides.keys() <= {declaration.name for declaration in declarations}:
+            return None
+        # 覆盖值在实例所在的模块中求值，默认值可以引用前面的参数
+        context = ConstantEvaluator(enums=self._enums, functions=self._functions)
+        values = {}
+        defaults = ConstantEvaluator(values, self._enums, self._functions)
+        try:
+            for declaration in declarations:
+                if declaration.name in overrides:
+                    values[declaration.name] = context.evaluate(overrides[declaration.name])
+                else:
+                    values[declaration.name] = defaults.evaluate(declaration.value)
+        except ConstantError:
+            return None
+        return self._specialize(target, values)
+
+    def _specialize(self, module, values):
+        key = (module.name, tuple(values.items()))
+        name = self.cache.get(key)
+        if name is not None:
+            self.hits += 1
+            return name
+        self.misses += 1
+        name = module.name + ''.join(f'__{parameter}_{_mangle(value)}' for parameter, value in values.items())
+        while name in self._names:
+            name += '_'
+        self._names.add(name)
+        # 先登记再构建模块体，模块递归实例化自身时不会重复特化
+        self.cache[key] = name
+        body = substitute(module, values)
+        body.name = name
+        body.parameters = []
+        body.sections = [section for section in body.sections if not isinstance(section, ParameterSection)]
+        body = self._rewrite_instances(body)
+        self._specialized.setdefault(module.name, []).append(body)
+        return name
+
+    def summary(self):
+        return f"参数特化: 生成 {self.misses} 个模块, 复用 {self.hits} 次"
@@ -0,0 +1,350 @@
+"""
+GraceHDL项目符号数据库
+把源代码树中的模块、端口（方向、位宽表达式）、参数、枚举项、函数和模块实例关系
+保存到本地SQLite数据库。每个文件按内容哈希增量更新，只重新分析新增或修改过的文件；
+"谁实例化了X"、"端口Y的位宽"等查询通过索引直接回答，无需重新分析所有文件。
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+try:
+    from .ast_nodes import EnumDeclaration, FunctionDeclaration, ModuleDeclaration
+    from .build_cache import DEFAULT_CACHE_DIR
+    from .interface_scan import extract_module_headers, module_interface
+    from .linker import find_instantiations
+    from .parser import GraceHDLParser
+    from .verilog_generator import VerilogGenerator
+except ImportError:
+    from ast_nodes import EnumDeclaration, FunctionDeclaration, ModuleDeclaration
+    from build_cache import DEFAULT_CACHE_DIR
+    from interface_scan import extract_module_headers, module_interface
+    from linker import find_instantiations
+    from parser import GraceHDLParser
+    from verilog_generator import VerilogGenerator
+
+DEFAULT_INDEX_PATH = os.path.join(DEFAULT_CACHE_DIR, 'symbols.sqlite')
+
+# 表结构改变时递增，旧数据库在打开时重建
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    hash TEXT NOT NULL,
+    complete INTEGER NOT NULL  -- 0: 语法分析失败，只索引了模块接口
+);
+CREATE TABLE modules (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    line INTEGER NOT NULL
+);
+CREATE INDEX modules_name ON modules(name);
+CREATE INDEX modules_file ON modules(file_id);
+CREATE TABLE ports (
+    module_id INTEGER NOT NULL REFERENCES modules(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    net_type TEXT NOT NULL,
+    width TEXT,  -- 位宽表达式 'msb:lsb'，单比特端口为NULL
+    position INTEGER NOT NULL
+);
+CREATE INDEX ports_module_name ON ports(module_id, name);
+CREATE TABLE parameters (
+    module_id INTEGER NOT NULL REFERENCES modules(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT,
+    position INTEGER NOT NULL
+);
+CREATE INDEX parameters_module ON parameters(module_id);
+CREATE TABLE instances (
+    module_id INTEGER NOT NULL REFERENCES modules(id) ON DELETE CASCADE,
+    instance TEXT NOT NULL,
+    target TEXT NOT NULL
+);
+CREATE INDEX instances_module ON instances(module_id);
+CREATE INDEX instances_target ON instances(target);
+CREATE TABLE enum_items (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    enum TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX enum_items_enum ON enum_items(enum);
+CREATE INDEX enum_items_file ON enum_items(file_id);
+CREATE TABLE functions (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    parameters TEXT NOT NULL
+);
+CREATE INDEX functions_name ON functions(name);
+CREATE INDEX functions_file ON functions(file_id);
+"""
+
+
+class SymbolIndex:
+    """SQLite符号数据库"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = str(path)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute('PRAGMA foreign_keys = ON')
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            self._create_schema()
+        self._parser = None
+        self._generator = VerilogGenerator()
+        self.skipped = []  # 上一次update()跳过的文件：(路径, 原因)
+
+    def _create_schema(self):
+        with self.db:
+            for (name,) in self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                self.db.execute(f'DROP TABLE {name}')
+            self.db.executescript(SCHEMA)
+            self.db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.db.close()
+
+    # 更新
+
+    def update(self, root, pattern='**/*.ghdl'):
+        """增量更新root下的文件，返回 (重新索引的文件数, 删除的文件数, 未改变的文件数)
+
+        无法读取或不是UTF-8编码的文件跳过并记录在skipped中，不影响其他文件。
+        """
+        root = Path(root).resolve()
+        paths = [root] if root.is_file() else sorted(root.glob(pattern))
+        known = dict(self.db.execute('SELECT path, hash FROM files'))
+        indexed = unchanged = 0
+        seen = set()
+        self.skipped = []
+        with self.db:
+            for path in paths:
+                name = str(path)
+                seen.add(name)
+                try:
+                    data = path.read_bytes()
+                except OSError as e:
+                    self.skipped.append((name, e.strerror or str(e)))
+                    continue
+                digest = hashlib.sha256(data).hexdigest()
+                if known.get(name) == digest:
+                    unchanged += 1
+                    continue
+                try:
+                    source_code = data.decode('utf-8')
+                except UnicodeDecodeError as e:
+                    # 旧的记录已经过时，一并删除
+                    self.db.execute('DELETE FROM files WHERE path = ?', (name,))
+                    self.skipped.append((name, f'不是UTF-8编码（第 {e.start} 字节）'))
+                    continue
+                self._index_file(name, digest, source_code)
+                indexed += 1
+            prefix = str(root) if root.is_file() else os.path.join(str(root), '')
+            removed = [name for name in known if name not in seen and (name == prefix or name.startswith(prefix))]
+            self.db.executemany('DELETE FROM files WHERE path = ?', [(name,) for name in removed])
+        return indexed, len(removed), unchanged
+
+    def _parse(self, source_code):
+        """完整语法分析，有错误时返回None"""
+        if self._parser is None:
+            self._parser = GraceHDLParser()
+            self._parser.build()
+        parser = self._parser
+        parser.error_count = 0
+        parser.lexer.input(source_code)
+        with redirect_stdout(StringIO()):
+            ast = parser.parser.parse(lexer=parser.lexer, debug=False)
+        if ast is None or parser.error_count or parser.lexer.error_count:
+            return None
+        return ast
+
+    def _index_file(self, path, digest, source_code):
+        db = self.db
+        db.execute('DELETE FROM files WHERE path = ?', (path,))
+        ast = self._parse(source_code)
+        file_id = db.execute('INSERT INTO files (path, hash, complete) VALUES (?, ?, ?)',
+                             (path, digest, int(ast is not None))).lastrowid
+        if ast is None:
+            # 语法分析失败时只索引能识别的模块接口
+            with redirect_stdout(StringIO()):
+                interfaces = self._parser.scan_interfaces(source_code)
+            for interface in interfaces:
+                self._insert_module(file_id, interface, [])
+            return
+
+        lines = iter(line for _, line in extract_module_headers(source_code)[1])
+        expression = self._generator.visit_expression
+        for item in ast.items:
+            if isinstance(item, ModuleDeclaration):
+                interface = module_interface(item, next(lines, 0))
+                self._insert_module(file_id, interface, find_instantiations(item.sections))
+            elif isinstance(item, EnumDeclaration):
+                db.executemany('INSERT INTO enum_items VALUES (?, ?, ?, ?)', [
+                    (file_id, item.name, enum_item.name,
+                     None if enum_item.value is None else expression(enum_item.value))
+                    for enum_item in item.items])
+            elif isinstance(item, FunctionDeclaration):
+                parameters = ', '.join(parameter.name for parameter in item.parameters)
+                db.execute('INSERT INTO functions VALUES (?, ?, ?)', (file_id, item.name, parameters))
+
+    def _insert_module(self, file_id, interface, instances):
+        db = self.db
+        expression = self._generator.visit_expression
+        module_id = db.execute('INSERT INTO modules (file_id, name, line) VALUES (?, ?, ?)',
+                               (file_id, interface.name, interface.line)).lastrowid
+        ports = []
+        for direction, declarations in (('input', interface.inputs), ('output', interface.outputs)):
+            for port in declarations:
+                width = None
+                if port.range_spec is not None:
+                    width = f'{expression(port.range_spec.msb)}:{expression(port.range_spec.lsb)}'
+                ports.extend((module_id, name, direction, port.net_type, width, len(ports))
+                             for name in port.names)
+        db.executemany('INSERT INTO ports VALUES (?, ?, ?, ?, ?, ?)', ports)
+        db.executemany('INSERT INTO parameters VALUES (?, ?, ?, ?)', [
+            (module_id, parameter.name, expression(parameter.value), position)
+            for position, parameter in enumerate(interface.parameters)])
+        db.executemany('INSERT INTO instances VALUES (?, ?, ?)', [
+            (module_id, instance.instance_name, instance.module_name) for instance in instances])
+
+    # 查询
+
+    def modules(self, name):
+        """名为name的模块定义，返回 [(文件路径, 行号)]"""
+        return self.db.execute(
+            'SELECT files.path, modules.line FROM modules JOIN files ON files.id = modules.file_id '
+            'WHERE modules.name = ? ORDER BY files.path, modules.line', (name,)).fetchall()
+
+    def ports(self, module):
+        """模块的端口，返回 [(端口名, 方向, 线网类型, 位宽)]"""
+        return self.db.execute(
+            'SELECT ports.name, direction, net_type, width FROM ports JOIN modules ON modules.id = ports.module_id '
+            'WHERE modules.name = ? ORDER BY modules.id, position', (module,)).fetchall()
+
+    def port(self, module, port):
+        """模块端口的 (方向, 线网类型, 位宽)，不存在时返回None"""
+        return self.db.execute(
+            'SELECT direction, net_type, width FROM ports JOIN modules ON modules.id = ports.module_id '
+            'WHERE modules.name = ? AND ports.name = ?', (module, port)).fetchone()
+
+    def parameters(self, module):
+        """模块的参数，返回 [(参数名, 默认值)]"""
+        return self.db.execute(
+            'SELECT parameters.name, value FROM parameters JOIN modules ON modules.id = parameters.module_id '
+            'WHERE modules.name = ? ORDER BY modules.id, position', (module,)).fetchall()
+
+    def instantiators(self, module):
+        """实例化了module的位置，返回 [(所在模块, 实例名, 文件路径)]"""
+        return self.db.execute(
+            'SELECT modules.name, instance, files.path FROM instances '
+            'JOIN modules ON modules.id = instances.module_id JOIN files ON files.id = modules.file_id '
+            'WHERE target = ? ORDER BY files.path, modules.line, instances.rowid', (module,)).fetchall()
+
+    def instances(self, module):
+        """module中的模块实例，返回 [(实例名, 被实例化的模块)]"""
+        return self.db.execute(
+            'SELECT instance, target FROM instances JOIN modules ON modules.id = instances.module_id '
+            'WHERE modules.name = ? ORDER BY instances.rowid', (module,)).fetchall()
+
+    def enum_items(self, enum):
+        """枚举的各项，返回 [(项名, 值)]"""
+        return self.db.execute(
+            'SELECT name, value FROM enum_items WHERE enum = ? ORDER BY rowid', (enum,)).fetchall()
+
+    def functions(self, name):
+        """名为name的函数，返回 [(参数列表, 文件路径)]"""
+        return self.db.execute(
+            'SELECT parameters, files.path FROM functions JOIN files ON files.id = functions.file_id '
+            'WHERE name = ? ORDER BY files.path', (name,)).fetchall()
+
+    def summary(self):
+        counts = [self.db.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                  for table in ('files', 'modules', 'ports', 'instances')]
+        return "符号数据库: 文件 {}, 模块 {}, 端口 {}, 实例 {}".format(*counts)
+
+
+def main(argv=None):
+    """命令行入口：index 子命令"""
+    parser = argparse.ArgumentParser(
+        prog='gracehdl index',
+        description='GraceHDL项目符号数据库：建立或增量更新，并查询模块、端口和实例关系',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  %(prog)s src/                          # 建立或增量更新符号数据库
+  %(prog)s src/ --users alu              # 哪些模块实例化了alu
+  %(prog)s src/ --port alu.y             # alu的端口y的方向和位宽
+  %(prog)s --module alu --no-update      # 只查询，不更新
+        """
+    )
+    parser.add_argument('input', nargs='?', default='.', help='源文件或目录（默认: 当前目录）')
+    parser.add_argument('--db', default=DEFAULT_INDEX_PATH, help=f'数据库路径（默认: {DEFAULT_INDEX_PATH}）')
+    parser.add_argument('--no-update', action='store_true', help='只查询，不更新数据库')
+    parser.add_argument('--module', metavar='NAME', help='显示模块的定义位置、参数和端口')
+    parser.add_argument('--users', metavar='NAME', help='列出实例化了该模块的位置')
+    parser.add_argument('--port', metavar='MODULE.PORT', help='显示端口的方向和位宽')
+    args = parser.parse_args(argv)
+
+    index = SymbolIndex(args.db)
+    try:
+        if not args.no_update:
+            if not os.path.exists(args.input):
+                print(f"错误: '{args.input}' 不存在")
+                return 1
+            indexed, removed, unchanged = index.update(args.input)
+            for path, reason in index.skipped:
+                print(f"警告: 跳过 {path}: {reason}")
+            print(f"已索引 {indexed} 个文件，删除 {removed} 个，{unchanged} 个未改变")
+            print(index.summary())
+        found = True
+        if args.module:
+            found = _show_module(index, args.module) and found
+        if args.users:
+            users = index.instantiators(args.users)
+            for parent, instance, path in users:
+                print(f"{parent}.{instance}  ({path})")
+            if not users:
+                print(f"没有模块实例化 {args.users}")
+        if args.port:
+            module, _, port = args.port.partition('.')
+            info = index.port(module, port)
+            if info is None:
+                print(f"找不到端口 {args.port}")
+                found = False
+            else:
+                direction, net_type, width = info
+                print(f"{args.port}: {direction} {net_type}" + (f"({width})" if width else ''))
+        return 0 if found else 1
+    finally:
+        index.close()
+
+
+def _show_module(index, name):
+    definitions = index.modules(name)
+    if not definitions:
+        print(f"找不到模块 {name}")
+        return False
+    for path, line in definitions:
+        print(f"{name}  {path}:{line}")
+    for parameter, value in index.parameters(name):
+        print(f"  parameter {parameter} = {value}")
+    for port, direction, net_type, width in index.ports(name):
+        print(f"  {direction} {net_type}" + (f"({width})" if width else '') + f" {port}")
+    for instance, target in index.instances(name):
+        print(f"  instance {instance}: {target}")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,39 +4,150 @@ Verilog代码生成器 - 新语法版本
 支持新的数值格式和run/always语句
 """
 
+import io
+
 try:
     from .ast_nodes import *
+    from .const_eval import ConstantError, ConstantEvaluator, parameter_declarations
+    from .driver_index import ALWAYS, build_driver_index
+    from .lexer import GraceHDLLexer
+    from .loop_lowering import DEFAULT_UNROLL_LIMIT, EMIT, UNROLL, LoopRecord, native_loop_blocker, \
+        referenced_names, trip_count
+    from .parser import GraceHDLParser
+    from .visitor import NodeVisitor
 except ImportError:
     from ast_nodes import *
+    from const_eval import ConstantError, ConstantEvaluator, parameter_declarations
+    from driver_index import ALWAYS, build_driver_index
+    from lexer import GraceHDLLexer
+    from loop_lowering import DEFAULT_UNROLL_LIMIT, EMIT, UNROLL, LoopRecord, native_loop_blocker, \
+        referenced_names, trip_count
+    from parser import GraceHDLParser
+    from visitor import NodeVisitor
+
+# 括号风格：minimal只输出运算优先级需要的括号，full给每个二元和一元表达式加括号
+PAREN_STYLES = ('minimal', 'full')
+
+
+def operator_precedence():
+    """由GraceHDLParser.precedence得到 (二元运算符 -> 优先级, 一元运算符 -> 优先级)，数值越大结合越紧
+
+    两种语言中这些运算符的相对优先级一致。文法优先级表中没有的运算符（<< >> !）
+    在GraceHDL和Verilog中的结合方式不同，作为操作数或带二元操作数时总是加括号。
+    """
+    binary = {}
+    unary = {}
+    for level, (_, *tokens) in enumerate(GraceHDLParser.precedence):
+        table = unary if 'UMINUS' in tokens else binary
+        for token in tokens:
+            pattern = getattr(GraceHDLLexer, 't_' + ('MINUS' if token == 'UMINUS' else token), None)
+            if isinstance(pattern, str):
+                table[pattern.replace('\\', '')] = level
+    return binary, unary
+
+
+BINARY_PRECEDENCE, UNARY_PRECEDENCE = operator_precedence()
+
+# 作为操作数时可能需要加括号的表达式类型
+COMPOUND_EXPRESSIONS = (BinaryExpression, UnaryExpression, ConditionalExpression)
+
+# 表达式嵌套不超过这个深度时递归输出（较快），更深的子树改用render_compound的显式栈，
+# 不受Python递归深度限制
+RECURSIVE_EXPRESSION_DEPTH = 100
+
 
-class VerilogGenerator:
+class _SharedText:
+    """render_compound栈中的标记：共享节点的文本从parts[start]开始，标记出栈时已全部输出"""
+    __slots__ = ('node', 'start')
+
+    def __init__(self, node, start):
+        self.node = node
+        self.start = start
+
+
+# render_compound中复合子表达式在输出文本中的占位标记（生成的代码中不会出现的字符）
+_DEFERRED = '\0'
+
+
+class _DeferredOperands:
+    """render_compound传给visit_方法的nested：复合子表达式记录下来并返回占位标记，其他操作数直接输出"""
+    __slots__ = ('visit', 'nodes')
+
+    def __init__(self, visit):
+        self.visit = visit
+        self.nodes = []
+
+    def __call__(self, node):
+        if isinstance(node, COMPOUND_EXPRESSIONS):
+            self.nodes.append(node)
+            return _DEFERRED
+        return self.visit(node)
+
+
+class VerilogGenerator(NodeVisitor):
     """Verilog代码生成器"""
     
+    dispatch_tables = NodeVisitor.dispatch_tables + ('_expression_table',)
+    
+    # 表达式节点类型：visit_expression只对这些类型分派到对应的visit_方法，
+    # 其他类型直接转换为字符串
+    EXPRESSION_TYPES = (Expression, BinaryExpression, EnumReference, FunctionCall,
+                        ReduceOperation, str, int)
+    
     def __init__(self):
         self.indent_level = 0
-        self.output = []
+        self.loop_params = {}  # for循环展开时循环变量的当前值
+        self.unroll_limit = DEFAULT_UNROLL_LIMIT  # 迭代次数超过它的for循环输出为Verilog for循环
+        self.parentheses = 'minimal'  # 表达式括号风格，见PAREN_STYLES
+        self._expression_depth = 0  # 正在递归输出的复合表达式层数
+        self.shared_expressions = False  # 语法树中结构相同的表达式是否共享节点（--share-expressions）
+        self._shared = set()  # 当前模块中被多处引用的节点id
+        self._rendered = {}  # id(共享节点) -> (节点, 输出的文本)
+        self._shared_rendering = False  # visit_expression是否已换成visit_shared_expression
+        self.loop_records = {}  # id(ForStatement) -> LoopRecord
+        self.lines_emitted = 0
+        self._native_loops = set()  # 外层Verilog for循环的下标变量
+        self._loop_blocks = 0  # 当前模块中输出的for循环块数，用于命名
+        self._procedural = False  # 是否在过程块（always/run/函数）中
+        self._write = None  # 当前输出的write方法
+        self._separator = ''  # 下一行之前写入的分隔符
+        self.drivers = {}  # 当前模块的驱动索引：信号名 -> 驱动结构类型集合
+        self.enums = {}  # 当前源文件的枚举：名称 -> EnumDeclaration
+        self.functions = {}  # 当前源文件的函数：名称 -> FunctionDeclaration
+        self.constants = ConstantEvaluator()  # 当前模块的常量求值器
+        self.module_name = None
 
     def generate(self, ast):
         """生成Verilog代码"""
-        self.output = []
+        buffer = io.StringIO()
+        self.generate_to(ast, buffer)
+        return buffer.getvalue()
+
+    def generate_to(self, ast, sink):
+        """生成Verilog代码，访问节点时逐行写入文本输出（文件、sys.stdout或io.StringIO）
+
+        行之间以换行分隔，末尾不加换行，与generate()返回的字符串完全一致。
+        """
         self.indent_level = 0
-        self.visit(ast)
-        return '\n'.join(self.output)
+        self._write = sink.write
+        self._separator = ''
+        self.loop_records = {}
+        self.lines_emitted = 0
+        self._native_loops = set()
+        self._procedural = False
+        try:
+            self.visit(ast)
+        finally:
+            self._write = None
+            self._use_shared_rendering(False)
+            self._shared = set()
+            self._rendered = {}
 
     def emit(self, code):
         """输出一行代码"""
-        indent = '    ' * self.indent_level
-        self.output.append(indent + code)
-
-    def visit(self, node):
-        """访问AST节点"""
-        method_name = f'visit_{type(node).__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
-
-    def generic_visit(self, node):
-        """通用访问方法"""
-        raise Exception(f'No visit_{type(node).__name__} method')
+        self._write(self._separator + '    ' * self.indent_level + code)
+        self._separator = '\n'
+        self.lines_emitted += 1
 
     def visit_NoneType(self, node):
         """处理None值"""
@@ -53,6 +164,9 @@ class VerilogGenerator:
 
     def visit_SourceText(self, node):
         """访问源代码根节点"""
+        self.enums = {item.name: item for item in node.items if isinstance(item, EnumDeclaration)}
+        self.functions = {item.name: item for item in node.items if isinstance(item, FunctionDeclaration)}
+        
         # 首先处理所有非模块项（如枚举声明）
         for item in node.items:
             if item is not None and not isinstance(item, ModuleDeclaration):
@@ -71,6 +185,18 @@ class VerilogGenerator:
         output_ports = []
         reg_declarations = []
         
+        # 预先建立驱动索引，端口类型推断等检查直接查询
+        self.drivers = build_driver_index(node.sections)
+        # 通用输出中参数可以被实例覆盖，不能用默认值展开for循环
+        parameters = {param.name: param.value for param in parameter_declarations(node)}
+        self.constants = ConstantEvaluator(parameters, self.enums, self.functions, overridable=True)
+        self.module_name = node.name
+        self._loop_blocks = 0
+        # 共享的表达式节点在模块中多处出现，文本只输出一次
+        self._shared = shared_nodes(node) if self.shared_expressions else set()
+        self._rendered = {}
+        self._use_shared_rendering(bool(self._shared))
+        
         # 从sections中收集端口信息
         for section in node.sections:
             if isinstance(section, InputSection):
@@ -82,7 +208,7 @@ class VerilogGenerator:
                     if port is not None and isinstance(port, PortDeclaration):
                         # 检查是否在always块中被赋值，如果是则需要声明为reg
                         for name in port.names:
-                            is_reg = self.is_signal_assigned_in_always(name, node.sections)
+                            is_reg = ALWAYS in self.drivers.get(name, ())
                             port_type = 'reg' if is_reg else 'wire'
                             output_ports.append((name, port_type, port.range_spec))
         
@@ -141,45 +267,6 @@ class VerilogGenerator:
         
         self.emit('endmodule')
 
-    def is_signal_assigned_in_always(self, signal_name, sections):
-        """检查信号是否在always块中被赋值"""
-        for section in sections:
-            if isinstance(section, AlwaysSection):
-                # 检查always块中的赋值语句
-                if self.check_assignments_in_statements(signal_name, section.statements):
-                    return True
-        return False
-    
-    def check_assignments_in_statements(self, signal_name, statements):
-        """递归检查语句列表中是否有对指定信号的赋值"""
-        if not statements:
-            return False
-        
-        for stmt in statements:
-            if hasattr(stmt, 'target'):
-                # 处理字符串类型的target
-                if isinstance(stmt.target, str):
-                    if stmt.target == signal_name:
-                        return True
-                # 处理对象类型的target
-                elif hasattr(stmt.target, 'name'):
-                    if stmt.target.name == signal_name:
-                        return True
-            # 检查case语句
-            elif hasattr(stmt, 'case_items'):
-                for case_item in stmt.case_items:
-                    if hasattr(case_item, 'statements'):
-                        if self.check_assignments_in_statements(signal_name, case_item.statements):
-                            return True
-            # 检查if语句
-            elif hasattr(stmt, 'then_statements'):
-                if self.check_assignments_in_statements(signal_name, stmt.then_statements):
-                    return True
-                if hasattr(stmt, 'else_statements') and stmt.else_statements:
-                    if self.check_assignments_in_statements(signal_name, stmt.else_statements):
-                        return True
-        return False
-
     def format_port_declaration(self, port):
         """格式化端口声明"""
         result = f'{port.direction} {port.net_type}'
@@ -220,9 +307,11 @@ class VerilogGenerator:
         self.emit(always_str)
         self.emit('begin')
         self.indent_level += 1
+        self._procedural = True
         for stmt in node.statements:
             if stmt is not None:
                 self.visit(stmt)
+        self._procedural = False
         self.indent_level -= 1
         self.emit('end')
 
@@ -247,9 +336,11 @@ class VerilogGenerator:
                 statements_to_process.append(stmt)
             i += 1
         
+        self._procedural = True
         for stmt in statements_to_process:
             if stmt is not None:
                 self.visit(stmt)
+        self._procedural = False
         self.indent_level -= 1
         self.emit('end')
 
@@ -500,31 +591,114 @@ class VerilogGenerator:
         self.emit('endcase')
 
     def visit_ForStatement(self, node):
-        """访问for语句 - 展开循环生成多个硬件结构"""
-        # For语句在编译时展开，生成多个硬件结构
+        """访问for语句 - 迭代次数不超过unroll_limit时在编译时展开，否则输出Verilog for循环"""
+        loop_var = node.loop_var
+        bounds = self._loop_bounds(node)
+        trips = None if bounds is None else trip_count(*bounds)
+        
+        strategy = UNROLL
+        if trips is None or trips > self.unroll_limit:
+            blocker = self._native_blocker(node)
+            if blocker is None:
+                strategy = EMIT
+            elif trips is None:
+                raise ConstantError(f"模块 {self.module_name}: for循环 {loop_var} 的范围依赖外层for循环的下标，"
+                                    f"但无法输出为Verilog for循环: {blocker}")
+        
+        record = self.loop_records.get(id(node))
+        if record is None:
+            record = self.loop_records[id(node)] = LoopRecord(self.module_name, loop_var)
+        lines = self.lines_emitted
+        if strategy == EMIT:
+            self._emit_loop(node, bounds)
+        else:
+            self._unroll_loop(node, *bounds)
+        record.add(strategy, trips, self.lines_emitted - lines)
+
+    def _native_blocker(self, node):
+        """循环不能输出为Verilog for循环时返回原因，可以时返回None"""
+        return '不在always/run块或函数中' if not self._procedural else native_loop_blocker(node)
+
+    def _loop_bounds(self, node):
+        """计算range的 (start, end, step)
+
+        范围依赖外层Verilog for循环的下标，或依赖可以被实例覆盖的模块参数、且循环可以输出为
+        Verilog for循环时返回None，由_emit_loop把范围输出为表达式。
+        """
         loop_var = node.loop_var
         range_expr = node.range_expr
+        try:
+            start = self.evaluate_expression(range_expr.start)
+            end = self.evaluate_expression(range_expr.end)
+            step = 1 if range_expr.step is None else self.evaluate_expression(range_expr.step)
+        except ConstantError as e:
+            if self._native_loops & referenced_names([range_expr.start, range_expr.end]):
+                return None
+            hint = ''
+            if '模块参数' in str(e):
+                blocker = self._native_blocker(node)
+                if blocker is None:
+                    return None
+                hint = f'，且无法输出为Verilog for循环: {blocker}（可使用 --specialize 按实例的参数取值展开）'
+            raise ConstantError(f"模块 {self.module_name}: for循环 {loop_var} 的范围不是编译时常量: {e}{hint}") from None
+        if step == 0:
+            raise ConstantError(f"模块 {self.module_name}: for循环 {loop_var} 的步长为0")
+        return start, end, step
+
+    def _unroll_loop(self, node, start, end, step):
+        """编译时展开：在同一个替换环境中依次绑定循环变量的每个值"""
+        loop_var = node.loop_var
+        params = self.loop_params
+        shadowed = params.get(loop_var)
+        try:
+            for value in range(start, end, step):
+                params[loop_var] = value
+                for stmt in node.statements:
+                    self.visit(stmt)
+        finally:
+            if shadowed is None:
+                params.pop(loop_var, None)
+            else:
+                params[loop_var] = shadowed
+
+    def _emit_loop(self, node, bounds):
+        """输出为命名块中带 integer 下标的Verilog for循环"""
+        loop_var = node.loop_var
+        range_expr = node.range_expr
+        if bounds is None:
+            start = self.visit_expression(range_expr.start)
+            end = self.visit_operand(range_expr.end, BINARY_PRECEDENCE['<'], True)
+            step = 1 if range_expr.step is None else self.evaluate_expression(range_expr.step)
+            if step == 0:
+                raise ConstantError(f"模块 {self.module_name}: for循环 {loop_var} 的步长为0")
+        else:
+            start, end, step = bounds
+        compare, update = ('<', '+') if step > 0 else ('>', '-')
         
-        # 计算range表达式的值
-        start = self.evaluate_expression(range_expr.start)
-        end = self.evaluate_expression(range_expr.end)
-        step = 1 if range_expr.step is None else self.evaluate_expression(range_expr.step)
-        
-        # 为每个循环值生成代码（编译时展开）
-        current = start
-        while (step > 0 and current < end) or (step < 0 and current > end):
-            # 创建一个临时的参数替换环境
-            old_params = getattr(self, 'loop_params', {})
-            self.loop_params = old_params.copy()
-            self.loop_params[loop_var] = current
-            
-            # 生成当前循环迭代的代码
+        self._loop_blocks += 1
+        self.emit(f'begin : {loop_var}_loop{self._loop_blocks}')
+        self.indent_level += 1
+        self.emit(f'integer {loop_var};')
+        self.emit(f'for ({loop_var} = {start}; {loop_var} {compare} {end}; '
+                  f'{loop_var} = {loop_var} {update} {abs(step)})')
+        self.emit('begin')
+        self.indent_level += 1
+        # 循环体中的下标是Verilog变量，不替换为外层展开循环中同名变量的值
+        shadowed = self.loop_params.pop(loop_var, None)
+        outer = loop_var in self._native_loops
+        self._native_loops.add(loop_var)
+        try:
             for stmt in node.statements:
                 self.visit(stmt)
-            
-            # 恢复参数环境
-            self.loop_params = old_params
-            current += step
+        finally:
+            if not outer:
+                self._native_loops.discard(loop_var)
+            if shadowed is not None:
+                self.loop_params[loop_var] = shadowed
+        self.indent_level -= 1
+        self.emit('end')
+        self.indent_level -= 1
+        self.emit('end')
 
     def visit_RangeExpression(self, node):
         """访问range表达式"""
@@ -532,40 +706,16 @@ class VerilogGenerator:
         return node
 
     def evaluate_expression(self, expr):
-        """计算表达式的值（用于编译时常量）"""
-        if isinstance(expr, NumberExpression) or isinstance(expr, Number):
-            return int(expr.value) if isinstance(expr.value, (int, str)) and str(expr.value).isdigit() else expr.value
-        elif isinstance(expr, IdentifierExpression) or isinstance(expr, Identifier):
-            # 检查是否是参数或循环变量
-            if hasattr(self, 'parameters') and expr.name in self.parameters:
-                return self.parameters[expr.name]
-            elif hasattr(self, 'loop_params') and expr.name in self.loop_params:
-                return self.loop_params[expr.name]
-            else:
-                return expr.name  # 返回标识符名称
-        elif isinstance(expr, BinaryExpression):
-            left = self.evaluate_expression(expr.left)
-            right = self.evaluate_expression(expr.right)
-            if isinstance(left, (int, float)) and isinstance(right, (int, float)):
-                if expr.operator == '+':
-                    return left + right
-                elif expr.operator == '-':
-                    return left - right
-                elif expr.operator == '*':
-                    return left * right
-                elif expr.operator == '/':
-                    return left // right  # 整数除法
-                else:
-                    return f"({left} {expr.operator} {right})"
-            else:
-                return f"({left} {expr.operator} {right})"
-        elif isinstance(expr, int):
-            return expr
-        else:
-            return str(expr)
+        """计算表达式的值（用于编译时常量），不是常量时抛出ConstantError"""
+        return self.constants.evaluate(expr, self.loop_params)
 
     def visit_ModuleInstantiation(self, node):
         """访问模块实例化"""
+        module_name = node.module_name
+        if node.parameters:
+            # 参数覆盖
+            param_str = ', '.join(f'.{p.name}({self.visit_expression(p.value)})' for p in node.parameters)
+            module_name = f'{module_name} #({param_str})'
         # 生成模块实例化语句
         if node.port_connections:
             # 有端口连接
@@ -577,34 +727,259 @@ class VerilogGenerator:
                     port_list.append(f'.{conn.port_name}()')
             
             port_str = ', '.join(port_list)
-            self.emit(f'{node.module_name} {node.instance_name} ({port_str});')
+            self.emit(f'{module_name} {node.instance_name} ({port_str});')
         else:
             # 无端口连接
-            self.emit(f'{node.module_name} {node.instance_name} ();')
+            self.emit(f'{module_name} {node.instance_name} ();')
 
-    def visit_BinaryExpression(self, node):
-        """访问二元表达式"""
-        left = self.visit(node.left)
-        right = self.visit(node.right)
-        return f"({left} {node.operator} {right})"
+    def visit_expression(self, node):
+        """访问表达式（返回字符串）
 
-    def visit_UnaryExpression(self, node):
+        与visit共用按类型分派的方式：表达式节点分派到对应的visit_方法，
+        其他值直接转换为字符串。
+        """
+        try:
+            render = self._expression_table[type(node)]
+        except KeyError:
+            cls = type(self)
+            render = None
+            if issubclass(type(node), cls.EXPRESSION_TYPES):
+                render = cls.lookup(type(node))
+            render = cls._expression_table[type(node)] = render or cls.render_default
+        return render(self, node)
+
+    def _use_shared_rendering(self, enabled):
+        """只在有共享节点的模块中用visit_shared_expression代替visit_expression，
+        其余模块的表达式输出没有额外开销"""
+        if enabled and not self._shared_rendering:
+            self.visit_expression = self.visit_shared_expression
+        elif not enabled and self._shared_rendering:
+            del self.visit_expression
+        self._shared_rendering = enabled
+
+    def visit_shared_expression(self, node):
+        """有共享节点的模块中代替visit_expression：共享节点的文本只生成一次
+
+        文本与节点所在位置无关，只有展开的循环中随循环变量变化，这时不缓存。
+        """
+        if id(node) not in self._shared or self.loop_params:
+            return VerilogGenerator.visit_expression(self, node)
+        entry = self._rendered.get(id(node))
+        if entry is None:
+            entry = self._rendered[id(node)] = (node, VerilogGenerator.visit_expression(self, node))
+        return entry[1]
+
+    def render_default(self, node):
+        """非表达式节点按字符串输出"""
+        return str(node)
+
+    def render_compound(self, root):
+        """输出由二元、一元和条件表达式组成的子树
+
+        用显式栈代替递归：机器生成的长运算链（a0 ^ a1 ^ ... ^ a99999）嵌套很深，
+        递归输出会超过Python的递归深度限制，嵌套超过RECURSIVE_EXPRESSION_DEPTH层的
+        子树由这里输出。每个节点调用与递归输出相同的visit_方法，只是复合子表达式先以
+        _DEFERRED标记占位：标记分隔的文本直接写入parts，子表达式逆序压栈后依次展开；
+        最后一次拼接，输出时间与文本长度成正比。
+        """
+        visit = self.visit_expression
+        methods = self._expression_table
+        shared = self._shared if not self.loop_params else None
+        rendered = self._rendered
+        deferred = _DeferredOperands(visit)
+        children = deferred.nodes
+        parts = []
+        write = parts.append
+        stack = [root]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            node = pop()
+            if type(node) is str:
+                write(node)
+                continue
+            if shared and node is not root:
+                if type(node) is _SharedText:
+                    # 共享节点的文本已全部输出，合并为一段并缓存
+                    text = ''.join(parts[node.start:])
+                    parts[node.start:] = [text]
+                    rendered[id(node.node)] = (node.node, text)
+                    continue
+                if id(node) in shared:
+                    entry = rendered.get(id(node))
+                    if entry is not None:
+                        write(entry[1])
+                        continue
+                    push(_SharedText(node, len(parts)))
+            if isinstance(node, COMPOUND_EXPRESSIONS):
+                method = methods.get(type(node))
+                if method is None:
+                    method = methods[type(node)] = type(self).lookup(type(node))
+                text = method(self, node, deferred)
+            else:
+                text = visit(node)
+            if not children:
+                write(text)
+            elif len(children) == 1:
+                # 长运算链中最常见：只有一个复合操作数
+                head, tail = text.split(_DEFERRED)
+                write(head)
+                push(tail)
+                push(children.pop())
+            else:
+                texts = text.split(_DEFERRED)
+                write(texts[0])
+                for index in range(len(children) - 1, -1, -1):
+                    push(texts[index + 1])
+                    push(children[index])
+                children.clear()
+        return ''.join(parts)
+
+    # 二元、一元和条件表达式的visit_方法同时供递归输出和render_compound使用，括号只在这里决定。
+    # 操作数交给nested输出：nested为None时递归输出（visit_expression），嵌套超过
+    # RECURSIVE_EXPRESSION_DEPTH层时整棵子树改用render_compound；render_compound传入
+    # _DeferredOperands，操作数先以标记占位，由显式栈展开
+
+    def visit_BinaryExpression(self, node, nested=None):
+        """访问二元表达式"""
+        depth = self._expression_depth
+        if nested is None:
+            if depth >= RECURSIVE_EXPRESSION_DEPTH:
+                return self.render_compound(node)
+            nested = self.visit_expression
+            self._expression_depth = depth + 1
+        try:
+            operator = node.operator
+            left = node.left
+            right = node.right
+            left_text = nested(left)
+            right_text = nested(right)
+        finally:
+            self._expression_depth = depth
+        if self.parentheses == 'full':
+            return f'({left_text} {operator} {right_text})'
+        level = BINARY_PRECEDENCE.get(operator)
+        # 操作数也是二元表达式时直接比较优先级（常见情况），其他复合表达式交给needs_parentheses
+        if isinstance(left, BinaryExpression):
+            child = BINARY_PRECEDENCE.get(left.operator)
+            if level is None or child is None or child < level:
+                left_text = f'({left_text})'
+        elif isinstance(left, COMPOUND_EXPRESSIONS) and self.needs_parentheses(left, level):
+            left_text = f'({left_text})'
+        if isinstance(right, BinaryExpression):
+            child = BINARY_PRECEDENCE.get(right.operator)
+            if level is None or child is None or child <= level:
+                right_text = f'({right_text})'
+        elif isinstance(right, COMPOUND_EXPRESSIONS) and self.needs_parentheses(right, level, True):
+            right_text = f'({right_text})'
+        return f'{left_text} {operator} {right_text}'
+
+    def visit_UnaryExpression(self, node, nested=None):
         """访问一元表达式"""
-        operand = self.visit(node.operand)
-        return f"({node.operator}{operand})"
+        operand = node.operand
+        if not isinstance(operand, COMPOUND_EXPRESSIONS):
+            text = self.visit_expression(operand)
+            # 负数常量加括号，避免输出 --1
+            wrap = isinstance(operand, ReduceOperation) or text.startswith('-')
+        else:
+            depth = self._expression_depth
+            if nested is None:
+                if depth >= RECURSIVE_EXPRESSION_DEPTH:
+                    return self.render_compound(node)
+                nested = self.visit_expression
+                self._expression_depth = depth + 1
+            try:
+                text = nested(operand)
+            finally:
+                self._expression_depth = depth
+            wrap = True
+        if self.parentheses == 'full':
+            return f'({node.operator}{text})'
+        # 操作数不是基本表达式时加括号
+        return f'{node.operator}({text})' if wrap else node.operator + text
+
+    def visit_ConditionalExpression(self, node, nested=None):
+        """访问条件表达式"""
+        depth = self._expression_depth
+        if nested is None:
+            if depth >= RECURSIVE_EXPRESSION_DEPTH:
+                return self.render_compound(node)
+            nested = self.visit_expression
+            self._expression_depth = depth + 1
+        try:
+            cond = nested(node.condition)
+            true_expr = nested(node.true_expr)
+            false_expr = nested(node.false_expr)
+        finally:
+            self._expression_depth = depth
+        if self.parentheses == 'full':
+            return f'({cond} ? {true_expr} : {false_expr})'
+        # 嵌套的条件表达式加括号
+        if isinstance(node.condition, ConditionalExpression):
+            cond = f'({cond})'
+        if isinstance(node.true_expr, ConditionalExpression):
+            true_expr = f'({true_expr})'
+        if isinstance(node.false_expr, ConditionalExpression):
+            false_expr = f'({false_expr})'
+        return f'{cond} ? {true_expr} : {false_expr}'
+
+    def visit_operand(self, node, level, right=False):
+        """输出优先级为level的二元运算的操作数，只在需要时加括号"""
+        text = self.visit_expression(node)
+        if self.parentheses == 'minimal' and self.needs_parentheses(node, level, right):
+            return f'({text})'
+        return text
+
+    @staticmethod
+    def needs_parentheses(node, level, right=False):
+        """node作为优先级为level的二元运算的操作数时是否需要括号
+
+        level为None表示运算符不在优先级表中（移位），带二元操作数时总是加括号；
+        运算都是左结合的，右操作数与父运算同级时也要加括号以保持树的形状。
+        """
+        if isinstance(node, BinaryExpression):
+            child = BINARY_PRECEDENCE.get(node.operator)
+            return level is None or child is None or child < level or (right and child == level)
+        if isinstance(node, UnaryExpression):
+            return node.operator not in UNARY_PRECEDENCE
+        return isinstance(node, ConditionalExpression)
+
+    def visit_primary(self, node):
+        """输出只能接受基本表达式的位置（如延时 #d）上的表达式"""
+        text = self.visit_expression(node)
+        if self.parentheses == 'full' or not isinstance(node, COMPOUND_EXPRESSIONS):
+            return text
+        return f'({text})'
+
+    def visit_IdentifierExpression(self, node):
+        """访问标识符"""
+        # 检查是否是循环变量，如果是则替换为当前值
+        if node.name in self.loop_params:
+            return str(self.loop_params[node.name])
+        return node.name
+
+    def visit_NumberExpression(self, node):
+        """访问数字"""
+        if isinstance(node.value, str):
+            return node.value  # 已经是格式化的数字字符串
+        return str(node.value)
 
     def visit_IndexExpression(self, node):
         """访问数组索引表达式"""
-        array = node.array
-        index = self.visit(node.index)
-        return f"{array}[{index}]"
+        array_name = node.array
+        # 检查数组名是否是循环变量，如果是则替换
+        if array_name in self.loop_params:
+            array_name = str(self.loop_params[array_name])
+        return f'{array_name}[{self.visit_expression(node.index)}]'
 
     def visit_SliceExpression(self, node):
         """访问数组切片表达式"""
-        array = node.array
-        msb = self.visit(node.msb)
-        lsb = self.visit(node.lsb)
-        return f"{array}[{msb}:{lsb}]"
+        return f'{self.visit_expression(node.array)}[{self.visit_expression(node.msb)}:{self.visit_expression(node.lsb)}]'
+
+    def visit_ConcatenationExpression(self, node):
+        """访问拼接表达式"""
+        expr_list = [self.visit_expression(expr) for expr in node.expressions]
+        return f'{{{", ".join(expr_list)}}}'
 
     def visit_RangeSpec(self, node):
         """访问范围规格"""
@@ -616,73 +991,6 @@ class VerilogGenerator:
         """访问整数"""
         return str(node)
 
-    def visit_expression(self, node):
-        """访问表达式（返回字符串）"""
-        if isinstance(node, BinaryExpression) or isinstance(node, BinaryOp):
-            left = self.visit_expression(node.left)
-            right = self.visit_expression(node.right)
-            return f'({left} {node.operator} {right})'
-        elif isinstance(node, UnaryExpression):
-            operand = self.visit_expression(node.operand)
-            return f'({node.operator}{operand})'
-        elif isinstance(node, ConditionalExpression):
-            cond = self.visit_expression(node.condition)
-            true_expr = self.visit_expression(node.true_expr)
-            false_expr = self.visit_expression(node.false_expr)
-            return f'({cond} ? {true_expr} : {false_expr})'
-        elif isinstance(node, IdentifierExpression) or isinstance(node, Identifier):
-            # 检查是否是循环变量，如果是则替换为当前值
-            if hasattr(self, 'loop_params') and node.name in self.loop_params:
-                return str(self.loop_params[node.name])
-            else:
-                return node.name
-        elif isinstance(node, NumberExpression) or isinstance(node, Number):
-            if isinstance(node.value, str):
-                return node.value  # 已经是格式化的数字字符串
-            else:
-                return str(node.value)
-        elif isinstance(node, NewNumberExpression):
-            # 将新数值格式转换为Verilog格式
-            return self.convert_new_number_format(node)
-        elif isinstance(node, IndexExpression):
-            array_name = node.array
-            # 检查数组名是否是循环变量，如果是则替换
-            if hasattr(self, 'loop_params') and array_name in self.loop_params:
-                array_name = str(self.loop_params[array_name])
-            index = self.visit_expression(node.index)
-            return f'{array_name}[{index}]'
-        elif isinstance(node, SliceExpression):
-            return f'{self.visit_expression(node.array)}[{self.visit_expression(node.msb)}:{self.visit_expression(node.lsb)}]'
-        elif isinstance(node, ConcatenationExpression):
-            expr_list = [self.visit_expression(expr) for expr in node.expressions]
-            return f'{{{", ".join(expr_list)}}}'
-        elif isinstance(node, EnumReference):
-            return self.visit_EnumReference(node)
-        elif isinstance(node, FunctionCall):
-            return self.visit_FunctionCall(node)
-        elif isinstance(node, ReduceOperation):
-            return self.visit_ReduceOperation(node)
-        elif isinstance(node, str):
-            return node
-        elif isinstance(node, int):
-            return str(node)
-        else:
-            return str(node)
-
-    def visit_NewNumberExpression(self, node):
-        """访问新数值格式表达式"""
-        # 转换为Verilog格式
-        if node.base == 'd':
-            return f"{node.width}'{node.value}"
-        elif node.base == 'b':
-            return f"{node.width}'b{bin(node.value)[2:].zfill(node.width)}"
-        elif node.base == 'h':
-            return f"{node.width}'h{hex(node.value)[2:].upper()}"
-        elif node.base == 'o':
-            return f"{node.width}'o{oct(node.value)[2:]}"
-        else:
-            return str(node.value)
-
     # 新语法特性的访问方法
 
     def visit_EnumDeclaration(self, node):
@@ -718,9 +1026,11 @@ class VerilogGenerator:
         self.emit('begin')
         self.indent_level += 1
         
+        self._procedural = True
         for stmt in node.statements:
             if stmt is not None:
                 self.visit(stmt)
+        self._procedural = False
         
         self.indent_level -= 1
         self.emit('end')
@@ -778,11 +1088,12 @@ class VerilogGenerator:
         # 转换为Verilog的genvar和for循环
         self.emit(f'genvar {node.variable};')
         start_expr = self.visit_expression(node.start)
-        end_expr = self.visit_expression(node.end)
+        end_expr = self.visit_operand(node.end, BINARY_PRECEDENCE['<'], True)
         
         if node.step and self.visit_expression(node.step) != "1":
             # 如果有步长且不为1，需要特殊处理
-            self.emit(f'for ({node.variable} = {start_expr}; {node.variable} < {end_expr}; {node.variable} = {node.variable} + {self.visit_expression(node.step)}) begin')
+            step_expr = self.visit_operand(node.step, BINARY_PRECEDENCE['+'], True)
+            self.emit(f'for ({node.variable} = {start_expr}; {node.variable} < {end_expr}; {node.variable} = {node.variable} + {step_expr}) begin')
         else:
             self.emit(f'for ({node.variable} = {start_expr}; {node.variable} < {end_expr}; {node.variable} = {node.variable} + 1) begin')
         
@@ -852,7 +1163,7 @@ class VerilogGenerator:
         self.emit(f'initial begin')
         self.indent_level += 1
         self.emit(f'{node.clock_name} = 0;')
-        period_value = self.visit_expression(node.period)
+        period_value = self.visit_primary(node.period)
         # 计算半周期，如果是数字则直接计算，否则生成表达式
         try:
             half_period = int(period_value) // 2
@@ -918,7 +1229,7 @@ class VerilogGenerator:
     def visit_WaitStatement(self, node):
         """访问等待语句"""
         # 转换为Verilog的延时语句
-        delay_value = self.visit_expression(node.duration)
+        delay_value = self.visit_primary(node.duration)
         self.emit(f'#{delay_value};')
 
     def visit_DumpWavesStatement(self, node):
@@ -982,6 +1293,9 @@ class VerilogGenerator:
             else:
                 return str(value)
 
+    # 新数值格式表达式按上面的规则转换为Verilog格式
+    visit_NewNumberExpression = convert_new_number_format
+
 if __name__ == "__main__":
     # 测试代码生成器
     from .parser import GraceHDLParser
@@ -0,0 +1,42 @@
+"""
+GraceHDL AST访问者基类
+按节点类型查表分派到 visit_<类型名> 方法。分派表在类级别按需建立，每个
+(访问者类, 节点类型) 只解析一次；节点类型没有对应方法时沿其MRO查找基类的方法，
+因此兼容性子类（如 Identifier、BinaryOp）自动使用基类的处理方法。
+"""
+
+
+class NodeVisitor:
+    """基于分派表的访问者基类"""
+
+    # 类级别分派表的属性名，子类创建时各自获得新的空表
+    dispatch_tables = ('_visit_table',)
+    _visit_table = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls.dispatch_tables:
+            setattr(cls, name, {})
+
+    @classmethod
+    def lookup(cls, node_type, prefix='visit_'):
+        """沿节点类型的MRO查找 <prefix><类型名> 方法（未绑定），找不到时返回None"""
+        for klass in node_type.__mro__:
+            method = getattr(cls, prefix + klass.__name__, None)
+            if method is not None:
+                return method
+        return None
+
+    def visit(self, node):
+        """访问AST节点"""
+        try:
+            method = self._visit_table[type(node)]
+        except KeyError:
+            cls = type(self)
+            method = cls.lookup(type(node)) or cls.generic_visit
+            cls._visit_table[type(node)] = method
+        return method(self, node)
+
+    def generic_visit(self, node):
+        """通用访问方法"""
+        raise Exception(f'No visit_{type(node).__name__} method')
@@ -0,0 +1,78 @@
+"""
+GraceHDL目录监视
+轮询目录树中的.ghdl文件，按修改时间和大小发现变化；短时间内的连续修改
+合并为一批，等文件停止变化后再交给编译器。只用标准库，不依赖inotify。
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+
+# 轮询间隔（秒）
+DEFAULT_INTERVAL = 0.05
+
+# 发现变化后，文件需要保持不变的时间（秒），期间的修改并入同一批
+DEFAULT_SETTLE = 0.02
+
+
+def content_hash(path):
+    """文件内容的哈希，文件无法读取时返回None"""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class DirectoryWatcher:
+    """轮询式目录监视器"""
+
+    def __init__(self, root, pattern='**/*.ghdl', interval=DEFAULT_INTERVAL, settle=DEFAULT_SETTLE):
+        self.root = Path(root)
+        self.pattern = pattern
+        self.interval = interval
+        self.settle = settle
+        self._state = self.snapshot()
+
+    def snapshot(self):
+        """返回 {文件路径: (修改时间, 大小)}"""
+        state = {}
+        for path in self.root.glob(self.pattern):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    @property
+    def files(self):
+        """上次轮询时存在的文件"""
+        return sorted(self._state)
+
+    def poll(self):
+        """与上次轮询比较，返回 (新增或修改的文件集合, 删除的文件集合)"""
+        state = self.snapshot()
+        previous = self._state
+        self._state = state
+        changed = {path for path, stamp in state.items() if previous.get(path) != stamp}
+        removed = set(previous) - set(state)
+        return changed, removed
+
+    def batches(self, stop=None):
+        """持续轮询，每当文件停止变化时产生一批 (变化的文件, 删除的文件)
+
+        stop为threading.Event，设置后结束迭代。
+        """
+        stop = stop or threading.Event()
+        while not stop.wait(self.interval):
+            changed, removed = self.poll()
+            if not changed and not removed:
+                continue
+            # 等待编辑器完成保存：文件保持不变settle秒后才产生这一批
+            while not stop.wait(self.settle):
+                more_changed, more_removed = self.poll()
+                if not more_changed and not more_removed:
+                    break
+                changed = (changed | more_changed) - more_removed
+                removed = (removed - more_changed) | more_removed
+            yield changed, removed
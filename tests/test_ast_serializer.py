@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+测试AST二进制序列化和AST缓存
+"""
+
+import glob
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_nodes import ASTNode, BinaryOp, IdentifierExpression, NewNumberExpression, SourceText
+from src.ast_serializer import ASTCache, ASTFormatError, dump_ast, load_ast
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+EXAMPLES = sorted(glob.glob(os.path.join(ROOT, 'examples', '*.ghdl'))
+                  + glob.glob(os.path.join(ROOT, 'demos', '*.ghdl'))
+                  + glob.glob(os.path.join(ROOT, 'counter_project', '*.ghdl'))
+                  + glob.glob(os.path.join(ROOT, 'tests', '*.ghdl')))
+
+
+def assert_same_tree(a, b):
+    assert type(a) is type(b)
+    if isinstance(a, ASTNode):
+        for (name, left), (_, right) in zip(a.fields(), b.fields()):
+            assert_same_tree(left, right)
+    elif isinstance(a, (list, tuple)):
+        assert len(a) == len(b)
+        for left, right in zip(a, b):
+            assert_same_tree(left, right)
+    else:
+        assert a == b
+
+
+@pytest.mark.parametrize('path', EXAMPLES, ids=os.path.basename)
+def test_round_trip_examples(path, capsys):
+    compiler = GraceHDLCompiler()
+    with open(path, encoding='utf-8') as f:
+        ast = compiler._parse(f.read())
+    capsys.readouterr()
+    loaded = load_ast(dump_ast(ast))
+    assert_same_tree(ast, loaded)
+    if ast is not None:
+        assert compiler.generator.generate(loaded) == compiler.generator.generate(ast)
+
+
+def test_values_and_shared_nodes():
+    shared = BinaryOp('+', IdentifierExpression('a'), NewNumberExpression('-3', 'd', 8))
+    root = SourceText([shared], [shared, (1, -70000, 2.5, True, False, None, '中文')])
+    loaded = load_ast(dump_ast(root))
+    assert_same_tree(root, loaded)
+    assert loaded.modules[0] is loaded.items[0]
+
+
+def test_rejects_foreign_data():
+    data = dump_ast(IdentifierExpression('a'))
+    with pytest.raises(ASTFormatError):
+        load_ast(b'not an ast')
+    with pytest.raises(ASTFormatError):
+        load_ast(data[:5] + bytes([99]) + data[6:])
+    with pytest.raises(ASTFormatError):
+        load_ast(data[:-1])
+
+
+def test_cache_skips_parser(tmp_path, monkeypatch):
+    source = open(os.path.join(ROOT, 'demos', '01_basic_gates.ghdl'), encoding='utf-8').read()
+    compiler = GraceHDLCompiler()
+    compiler.ast_cache = ASTCache(tmp_path)
+    expected = compiler.generator.generate(compiler._parse(source))
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError('命中缓存时不应进行语法分析')
+
+    monkeypatch.setattr(compiler.parser.parser, 'parse', no_parse)
+    assert compiler.generator.generate(compiler._parse(source)) == expected
+    assert compiler.ast_cache.hits == 1
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+测试AST节点的 __slots__ 声明
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import ast_nodes
+from src.ast_nodes import ASTNode, BinaryOp, Identifier, NumberExpression
+from src.profiler import count_ast_nodes
+
+
+def test_all_node_classes_have_no_dict():
+    for value in vars(ast_nodes).values():
+        if isinstance(value, type) and issubclass(value, ASTNode):
+            assert '__slots__' in value.__dict__, value.__name__
+            assert '__dict__' not in dir(value), value.__name__
+
+
+def test_fields_include_base_class_slots():
+    node = BinaryOp('+', Identifier('a'), NumberExpression(1))
+    assert [name for name, _ in node.fields()] == ['operator', 'left', 'right']
+    assert count_ast_nodes(node) == 3
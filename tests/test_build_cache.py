@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+测试构建缓存：未改变的文件命中缓存且输出不变，修改后的文件重新编译
+"""
+
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.build_cache import BuildCache
+
+DEMO = os.path.join(os.path.dirname(__file__), '..', 'demos', '01_basic_gates.ghdl')
+
+
+def test_rebuild_uses_cache(tmp_path, capsys):
+    src = tmp_path / 'src'
+    src.mkdir()
+    shutil.copy(DEMO, src / 'a.ghdl')
+    shutil.copy(DEMO, src / 'b.ghdl')
+    cache_dir = tmp_path / 'cache'
+    compiler = GraceHDLCompiler()
+
+    assert compiler.compile_directory(str(src), str(tmp_path / 'out'), cache_dir=str(cache_dir))
+    assert "命中 0, 未命中 2" in capsys.readouterr().out
+    expected = (tmp_path / 'out' / 'a.v').read_bytes()
+
+    (tmp_path / 'out' / 'a.v').unlink()
+    with open(src / 'b.ghdl', 'a', encoding='utf-8') as f:
+        f.write("\n# 修改\n")
+    assert compiler.compile_directory(str(src), str(tmp_path / 'out'), cache_dir=str(cache_dir))
+    out = capsys.readouterr().out
+    assert "命中 1, 未命中 1" in out
+    assert "编译完成: 2/2" in out
+    assert (tmp_path / 'out' / 'a.v').read_bytes() == expected
+
+
+def test_key_depends_on_version_and_options(tmp_path):
+    source = b"module m:\n"
+    base = BuildCache(tmp_path, '1.0.0').key(source)
+    assert base == BuildCache(tmp_path, '1.0.0').key(source)
+    assert base != BuildCache(tmp_path, '1.0.1').key(source)
+    assert base != BuildCache(tmp_path, '1.0.0', {'paren': 'full'}).key(source)
+    assert base != BuildCache(tmp_path, '1.0.0').key(source + b"\n")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+测试编译守护进程：通过套接字编译的结果与直接编译一致，请求可以带编译选项，
+守护进程未运行时客户端回退到本进程编译
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import gracehdl_daemon
+from gracehdl_compiler import GraceHDLCompiler
+from gracehdl_daemon import CompileServer, request_compile
+
+SOURCE = """module and_gate:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a & b
+"""
+
+TOP = """
+module top:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    and_gate(W = 2) u1(.a(a), .b(b), .y(y))
+"""
+
+
+def _expected(tmp_path, source_code=SOURCE, options=None):
+    source = tmp_path / 'expected.ghdl'
+    source.write_text(source_code, encoding='utf-8')
+    compiler = GraceHDLCompiler()
+    compiler.configure(options or {})
+    assert compiler.compile_file(str(source))
+    return (tmp_path / 'expected.v').read_text(encoding='utf-8')
+
+
+def test_daemon_compiles_files_and_inline_source(tmp_path):
+    expected = _expected(tmp_path)
+    source = tmp_path / 'and_gate.ghdl'
+    source.write_text(SOURCE, encoding='utf-8')
+    socket_path = str(tmp_path / 'gracehdl.sock')
+
+    server = CompileServer(socket_path, jobs=1)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        response = request_compile({'input': str(source)}, socket_path)
+        assert response['success'] is True
+        assert (tmp_path / 'and_gate.v').read_text(encoding='utf-8') == expected
+
+        response = request_compile({'source': SOURCE}, socket_path)
+        assert response == {'success': True, 'output': expected + '\n'}
+
+        response = request_compile({'input': str(tmp_path / 'missing.ghdl')}, socket_path)
+        assert response['success'] is False
+        assert 'missing.ghdl' in response['output']
+
+        response = request_compile({'verbose': True}, socket_path)
+        assert response['success'] is False
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+    assert not os.path.exists(socket_path)
+
+
+def test_client_falls_back_without_daemon(tmp_path, capsys):
+    expected = _expected(tmp_path)
+    source = tmp_path / 'and_gate.ghdl'
+    source.write_text(SOURCE, encoding='utf-8')
+    socket_path = str(tmp_path / 'missing.sock')
+
+    assert request_compile({'input': str(source)}, socket_path) is None
+    assert gracehdl_daemon.client(str(source), socket_path=socket_path)
+    assert (tmp_path / 'and_gate.v').read_text(encoding='utf-8') == expected
+    assert gracehdl_daemon.client(source=SOURCE, socket_path=socket_path)
+    assert capsys.readouterr().out == expected + '\n'
+
+
+def test_request_options(tmp_path):
+    source = SOURCE.replace('    input(', '    parameter(W = 1)\n    input(', 1) + TOP
+    options = {'specialize': True, 'top': ['top'], 'paren': 'full'}
+    expected = _expected(tmp_path, source, options)
+    assert "module and_gate__W_2(" in expected and "assign y = (a & b);" in expected
+    socket_path = str(tmp_path / 'gracehdl.sock')
+
+    server = CompileServer(socket_path, jobs=1)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        for _ in range(2):
+            response = request_compile({'source': source, 'options': options}, socket_path)
+            assert response == {'success': True, 'output': expected + '\n'}
+        # 不带选项的请求仍使用默认设置
+        response = request_compile({'source': source}, socket_path)
+        assert "and_gate #(.W(2)) u1" in response['output']
+
+        for options, message in (({'link': True}, '不支持 link'), ({'jobs': 2}, '未知的编译选项: jobs'),
+                                 ({'paren': 'none'}, 'paren 必须是')):
+            response = request_compile({'source': source, 'options': options}, socket_path)
+            assert response['success'] is False
+            assert message in response['output']
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    response = gracehdl_daemon.compile_in_process({'source': source, 'options': {'cse': [3, 2], 'top': 'top'}})
+    assert response == {'success': False, 'output': '错误: 无效的请求: top 必须是模块名列表\n'}
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+测试编译时常量求值：全部运算符、数值字面量、参数、枚举项和纯函数，
+按表达式缓存结果，不是常量时给出明确的错误
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_nodes import EnumDeclaration, FunctionDeclaration
+from src.const_eval import ConstantError, ConstantEvaluator, parameter_declarations
+
+SOURCE = """enum mode:
+IDLE = 2
+RUN
+
+def half(x):
+    y = x >> 1
+    return y + 0
+
+def forever(x):
+    return forever(x + 1)
+
+module m:
+    parameter(WIDTH = 8, HALF = half(WIDTH), MASK = (1 << HALF) - 1, HEX = 8'hF0 & ~MASK, FLAGS = (WIDTH >= 8) && !(HALF != 4), NEW = (1010, b, 4) ^ mode.RUN, RED = reduce_xor(WIDTH + 1), BIT = MASK[3:1], LOOP = forever(0), BAD = WIDTH + a)
+    input(
+        wire(7:0) a
+    )
+    output(
+        wire(7:0) y
+    )
+    always:
+        for i in range(mode.IDLE, half(mode.RUN + 6)):
+            y[i] = a[i + 1]
+"""
+
+
+def _evaluator(ast):
+    enums = {item.name: item for item in ast.items if isinstance(item, EnumDeclaration)}
+    functions = {item.name: item for item in ast.items if isinstance(item, FunctionDeclaration)}
+    declarations = {parameter.name: parameter.value for parameter in parameter_declarations(ast.modules[0])}
+    return ConstantEvaluator(declarations, enums, functions, module='m'), declarations
+
+
+def test_evaluate_constants():
+    evaluator, declarations = _evaluator(GraceHDLCompiler()._parse(SOURCE))
+    expected = {'WIDTH': 8, 'HALF': 4, 'MASK': 15, 'HEX': 0xF0, 'FLAGS': 1, 'NEW': 0b1010 ^ 2, 'RED': 0, 'BIT': 7}
+    assert {name: evaluator.evaluate(declarations[name]) for name in expected} == expected
+    # 参数值和函数调用只计算一次，再次求值直接命中缓存
+    assert evaluator.calls == {('half', (8,)): 4}
+    hits = evaluator.hits
+    assert evaluator.evaluate(declarations['MASK']) == 15
+    assert evaluator.hits == hits + 1
+    # 依赖局部绑定的表达式不缓存
+    assert [evaluator.evaluate(declarations['BAD'], {'a': value}) for value in (1, 2)] == [9, 10]
+
+    with pytest.raises(ConstantError, match=r"模块 m: 'a' 不是编译时常量"):
+        evaluator.evaluate(declarations['BAD'])
+    with pytest.raises(ConstantError, match="函数 forever 调用嵌套超过"):
+        evaluator.evaluate(declarations['LOOP'])
+
+
+def test_loop_bounds(tmp_path, capsys):
+    source = tmp_path / 'm.ghdl'
+    source.write_text(SOURCE, encoding='utf-8')
+    compiler = GraceHDLCompiler()
+    assert compiler.compile_file(str(source), str(tmp_path / 'm.v'))
+    output = (tmp_path / 'm.v').read_text(encoding='utf-8')
+    assert "y[2] = a[2 + 1];\n        y[3] = a[3 + 1];\n    end" in output
+
+    # 通用输出中参数可以被实例覆盖，依赖参数的循环输出为Verilog for循环
+    source.write_text(SOURCE.replace('range(mode.IDLE,', 'range(HALF,'), encoding='utf-8')
+    assert compiler.compile_file(str(source), str(tmp_path / 'm.v'))
+    output = (tmp_path / 'm.v').read_text(encoding='utf-8')
+    assert "for (i = HALF; i < half(mode_RUN + 6); i = i + 1)" in output
+    # 必须展开的循环报告明确的错误
+    source.write_text(SOURCE.replace('range(mode.IDLE,', 'range(HALF,').replace('y[i] =', 'y[i:i] ='),
+                      encoding='utf-8')
+    assert not compiler.compile_file(str(source), str(tmp_path / 'm.v'))
+    assert ("模块 m: for循环 i 的范围不是编译时常量: 'HALF' 是可以被实例覆盖的模块参数，"
+            "且无法输出为Verilog for循环: 切片范围依赖循环变量 i"
+            "（可使用 --specialize 按实例的参数取值展开）") in capsys.readouterr().out
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+测试公共子表达式提取（--cse）：重复的一位表达式提取为wire，嵌套的公共子表达式按提取后的
+出现次数决定；读取段内阻塞赋值的信号或循环变量的出现不提取
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.cse import CommonSubexpressionExtractor
+
+SOURCE = """module fsm:
+    input(
+        wire(1:0) state,
+        wire(7:0) a,
+        wire en
+    )
+    output(
+        reg(1:0) s,
+        reg(7:0) y,
+        wire z,
+        wire w
+    )
+    always:
+        if state == 1 && a[3:0] != 0: y = a
+    always:
+        if state == 1: y = a + 1
+    always:
+        s = a[1:0]
+        y[0] = s == 1
+        for i in range(0, 2):
+            y[i] = a[i] == en
+    always:
+        if s == 1: y = 0
+        elsif a[i] == en: y = 1
+    assign:
+        z = state == 1 && a[3:0] != 0
+        w = (state == 1) + (a[3:0] != 0)
+"""
+
+
+def _generate(extractor):
+    compiler = GraceHDLCompiler()
+    ast = compiler._parse(SOURCE)
+    return compiler.generator.generate(extractor.extract(ast))
+
+
+def test_extract_shared_wires():
+    extractor = CommonSubexpressionExtractor()
+    output = _generate(extractor)
+    assert extractor.extracted == 3
+    assert ("    wire cse_0, cse_1, cse_2;\n"
+            "    \n"
+            "    assign cse_0 = cse_1 && cse_2;\n"
+            "    assign cse_1 = state == 1;\n"
+            "    assign cse_2 = a[3:0] != 0;\n") in output
+    assert "        if (cse_0)\n            y = a;" in output
+    assert "assign z = cse_0;" in output
+    assert "assign w = cse_1 + cse_2;" in output
+    # s在同一段中先被阻塞赋值，展开的循环中 a[i] == en 随循环变量变化
+    assert "        y[0] = s == 1;\n        y[0] = a[0] == en;" in output
+    assert "        if (s == 1)" in output
+
+
+def test_thresholds():
+    # state == 1 只有3个节点；外层的 && 只出现两次不提取，a[3:0] != 0 随它共出现三次
+    extractor = CommonSubexpressionExtractor(min_size=4, min_uses=3)
+    output = _generate(extractor)
+    assert extractor.extracted == 1
+    assert "    assign cse_0 = a[3:0] != 0;\n" in output
+    assert "if (state == 1 && cse_0)" in output
+
+    compiler = GraceHDLCompiler()
+    compiler.cse = CommonSubexpressionExtractor(4, 3)
+    assert compiler.cache_options() == {'cse': (4, 3)}
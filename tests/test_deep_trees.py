@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+测试很深的语法树：10万层左结合表达式和1万个分支的elsif链在默认递归深度限制下
+输出、求值和编译，结果与逐层递归时一致
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_nodes import BinaryExpression, IndexExpression, UnaryExpression
+from src.const_eval import ConstantEvaluator
+
+DEPTH = 100000
+ARMS = 10000
+
+HEADER = """module deep:
+    input(
+        wire(7:0) a,
+        wire(15:0) s
+    )
+    output(
+        reg y,
+        wire z,
+        wire w
+    )
+"""
+
+
+def test_deep_expression():
+    expression = IndexExpression('a', 0)
+    constant = 1
+    for i in range(1, DEPTH):
+        expression = BinaryExpression('^', expression, IndexExpression('a', i % 8))
+        constant = BinaryExpression('+', constant, UnaryExpression('-', -1))
+
+    compiler = GraceHDLCompiler()
+    ast = compiler._parse(HEADER + "    assign:\n        z = a[0]\n")
+    ast.modules[0].sections[-1].assignments[0].expression = expression
+    output = compiler.generator.generate(ast)
+    assert "    assign z = a[0] ^ a[1] ^ a[2] ^ " in output
+    assert output.count(' ^ ') == DEPTH - 1
+
+    compiler.generator.parentheses = 'full'
+    output = compiler.generator.generate(ast)
+    assert "    assign z = " + '(' * (DEPTH - 1) + "a[0] ^ a[1]) ^ a[2]) ^ " in output
+
+    assert ConstantEvaluator().evaluate(constant) == DEPTH
+
+
+def test_long_elsif_chain(tmp_path):
+    arms = ''.join(f"        elsif s == {i}: y = a[{i % 8}]\n" for i in range(1, ARMS - 1))
+    source = tmp_path / 'deep.ghdl'
+    source.write_text(HEADER + "    always:\n        if s == 0: y = a[0]\n" + arms +
+                      f"        elsif s == {ARMS - 1}: w = a[7]\n        else: y = 0\n"
+                      "    assign:\n        z = a[0]\n", encoding='utf-8')
+    compiler = GraceHDLCompiler()
+    assert compiler.compile_file(str(source), str(tmp_path / 'deep.v'))
+    output = (tmp_path / 'deep.v').read_text(encoding='utf-8')
+    assert output.count('else if (s == ') == ARMS - 1
+    assert ("        else if (s == 9999)\n"
+            "            w = a[7];\n"
+            "        else\n"
+            "            y = 0;\n") in output
+    # 只在最后一个elsif分支中赋值的输出也由always块驱动
+    assert "    output reg w\n" in output
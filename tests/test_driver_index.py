@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+测试信号驱动索引
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.driver_index import ALWAYS, ASSIGN, INSTANCE, RUN, build_driver_index
+from src.parser import GraceHDLParser
+
+SOURCE = """module top:
+    input(
+        wire clk,
+        wire(7, 0) a
+    )
+    output(
+        wire(7, 0) x,
+        wire(7, 0) y,
+        wire(7, 0) z
+    )
+    always:
+        if a == (0, d, 8):
+            x = a
+        else:
+            y = a
+    run (clk.posedge):
+        r = a
+    assign:
+        z = a
+"""
+
+
+def test_driver_kinds():
+    parser = GraceHDLParser()
+    parser.build()
+    module = parser.parse(SOURCE).modules[0]
+    index = build_driver_index(module.sections)
+    assert index['x'] == {ALWAYS}
+    assert index['y'] == {ALWAYS}
+    assert index['r'] == {RUN}
+    assert index['z'] == {ASSIGN}
+    assert 'a' not in index
+
+
+def test_instance_connections():
+    from src.ast_nodes import ModuleInstantiation, PortConnection
+    inst = ModuleInstantiation('sub', 'u0', [PortConnection('q', 'w'), PortConnection('d', 'a')])
+    index = build_driver_index([inst])
+    assert index == {'w': {INSTANCE}, 'a': {INSTANCE}}
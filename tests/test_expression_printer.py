@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+测试最少括号的表达式输出：随机表达式按默认风格输出后重新分析，树的形状不变；
+--paren=full 保持每个运算都加括号的输出
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_nodes import BinaryExpression, IdentifierExpression, IndexExpression, UnaryExpression
+
+# '<=' 在GraceHDL表达式中被分析为非阻塞赋值，不参与测试
+BINARY = ['+', '-', '<<', '>>', '&', '|', '^', '&&', '||', '==', '!=', '<', '>', '>=']
+UNARY = ['~', '-', '!']
+
+HEADER = """module m:
+    input(
+        wire a
+    )
+    output(
+        wire y
+    )
+    assign:
+"""
+
+
+def _random_expression(rng, depth):
+    if depth == 0 or rng.random() < 0.2:
+        choice = rng.randrange(3)
+        if choice == 0:
+            return IdentifierExpression(rng.choice('abcd'))
+        if choice == 1:
+            return rng.randrange(16)
+        return IndexExpression('a', rng.randrange(4))
+    if rng.random() < 0.2:
+        return UnaryExpression(rng.choice(UNARY), _random_expression(rng, depth - 1))
+    return BinaryExpression(rng.choice(BINARY), _random_expression(rng, depth - 1),
+                            _random_expression(rng, depth - 1))
+
+
+def test_round_trip_keeps_tree_shape():
+    rng = random.Random(2024)
+    expressions = [_random_expression(rng, 4) for _ in range(300)]
+    compiler = GraceHDLCompiler()
+    generator = compiler.generator
+    minimal = [generator.visit_expression(expression) for expression in expressions]
+
+    ast = compiler._parse(HEADER + ''.join(f'        y = {text}\n' for text in minimal))
+    parsed = [assignment.expression for assignment in ast.modules[0].sections[-1].assignments]
+
+    generator.parentheses = 'full'
+    full = [generator.visit_expression(expression) for expression in expressions]
+    assert [generator.visit_expression(expression) for expression in parsed] == full
+    assert sum(map(len, minimal)) < sum(map(len, full)) * 0.9
+
+
+def test_paren_styles():
+    compiler = GraceHDLCompiler()
+    ast = compiler._parse(HEADER + "        y = a ^ (b ^ c) | ~(a & b) | (a << 1) + 1\n"
+                                   "        y = !a & b | -(a - b)\n")
+    output = compiler.generator.generate(ast)
+    assert "assign y = a ^ (b ^ c) | ~(a & b) | (a << 1) + 1;" in output
+    # GraceHDL中 ! 作用于整个右侧表达式
+    assert "assign y = !(a & b | -(a - b));" in output
+    compiler.generator.parentheses = 'full'
+    output = compiler.generator.generate(ast)
+    assert "assign y = (((a ^ (b ^ c)) | (~(a & b))) | ((a << 1) + 1));" in output
+    assert compiler.cache_options() == {'paren': 'full'}
+
+
+def test_explicit_stack_matches_recursive():
+    rng = random.Random(7)
+    expressions = [_random_expression(rng, 6) for _ in range(300)]
+    generator = GraceHDLCompiler().generator
+    for style in ('minimal', 'full'):
+        generator.parentheses = style
+        assert ([generator.render_compound(expression) for expression in expressions
+                 if not isinstance(expression, int)] ==
+                [generator.visit_expression(expression) for expression in expressions
+                 if not isinstance(expression, int)])
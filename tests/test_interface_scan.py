@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+测试接口扫描模式：结果与完整语法分析得到的模块接口一致
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.interface_scan import extract_module_headers, module_interface
+
+SOURCE = """# 库文件
+enum State:
+    IDLE
+    RUN
+
+module alu:
+    parameter(WIDTH = 8)
+    input(
+        wire(7, 0) a,  # 操作数(a)
+        wire(7, 0) b,
+        wire(2, 0) op
+    )
+    output(
+        wire(7, 0) result
+    )
+    always:
+        case op:
+            (0, d, 3):
+                result = a + b
+            default:
+                result = a - b
+
+module buffer:
+    input(
+        wire a
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a
+"""
+
+
+def _signature(interface):
+    return (interface.name,
+            [(p.name, repr(p.value)) for p in interface.parameters],
+            [repr(port) for port in interface.inputs],
+            [repr(port) for port in interface.outputs])
+
+
+def test_scan_matches_full_parse():
+    compiler = GraceHDLCompiler()
+    full = compiler._parse(SOURCE)
+    expected = [module_interface(module, 0) for module in full.modules]
+    scanned = compiler.parser.scan_interfaces(SOURCE)
+
+    assert [_signature(i) for i in scanned] == [_signature(i) for i in expected]
+    assert [(i.name, i.line) for i in scanned] == [('alu', 6), ('buffer', 23)]
+    assert [p.name for p in scanned[0].parameters] == ['WIDTH']
+    assert [port.names for port in scanned[0].inputs] == [['a'], ['b'], ['op']]
+
+
+def test_bodies_are_skipped():
+    header_source, modules = extract_module_headers(SOURCE)
+    assert modules == [('alu', 6), ('buffer', 23)]
+    assert header_source.count('\n') == SOURCE.count('\n')
+    assert 'case' not in header_source and 'assign' not in header_source
+    assert 'IDLE' not in header_source
+
+
+def test_broken_header_reports_original_line(capsys):
+    broken = SOURCE.replace("        wire y\n", "        wire y y y\n")
+    scanned = GraceHDLCompiler().parser.scan_interfaces(broken)
+    assert [i.name for i in scanned] == ['alu']
+    assert '行 28' in capsys.readouterr().out
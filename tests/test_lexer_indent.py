@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+测试单遍前向缩进处理：与旧的回退重扫实现产生相同的token流
+"""
+
+import glob
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lexer import GraceHDLLexer
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+SOURCES = sorted(
+    glob.glob(os.path.join(ROOT, 'examples', '*.ghdl'))
+    + glob.glob(os.path.join(ROOT, 'demos', '*.ghdl'))
+    + glob.glob(os.path.join(ROOT, 'counter_project', '*.ghdl'))
+)
+
+
+def _stream(mode, source, **build_options):
+    lexer = GraceHDLLexer(indent_mode=mode)
+    lexer.build(**build_options)
+    lexer.input(source)
+    tokens = []
+    while True:
+        tok = lexer.token()
+        if not tok:
+            return tokens
+        tokens.append((tok.type, tok.value, tok.lineno))
+
+
+def _without_lost_tokens(tokens):
+    """旧实现在INDENT/DEDENT之后无法放回值为假的token（如行首的0），比较时去掉它们"""
+    result = []
+    for tok in tokens:
+        if result and result[-1][0] in ('INDENT', 'DEDENT') and tok[0] not in ('INDENT', 'DEDENT') \
+                and not tok[1] and tok[1] is not None:
+            continue
+        result.append(tok)
+    return result
+
+
+def test_forward_matches_rewind():
+    """examples/demos/counter_project 下的所有源文件token流一致"""
+    assert SOURCES
+    for path in SOURCES:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        forward = _stream('forward', source)
+        assert _without_lost_tokens(forward) == _stream('rewind', source), path
+
+
+def test_forward_keeps_line_start_zero():
+    """缩进变化后行首的0不会丢失"""
+    tokens = _stream('forward', "if a:\n    0\nb\n")
+    assert [t[0] for t in tokens] == ['IF', 'IDENTIFIER', 'COLON', 'NEWLINE', 'INDENT', 'NUMBER',
+                                      'NEWLINE', 'DEDENT', 'IDENTIFIER', 'NEWLINE']
+
+
+def test_forward_matches_rewind_on_edge_cases():
+    """共用前缀的运算符、跨行的注释/字符串/数值格式、制表符缩进、非法字符和文件末尾的空格"""
+    source = ("module m:\n\tif a <= b || c ~^ d:\n\t    x = (1,\n d, 8) >> 2 /* a\nb */ y\n"
+              "  \t  z = \"s\ntr\" @ 'h1f\n    w = 3 $ 4   ")
+    assert _stream('forward', source) == _stream('rewind', source)
+
+
+def test_forward_follows_rule_changes(monkeypatch):
+    """forward模式使用规则本身的正则和处理函数，修改GraceHDLLexer的规则后两种模式仍一致"""
+    def t_NUMBER(self, t):
+        r'\d+(_\d+)*'
+        t.value = t.value.replace('_', '')  # 保留为文本
+        return t
+
+    monkeypatch.setattr(GraceHDLLexer, 't_NUMBER', t_NUMBER)
+    source = "x = 1_000 + 2\n"
+    # 不使用预生成的词法表，规则的正则从修改后的方法中读取
+    forward = _stream('forward', source, optimize=False)
+    assert forward == _stream('rewind', source, optimize=False)
+    assert ('NUMBER', '1000', 1) in forward
+
+
+def test_unknown_indent_mode():
+    try:
+        GraceHDLLexer(indent_mode='backward')
+    except ValueError:
+        pass
+    else:
+        assert False, "应当拒绝未知的缩进处理模式"
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+测试跨文件模块链接：目录编译时报告未定义的模块、不存在的端口和重复定义，
+串行、并行和使用构建缓存时结果一致
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.linker import ModuleLinker
+
+LEAF = """module and_gate:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a & b
+"""
+
+TOP = """module top:
+    input(
+        wire en
+    )
+    output(
+        wire y
+    )
+    and_gate u0(.a(en), .b(en), .y(y))
+    and_gate u1(.a(en), .q(en), .y(y))
+    or_gate u2(.a(en), .b(en), .y(y))
+"""
+
+
+def _write_project(root):
+    root.mkdir()
+    (root / 'and_gate.ghdl').write_text(LEAF, encoding='utf-8')
+    (root / 'top.ghdl').write_text(TOP, encoding='utf-8')
+    (root / 'copy.ghdl').write_text(LEAF, encoding='utf-8')
+
+
+def _link_errors(output):
+    return [line for line in output.splitlines() if '链接错误' in line]
+
+
+def test_link_errors_in_directory_compile(tmp_path, capsys):
+    _write_project(tmp_path / 'src')
+    results = []
+    for name, jobs, cache_dir in (('serial', 1, None), ('parallel', 2, None),
+                                  ('cached', 1, tmp_path / 'cache'), ('cached2', 2, tmp_path / 'cache')):
+        compiler = GraceHDLCompiler()
+        compiler.linker = ModuleLinker()
+        success = compiler.compile_directory(str(tmp_path / 'src'), str(tmp_path / name), jobs=jobs,
+                                             cache_dir=cache_dir and str(cache_dir))
+        assert success is False
+        results.append(_link_errors(capsys.readouterr().out))
+
+    errors = results[0]
+    assert all(result == errors for result in results)
+    assert len(errors) == 3
+    assert "and_gate: 模块重复定义" in errors[0] and 'copy.ghdl' in errors[0]
+    assert "top.u1: 模块 and_gate 没有端口 q" in errors[1]
+    assert "top.u2: 未定义的模块 or_gate" in errors[2]
+
+    # 修正后链接通过
+    (tmp_path / 'src' / 'copy.ghdl').unlink()
+    (tmp_path / 'src' / 'top.ghdl').write_text(
+        TOP.replace('.q(', '.b(').replace('or_gate', 'and_gate'), encoding='utf-8')
+    compiler = GraceHDLCompiler()
+    compiler.linker = ModuleLinker()
+    assert compiler.compile_directory(str(tmp_path / 'src'), str(tmp_path / 'fixed')) is True
+    assert _link_errors(capsys.readouterr().out) == []
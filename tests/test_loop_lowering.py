@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+测试for循环降级：迭代次数超过展开上限的循环输出为Verilog for循环，
+其余展开；记录每个循环的策略、迭代次数和输出行数
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+
+SOURCE = """module big:
+    input(
+        wire(4095:0) a
+    )
+    output(
+        wire(4095:0) y
+    )
+    always:
+        for i in range(0, 4096):
+            y[i] = a[4095 - i]
+        for j in range(0, 4):
+            for k in range(j, 100, 2):
+                y[k] = a[j + k]
+        for n in range(0, 128):
+            y[n + 1:n] = a[1:0]
+"""
+
+
+def _generate(limit):
+    compiler = GraceHDLCompiler()
+    compiler.generator.unroll_limit = limit
+    output = compiler.generator.generate(compiler._parse(SOURCE))
+    records = [(record.loop_var, record.strategy, record.trips, record.expansions, record.lines)
+               for record in compiler.generator.loop_records.values()]
+    return output, records
+
+
+def test_unroll_or_emit():
+    output, records = _generate(64)
+    assert ("        begin : i_loop1\n"
+            "            integer i;\n"
+            "            for (i = 0; i < 4096; i = i + 1)\n"
+            "            begin\n"
+            "                y[i] = a[4095 - i];\n"
+            "            end\n"
+            "        end\n"
+            "        y[0] = a[0 + 0];\n") in output
+    # 切片范围依赖循环变量，只能展开
+    assert "y[127 + 1:127] = a[1:0];" in output
+    assert records == [('i', 'emit', 4096, 1, 7), ('j', 'unroll', 4, 1, 198),
+                       ('k', 'unroll', 198, 4, 198), ('n', 'unroll', 128, 1, 128)]
+
+    # 内层循环的范围依赖外层Verilog for循环的下标时也输出为for循环
+    output, records = _generate(2)
+    assert ("                begin : k_loop3\n"
+            "                    integer k;\n"
+            "                    for (k = j; k < 100; k = k + 2)\n") in output
+    assert records[1:3] == [('j', 'emit', 4, 1, 13), ('k', 'emit', None, 1, 7)]
+
+
+def test_unroll_limit_in_cache_key():
+    compiler = GraceHDLCompiler()
+    assert compiler.cache_options() == {}
+    compiler.generator.unroll_limit = 8
+    assert compiler.cache_options() == {'unroll_limit': 8}
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+测试目录并行编译：输出文件、打印内容和返回值与串行编译一致
+"""
+
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+
+DEMOS_DIR = os.path.join(os.path.dirname(__file__), '..', 'demos')
+
+
+def _compile(tmp_path, name, jobs, capsys):
+    output_dir = tmp_path / name
+    result = GraceHDLCompiler().compile_directory(str(tmp_path / 'src'), str(output_dir), jobs=jobs)
+    outputs = {path.relative_to(output_dir): path.read_text(encoding='utf-8')
+               for path in output_dir.glob('**/*.v')}
+    return result, capsys.readouterr().out, outputs
+
+
+def test_parallel_matches_serial(tmp_path, capsys):
+    shutil.copytree(DEMOS_DIR, tmp_path / 'src' / 'demos')
+    # 包含一个无法编译的文件，确认错误仍按文件顺序报告
+    (tmp_path / 'src' / 'broken.ghdl').write_text("module broken:\n    input(\n", encoding='utf-8')
+
+    serial = _compile(tmp_path, 'serial', 1, capsys)
+    parallel = _compile(tmp_path, 'parallel', 3, capsys)
+
+    assert serial == parallel
+    assert serial[0] is False
+    assert "编译完成" in serial[1]
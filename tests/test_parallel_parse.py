@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+测试并行语法分析：按顶层项切分后并行分析的AST与串行分析逐项一致，行号与原文件一致
+"""
+
+import glob
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_serializer import dump_ast
+from src.parallel_parse import ParallelParser, split_top_level
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+EXAMPLES = sorted(glob.glob(os.path.join(ROOT, 'examples', '*.ghdl'))
+                  + glob.glob(os.path.join(ROOT, 'demos', '*.ghdl')))
+
+SOURCE = """// 两个模块
+module and_gate:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a & b
+
+module or_gate:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a | b
+"""
+
+
+@pytest.fixture(scope='module')
+def compiler():
+    compiler = GraceHDLCompiler()
+    compiler.parallel_parser = ParallelParser(compiler.parser, jobs=2, min_size=0)
+    yield compiler
+    compiler.parallel_parser.close()
+
+
+def _serial(source):
+    return GraceHDLCompiler()._parse(source)
+
+
+def test_split_keeps_line_numbers():
+    chunks = split_top_level(SOURCE)
+    assert [line for line, _ in chunks] == [1, 2, 13]
+    assert ''.join(text for _, text in chunks) == SOURCE
+    # 每块从原文件中的行号开始计数
+    lexer = GraceHDLCompiler().lexer
+    line, text = chunks[2]
+    lexer.input(text, line)
+    tokens = iter(lexer.token, None)
+    assert [(tok.value, tok.lineno) for tok in tokens if tok.type == 'IDENTIFIER'][0] == ('or_gate', 13)
+
+
+@pytest.mark.parametrize('path', EXAMPLES + [None], ids=lambda path: os.path.basename(path or 'inline'))
+def test_matches_serial_parse(compiler, path, capsys):
+    if path is None:
+        source = SOURCE
+    else:
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+    expected = _serial(source)
+    expected_output = capsys.readouterr().out
+    ast = compiler._parse(source)
+    assert capsys.readouterr().out == expected_output
+    if expected is None:
+        assert ast is None
+    else:
+        assert dump_ast(ast) == dump_ast(expected)
+
+
+def test_errors_fall_back_to_serial_parse(compiler, capsys):
+    source = SOURCE.replace('y = a | b', 'y = a | | b')
+    assert _serial(source) is None
+    expected_output = capsys.readouterr().out
+    assert "行 22" in expected_output
+    assert compiler._parse(source) is None
+    assert capsys.readouterr().out == expected_output
+    assert compiler.parser.error_count == 1
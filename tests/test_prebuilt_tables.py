@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+测试预生成的词法表/分析表：与当前文法一致，且构建编译器时不写入任何文件
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+from gracehdl_compiler import GraceHDLCompiler
+from src import lextab, parsetab
+from src.lexer import GraceHDLLexer
+from src.parser import GraceHDLParser
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+
+def _listing(path):
+    return sorted(name for name in os.listdir(path) if name != '__pycache__')
+
+
+def test_parsetab_matches_grammar():
+    """分析表签名必须与当前文法一致（否则需运行 python -m src.build_tables）"""
+    parser = GraceHDLParser()
+    pdict = {k: getattr(parser, k) for k in dir(parser)}
+    pinfo = yacc.ParserReflect(pdict)
+    pinfo.get_all()
+    assert parsetab._lr_signature == pinfo.signature()
+
+
+def test_lextab_matches_rules():
+    """词法表必须与当前词法规则一致"""
+    fresh = lex.lex(module=GraceHDLLexer(), optimize=False)
+    shipped = [pat for pat, _ in lextab._lexstatere['INITIAL']]
+    assert [regex.pattern for regex, _ in fresh.lexstatere['INITIAL']] == shipped
+    assert fresh.lextokens == lextab._lextokens
+
+
+def test_build_writes_no_files(tmp_path, monkeypatch):
+    """构建编译器不生成 parsetab.py/parser.out 等文件"""
+    monkeypatch.chdir(tmp_path)
+    src_before = _listing(SRC_DIR)
+
+    compiler = GraceHDLCompiler()
+    source = tmp_path / 'and_gate.ghdl'
+    source.write_text("""module and_gate:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a & b
+""", encoding='utf-8')
+    assert compiler.compile_file(str(source))
+
+    assert sorted(os.listdir(tmp_path)) == ['and_gate.ghdl', 'and_gate.v']
+    assert _listing(SRC_DIR) == src_before
+
+
+def test_lexer_built_once():
+    """编译器复用语法分析器中的词法分析器"""
+    compiler = GraceHDLCompiler()
+    assert compiler.lexer is compiler.parser.lexer
+    assert compiler.lexer.lexer is not None
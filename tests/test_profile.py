@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+测试性能分析：记录各阶段数据，且不改变编译结果
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.profiler import PHASES, CompileProfiler
+
+DEMO = os.path.join(os.path.dirname(__file__), '..', 'demos', '01_basic_gates.ghdl')
+
+
+def test_profile_records_phases(tmp_path):
+    compiler = GraceHDLCompiler()
+    assert compiler.compile_file(DEMO, str(tmp_path / 'plain.v'))
+
+    compiler.profiler = CompileProfiler()
+    assert compiler.compile_file(DEMO, str(tmp_path / 'profiled.v'))
+    compiler.profiler.stop()
+    assert (tmp_path / 'plain.v').read_text() == (tmp_path / 'profiled.v').read_text()
+
+    record, = compiler.profiler.files
+    assert set(record.times) == set(PHASES)
+    assert record.tokens > 0 and record.ast_nodes > 0
+    assert record.output_lines == (tmp_path / 'plain.v').read_text().count('\n') + 1
+    assert "词法分析" in compiler.profiler.report()
+
+    compiler.profiler.write_json(tmp_path / 'profile.json')
+    data = json.loads((tmp_path / 'profile.json').read_text(encoding='utf-8'))
+    assert data['files'][0]['tokens'] == record.tokens
+    assert set(data['files'][0]['phases']) == set(PHASES)
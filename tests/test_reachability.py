@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+测试 --top：只输出从顶层模块可达的模块及其引用的枚举和函数，并报告删除的项
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.reachability import prune_unreachable
+
+SOURCE = """enum state:
+IDLE = 0
+BUSY = 1
+
+enum unused_state:
+OFF = 0
+
+def inc(x):
+    return twice(x) + 1
+
+def twice(x):
+    return x + x
+
+def unused(x):
+    return x
+
+module leaf:
+    input(
+        wire a
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = inc(a) + state.IDLE
+
+module middle:
+    input(
+        wire a
+    )
+    output(
+        wire y
+    )
+    leaf l0(.a(a), .y(y))
+
+module spare:
+    input(
+        wire a
+    )
+    output(
+        wire y
+    )
+    leaf l1(.a(a), .y(y))
+
+module soc_top:
+    input(
+        wire a
+    )
+    output(
+        wire y
+    )
+    middle m0(.a(a), .y(y))
+"""
+
+
+def test_prune_keeps_reachable_items():
+    ast = GraceHDLCompiler()._parse(SOURCE)
+    pruned_ast, pruned = prune_unreachable(ast, ['soc_top'])
+    assert [item.name for item in pruned_ast.items] == ['state', 'inc', 'twice', 'leaf', 'middle', 'soc_top']
+    assert pruned == ['unused_state', 'unused', 'spare']
+    assert len(ast.items) == 9  # 原AST不变
+    # 多个顶层模块
+    assert prune_unreachable(ast, ['soc_top', 'spare'])[1] == ['unused_state', 'unused']
+
+
+def test_top_option(tmp_path, capsys):
+    source = tmp_path / 'soc.ghdl'
+    source.write_text(SOURCE, encoding='utf-8')
+    compiler = GraceHDLCompiler()
+    compiler.tops = ['middle']
+    assert compiler.compile_file(str(source), str(tmp_path / 'soc.v'))
+    output = (tmp_path / 'soc.v').read_text(encoding='utf-8')
+    assert 'module leaf' in output and 'module middle' in output
+    assert 'module spare' not in output and 'module soc_top' not in output
+    assert "已删除 4 个不可达的项: unused_state, unused, spare, soc_top" in capsys.readouterr().out
+
+    compiler.tops = ['missing']
+    assert not compiler.compile_file(str(source), str(tmp_path / 'missing.v'))
+    assert "找不到顶层模块 missing" in capsys.readouterr().out
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+测试表达式结构共享（--share-expressions）：结构相同的表达式只保留一个节点，
+输出与不共享时相同；序列化和参数特化后共享关系保持不变
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_serializer import dump_ast, load_ast
+from src.specializer import substitute
+
+SOURCE = """module m:
+    parameter(W = 4)
+    input(
+        wire(7:0) a,
+        wire(1:0) s
+    )
+    output(
+        reg(7:0) y,
+        wire(7:0) z
+    )
+    always:
+        if s == 1 && a[3:0] == W: y = a[3:0] + (a[3:0] == W)
+    always:
+        for i in range(0, 2):
+            y[i] = a[i] ^ a[3:0] == W
+    assign:
+        z = (s == 1) + a[7:4]
+"""
+
+
+def _compile(share):
+    compiler = GraceHDLCompiler()
+    if share:
+        compiler.share_expressions()
+    ast = compiler._parse(SOURCE)
+    return compiler, ast, compiler.generator.generate(ast)
+
+
+def test_shared_nodes_and_output():
+    _, plain_ast, plain = _compile(False)
+    compiler, ast, shared = _compile(True)
+    assert shared == plain
+    assert "y[1] = a[1] ^ a[3:0] == W;" in shared
+
+    always = ast.modules[0].sections[3].statements
+    condition = always[0].condition
+    assert condition.left is ast.modules[0].sections[5].assignments[0].expression.left
+    assert condition.right is always[0].then_statements[0].expression.right
+    # 共享表只在分析一个文件时使用
+    assert compiler.parser.interner.nodes == {}
+
+    loaded = load_ast(dump_ast(ast))
+    condition = loaded.modules[0].sections[3].statements[0].condition
+    assert condition.right is loaded.modules[0].sections[3].statements[0].then_statements[0].expression.right
+
+    copy = substitute(always[0], {'W': 5})
+    assert copy.condition.right is copy.then_statements[0].expression.right
+    assert copy.condition.right is not condition.right
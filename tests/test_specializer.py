@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+测试参数特化：每组不同的参数值只生成一个特化模块，位宽和for循环按已知参数折叠，
+不特化时保持通用的参数化输出
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.ast_serializer import dump_ast
+from src.linker import ModuleLinker
+from src.specializer import ModuleSpecializer
+
+SHIFTER = """module shifter:
+    parameter(WIDTH = 8, SHIFT = WIDTH >> 1)
+    input(
+        wire(WIDTH-1:0) a
+    )
+    output(
+        wire(WIDTH-1:0) y
+    )
+    always:
+        for i in range(0, WIDTH - SHIFT):
+            y[i] = a[i + SHIFT]
+"""
+
+TOP_HEADER = """
+module top:
+    input(
+        wire(7:0) a
+    )
+    output(
+        wire(7:0) y
+    )
+"""
+
+PARAMETER_SETS = ['(WIDTH = 4)', '(WIDTH = 2 + 2, SHIFT = 2)', '(WIDTH = 8, SHIFT = 1)', '']
+
+
+def _source(instances):
+    lines = [f"    shifter{PARAMETER_SETS[index % len(PARAMETER_SETS)]} s{index}(.a(a), .y(y))"
+             for index in range(instances)]
+    return SHIFTER + TOP_HEADER + '\n'.join(lines) + '\n'
+
+
+def test_instances_share_specialized_bodies():
+    compiler = GraceHDLCompiler()
+    ast = compiler._parse(_source(500))
+    before = dump_ast(ast)
+    specializer = ModuleSpecializer()
+    result = specializer.specialize(ast)
+    # 500个实例共用3组参数值（前两组相同）
+    assert [module.name for module in result.modules] == [
+        'shifter', 'shifter__WIDTH_4__SHIFT_2', 'shifter__WIDTH_8__SHIFT_1', 'shifter__WIDTH_8__SHIFT_4', 'top']
+    assert (specializer.misses, specializer.hits) == (3, 497)
+    # 给出顶层模块时，不再可达的通用版本不输出
+    result = specializer.specialize(ast, ['top'])
+    assert [module.name for module in result.modules][0] == 'shifter__WIDTH_4__SHIFT_2'
+    # 原AST不被修改（可能来自AST缓存）
+    assert dump_ast(ast) == before
+
+
+def test_specialized_output(tmp_path):
+    source = tmp_path / 'top.ghdl'
+    source.write_text(_source(4), encoding='utf-8')
+    compiler = GraceHDLCompiler()
+    # 通用输出：实例带 #(...) 参数覆盖，依赖参数的for循环输出为Verilog for循环
+    generic = compiler.generator.generate(compiler._parse(_source(4)))
+    assert "shifter #(.WIDTH(8), .SHIFT(1)) s2 (.a(a), .y(y));" in generic
+    assert "for (i = 0; i < WIDTH - SHIFT; i = i + 1)\n" in generic
+    assert "y[i] = a[i + SHIFT];" in generic
+
+    compiler.specializer = ModuleSpecializer()
+    compiler.tops = ['top']
+    assert compiler.compile_file(str(source), str(tmp_path / 'specialized.v'))
+    specialized = (tmp_path / 'specialized.v').read_text(encoding='utf-8')
+    assert "#(" not in specialized and "parameter" not in specialized
+    assert "module shifter__WIDTH_4__SHIFT_2(\n    input wire[3:0] a," in specialized
+    assert "        y[1] = a[1 + 2];\n    end" in specialized
+    assert "shifter__WIDTH_4__SHIFT_2 s1 (.a(a), .y(y));" in specialized
+    assert "module shifter(" not in specialized
+
+
+def test_generic_module_used_by_another_file(tmp_path):
+    # 另一个文件用 #(...) 实例化shifter，特化后通用版本仍然输出
+    root = tmp_path / 'src'
+    root.mkdir()
+    (root / 'lib.ghdl').write_text(_source(2), encoding='utf-8')
+    (root / 'user.ghdl').write_text(TOP_HEADER.replace('module top', 'module user')
+                                    + "    shifter(WIDTH = 16) s0(.a(a), .y(y))\n", encoding='utf-8')
+    compiler = GraceHDLCompiler()
+    compiler.linker = ModuleLinker()
+    compiler.specializer = ModuleSpecializer()
+    assert compiler.compile_directory(str(root), str(tmp_path / 'out')) is True
+    lib = (tmp_path / 'out' / 'lib.v').read_text(encoding='utf-8')
+    assert "module shifter(" in lib and "module shifter__WIDTH_4__SHIFT_2(" in lib
+    assert "shifter #(.WIDTH(16)) s0 (.a(a), .y(y));" in (tmp_path / 'out' / 'user.v').read_text(encoding='utf-8')
+
+
+def test_parent_without_parameters_is_unchanged():
+    # 不带参数的父模块只改实例，带位宽的字面值不能被折叠成无位宽的整数
+    source = _source(2).replace("    shifter(WIDTH = 4) s0",
+                                "    assign:\n"
+                                "        y[3:0] = ((1, d, 4) << 4) >> 4\n"
+                                "        y[7:4] = (15, d, 4) + (1, d, 4)\n"
+                                "    shifter(WIDTH = 4) s0")
+    compiler = GraceHDLCompiler()
+    generic = compiler.generator.generate(compiler._parse(source))
+    specialized = compiler.generator.generate(ModuleSpecializer().specialize(compiler._parse(source)))
+    assert "(4'd1 << 4) >> 4;" in generic and "4'd15 + 4'd1;" in generic
+
+    def assigns(text):
+        return [line for line in text.splitlines() if line.lstrip().startswith('assign')]
+
+    assert assigns(specialized) == assigns(generic)
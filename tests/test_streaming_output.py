@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+测试流式代码生成：输出与generate()一致，生成失败时不留下不完整的输出文件
+"""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.parser import GraceHDLParser
+from src.verilog_generator import VerilogGenerator
+
+DEMO = os.path.join(os.path.dirname(__file__), '..', 'demos', '01_basic_gates.ghdl')
+
+
+def test_generate_to_matches_generate():
+    parser = GraceHDLParser()
+    parser.build()
+    with open(DEMO, 'r', encoding='utf-8') as f:
+        ast = parser.parse(f.read())
+    generator = VerilogGenerator()
+    sink = io.StringIO()
+    generator.generate_to(ast, sink)
+    assert sink.getvalue() == generator.generate(ast)
+
+
+def test_failed_generation_leaves_no_output(tmp_path, monkeypatch):
+    compiler = GraceHDLCompiler()
+    output = tmp_path / 'out.v'
+
+    def broken_visit(node):
+        compiler.generator.emit('module partial;')
+        raise Exception('生成失败')
+
+    monkeypatch.setattr(compiler.generator, 'visit', broken_visit)
+    assert not compiler.compile_file(DEMO, str(output))
+    assert list(tmp_path.iterdir()) == []
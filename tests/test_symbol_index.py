@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+测试项目符号数据库：模块、端口、参数和实例关系的查询，按文件哈希的增量更新
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.symbol_index import SymbolIndex, main
+
+LEAF = """module and_gate:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a & b
+"""
+
+TOP = """// 顶层
+module top:
+    parameter(WIDTH = 8)
+    input(
+        wire(WIDTH-1:0) data,
+        wire en
+    )
+    output(
+        wire y
+    )
+    and_gate u0(.a(en), .b(en), .y(y))
+    and_gate u1(.a(en), .b(en), .y(y))
+"""
+
+
+def test_queries_and_incremental_update(tmp_path):
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'and_gate.ghdl').write_text(LEAF, encoding='utf-8')
+    (src / 'top.ghdl').write_text(TOP, encoding='utf-8')
+    db = tmp_path / 'symbols.sqlite'
+
+    index = SymbolIndex(db)
+    assert index.update(src) == (2, 0, 0)
+    assert index.modules('top') == [(str((src / 'top.ghdl').resolve()), 2)]
+    assert index.instantiators('and_gate') == [
+        ('top', 'u0', str((src / 'top.ghdl').resolve())),
+        ('top', 'u1', str((src / 'top.ghdl').resolve()))]
+    assert index.instances('top') == [('u0', 'and_gate'), ('u1', 'and_gate')]
+    assert index.port('top', 'data') == ('input', 'wire', 'WIDTH - 1:0')
+    assert index.port('top', 'missing') is None
+    assert index.parameters('top') == [('WIDTH', '8')]
+    assert [port[:2] for port in index.ports('and_gate')] == [('a', 'input'), ('b', 'input'), ('y', 'output')]
+    index.close()
+
+    # 重新打开：未改变的文件不重新分析；修改的文件替换旧记录，删除的文件移除
+    (src / 'and_gate.ghdl').write_text(LEAF.replace('wire y', 'wire(3:0) y'), encoding='utf-8')
+    (src / 'top.ghdl').unlink()
+    (src / 'broken.ghdl').write_text(LEAF.replace('and_gate', 'half') + '    if :\n', encoding='utf-8')
+    index = SymbolIndex(db)
+    assert index.update(src) == (2, 1, 0)
+    assert index.port('and_gate', 'y') == ('output', 'wire', '3:0')
+    assert index.instantiators('and_gate') == []
+    # 语法分析失败的文件仍索引模块接口
+    assert index.port('half', 'y') == ('output', 'wire', None)
+    assert index.update(src) == (0, 0, 2)
+    index.close()
+
+
+def test_command_line(tmp_path, capsys):
+    (tmp_path / 'top.ghdl').write_text(TOP, encoding='utf-8')
+    db = str(tmp_path / 'symbols.sqlite')
+    assert main([str(tmp_path), '--db', db, '--users', 'and_gate', '--port', 'top.data']) == 0
+    output = capsys.readouterr().out
+    assert "已索引 1 个文件" in output
+    assert "top.u1" in output
+    assert "top.data: input wire(WIDTH - 1:0)" in output
+    assert main(['--db', db, '--no-update', '--module', 'missing']) == 1
+
+
+def test_skip_non_utf8_file(tmp_path, capsys):
+    (tmp_path / 'top.ghdl').write_text(TOP, encoding='utf-8')
+    (tmp_path / 'latin1.ghdl').write_bytes('// 注释\n'.encode('gbk'))
+    db = str(tmp_path / 'symbols.sqlite')
+    assert main([str(tmp_path), '--db', db, '--users', 'and_gate']) == 0
+    output = capsys.readouterr().out
+    assert f"警告: 跳过 {tmp_path.resolve() / 'latin1.ghdl'}: 不是UTF-8编码" in output
+    assert "已索引 1 个文件" in output
+    assert "top.u1" in output
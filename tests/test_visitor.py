@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+测试基于分派表的访问者
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ast_nodes import BinaryOp, Identifier, IdentifierExpression, NumberExpression
+from src.verilog_generator import VerilogGenerator
+from src.visitor import NodeVisitor
+
+
+def test_compat_subclasses_use_base_handlers():
+    generator = VerilogGenerator()
+    expr = BinaryOp('+', Identifier('a'), NumberExpression(1))
+    assert generator.visit_expression(expr) == generator.visit_expression(
+        BinaryOp('+', IdentifierExpression('a'), NumberExpression(1)))
+    assert 'a' in generator.visit_expression(expr)
+
+
+def test_unknown_expression_falls_back_to_str():
+    class Opaque:
+        def __str__(self):
+            return 'opaque'
+
+    assert VerilogGenerator().visit_expression(Opaque()) == 'opaque'
+
+
+def test_dispatch_tables_are_per_class():
+    class First(NodeVisitor):
+        def visit_int(self, node):
+            return 'first'
+
+    class Second(NodeVisitor):
+        def visit_object(self, node):
+            return 'second'
+
+    assert First().visit(1) == 'first'
+    assert Second().visit(1) == 'second'
+    assert First._visit_table is not Second._visit_table
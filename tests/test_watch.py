@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+测试监视模式：只重新编译内容发生变化的文件，开启链接检查时每批编译后重新链接
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from gracehdl_compiler import GraceHDLCompiler
+from src.linker import ModuleLinker
+from src.watcher import DirectoryWatcher
+
+GATE = """module {name}:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    assign:
+        y = a {op} b
+"""
+
+TOP = """module top:
+    input(
+        wire a,
+        wire b
+    )
+    output(
+        wire y
+    )
+    {name} u1(.a(a), .b(b), .y(y))
+"""
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_watcher_reports_changes_and_removals(tmp_path):
+    first = tmp_path / 'first.ghdl'
+    second = tmp_path / 'sub' / 'second.ghdl'
+    second.parent.mkdir()
+    first.write_text('a', encoding='utf-8')
+    watcher = DirectoryWatcher(tmp_path)
+    assert watcher.poll() == (set(), set())
+
+    second.write_text('b', encoding='utf-8')
+    first.unlink()
+    assert watcher.poll() == ({second}, {first})
+    assert watcher.files == [second]
+
+
+def test_watch_recompiles_only_changed_files(tmp_path):
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'and_gate.ghdl').write_text(GATE.format(name='and_gate', op='&'), encoding='utf-8')
+    (src / 'or_gate.ghdl').write_text(GATE.format(name='or_gate', op='|'), encoding='utf-8')
+    build = tmp_path / 'build'
+
+    stop = threading.Event()
+    compiler = GraceHDLCompiler()
+    thread = threading.Thread(target=compiler.watch_directory,
+                              args=(str(src), str(build)), kwargs={'jobs': 1, 'stop': stop})
+    thread.start()
+    try:
+        _wait_for(lambda: (build / 'and_gate.v').exists() and (build / 'or_gate.v').exists())
+        untouched = (build / 'or_gate.v').stat().st_mtime_ns
+
+        (src / 'and_gate.ghdl').write_text(GATE.format(name='and_gate', op='^'), encoding='utf-8')
+        _wait_for(lambda: '^' in (build / 'and_gate.v').read_text(encoding='utf-8'))
+        assert (build / 'or_gate.v').stat().st_mtime_ns == untouched
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_watch_relinks_after_each_batch(tmp_path, capsys):
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'and_gate.ghdl').write_text(GATE.format(name='and_gate', op='&'), encoding='utf-8')
+    (src / 'top.ghdl').write_text(TOP.format(name='and_gate'), encoding='utf-8')
+    build = tmp_path / 'build'
+    output = []
+
+    def printed(text, count=1):
+        output.append(capsys.readouterr().out)
+        return ''.join(output).count(text) >= count
+
+    stop = threading.Event()
+    compiler = GraceHDLCompiler()
+    compiler.linker = ModuleLinker()
+    thread = threading.Thread(target=compiler.watch_directory,
+                              args=(str(src), str(build)), kwargs={'jobs': 1, 'stop': stop})
+    thread.start()
+    try:
+        _wait_for(lambda: printed('正在监视'))
+        (src / 'top.ghdl').write_text(TOP.format(name='or_gate'), encoding='utf-8')
+        _wait_for(lambda: printed('top.u1: 未定义的模块 or_gate'))
+
+        (src / 'or_gate.ghdl').write_text(GATE.format(name='or_gate', op='|'), encoding='utf-8')
+        _wait_for(lambda: printed('链接通过'))
+        # 重新编译的文件替换之前的链接信息，不累积
+        assert sorted(compiler.linker.units) == [str(src / name) for name in ('and_gate.ghdl', 'or_gate.ghdl', 'top.ghdl')]
+
+        (src / 'or_gate.ghdl').unlink()
+        _wait_for(lambda: printed('未定义的模块 or_gate', 2))
+        assert '模块重复定义' not in ''.join(output)
+    finally:
+        stop.set()
+        thread.join()